@@ -21,6 +21,7 @@ from pm4py.objects.petri_net.utils import align_utils, check_soundness
 from pm4py.objects.conversion.log import converter as log_converter
 from pm4py.util.xes_constants import DEFAULT_NAME_KEY, DEFAULT_TRACEID_KEY
 from pm4py.objects.log.obj import Trace, Event
+from pm4py.objects.log.util import variant_index
 import time
 from pm4py.util.lp import solver
 from pm4py.util import exec_utils
@@ -41,6 +42,7 @@ class Variants(Enum):
     VERSION_DIJKSTRA_NO_HEURISTICS = variants.dijkstra_no_heuristics
     VERSION_DIJKSTRA_LESS_MEMORY = variants.dijkstra_less_memory
     VERSION_DISCOUNTED_A_STAR = variants.discounted_a_star
+    VERSION_COMPACT_STATE_EQUATION_A_STAR = variants.compact_state_equation_a_star
 
 class Parameters(Enum):
     PARAM_TRACE_COST_FUNCTION = 'trace_cost_function'
@@ -63,6 +65,8 @@ class Parameters(Enum):
     SYNCHRONOUS = "synchronous_dijkstra"
     EXPONENT="theta"
     ENABLE_BEST_WORST_COST = "enable_best_worst_cost"
+    VARIANTS_PER_TASK = "variants_per_task"
+    PREFIX_CACHE = "prefix_cache"
 
 
 def __variant_mapper(variant):
@@ -75,6 +79,10 @@ def __variant_mapper(variant):
             variant = Variants.VERSION_DIJKSTRA_NO_HEURISTICS
         elif variant == "Variants.VERSION_DIJKSTRA_LESS_MEMORY":
             variant = Variants.VERSION_DIJKSTRA_LESS_MEMORY
+        elif variant == "Variants.VERSION_DISCOUNTED_A_STAR":
+            variant = Variants.VERSION_DISCOUNTED_A_STAR
+        elif variant == "Variants.VERSION_COMPACT_STATE_EQUATION_A_STAR":
+            variant = Variants.VERSION_COMPACT_STATE_EQUATION_A_STAR
 
     return variant
 
@@ -183,7 +191,10 @@ def apply_log(log, petri_net, initial_marking, final_marking, parameters=None, v
     variant
         selected variant of the algorithm, possible values: {\'Variants.VERSION_STATE_EQUATION_A_STAR, Variants.VERSION_DIJKSTRA_NO_HEURISTICS \'}
     parameters
-        :class:`dict` parameters of the algorithm,
+        :class:`dict` parameters of the algorithm, including:
+            Parameters.PREFIX_CACHE -> (optional) instance of
+            :class:`pm4py.algo.conformance.alignments.petri_net.utils.prefix_cache.PrefixCache`, used to reuse the search
+            states reached after the prefixes shared by different variants (supported by VERSION_DIJKSTRA_LESS_MEMORY)
 
     Returns
     -----------
@@ -217,12 +228,21 @@ def apply_log(log, petri_net, initial_marking, final_marking, parameters=None, v
         best_worst_cost = __get_best_worst_cost(petri_net, initial_marking, final_marking, variant, parameters)
         parameters[Parameters.BEST_WORST_COST_INTERNAL] = best_worst_cost
 
-    all_alignments = []
-    for trace in one_tr_per_var:
+    order = list(range(len(one_tr_per_var)))
+    prefix_cache = exec_utils.get_param_value(Parameters.PREFIX_CACHE, parameters, None)
+    if prefix_cache is not None:
+        from pm4py.algo.conformance.alignments.petri_net.utils import prefix_cache as prefix_cache_utils
+        activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, DEFAULT_NAME_KEY)
+        prefix_cache.register_prefixes(prefix_cache_utils.get_branching_prefixes(one_tr_per_var, parameters=parameters))
+        # aligns the variants in lexicographic order, so the variants sharing a prefix are aligned one after the other
+        order.sort(key=lambda i: [x[activity_key] for x in one_tr_per_var[i]])
+
+    all_alignments = [None] * len(one_tr_per_var)
+    for i in order:
         this_max_align_time = min(max_align_time_case, (max_align_time - (time.time() - start_time)) * 0.5)
         parameters[Parameters.PARAM_MAX_ALIGN_TIME_TRACE] = this_max_align_time
-        all_alignments.append(apply_trace(trace, petri_net, initial_marking, final_marking, parameters=copy(parameters),
-                                          variant=variant))
+        all_alignments[i] = apply_trace(one_tr_per_var[i], petri_net, initial_marking, final_marking,
+                                        parameters=copy(parameters), variant=variant)
         if progress is not None:
             progress.update()
 
@@ -234,7 +254,12 @@ def apply_log(log, petri_net, initial_marking, final_marking, parameters=None, v
 
 def apply_multiprocessing(log, petri_net, initial_marking, final_marking, parameters=None, variant=DEFAULT_VARIANT):
     """
-    Applies the alignments using a process pool (multiprocessing)
+    Applies the alignments using a process pool (multiprocessing).
+
+    The accepting Petri net (along with the parameters of the alignments) is serialized once into a shared memory
+    block, which is attached by every worker at startup (instead of pickling the net for every variant).
+    The variants are scheduled longest-first, and are picked up by the workers from a shared queue as soon as they
+    become idle, so that a very long variant does not hold up the tail of the computation.
 
     Parameters
     ---------------
@@ -247,7 +272,9 @@ def apply_multiprocessing(log, petri_net, initial_marking, final_marking, parame
     final_marking
         Final marking
     parameters
-        Parameters of the algorithm
+        Parameters of the algorithm, including:
+        - Parameters.CORES => number of worker processes
+        - Parameters.VARIANTS_PER_TASK => maximum number of variants sent to a worker in a single task
 
     Returns
     ----------------
@@ -257,45 +284,143 @@ def apply_multiprocessing(log, petri_net, initial_marking, final_marking, parame
     if parameters is None:
         parameters = {}
 
+    variants_idxs, one_tr_per_var = __get_variants_structure(log, parameters)
+
+    all_alignments = [None] * len(one_tr_per_var)
+    progress = __get_progress_bar(len(one_tr_per_var), parameters)
+
+    for index_variant, alignment in __apply_multiprocessing_variants(one_tr_per_var, petri_net, initial_marking,
+                                                                      final_marking, parameters=parameters,
+                                                                      variant=variant):
+        all_alignments[index_variant] = alignment
+        if progress is not None:
+            progress.update()
+
+    __close_progress_bar(progress)
+
+    alignments = __form_alignments(variants_idxs, all_alignments)
+
+    return alignments
+
+
+def apply_multiprocessing_streaming(log, petri_net, initial_marking, final_marking, parameters=None, variant=DEFAULT_VARIANT):
+    """
+    Applies the alignments using a process pool (multiprocessing), yielding the alignments of the variants
+    as soon as they are computed (in order of completion).
+
+    Parameters
+    ---------------
+    log
+        Event log
+    petri_net
+        Petri net
+    initial_marking
+        Initial marking
+    final_marking
+        Final marking
+    parameters
+        Parameters of the algorithm (see apply_multiprocessing)
+
+    Returns
+    ----------------
+    generator
+        Generator of couples (indexes of the cases of the log having the variant, alignment of the variant)
+    """
+    if parameters is None:
+        parameters = {}
+
+    variants_idxs, one_tr_per_var = __get_variants_structure(log, parameters)
+    cases_per_variant = list(variants_idxs.values())
+
+    for index_variant, alignment in __apply_multiprocessing_variants(one_tr_per_var, petri_net, initial_marking,
+                                                                      final_marking, parameters=parameters,
+                                                                      variant=variant):
+        yield cases_per_variant[index_variant], alignment
+
+
+def __apply_multiprocessing_variants(one_tr_per_var, petri_net, initial_marking, final_marking, parameters=None,
+                                     variant=DEFAULT_VARIANT):
+    """
+    Aligns the given traces (one per variant) in a process pool, yielding the couples (index of the variant,
+    alignment) in order of completion
+    """
+    if parameters is None:
+        parameters = {}
+
     import multiprocessing
+    import pickle
+    from multiprocessing import shared_memory
+    from concurrent.futures import ProcessPoolExecutor, as_completed
 
+    parameters = copy(parameters)
     variant = __variant_mapper(variant)
 
     num_cores = exec_utils.get_param_value(Parameters.CORES, parameters, multiprocessing.cpu_count() - 2)
+    num_cores = max(1, num_cores)
+    variants_per_task = max(1, exec_utils.get_param_value(Parameters.VARIANTS_PER_TASK, parameters, 1))
 
     enable_best_worst_cost = exec_utils.get_param_value(Parameters.ENABLE_BEST_WORST_COST, parameters, True)
 
-    variants_idxs, one_tr_per_var = __get_variants_structure(log, parameters)
-
     if enable_best_worst_cost:
         best_worst_cost = __get_best_worst_cost(petri_net, initial_marking, final_marking, variant, parameters)
         parameters[Parameters.BEST_WORST_COST_INTERNAL] = best_worst_cost
 
-    all_alignments = []
+    # longest variants first: the tail of the computation is then made of short variants
+    order = sorted(range(len(one_tr_per_var)), key=lambda i: len(one_tr_per_var[i]), reverse=True)
+    tasks = [[(i, one_tr_per_var[i]) for i in order[j:j + variants_per_task]] for j in
+             range(0, len(order), variants_per_task)]
 
-    from concurrent.futures import ProcessPoolExecutor
-    with ProcessPoolExecutor(max_workers=num_cores) as executor:
+    # the enumeration values are modules (not serializable): the workers map back the string representation
+    shared_context = pickle.dumps((petri_net, initial_marking, final_marking, parameters, str(variant)),
+                                  protocol=pickle.HIGHEST_PROTOCOL)
+    shm = shared_memory.SharedMemory(create=True, size=len(shared_context))
+    try:
+        shm.buf[:len(shared_context)] = shared_context
+
+        executor = ProcessPoolExecutor(max_workers=num_cores, initializer=_init_shared_alignment_worker,
+                                       initargs=(shm.name, len(shared_context)))
         futures = []
-        for trace in one_tr_per_var:
-            futures.append(executor.submit(apply_trace, trace, petri_net, initial_marking, final_marking, parameters, str(variant)))
-        progress = __get_progress_bar(len(one_tr_per_var), parameters)
-        if progress is not None:
-            alignments_ready = 0
-            while alignments_ready != len(futures):
-                current = 0
-                for index, variant in enumerate(futures):
-                    current = current + 1 if futures[index].done() else current
-                if current > alignments_ready:
-                    for i in range(0, current - alignments_ready):
-                        progress.update()
-                alignments_ready = current
-        for index, variant in enumerate(futures):
-            all_alignments.append(futures[index].result())
-        __close_progress_bar(progress)
+        try:
+            futures = [executor.submit(_align_shared_task, task) for task in tasks]
+            for future in as_completed(futures):
+                for index_variant, alignment in future.result():
+                    yield index_variant, alignment
+        finally:
+            # when the generator is abandoned (or fails), the pending tasks are not awaited
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+    finally:
+        shm.close()
+        shm.unlink()
 
-    alignments = __form_alignments(variants_idxs, all_alignments)
 
-    return alignments
+_SHARED_ALIGNMENT_CONTEXT = None
+
+
+def _init_shared_alignment_worker(shm_name, size):
+    """
+    Initializer of the workers of the process pool: attaches the shared memory block and deserializes
+    (once per worker) the accepting Petri net and the parameters of the alignments
+    """
+    global _SHARED_ALIGNMENT_CONTEXT
+    from multiprocessing import shared_memory
+    import pickle
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        _SHARED_ALIGNMENT_CONTEXT = pickle.loads(bytes(shm.buf[:size]))
+    finally:
+        shm.close()
+
+
+def _align_shared_task(task):
+    """
+    Aligns a batch of (index of the variant, trace) against the accepting Petri net shared with the worker
+    """
+    petri_net, initial_marking, final_marking, parameters, variant = _SHARED_ALIGNMENT_CONTEXT
+    return [(index_variant, apply_trace(trace, petri_net, initial_marking, final_marking, parameters=copy(parameters),
+                                        variant=variant)) for index_variant, trace in task]
 
 
 def __get_best_worst_cost(petri_net, initial_marking, final_marking, variant, parameters):
@@ -318,16 +443,15 @@ def __get_variants_structure(log, parameters):
 
     if pandas_utils.check_is_pandas_dataframe(log):
         case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, CASE_CONCEPT_NAME)
-        traces = [tuple(x) for x in log.groupby(case_id_key)[activity_key].agg(list).to_dict().values()]
-        for idx, trace in enumerate(traces):
-            if trace not in variants_idxs:
-                variants_idxs[trace] = [idx]
-                case = Trace()
-                for act in trace:
-                    case.append(Event({activity_key: act}))
-                one_tr_per_var.append(case)
-            else:
-                variants_idxs[trace].append(idx)
+        # reuses the variant index of the dataframe
+        variants_idxs = variant_index.get_variant_index(log, parameters={
+            variant_index.Parameters.CASE_ID_KEY: case_id_key,
+            variant_index.Parameters.ACTIVITY_KEY: activity_key}).get_variants_cases()
+        for trace in variants_idxs:
+            case = Trace()
+            for act in trace:
+                case.append(Event({activity_key: act}))
+            one_tr_per_var.append(case)
     else:
         log = log_converter.apply(log, variant=log_converter.Variants.TO_EVENT_LOG, parameters=parameters)
         for idx, case in enumerate(log):
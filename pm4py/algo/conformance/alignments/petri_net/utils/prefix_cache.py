@@ -0,0 +1,228 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+from collections import OrderedDict
+from enum import Enum
+from typing import Optional, Dict, Any, Union, Tuple, Collection, List
+
+from pm4py.objects.log.obj import EventLog, Trace
+from pm4py.objects.petri_net.obj import PetriNet
+from pm4py.util import exec_utils, constants, xes_constants
+
+
+class Parameters(Enum):
+    ACTIVITY_KEY = constants.PARAMETER_CONSTANT_ACTIVITY_KEY
+
+
+class _PrefixNode(object):
+    __slots__ = ("label", "parent", "children", "snapshot")
+
+    def __init__(self, label=None, parent=None):
+        self.label = label
+        self.parent = parent
+        self.children = {}
+        self.snapshot = None
+
+
+class PrefixCache(object):
+    """
+    Bounded cache (with LRU eviction) of the states of the alignment search reached after a prefix of a trace.
+
+    The cache is organized as a trie over the activities of the traces. Each node of the trie can store a snapshot
+    of the search (open set, closed set, counters) taken right before the first state that consumes an event after
+    the prefix is expanded. Since such a snapshot depends only on the prefix, the search for another trace sharing
+    the same prefix can resume from it, obtaining exactly the same alignment.
+
+    The cache is bound to a single accepting Petri net (it is cleared when used with a different net).
+    The snapshots are stored by namespace, so that searches executed with different cost functions are kept apart.
+    """
+
+    def __init__(self, max_size: int = 1000, prefixes: Optional[Collection[Tuple[str, ...]]] = None):
+        """
+        Constructor
+
+        Parameters
+        ---------------
+        max_size
+            Maximum number of snapshots kept in the cache
+        prefixes
+            (optional) Prefixes for which the snapshots should be stored. If not provided,
+            a snapshot is stored for every prefix of the aligned traces.
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._net = None
+        self._roots = {}
+        self._lru = OrderedDict()
+        self._prefixes = set(prefixes) if prefixes is not None else None
+
+    def __len__(self):
+        return len(self._lru)
+
+    def clear(self):
+        """
+        Removes all the snapshots from the cache (the counters are kept)
+        """
+        self._roots = {}
+        self._lru = OrderedDict()
+
+    def bind(self, net: PetriNet):
+        """
+        Binds the cache to the given Petri net (clearing the cache if it was bound to a different one)
+        """
+        if self._net is not net:
+            self.clear()
+            self._net = net
+
+    def register_prefixes(self, prefixes: Collection[Tuple[str, ...]]):
+        """
+        Restricts the storage of snapshots to the provided prefixes
+        """
+        if self._prefixes is None:
+            self._prefixes = set()
+        self._prefixes.update(prefixes)
+
+    def get_snapshot_depths(self, trace_labels: List[str], min_depth: int) -> List[int]:
+        """
+        Gets the lengths (greater than min_depth) of the prefixes of the trace for which a snapshot should be stored
+        """
+        depths = []
+        for d in range(min_depth + 1, len(trace_labels) + 1):
+            if self._prefixes is None or tuple(trace_labels[:d]) in self._prefixes:
+                depths.append(d)
+        return depths
+
+    def lookup(self, namespace: Any, trace_labels: List[str]) -> Tuple[int, Any]:
+        """
+        Retrieves the snapshot associated to the longest cached prefix of the trace
+
+        Parameters
+        ---------------
+        namespace
+            Namespace of the search (e.g., the cost function that is used)
+        trace_labels
+            Activities of the trace
+
+        Returns
+        ---------------
+        depth
+            Length of the prefix (0 if nothing is found)
+        snapshot
+            Snapshot of the search (None if nothing is found)
+        """
+        node = self._roots.get(namespace, None)
+        best = None
+        depth = 0
+        if node is not None:
+            for i, label in enumerate(trace_labels):
+                node = node.children.get(label, None)
+                if node is None:
+                    break
+                if node.snapshot is not None:
+                    best = node
+                    depth = i + 1
+        if best is None:
+            self.misses += 1
+            return 0, None
+        self.hits += 1
+        self._lru.move_to_end(best)
+        return depth, best.snapshot
+
+    def store(self, namespace: Any, prefix: List[str], snapshot: Any):
+        """
+        Stores the snapshot of the search reached after the given prefix (evicting the least recently
+        used snapshot if the cache is full)
+        """
+        if self.max_size <= 0:
+            return
+        if namespace not in self._roots:
+            self._roots[namespace] = _PrefixNode()
+        node = self._roots[namespace]
+        for label in prefix:
+            if label not in node.children:
+                node.children[label] = _PrefixNode(label=label, parent=node)
+            node = node.children[label]
+        node.snapshot = snapshot
+        self._lru[node] = namespace
+        self._lru.move_to_end(node)
+        while len(self._lru) > self.max_size:
+            evicted, evicted_namespace = self._lru.popitem(last=False)
+            self.__evict(evicted, evicted_namespace)
+            self.evictions += 1
+
+    def __evict(self, node: _PrefixNode, namespace: Any):
+        node.snapshot = None
+        # removes the branch of the trie that does not lead anymore to any snapshot
+        while node.parent is not None and not node.children and node.snapshot is None:
+            del node.parent.children[node.label]
+            node = node.parent
+        if node.parent is None and not node.children:
+            del self._roots[namespace]
+
+    def get_statistics(self) -> Dict[str, int]:
+        """
+        Gets the counters of the cache
+
+        Returns
+        ---------------
+        statistics
+            Dictionary with the hits, misses, evictions and the current number of snapshots
+        """
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "size": len(self._lru)}
+
+
+def get_branching_prefixes(log: Union[EventLog, List[Trace]], parameters: Optional[Dict[Any, Any]] = None) -> \
+        List[Tuple[str, ...]]:
+    """
+    Gets the prefixes of the traces of the log after which the variants diverge (or one variant ends while
+    others continue), which are the prefixes worth caching.
+
+    Parameters
+    ---------------
+    log
+        Event log (or list of traces)
+    parameters
+        Parameters, including:
+        - Parameters.ACTIVITY_KEY => the attribute to be used as activity
+
+    Returns
+    ---------------
+    prefixes
+        List of prefixes
+    """
+    if parameters is None:
+        parameters = {}
+
+    from pm4py.algo.transformation.log_to_trie import algorithm as log_to_trie
+
+    activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, xes_constants.DEFAULT_NAME_KEY)
+    if not isinstance(log, EventLog):
+        log = EventLog(log)
+
+    root = log_to_trie.apply(log, parameters={log_to_trie.Parameters.ACTIVITY_KEY: activity_key})
+
+    prefixes = []
+    to_visit = [(root, ())]
+    while to_visit:
+        node, prefix = to_visit.pop()
+        if node.depth > 0 and (len(node.children) > 1 or (node.final and node.children)):
+            prefixes.append(prefix)
+        for child in node.children:
+            to_visit.append((child, prefix + (child.label,)))
+
+    return prefixes
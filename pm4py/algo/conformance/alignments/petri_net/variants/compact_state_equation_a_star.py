@@ -0,0 +1,627 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+"""
+This module contains a compact implementation of the A* search on the state-space of the synchronous product net
+of a trace and a Petri net, returning optimal alignments (with the same cost as the state_equation_a_star variant).
+
+Differently from the state_equation_a_star variant, the markings of the synchronous product net are stored as
+fixed-width integer arrays (serialized to bytes, which cache their hash), the firing rule works on the
+CSR representation of the presets/postsets of the transitions, and the open set is a heap of plain tuples.
+Every marking is stored once: a queued marking reached again through a cheaper path gets the new parent (and a new
+entry in the open set), while paths that are not cheaper are discarded.
+The solution vector of the marking equation is stored only for the expanded states (the ones in the open set
+are reconstructed from the parent when needed), reducing the memory required by each state.
+
+The states of the open set are ordered as in the state_equation_a_star variant (by f, then the states with an exact
+heuristic first, then by h). The remaining ties are broken by insertion order, while the state_equation_a_star
+variant breaks them following the memory addresses of the transitions, hence equally optimal alignments may differ.
+"""
+import heapq
+import sys
+import time
+from enum import Enum
+
+import numpy as np
+
+from pm4py.objects.log import obj as log_implementation
+from pm4py.objects.petri_net.utils import align_utils as utils
+from pm4py.objects.petri_net.utils.incidence_matrix import construct as inc_mat_construct, construct_pre_post_csr
+from pm4py.objects.petri_net.utils.synchronous_product import construct_cost_aware, construct
+from pm4py.objects.petri_net.utils.petri_utils import construct_trace_net_cost_aware
+from pm4py.util import exec_utils
+from pm4py.util.constants import PARAMETER_CONSTANT_ACTIVITY_KEY
+from pm4py.util.lp import solver as lp_solver
+from pm4py.util.xes_constants import DEFAULT_NAME_KEY
+from pm4py.util import variants_util
+from typing import Optional, Dict, Any, Union
+from pm4py.objects.log.obj import Trace
+from pm4py.objects.petri_net.obj import PetriNet, Marking
+from pm4py.util import typing
+
+
+class Parameters(Enum):
+    PARAM_TRACE_COST_FUNCTION = 'trace_cost_function'
+    PARAM_MODEL_COST_FUNCTION = 'model_cost_function'
+    PARAM_SYNC_COST_FUNCTION = 'sync_cost_function'
+    PARAM_ALIGNMENT_RESULT_IS_SYNC_PROD_AWARE = 'ret_tuple_as_trans_desc'
+    PARAM_TRACE_NET_COSTS = "trace_net_costs"
+    TRACE_NET_CONSTR_FUNCTION = "trace_net_constr_function"
+    TRACE_NET_COST_AWARE_CONSTR_FUNCTION = "trace_net_cost_aware_constr_function"
+    PARAM_MAX_ALIGN_TIME_TRACE = "max_align_time_trace"
+    PARAM_MAX_ALIGN_TIME = "max_align_time"
+    PARAMETER_VARIANT_DELIMITER = "variant_delimiter"
+    ACTIVITY_KEY = PARAMETER_CONSTANT_ACTIVITY_KEY
+    VARIANTS_IDX = "variants_idx"
+    RETURN_SYNC_COST_FUNCTION = "return_sync_cost_function"
+
+
+PARAM_TRACE_COST_FUNCTION = Parameters.PARAM_TRACE_COST_FUNCTION.value
+PARAM_MODEL_COST_FUNCTION = Parameters.PARAM_MODEL_COST_FUNCTION.value
+PARAM_SYNC_COST_FUNCTION = Parameters.PARAM_SYNC_COST_FUNCTION.value
+
+
+def get_best_worst_cost(petri_net, initial_marking, final_marking, parameters=None):
+    """
+    Gets the best worst cost of an alignment
+
+    Parameters
+    -----------
+    petri_net
+        Petri net
+    initial_marking
+        Initial marking
+    final_marking
+        Final marking
+
+    Returns
+    -----------
+    best_worst_cost
+        Best worst cost of alignment
+    """
+    if parameters is None:
+        parameters = {}
+    trace = log_implementation.Trace()
+
+    best_worst = apply(trace, petri_net, initial_marking, final_marking, parameters=parameters)
+
+    if best_worst is not None:
+        return best_worst['cost']
+
+    return None
+
+
+def apply(trace: Trace, petri_net: PetriNet, initial_marking: Marking, final_marking: Marking, parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> typing.AlignmentResult:
+    """
+    Performs the basic alignment search, given a trace and a net.
+
+    Parameters
+    ----------
+    trace: :class:`list` input trace, assumed to be a list of events (i.e. the code will use the activity key
+    to get the attributes)
+    petri_net: :class:`pm4py.objects.petri.net.PetriNet` the Petri net to use in the alignment
+    initial_marking: :class:`pm4py.objects.petri.net.Marking` initial marking in the Petri net
+    final_marking: :class:`pm4py.objects.petri.net.Marking` final marking in the Petri net
+    parameters: :class:`dict` (optional) dictionary containing one of the following:
+        Parameters.PARAM_TRACE_COST_FUNCTION: :class:`list` (parameter) mapping of each index of the trace to a positive cost value
+        Parameters.PARAM_MODEL_COST_FUNCTION: :class:`dict` (parameter) mapping of each transition in the model to corresponding
+        model cost
+        Parameters.PARAM_SYNC_COST_FUNCTION: :class:`dict` (parameter) mapping of each transition in the model to corresponding
+        synchronous costs
+        Parameters.ACTIVITY_KEY: :class:`str` (parameter) key to use to identify the activity described by the events
+
+    Returns
+    -------
+    dictionary: `dict` with keys **alignment**, **cost**, **visited_states**, **queued_states** and **traversed_arcs**
+    """
+    if parameters is None:
+        parameters = {}
+
+    activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, DEFAULT_NAME_KEY)
+    trace_cost_function = exec_utils.get_param_value(Parameters.PARAM_TRACE_COST_FUNCTION, parameters, None)
+    model_cost_function = exec_utils.get_param_value(Parameters.PARAM_MODEL_COST_FUNCTION, parameters, None)
+    trace_net_constr_function = exec_utils.get_param_value(Parameters.TRACE_NET_CONSTR_FUNCTION, parameters,
+                                                           None)
+    trace_net_cost_aware_constr_function = exec_utils.get_param_value(Parameters.TRACE_NET_COST_AWARE_CONSTR_FUNCTION,
+                                                                      parameters, construct_trace_net_cost_aware)
+
+    if trace_cost_function is None:
+        trace_cost_function = list(
+            map(lambda e: utils.STD_MODEL_LOG_MOVE_COST, trace))
+        parameters[Parameters.PARAM_TRACE_COST_FUNCTION] = trace_cost_function
+
+    if model_cost_function is None:
+        # reset variables value
+        model_cost_function = dict()
+        sync_cost_function = dict()
+        for t in petri_net.transitions:
+            if t.label is not None:
+                model_cost_function[t] = utils.STD_MODEL_LOG_MOVE_COST
+                sync_cost_function[t] = utils.STD_SYNC_COST
+            else:
+                model_cost_function[t] = utils.STD_TAU_COST
+        parameters[Parameters.PARAM_MODEL_COST_FUNCTION] = model_cost_function
+        parameters[Parameters.PARAM_SYNC_COST_FUNCTION] = sync_cost_function
+
+    if trace_net_constr_function is not None:
+        # keep the possibility to pass TRACE_NET_CONSTR_FUNCTION in this old version
+        trace_net, trace_im, trace_fm = trace_net_constr_function(trace, activity_key=activity_key)
+    else:
+        trace_net, trace_im, trace_fm, parameters[
+            Parameters.PARAM_TRACE_NET_COSTS] = trace_net_cost_aware_constr_function(trace,
+                                                                                     trace_cost_function,
+                                                                                     activity_key=activity_key)
+
+    alignment = apply_trace_net(petri_net, initial_marking, final_marking, trace_net, trace_im, trace_fm, parameters)
+
+    return alignment
+
+
+def apply_from_variant(variant, petri_net, initial_marking, final_marking, parameters=None):
+    """
+    Apply the alignments from the specification of a single variant
+
+    Parameters
+    -------------
+    variant
+        Variant (as string delimited by the "variant_delimiter" parameter)
+    petri_net
+        Petri net
+    initial_marking
+        Initial marking
+    final_marking
+        Final marking
+    parameters
+        Parameters of the algorithm (same as 'apply' method, plus 'variant_delimiter' that is , by default)
+
+    Returns
+    ------------
+    dictionary: `dict` with keys **alignment**, **cost**, **visited_states**, **queued_states** and **traversed_arcs**
+    """
+    if parameters is None:
+        parameters = {}
+    trace = variants_util.variant_to_trace(variant, parameters=parameters)
+
+    return apply(trace, petri_net, initial_marking, final_marking, parameters=parameters)
+
+
+def apply_from_variants_dictionary(var_dictio, petri_net, initial_marking, final_marking, parameters=None):
+    """
+    Apply the alignments from the specification of a variants dictionary
+
+    Parameters
+    -------------
+    var_dictio
+        Dictionary of variants (along possibly with their count, or the list of indexes, or the list of involved cases)
+    petri_net
+        Petri net
+    initial_marking
+        Initial marking
+    final_marking
+        Final marking
+    parameters
+        Parameters of the algorithm (same as 'apply' method, plus 'variant_delimiter' that is , by default)
+
+    Returns
+    --------------
+    dictio_alignments
+        Dictionary that assigns to each variant its alignment
+    """
+    if parameters is None:
+        parameters = {}
+    dictio_alignments = {}
+    for variant in var_dictio:
+        dictio_alignments[variant] = apply_from_variant(variant, petri_net, initial_marking, final_marking,
+                                                        parameters=parameters)
+    return dictio_alignments
+
+
+def apply_from_variants_list(var_list, petri_net, initial_marking, final_marking, parameters=None):
+    """
+    Apply the alignments from the specification of a list of variants in the log
+
+    Parameters
+    -------------
+    var_list
+        List of variants (for each item, the first entry is the variant itself, the second entry may be the number of cases)
+    petri_net
+        Petri net
+    initial_marking
+        Initial marking
+    final_marking
+        Final marking
+    parameters
+        Parameters of the algorithm (same as 'apply' method, plus 'variant_delimiter' that is , by default)
+
+    Returns
+    --------------
+    dictio_alignments
+        Dictionary that assigns to each variant its alignment
+    """
+    if parameters is None:
+        parameters = {}
+    start_time = time.time()
+    max_align_time = exec_utils.get_param_value(Parameters.PARAM_MAX_ALIGN_TIME, parameters,
+                                                sys.maxsize)
+    max_align_time_trace = exec_utils.get_param_value(Parameters.PARAM_MAX_ALIGN_TIME_TRACE, parameters,
+                                                      sys.maxsize)
+    dictio_alignments = {}
+    for varitem in var_list:
+        this_max_align_time = min(max_align_time_trace, (max_align_time - (time.time() - start_time)) * 0.5)
+        variant = varitem[0]
+        parameters[Parameters.PARAM_MAX_ALIGN_TIME_TRACE] = this_max_align_time
+        dictio_alignments[variant] = apply_from_variant(variant, petri_net, initial_marking, final_marking,
+                                                        parameters=parameters)
+    return dictio_alignments
+
+
+def apply_from_variants_list_petri_string(var_list, petri_net_string, parameters=None):
+    """
+    Apply the alignments from the specification of a list of variants in the log
+
+    Parameters
+    -------------
+    var_list
+        List of variants (for each item, the first entry is the variant itself, the second entry may be the number of cases)
+    petri_net_string
+        String representing the accepting Petri net
+
+    Returns
+    --------------
+    dictio_alignments
+        Dictionary that assigns to each variant its alignment
+    """
+    if parameters is None:
+        parameters = {}
+
+    from pm4py.objects.petri_net.importer.variants import pnml as petri_importer
+
+    petri_net, initial_marking, final_marking = petri_importer.import_petri_from_string(petri_net_string)
+
+    res = apply_from_variants_list(var_list, petri_net, initial_marking, final_marking, parameters=parameters)
+    return res
+
+
+def apply_from_variants_list_petri_string_mprocessing(mp_output, var_list, petri_net_string, parameters=None):
+    """
+    Apply the alignments from the specification of a list of variants in the log
+
+    Parameters
+    -------------
+    mp_output
+        Multiprocessing output
+    var_list
+        List of variants (for each item, the first entry is the variant itself, the second entry may be the number of cases)
+    petri_net_string
+        String representing the accepting Petri net
+
+    Returns
+    --------------
+    dictio_alignments
+        Dictionary that assigns to each variant its alignment
+    """
+    if parameters is None:
+        parameters = {}
+
+    res = apply_from_variants_list_petri_string(var_list, petri_net_string, parameters=parameters)
+    mp_output.put(res)
+
+
+def apply_trace_net(petri_net, initial_marking, final_marking, trace_net, trace_im, trace_fm, parameters=None):
+    """
+        Performs the basic alignment search, given a trace net and a net.
+
+        Parameters
+        ----------
+        trace: :class:`list` input trace, assumed to be a list of events (i.e. the code will use the activity key
+        to get the attributes)
+        petri_net: :class:`pm4py.objects.petri.net.PetriNet` the Petri net to use in the alignment
+        initial_marking: :class:`pm4py.objects.petri.net.Marking` initial marking in the Petri net
+        final_marking: :class:`pm4py.objects.petri.net.Marking` final marking in the Petri net
+        parameters: :class:`dict` (optional) dictionary containing one of the following:
+            Parameters.PARAM_TRACE_COST_FUNCTION: :class:`list` (parameter) mapping of each index of the trace to a positive cost value
+            Parameters.PARAM_MODEL_COST_FUNCTION: :class:`dict` (parameter) mapping of each transition in the model to corresponding
+            model cost
+            Parameters.PARAM_SYNC_COST_FUNCTION: :class:`dict` (parameter) mapping of each transition in the model to corresponding
+            synchronous costs
+            Parameters.ACTIVITY_KEY: :class:`str` (parameter) key to use to identify the activity described by the events
+            Parameters.PARAM_TRACE_NET_COSTS: :class:`dict` (parameter) mapping between transitions and costs
+
+        Returns
+        -------
+        dictionary: `dict` with keys **alignment**, **cost**, **visited_states**, **queued_states** and **traversed_arcs**
+        """
+    if parameters is None:
+        parameters = {}
+
+    ret_tuple_as_trans_desc = exec_utils.get_param_value(Parameters.PARAM_ALIGNMENT_RESULT_IS_SYNC_PROD_AWARE,
+                                                         parameters, False)
+
+    trace_cost_function = exec_utils.get_param_value(Parameters.PARAM_TRACE_COST_FUNCTION, parameters, None)
+    model_cost_function = exec_utils.get_param_value(Parameters.PARAM_MODEL_COST_FUNCTION, parameters, None)
+    sync_cost_function = exec_utils.get_param_value(Parameters.PARAM_SYNC_COST_FUNCTION, parameters, None)
+    trace_net_costs = exec_utils.get_param_value(Parameters.PARAM_TRACE_NET_COSTS, parameters, None)
+
+    if trace_cost_function is None or model_cost_function is None or sync_cost_function is None:
+        sync_prod, sync_initial_marking, sync_final_marking = construct(trace_net, trace_im,
+                                                                        trace_fm, petri_net,
+                                                                        initial_marking,
+                                                                        final_marking,
+                                                                        utils.SKIP)
+        cost_function = utils.construct_standard_cost_function(sync_prod, utils.SKIP)
+    else:
+        revised_sync = dict()
+        for t_trace in trace_net.transitions:
+            for t_model in petri_net.transitions:
+                if t_trace.label == t_model.label:
+                    revised_sync[(t_trace, t_model)] = sync_cost_function[t_model]
+
+        sync_prod, sync_initial_marking, sync_final_marking, cost_function = construct_cost_aware(
+            trace_net, trace_im, trace_fm, petri_net, initial_marking, final_marking, utils.SKIP,
+            trace_net_costs, model_cost_function, revised_sync)
+
+    max_align_time_trace = exec_utils.get_param_value(Parameters.PARAM_MAX_ALIGN_TIME_TRACE, parameters,
+                                                      sys.maxsize)
+
+    alignment = apply_sync_prod(sync_prod, sync_initial_marking, sync_final_marking, cost_function,
+                           utils.SKIP, ret_tuple_as_trans_desc=ret_tuple_as_trans_desc,
+                           max_align_time_trace=max_align_time_trace)
+
+    return_sync_cost = exec_utils.get_param_value(Parameters.RETURN_SYNC_COST_FUNCTION, parameters, False)
+    if return_sync_cost:
+        # needed for the decomposed alignments (switching them from state_equation_less_memory)
+        return alignment, cost_function
+
+    return alignment
+
+
+def apply_sync_prod(sync_prod, initial_marking, final_marking, cost_function, skip, ret_tuple_as_trans_desc=False,
+                    max_align_time_trace=sys.maxsize):
+    """
+    Performs the basic alignment search on top of the synchronous product net, given a cost function and skip-symbol
+
+    Parameters
+    ----------
+    sync_prod: :class:`pm4py.objects.petri.net.PetriNet` synchronous product net
+    initial_marking: :class:`pm4py.objects.petri.net.Marking` initial marking in the synchronous product net
+    final_marking: :class:`pm4py.objects.petri.net.Marking` final marking in the synchronous product net
+    cost_function: :class:`dict` cost function mapping transitions to the synchronous product net
+    skip: :class:`Any` symbol to use for skips in the alignment
+
+    Returns
+    -------
+    dictionary : :class:`dict` with keys **alignment**, **cost**, **visited_states**, **queued_states**
+    and **traversed_arcs**
+    """
+    return __search(sync_prod, initial_marking, final_marking, cost_function, skip,
+                    ret_tuple_as_trans_desc=ret_tuple_as_trans_desc, max_align_time_trace=max_align_time_trace)
+
+
+def __search(sync_net, ini, fin, cost_function, skip, ret_tuple_as_trans_desc=False,
+             max_align_time_trace=sys.maxsize):
+    start_time = time.time()
+
+    incidence_matrix = inc_mat_construct(sync_net)
+    ini_vec, fin_vec, cost_vec = utils.__vectorize_initial_final_cost(incidence_matrix, ini, fin, cost_function)
+    transitions = sorted(incidence_matrix.transitions, key=lambda t: incidence_matrix.transitions[t])
+
+    pre_indptr, pre_indices, pre_weights, post_indptr, post_indices, post_weights = construct_pre_post_csr(
+        sync_net, incidence_matrix=incidence_matrix)
+    # net effect of the firing of each transition, stored as CSR (places / token changes)
+    delta_indptr, delta_indices, delta_values = __get_delta_csr(pre_indptr, pre_indices, pre_weights, post_indptr,
+                                                                post_indices, post_weights)
+    # the transitions with an empty preset are always enabled
+    empty_preset = pre_indptr[1:] == pre_indptr[:-1]
+    allowed = np.array([not (utils.__is_log_move(t, skip) and utils.__is_model_move(t, skip)) for t in transitions],
+                       dtype=bool)
+    reduce_start = np.minimum(pre_indptr[:-1], len(pre_indices))
+
+    a_matrix = np.asmatrix(incidence_matrix.a_matrix).astype(np.float64)
+    g_matrix = -np.eye(len(sync_net.transitions))
+    h_cvx = np.matrix(np.zeros(len(sync_net.transitions))).transpose()
+    trans_costs = [cost_function[t] for t in transitions]
+    cost_vec = [x * 1.0 for x in cost_vec]
+    fin_arr = np.array(fin_vec, dtype=np.int32)
+    fin_key = fin_arr.tobytes()
+
+    use_cvxopt = False
+    if lp_solver.DEFAULT_LP_SOLVER_VARIANT == lp_solver.CVXOPT_SOLVER_CUSTOM_ALIGN or lp_solver.DEFAULT_LP_SOLVER_VARIANT == lp_solver.CVXOPT_SOLVER_CUSTOM_ALIGN_ILP:
+        use_cvxopt = True
+
+    lp_cost_vec = cost_vec
+    if use_cvxopt:
+        # not available in the latest version of PM4Py
+        from cvxopt import matrix
+
+        a_matrix = matrix(a_matrix)
+        g_matrix = matrix(g_matrix)
+        h_cvx = matrix(h_cvx)
+        lp_cost_vec = matrix(cost_vec)
+
+    # for each state (identified by its position in the following lists): the marking (as bytes), the parent
+    # state, the transition that has been fired to reach the state, and the cost of the cheapest path found so far.
+    # every marking is stored once: when a cheaper path to a queued marking is found, its parent is replaced
+    ini_key = np.array(ini_vec, dtype=np.int32).tobytes()
+    markings = [ini_key]
+    parents = [-1]
+    fired = [-1]
+    costs = [0]
+    states = {ini_key: 0}
+    # solution vectors of the marking equation (only for the expanded states)
+    solutions = {}
+
+    h, x = __compute_exact_heuristic(a_matrix, h_cvx, g_matrix, lp_cost_vec, ini_key, fin_arr,
+                                     len(transitions), use_cvxopt=use_cvxopt)
+    solutions[0] = x
+    # each entry of the open set: f, 0 if the heuristic is exact (trusted) otherwise 1, h, counter (insertion order),
+    # g, state.
+    # the entries of a state whose cost has been decreased afterwards are outdated, and skipped when popped
+    counter = 0
+    open_set = [(h, 0, h, counter, 0, 0)]
+    closed = set()
+    visited = 0
+    queued = 0
+    traversed = 0
+    lp_solved = 1
+
+    while open_set:
+        if (time.time() - start_time) > max_align_time_trace:
+            return None
+
+        f, untrusted, h, _, g, state = heapq.heappop(open_set)
+
+        while untrusted:
+            if (time.time() - start_time) > max_align_time_trace:
+                return None
+
+            if state in closed or g > costs[state]:
+                f, untrusted, h, _, g, state = heapq.heappop(open_set)
+                continue
+
+            h, x = __compute_exact_heuristic(a_matrix, h_cvx, g_matrix, lp_cost_vec, markings[state], fin_arr,
+                                             len(transitions), use_cvxopt=use_cvxopt)
+            lp_solved += 1
+            solutions[state] = x
+            counter += 1
+            f, untrusted, h, _, g, state = heapq.heappushpop(open_set, (g + h, 0, h, counter, g, state))
+
+        # max allowed heuristics value (due to the numerical instability of some of our solvers)
+        if h > lp_solver.MAX_ALLOWED_HEURISTICS:
+            continue
+
+        if state in closed or g > costs[state]:
+            continue
+
+        current_key = markings[state]
+        if h < 0.01 and current_key == fin_key:
+            return __reconstruct_alignment(state, g, parents, fired, transitions, visited, queued, traversed,
+                                           ret_tuple_as_trans_desc=ret_tuple_as_trans_desc, lp_solved=lp_solved)
+
+        closed.add(state)
+        visited += 1
+
+        if state not in solutions:
+            # the solution vector of a trusted state is derived from the one of its parent
+            x = solutions[parents[state]].copy()
+            x[fired[state]] -= 1
+            solutions[state] = x
+        x = solutions[state]
+
+        current_marking = np.frombuffer(current_key, dtype=np.int32)
+        enabled = np.logical_and.reduceat(np.append(current_marking[pre_indices] >= pre_weights, True),
+                                          reduce_start)
+        enabled = (enabled | empty_preset) & allowed
+
+        for t in np.flatnonzero(enabled).tolist():
+            traversed += 1
+            new_marking = current_marking.copy()
+            new_marking[delta_indices[delta_indptr[t]:delta_indptr[t + 1]]] += delta_values[
+                                                                               delta_indptr[t]:delta_indptr[t + 1]]
+            new_key = new_marking.tobytes()
+            new_g = g + trans_costs[t]
+
+            new_state = states.get(new_key)
+            if new_state is None:
+                new_state = len(markings)
+                states[new_key] = new_state
+                markings.append(new_key)
+                parents.append(state)
+                fired.append(t)
+                costs.append(new_g)
+            elif new_state in closed or new_g >= costs[new_state]:
+                # the marking has already been expanded, or it is queued with a path that is not more expensive
+                continue
+            else:
+                parents[new_state] = state
+                fired[new_state] = t
+                costs[new_state] = new_g
+                # the solution vector of the state needs to be derived again from the new parent
+                solutions.pop(new_state, None)
+
+            queued += 1
+            new_h = max(0, h - cost_vec[t])
+            # the parent is trusted, hence the derived solution is trustable if it remains non-negative
+            new_untrusted = 0 if x[t] >= 0.999 else 1
+
+            counter += 1
+            heapq.heappush(open_set, (new_g + new_h, new_untrusted, new_h, counter, new_g, new_state))
+
+
+def __get_delta_csr(pre_indptr, pre_indices, pre_weights, post_indptr, post_indices, post_weights):
+    """
+    Computes the net effect of the firing of each transition (CSR representation)
+    """
+    indptr = [0]
+    indices = []
+    values = []
+    for t in range(len(pre_indptr) - 1):
+        delta = {}
+        for i in range(pre_indptr[t], pre_indptr[t + 1]):
+            delta[int(pre_indices[i])] = delta.get(int(pre_indices[i]), 0) - int(pre_weights[i])
+        for i in range(post_indptr[t], post_indptr[t + 1]):
+            delta[int(post_indices[i])] = delta.get(int(post_indices[i]), 0) + int(post_weights[i])
+        delta = sorted((p, v) for p, v in delta.items() if v != 0)
+        indices.extend(x[0] for x in delta)
+        values.extend(x[1] for x in delta)
+        indptr.append(len(indices))
+    return np.array(indptr, dtype=np.int64), np.array(indices, dtype=np.int64), np.array(values, dtype=np.int32)
+
+
+def __compute_exact_heuristic(a_matrix, h_cvx, g_matrix, cost_vec, marking_key, fin_arr, num_transitions,
+                              use_cvxopt=False):
+    """
+    Computes the exact heuristic (solution of the marking equation) for the given marking (as bytes)
+    """
+    m_vec = np.frombuffer(marking_key, dtype=np.int32)
+    b_term = np.matrix((fin_arr - m_vec).astype(np.float64)).transpose()
+
+    if use_cvxopt:
+        # not available in the latest version of PM4Py
+        from cvxopt import matrix
+
+        b_term = matrix(b_term)
+
+    parameters_solving = {"solver": "glpk"}
+
+    sol = lp_solver.apply(cost_vec, g_matrix, h_cvx, a_matrix, b_term, parameters=parameters_solving,
+                          variant=lp_solver.DEFAULT_LP_SOLVER_VARIANT)
+    prim_obj = lp_solver.get_prim_obj_from_sol(sol, variant=lp_solver.DEFAULT_LP_SOLVER_VARIANT)
+    points = lp_solver.get_points_from_sol(sol, variant=lp_solver.DEFAULT_LP_SOLVER_VARIANT)
+
+    prim_obj = prim_obj if prim_obj is not None else sys.maxsize
+    points = points if points is not None else [0.0] * num_transitions
+
+    return prim_obj, np.array(points, dtype=np.float64)
+
+
+def __reconstruct_alignment(state, cost, parents, fired, transitions, visited, queued, traversed,
+                            ret_tuple_as_trans_desc=False, lp_solved=0):
+    """
+    Reconstructs the alignment from the final state following the parents
+    """
+    trans_seq = []
+    while parents[state] != -1:
+        trans_seq.append(transitions[fired[state]])
+        state = parents[state]
+    trans_seq.reverse()
+
+    if ret_tuple_as_trans_desc:
+        alignment = [(t.name, t.label) for t in trans_seq]
+    else:
+        alignment = [t.label for t in trans_seq]
+
+    return {'alignment': alignment, 'cost': cost, 'visited_states': visited, 'queued_states': queued,
+            'traversed_arcs': traversed, 'lp_solved': lp_solved}
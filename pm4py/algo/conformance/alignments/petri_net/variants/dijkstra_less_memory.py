@@ -41,6 +41,7 @@ class Parameters(Enum):
     PARAMETER_VARIANT_DELIMITER = "variant_delimiter"
     PARAM_ALIGNMENT_RESULT_IS_SYNC_PROD_AWARE = 'ret_tuple_as_trans_desc'
     ACTIVITY_KEY = PARAMETER_CONSTANT_ACTIVITY_KEY
+    PREFIX_CACHE = "prefix_cache"
 
 
 PLACES_DICT = "places_dict"
@@ -330,6 +331,8 @@ def apply(trace: Trace, net: PetriNet, im: Marking, fm: Marking, parameters: Opt
         Parameters.PARAM_MODEL_COST_FUNCTION: :class:`dict` (parameter) mapping of each transition in the model to corresponding
         model cost
         Parameters.ACTIVITY_KEY: :class:`str` (parameter) key to use to identify the activity described by the events
+        Parameters.PREFIX_CACHE: :class:`PrefixCache` (parameter) cache of the search states reached after the prefixes
+        of the traces (shared between the alignments of different traces)
 
     Returns
     -------
@@ -338,6 +341,12 @@ def apply(trace: Trace, net: PetriNet, im: Marking, fm: Marking, parameters: Opt
     if parameters is None:
         parameters = {}
 
+    prefix_cache = exec_utils.get_param_value(Parameters.PREFIX_CACHE, parameters, None)
+    if prefix_cache is not None and exec_utils.get_param_value(Parameters.PARAM_TRACE_COST_FUNCTION, parameters,
+                                                               None) is not None:
+        # the snapshots do not account for trace-specific costs of the moves on log
+        prefix_cache = None
+
     model_struct = __transform_model_to_mem_efficient_structure(net, im, fm, trace, parameters=parameters)
     trace_struct = __transform_trace_to_mem_efficient_structure(trace, model_struct, parameters=parameters)
 
@@ -347,6 +356,17 @@ def apply(trace: Trace, net: PetriNet, im: Marking, fm: Marking, parameters: Opt
     ret_tuple_as_trans_desc = exec_utils.get_param_value(Parameters.PARAM_ALIGNMENT_RESULT_IS_SYNC_PROD_AWARE,
                                                          parameters, False)
 
+    if prefix_cache is not None:
+        activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, DEFAULT_NAME_KEY)
+        prefix_cache.bind(net)
+        trace_labels = [x[activity_key] for x in trace]
+        # the model cost function depends on the activities of the trace (cost of the invisible transitions)
+        cost_function = model_struct[TRANSF_MODEL_COST_FUNCTION]
+        namespace = (sync_cost, tuple(sorted(cost_function.items())))
+        return __dijkstra(model_struct, trace_struct, sync_cost=sync_cost, max_align_time_trace=max_align_time_trace,
+                          ret_tuple_as_trans_desc=ret_tuple_as_trans_desc, prefix_cache=prefix_cache,
+                          cache_namespace=namespace, trace_labels=trace_labels)
+
     return __dijkstra(model_struct, trace_struct, sync_cost=sync_cost, max_align_time_trace=max_align_time_trace,
                       ret_tuple_as_trans_desc=ret_tuple_as_trans_desc)
 
@@ -535,7 +555,7 @@ def __add_to_open_set(open_set, ns):
 
 
 def __dijkstra(model_struct, trace_struct, sync_cost=align_utils.STD_SYNC_COST, max_align_time_trace=sys.maxsize,
-               ret_tuple_as_trans_desc=False):
+               ret_tuple_as_trans_desc=False, prefix_cache=None, cache_namespace=None, trace_labels=None):
     """
     Alignments using Dijkstra
 
@@ -552,6 +572,12 @@ def __dijkstra(model_struct, trace_struct, sync_cost=align_utils.STD_SYNC_COST,
     ret_tuple_as_trans_desc
         Says if the alignments shall be constructed including also
         the name of the transition, or only the label (default=False includes only the label)
+    prefix_cache
+        (if provided) cache of the search states reached after the prefixes of the trace
+    cache_namespace
+        Namespace of the search in the prefix cache
+    trace_labels
+        Activities of the trace (keys of the prefix cache)
 
     Returns
     --------------
@@ -597,10 +623,27 @@ def __dijkstra(model_struct, trace_struct, sync_cost=align_utils.STD_SYNC_COST,
     dummy_count = 0
     visited = 0
 
+    snapshot_depths = []
+    if prefix_cache is not None:
+        cached_depth, snapshot = prefix_cache.lookup(cache_namespace, trace_labels)
+        if snapshot is not None:
+            open_set, closed, marking_dict, dummy_count, visited = snapshot
+            open_set, closed, marking_dict = list(open_set), copy(closed), copy(marking_dict)
+        # the snapshots are taken in ascending order of depth
+        snapshot_depths = prefix_cache.get_snapshot_depths(trace_labels, cached_depth)[::-1]
+
     while not len(open_set) == 0:
         if (time.time() - start_time) > max_align_time_trace:
             return None
         curr = heapq.heappop(open_set)
+        if snapshot_depths and -curr[POSITION_INDEX] >= snapshot_depths[-1]:
+            # no event after the prefix has been consumed yet: the state of the search depends only
+            # on the prefix, and can be reused by the traces sharing it
+            snapshot_open_set = list(open_set)
+            heapq.heappush(snapshot_open_set, curr)
+            prefix_cache.store(cache_namespace, trace_labels[:snapshot_depths[-1]],
+                               (snapshot_open_set, copy(closed), copy(marking_dict), dummy_count, visited))
+            snapshot_depths.pop()
         curr_m0 = curr[POSITION_MARKING]
         curr_m = __decode_marking(curr_m0)
         # if a situation equivalent to the one of the current state has been
@@ -16,10 +16,12 @@
 '''
 import sys
 from enum import Enum
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator, Tuple
 
+import numpy as np
 import pandas as pd
 
+from pm4py.algo.discovery.dfg.adapters.pandas import fused_statistics, eventually_follows
 from pm4py.algo.discovery.dfg.adapters.pandas.df_statistics import get_partial_order_dataframe
 from pm4py.util import exec_utils, constants, xes_constants, pandas_utils
 from pm4py.util import typing
@@ -34,6 +36,163 @@ class Parameters(Enum):
     BUSINESS_HOURS = "business_hours"
     BUSINESS_HOUR_SLOTS = "business_hour_slots"
     WORKCALENDAR = "workcalendar"
+    CHUNK_SIZE = "chunk_size"
+
+
+# default (maximum) number of events of the chunks of cases that are checked together
+DEFAULT_CHUNK_SIZE = 10 ** 6
+
+
+def __iterate_encoded(df: pd.DataFrame, temporal_profile: typing.TemporalProfile, activity_key: str,
+                      timestamp_key: str, start_timestamp_key: Optional[str], case_id_key: str,
+                      zeta: float) -> Iterator[Tuple[Any, str, str, float, float]]:
+    """
+    Checks the conformance of the dataframe using the provided temporal profile, iterating over chunks of
+    couples of events generated on the integer-encoded columns (only the deviations are materialized)
+    """
+    if start_timestamp_key is None:
+        start_timestamp_key = xes_constants.DEFAULT_START_TIMESTAMP_KEY
+
+    encoded_log = fused_statistics.encode_dataframe(df, activity_key=activity_key, case_id_glue=case_id_key,
+                                                    timestamp_key=timestamp_key,
+                                                    start_timestamp_key=start_timestamp_key)
+
+    activities = encoded_log.activities
+    num_activities = len(activities)
+    activities_codes = {act: i for i, act in enumerate(activities)}
+    means = np.full((num_activities, num_activities), np.nan)
+    stds = np.full((num_activities, num_activities), np.nan)
+    for (a, b), (mean, std) in temporal_profile.items():
+        if a in activities_codes and b in activities_codes:
+            means[activities_codes[a], activities_codes[b]] = mean
+            stds[activities_codes[a], activities_codes[b]] = std
+    minimums = means - zeta * stds
+    maximums = means + zeta * stds
+
+    act = encoded_log.activity_codes
+    for sources, targets in eventually_follows.iterate_pairs(encoded_log.case_codes, encoded_log.timestamps,
+                                                             encoded_log.start_timestamps):
+        keep = (act[sources] >= 0) & (act[targets] >= 0)
+        sources = sources[keep]
+        targets = targets[keep]
+        source_acts = act[sources]
+        target_acts = act[targets]
+        flow_times = fused_statistics.get_total_seconds(
+            encoded_log.start_timestamps[targets] - encoded_log.timestamps[sources])
+        deviating = (flow_times < minimums[source_acts, target_acts]) | (
+                flow_times > maximums[source_acts, target_acts])
+        for case, a, b, flow_time in zip(encoded_log.case_codes[sources[deviating]].tolist(),
+                                         source_acts[deviating].tolist(), target_acts[deviating].tolist(),
+                                         flow_times[deviating].tolist()):
+            # the values are returned as Python floats (as in the dataframe-based computation)
+            mean = float(means[a, b])
+            std = float(stds[a, b])
+            this_zeta = abs(flow_time - mean) / std if std > 0 else sys.maxsize
+            yield encoded_log.cases[case], activities[a], activities[b], flow_time, this_zeta
+
+
+def __iterate_business_hours(df: pd.DataFrame, temporal_profile: pd.DataFrame, activity_key: str,
+                             timestamp_key: str, start_timestamp_key: Optional[str], case_id_key: str,
+                             business_hours_slots, workcalendar) -> Iterator[Tuple[Any, str, str, float, float]]:
+    """
+    Checks the conformance of the dataframe using the provided temporal profile (as dataframe), measuring the
+    flow times in business hours
+    """
+    efg = get_partial_order_dataframe(df, activity_key=activity_key, timestamp_key=timestamp_key,
+                                      start_timestamp_key=start_timestamp_key, case_id_glue=case_id_key,
+                                      keep_first_following=False, business_hours=True,
+                                      business_hours_slot=business_hours_slots, workcalendar=workcalendar)
+    efg = efg[[case_id_key, activity_key, activity_key + "_2", "@@flow_time"]]
+    efg = efg.merge(temporal_profile, on=[activity_key, activity_key + "_2"])
+    efg = efg[(efg["@@flow_time"] < efg["@@min"]) | (efg["@@flow_time"] > efg["@@max"])][
+        [case_id_key, activity_key, activity_key + "_2", "@@flow_time", "@@mean", "@@std"]].to_dict("records")
+
+    for el in efg:
+        this_zeta = abs(el["@@flow_time"] - el["@@mean"]) / el["@@std"] if el["@@std"] > 0 else sys.maxsize
+        yield el[case_id_key], el[activity_key], el[activity_key + "_2"], el["@@flow_time"], this_zeta
+
+
+def iterate_deviations(df: pd.DataFrame, temporal_profile: typing.TemporalProfile,
+                       parameters: Optional[Dict[Any, Any]] = None) -> Iterator[Tuple[Any, str, str, float, float]]:
+    """
+    Checks the conformance of the dataframe using the provided temporal profile, yielding the deviations as they
+    are found. The dataframe is processed in chunks of cases (containing at most Parameters.CHUNK_SIZE events,
+    unless a single case is bigger), so only the couples of events of a chunk are considered at once.
+
+    Parameters
+    ---------------
+    df
+        Pandas dataframe
+    temporal_profile
+        Temporal profile
+    parameters
+        Parameters of the algorithm, including:
+         - Parameters.ACTIVITY_KEY => the attribute to use as activity
+         - Parameters.START_TIMESTAMP_KEY => the attribute to use as start timestamp
+         - Parameters.TIMESTAMP_KEY => the attribute to use as timestamp
+         - Parameters.ZETA => multiplier for the standard deviation
+         - Parameters.CASE_ID_KEY => column to use as case identifier
+         - Parameters.BUSINESS_HOURS => measures the flow times in business hours
+         - Parameters.CHUNK_SIZE => maximum number of events of a chunk of cases (default: 10 ** 6)
+
+    Returns
+    ---------------
+    deviations
+        Iterator over the deviations (the deviations of a case are yielded together, with the cases sorted by their
+        identifier). Each deviation is a tuple with five elements:
+        - 1) The case identifier
+        - 2) The source activity of the recorded deviation
+        - 3) The target activity of the recorded deviation
+        - 4) The time passed between the occurrence of the source activity and the target activity
+        - 5) The value of (time passed - mean)/std for this occurrence (zeta).
+    """
+    if parameters is None:
+        parameters = {}
+
+    activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, xes_constants.DEFAULT_NAME_KEY)
+    timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters,
+                                               xes_constants.DEFAULT_TIMESTAMP_KEY)
+    start_timestamp_key = exec_utils.get_param_value(Parameters.START_TIMESTAMP_KEY, parameters, None)
+    case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME)
+    zeta = exec_utils.get_param_value(Parameters.ZETA, parameters, 6.0)
+    chunk_size = exec_utils.get_param_value(Parameters.CHUNK_SIZE, parameters, DEFAULT_CHUNK_SIZE)
+
+    business_hours = exec_utils.get_param_value(Parameters.BUSINESS_HOURS, parameters, False)
+    business_hours_slots = exec_utils.get_param_value(Parameters.BUSINESS_HOUR_SLOTS, parameters, constants.DEFAULT_BUSINESS_HOUR_SLOTS)
+    workcalendar = exec_utils.get_param_value(Parameters.WORKCALENDAR, parameters, constants.DEFAULT_BUSINESS_HOURS_WORKCALENDAR)
+
+    if len(df) == 0:
+        return
+
+    if business_hours:
+        temporal_profile = pandas_utils.instantiate_dataframe([{activity_key: x[0], activity_key + "_2": x[1], "@@min": y[0] - zeta * y[1],
+                                          "@@max": y[0] + zeta * y[1], "@@mean": y[0], "@@std": y[1]} for x, y in
+                                         temporal_profile.items()])
+
+    # only the columns needed by the conformance checking are kept in the chunks
+    columns = df.columns.get_indexer([c for c in dict.fromkeys([case_id_key, activity_key, timestamp_key,
+                                                                 start_timestamp_key,
+                                                                 xes_constants.DEFAULT_START_TIMESTAMP_KEY]) if
+                                      c is not None and c in df.columns])
+
+    # the rows are grouped by case, and the cases (sorted by identifier) are partitioned in chunks
+    case_codes, cases = pd.factorize(df[case_id_key], sort=True)
+    order = np.argsort(case_codes, kind="stable")
+    order = order[case_codes[order] >= 0]
+    case_ends = np.cumsum(np.bincount(case_codes[order], minlength=len(cases)))
+    start = 0
+    while start < len(order):
+        end = int(case_ends[max(np.searchsorted(case_ends, start + chunk_size, side="right") - 1,
+                                np.searchsorted(case_ends, start, side="right"))])
+        chunk = df.iloc[order[start:end], columns]
+        start = end
+        if business_hours:
+            yield from __iterate_business_hours(chunk, temporal_profile, activity_key, timestamp_key,
+                                                start_timestamp_key, case_id_key, business_hours_slots,
+                                                workcalendar)
+        else:
+            yield from __iterate_encoded(chunk, temporal_profile, activity_key, timestamp_key, start_timestamp_key,
+                                         case_id_key, zeta)
 
 
 def apply(df: pd.DataFrame, temporal_profile: typing.TemporalProfile,
@@ -58,6 +217,8 @@ def apply(df: pd.DataFrame, temporal_profile: typing.TemporalProfile,
          - Parameters.TIMESTAMP_KEY => the attribute to use as timestamp
          - Parameters.ZETA => multiplier for the standard deviation
          - Parameters.CASE_ID_KEY => column to use as case identifier
+         - Parameters.BUSINESS_HOURS => measures the flow times in business hours
+         - Parameters.CHUNK_SIZE => maximum number of events of a chunk of cases checked together (default: 10 ** 6)
 
     Returns
     ---------------
@@ -73,35 +234,14 @@ def apply(df: pd.DataFrame, temporal_profile: typing.TemporalProfile,
     if parameters is None:
         parameters = {}
 
-    activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, xes_constants.DEFAULT_NAME_KEY)
-    timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters,
-                                               xes_constants.DEFAULT_TIMESTAMP_KEY)
-    start_timestamp_key = exec_utils.get_param_value(Parameters.START_TIMESTAMP_KEY, parameters, None)
     case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME)
-    zeta = exec_utils.get_param_value(Parameters.ZETA, parameters, 6.0)
-
-    business_hours = exec_utils.get_param_value(Parameters.BUSINESS_HOURS, parameters, False)
-    business_hours_slots = exec_utils.get_param_value(Parameters.BUSINESS_HOUR_SLOTS, parameters, constants.DEFAULT_BUSINESS_HOUR_SLOTS)
-    workcalendar = exec_utils.get_param_value(Parameters.WORKCALENDAR, parameters, constants.DEFAULT_BUSINESS_HOURS_WORKCALENDAR)
-
-    temporal_profile = pandas_utils.instantiate_dataframe([{activity_key: x[0], activity_key + "_2": x[1], "@@min": y[0] - zeta * y[1],
-                                      "@@max": y[0] + zeta * y[1], "@@mean": y[0], "@@std": y[1]} for x, y in
-                                     temporal_profile.items()])
 
     cases = pandas_utils.format_unique(df[case_id_key].unique())
+    cases_positions = {c: i for i, c in enumerate(cases)}
     ret = [[] for c in cases]
-    efg = get_partial_order_dataframe(df, activity_key=activity_key, timestamp_key=timestamp_key,
-                                      start_timestamp_key=start_timestamp_key, case_id_glue=case_id_key,
-                                      keep_first_following=False, business_hours=business_hours,
-                                      business_hours_slot=business_hours_slots, workcalendar=workcalendar)
-    efg = efg[[case_id_key, activity_key, activity_key + "_2", "@@flow_time"]]
-    efg = efg.merge(temporal_profile, on=[activity_key, activity_key + "_2"])
-    efg = efg[(efg["@@flow_time"] < efg["@@min"]) | (efg["@@flow_time"] > efg["@@max"])][
-        [case_id_key, activity_key, activity_key + "_2", "@@flow_time", "@@mean", "@@std"]].to_dict("records")
 
-    for el in efg:
-        this_zeta = abs(el["@@flow_time"] - el["@@mean"]) / el["@@std"] if el["@@std"] > 0 else sys.maxsize
-        ret[cases.index(el[case_id_key])].append(
-            (el[activity_key], el[activity_key + "_2"], el["@@flow_time"], this_zeta))
+    for case, source_activity, target_activity, flow_time, this_zeta in iterate_deviations(df, temporal_profile,
+                                                                                           parameters=parameters):
+        ret[cases_positions[case]].append((source_activity, target_activity, flow_time, this_zeta))
 
     return ret
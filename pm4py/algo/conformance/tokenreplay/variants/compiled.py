@@ -0,0 +1,579 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+"""
+Compiled version of the token-based replay.
+
+The Petri net is indexed once into integer structures (presets/postsets of the transitions, transitions associated
+to the activities, shortest paths between places through hidden transitions), and the variants of the log are
+replayed on markings expressed as dictionaries place index -> number of tokens, following exactly the same steps
+as the classic token-based replay (hence returning the same diagnostics).
+Optionally, the variants can be replayed in a process pool.
+
+Differences with the classic variant:
+- the place/transition-level fitness (ENABLE_PLTR_FITNESS), the reduction mode (IS_REDUCTION) and the cleaning
+  of the token flood (CLEANING_TOKEN_FLOOD) are not supported by the compiled engine: in such cases, the classic
+  variant is executed.
+- when several transitions having the same label are enabled at the same time, the first one (in the order of their
+  names) is fired.
+"""
+from collections import Counter
+from enum import Enum
+from types import SimpleNamespace
+from typing import Optional, Dict, Any, Union, List, Tuple
+
+import pandas as pd
+
+from pm4py.algo.conformance.tokenreplay.variants import token_replay
+from pm4py.algo.conformance.tokenreplay.variants.token_replay import TechnicalParameters
+from pm4py.objects.conversion.log import converter as log_converter
+from pm4py.objects.log.obj import EventLog
+from pm4py.objects.petri_net.obj import PetriNet, Marking
+from pm4py.objects.petri_net.utils.petri_utils import get_places_shortest_path_by_hidden
+from pm4py.util import exec_utils, constants, pandas_utils, typing
+from pm4py.util import xes_constants as xes_util
+
+
+class Parameters(Enum):
+    CASE_ID_KEY = constants.PARAMETER_CONSTANT_CASEID_KEY
+    ACTIVITY_KEY = constants.PARAMETER_CONSTANT_ACTIVITY_KEY
+    PARAMETER_VARIANT_DELIMITER = "variant_delimiter"
+    VARIANTS = "variants"
+    PLACES_SHORTEST_PATH_BY_HIDDEN = "places_shortest_path_by_hidden"
+    THREAD_MAX_EX_TIME = "thread_maximum_ex_time"
+    DISABLE_VARIANTS = "disable_variants"
+    CLEANING_TOKEN_FLOOD = "cleaning_token_flood"
+    IS_REDUCTION = "is_reduction"
+    WALK_THROUGH_HIDDEN_TRANS = "walk_through_hidden_trans"
+    RETURN_NAMES = "return_names"
+    STOP_IMMEDIATELY_UNFIT = "stop_immediately_unfit"
+    TRY_TO_REACH_FINAL_MARKING_THROUGH_HIDDEN = "try_to_reach_final_marking_through_hidden"
+    CONSIDER_REMAINING_IN_FITNESS = "consider_remaining_in_fitness"
+    CONSIDER_ACTIVITIES_NOT_IN_MODEL_IN_FITNESS = "consider_activities_not_in_model_in_fitness"
+    ENABLE_PLTR_FITNESS = "enable_pltr_fitness"
+    SHOW_PROGRESS_BAR = "show_progress_bar"
+    MULTIPROCESSING = "multiprocessing"
+    CORES = "cores"
+
+
+class CompiledNet(object):
+    """
+    Integer-indexed representation of an accepting Petri net, used by the compiled token-based replay.
+    The places are indexed in the order of their names, the transitions in the order of the transitions set of the net.
+    """
+
+    def __init__(self, net: PetriNet, initial_marking: Marking, final_marking: Marking,
+                 places_shortest_path_by_hidden: Dict[Any, Dict[Any, List[Any]]]):
+        places = sorted(net.places, key=lambda x: x.name)
+        transitions = list(net.transitions)
+        p_idx = {p: i for i, p in enumerate(places)}
+        t_idx = {t: i for i, t in enumerate(transitions)}
+
+        # the order of the arcs is kept, since it determines the order of the places in the markings
+        self.pre = [tuple((p_idx[a.source], a.weight) for a in t.in_arcs) for t in transitions]
+        self.post = [tuple((p_idx[a.target], a.weight) for a in t.out_arcs) for t in transitions]
+        self.consumed = [sum(x[1] for x in pre) for pre in self.pre]
+        self.produced = [sum(x[1] for x in post) for post in self.post]
+        self.invisible = [t.label is None for t in transitions]
+
+        # transitions consuming tokens from each place, and transitions with an empty preset
+        self.consumers = [[] for _ in places]
+        for i in range(len(transitions)):
+            for p, w in self.pre[i]:
+                self.consumers[p].append(i)
+        self.empty_preset = [i for i in range(len(transitions)) if not self.pre[i]]
+
+        # as in the classic variant, the transition associated to a label is the last one in the order of the names
+        self.trans_map = {}
+        for t in sorted(transitions, key=lambda x: x.name):
+            self.trans_map[t.label] = t_idx[t]
+        labels_count = Counter(t.label for t in transitions)
+        self.trans_by_label = {}
+        for t in sorted(transitions, key=lambda x: x.name):
+            if labels_count[t.label] > 1:
+                if t.label not in self.trans_by_label:
+                    self.trans_by_label[t.label] = []
+                self.trans_by_label[t.label].append(t_idx[t])
+
+        # rank of the transitions in the order (name, id) used to explore the visible transitions enabled
+        # by the reached marking
+        name_order = sorted(range(len(transitions)), key=lambda i: (str(transitions[i].name), id(transitions[i])))
+        self.name_rank = [0] * len(transitions)
+        for rank, i in enumerate(name_order):
+            self.name_rank[i] = rank
+
+        self.im = {p_idx[p]: initial_marking[p] for p in initial_marking}
+        self.fm = {p_idx[p]: final_marking[p] for p in final_marking}
+        self.fm_sorted = sorted(self.fm)
+
+        self.spaths = {}
+        for p1 in places_shortest_path_by_hidden:
+            self.spaths[p_idx[p1]] = {p_idx[p2]: tuple(t_idx[t] for t in path) for p2, path in
+                                      places_shortest_path_by_hidden[p1].items()}
+
+        self.places = places
+        self.transitions = transitions
+
+    def __getstate__(self):
+        # the Petri net objects are not needed by the workers
+        state = dict(self.__dict__)
+        state["places"] = None
+        state["transitions"] = None
+        return state
+
+
+def __is_enabled(cnet, t, marking):
+    for p, w in cnet.pre[t]:
+        if marking.get(p, 0) < w:
+            return False
+    return True
+
+
+def __execute(cnet, t, marking):
+    m = dict(marking)
+    for p, w in cnet.pre[t]:
+        m[p] -= w
+        if m[p] == 0:
+            del m[p]
+    for p, w in cnet.post[t]:
+        m[p] = m.get(p, 0) + w
+    return m
+
+
+def __enabled_transitions_by_name(cnet, marking):
+    candidates = set(cnet.empty_preset)
+    for p in marking:
+        candidates.update(cnet.consumers[p])
+    return sorted((t for t in candidates if __is_enabled(cnet, t, marking)), key=lambda t: cnet.name_rank[t])
+
+
+def __get_paths_to_places(cnet, marking, target_places):
+    paths = []
+    for p1 in sorted(marking):
+        if p1 in cnet.spaths:
+            spaths_p1 = cnet.spaths[p1]
+            for p2 in target_places:
+                if p2 in spaths_p1:
+                    paths.append(spaths_p1[p2])
+    return sorted(paths, key=lambda x: len(x))
+
+
+def __enable_hidden_transitions(cnet, marking, act_tr, visit_trans, hidden_transitions_to_enable, t):
+    j_indexes = [0] * len(hidden_transitions_to_enable)
+    for z in range(10000000):
+        something_changed = False
+        zz = z % len(hidden_transitions_to_enable)
+        for k in range(j_indexes[zz], len(hidden_transitions_to_enable[zz])):
+            t3 = hidden_transitions_to_enable[zz][j_indexes[zz]]
+            if not t3 == t:
+                if __is_enabled(cnet, t3, marking):
+                    if t3 not in visit_trans:
+                        marking = __execute(cnet, t3, marking)
+                        act_tr.append(t3)
+                        visit_trans.add(t3)
+                        something_changed = True
+            j_indexes[zz] = j_indexes[zz] + 1
+            if __is_enabled(cnet, t, marking):
+                break
+        if __is_enabled(cnet, t, marking):
+            break
+        if not something_changed:
+            break
+    return marking
+
+
+def __apply_hidden_trans(cnet, t, marking, act_tr, rec_depth, visit_trans):
+    if rec_depth >= TechnicalParameters.MAX_REC_DEPTH_HIDTRANSENABL.value or t in visit_trans:
+        return marking
+    visit_trans.add(t)
+    marking_at_start = marking
+    places_with_missing = sorted(p for p, w in cnet.pre[t] if marking.get(p, 0) < w)
+    hidden_transitions_to_enable = __get_paths_to_places(cnet, marking, places_with_missing)
+
+    if hidden_transitions_to_enable:
+        marking = __enable_hidden_transitions(cnet, marking, act_tr, visit_trans, hidden_transitions_to_enable, t)
+        if not __is_enabled(cnet, t, marking):
+            hidden_transitions_to_enable = __get_paths_to_places(cnet, marking, places_with_missing)
+            for z in range(len(hidden_transitions_to_enable)):
+                for k in range(len(hidden_transitions_to_enable[z])):
+                    t4 = hidden_transitions_to_enable[z][k]
+                    if not t4 == t:
+                        if t4 not in visit_trans:
+                            if not __is_enabled(cnet, t4, marking):
+                                marking = __apply_hidden_trans(cnet, t4, marking, act_tr, rec_depth + 1,
+                                                               visit_trans)
+                            if __is_enabled(cnet, t4, marking):
+                                marking = __execute(cnet, t4, marking)
+                                act_tr.append(t4)
+                                visit_trans.add(t4)
+        if not __is_enabled(cnet, t, marking):
+            if not (marking_at_start == marking):
+                marking = __apply_hidden_trans(cnet, t, marking, act_tr, rec_depth + 1, visit_trans)
+
+    return marking
+
+
+def __final_marking_reached(cnet, marking):
+    for p in cnet.fm:
+        if p not in marking:
+            return False
+    return True
+
+
+def __get_visible_transitions_eventually_enabled(cnet, marking):
+    all_enabled_transitions = __enabled_transitions_by_name(cnet, marking)
+    all_enabled_transitions_marking = {t: marking for t in all_enabled_transitions}
+    visible_transitions = []
+    visible_transitions_set = set()
+    visited = set()
+
+    i = 0
+    while i < len(all_enabled_transitions):
+        t = all_enabled_transitions[i]
+        marking_t = all_enabled_transitions_marking[t]
+        key = (t, tuple(sorted(marking_t.items())))
+        if key not in visited:
+            if not cnet.invisible[t]:
+                if t not in visible_transitions_set:
+                    visible_transitions_set.add(t)
+                    visible_transitions.append(t)
+            elif __is_enabled(cnet, t, marking_t):
+                new_marking = __execute(cnet, t, marking_t)
+                for t2 in __enabled_transitions_by_name(cnet, new_marking):
+                    all_enabled_transitions.append(t2)
+                    all_enabled_transitions_marking[t2] = new_marking
+            visited.add(key)
+        i = i + 1
+
+    return visible_transitions
+
+
+def replay_variant(cnet: CompiledNet, activities: Tuple[str, ...], consider_remaining_in_fitness: bool = True,
+                   reach_mark_through_hidden: bool = True, stop_immediately_unfit: bool = False,
+                   walk_through_hidden_trans: bool = True) -> Tuple:
+    """
+    Replays a variant on the compiled Petri net
+
+    Parameters
+    ---------------
+    cnet
+        Compiled Petri net
+    activities
+        Activities of the variant
+    consider_remaining_in_fitness
+        Boolean value telling if the remaining tokens should be considered in fitness evaluation
+    reach_mark_through_hidden
+        Boolean value that decides if we shall try to reach the final marking through hidden transitions
+    stop_immediately_unfit
+        Boolean value that decides if we shall stop immediately when a non-conformance is detected
+    walk_through_hidden_trans
+        Boolean value that decides if we shall walk through hidden transitions in order to enable visible transitions
+
+    Returns
+    ---------------
+    replay_result
+        Tuple containing: is_fit (not considering the activities not in the model), trace_fitness,
+        activated transitions (indexes), transitions with problems (indexes), reached marking (list of couples
+        place index, tokens), visible transitions eventually enabled in the reached marking (indexes), missing,
+        consumed, remaining, produced tokens, and a boolean telling if the variant contains activities not in the model
+    """
+    act_trans = []
+    transitions_with_problems = []
+    marking = dict(cnet.im)
+    missing = 0
+    consumed = 0
+    produced = sum(cnet.im.values())
+    activities_not_in_model = False
+
+    for activity in activities:
+        if activity in cnet.trans_map:
+            t = cnet.trans_map[activity]
+            if activity in cnet.trans_by_label:
+                for t0 in cnet.trans_by_label[activity]:
+                    if __is_enabled(cnet, t0, marking):
+                        t = t0
+                        break
+            if walk_through_hidden_trans and not __is_enabled(cnet, t, marking):
+                new_act_trans = list(act_trans)
+                marking = __apply_hidden_trans(cnet, t, marking, new_act_trans, 0, set())
+                for tt in new_act_trans[len(act_trans):]:
+                    consumed = consumed + cnet.consumed[tt]
+                    produced = produced + cnet.produced[tt]
+                act_trans = new_act_trans
+            if not __is_enabled(cnet, t, marking):
+                transitions_with_problems.append(t)
+                if stop_immediately_unfit:
+                    missing = missing + 1
+                    break
+                # as in the classic variant, the weight of the arc is added to the places with missing tokens
+                marking = dict(marking)
+                for p, w in cnet.pre[t]:
+                    if marking.get(p, 0) < w:
+                        missing = missing + (w - marking.get(p, 0))
+                        marking[p] = marking.get(p, 0) + w
+            consumed = consumed + cnet.consumed[t]
+            produced = produced + cnet.produced[t]
+            marking = __execute(cnet, t, marking)
+            act_trans.append(t)
+        else:
+            activities_not_in_model = True
+
+    if reach_mark_through_hidden:
+        for i in range(TechnicalParameters.MAX_IT_FINAL1.value):
+            if not __final_marking_reached(cnet, marking):
+                for group in __get_paths_to_places(cnet, marking, cnet.fm_sorted):
+                    for t in group:
+                        if __is_enabled(cnet, t, marking):
+                            marking = __execute(cnet, t, marking)
+                            act_trans.append(t)
+                            consumed = consumed + cnet.consumed[t]
+                            produced = produced + cnet.produced[t]
+                    if __final_marking_reached(cnet, marking):
+                        break
+            else:
+                break
+
+        # try to reach the final marking in a different fashion, if not already reached
+        if not __final_marking_reached(cnet, marking):
+            if len(cnet.fm) == 1:
+                sink_place = list(cnet.fm)[0]
+
+                connections_to_sink = []
+                for place in marking:
+                    if place in cnet.spaths and sink_place in cnet.spaths[place]:
+                        connections_to_sink.append(cnet.spaths[place][sink_place])
+                connections_to_sink = sorted(connections_to_sink, key=lambda x: len(x))
+
+                for i in range(TechnicalParameters.MAX_IT_FINAL2.value):
+                    for j in range(len(connections_to_sink)):
+                        for z in range(len(connections_to_sink[j])):
+                            t = connections_to_sink[j][z]
+                            if __is_enabled(cnet, t, marking):
+                                marking = __execute(cnet, t, marking)
+                                act_trans.append(t)
+                                consumed = consumed + cnet.consumed[t]
+                                produced = produced + cnet.produced[t]
+                                continue
+                            else:
+                                break
+
+    reached_marking = list(marking.items())
+
+    diff_fin_mark_mark = 0
+    for p in cnet.fm:
+        diff = cnet.fm[p] - marking.get(p, 0)
+        if diff > 0:
+            diff_fin_mark_mark += diff
+
+    remaining = 0
+    for p in marking:
+        if p in cnet.fm:
+            remaining = remaining + max(0, marking[p] - cnet.fm[p])
+        else:
+            remaining = remaining + marking[p]
+
+    if consider_remaining_in_fitness:
+        is_fit = (missing == 0) and (remaining == 0)
+    else:
+        is_fit = (missing == 0)
+
+    consumed += sum(cnet.fm.values())
+    missing += diff_fin_mark_mark
+
+    if consumed > 0 and produced > 0:
+        trace_fitness = 0.5 * (1.0 - float(missing) / float(consumed)) + 0.5 * (
+                1.0 - float(remaining) / float(produced))
+    else:
+        trace_fitness = 1.0
+
+    visible_transitions = __get_visible_transitions_eventually_enabled(cnet, marking)
+
+    return (is_fit, trace_fitness, act_trans, transitions_with_problems, reached_marking, visible_transitions,
+            missing, consumed, remaining, produced, activities_not_in_model)
+
+
+_WORKER_COMPILED_NET = None
+
+
+def _init_worker(cnet):
+    global _WORKER_COMPILED_NET
+    _WORKER_COMPILED_NET = cnet
+
+
+def _replay_variants_worker(variants, replay_parameters):
+    return [replay_variant(_WORKER_COMPILED_NET, variant, **replay_parameters) for variant in variants]
+
+
+def __to_result(cnet, replay_result, is_fit, return_object_names):
+    t = SimpleNamespace()
+    t.t_fit = is_fit
+    t.t_value = replay_result[1]
+    t.act_trans = [cnet.transitions[i] for i in replay_result[2]]
+    t.trans_probl = [cnet.transitions[i] for i in replay_result[3]]
+    t.reached_marking = Marking()
+    for p, n in replay_result[4]:
+        t.reached_marking[cnet.places[p]] = n
+    t.enabled_trans_in_mark = set()
+    for i in replay_result[5]:
+        t.enabled_trans_in_mark.add(cnet.transitions[i])
+    t.missing, t.consumed, t.remaining, t.produced = replay_result[6:10]
+    return t
+
+
+def apply(log: Union[EventLog, pd.DataFrame], net: PetriNet, initial_marking: Marking, final_marking: Marking, parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> typing.ListAlignments:
+    """
+    Applies the compiled token-based replay
+
+    Parameters
+    -----------
+    log
+        Log
+    net
+        Petri net
+    initial_marking
+        Initial marking
+    final_marking
+        Final marking
+    parameters
+        Parameters of the algorithm (same as the classic token-based replay), including:
+        - Parameters.MULTIPROCESSING => replays the variants in a process pool
+        - Parameters.CORES => number of processes of the pool
+
+    Returns
+    -----------
+    aligned_traces
+        List containing, for each case of the log, the diagnostics of the token-based replay
+    """
+    if parameters is None:
+        parameters = {}
+
+    enable_pltr_fitness = exec_utils.get_param_value(Parameters.ENABLE_PLTR_FITNESS, parameters, False)
+    is_reduction = exec_utils.get_param_value(Parameters.IS_REDUCTION, parameters, False)
+    cleaning_token_flood = exec_utils.get_param_value(Parameters.CLEANING_TOKEN_FLOOD, parameters, False)
+
+    if enable_pltr_fitness or is_reduction or cleaning_token_flood:
+        # not supported by the compiled engine
+        return token_replay.apply(log, net, initial_marking, final_marking, parameters=parameters)
+
+    consider_remaining_in_fitness = exec_utils.get_param_value(Parameters.CONSIDER_REMAINING_IN_FITNESS, parameters,
+                                                               True)
+    try_to_reach_final_marking_through_hidden = exec_utils.get_param_value(
+        Parameters.TRY_TO_REACH_FINAL_MARKING_THROUGH_HIDDEN, parameters, True)
+    stop_immediately_unfit = exec_utils.get_param_value(Parameters.STOP_IMMEDIATELY_UNFIT, parameters, False)
+    walk_through_hidden_trans = exec_utils.get_param_value(Parameters.WALK_THROUGH_HIDDEN_TRANS, parameters, True)
+    return_names = exec_utils.get_param_value(Parameters.RETURN_NAMES, parameters, False)
+    places_shortest_path_by_hidden = exec_utils.get_param_value(Parameters.PLACES_SHORTEST_PATH_BY_HIDDEN, parameters,
+                                                                None)
+    activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, xes_util.DEFAULT_NAME_KEY)
+    consider_activities_not_in_model_in_fitness = exec_utils.get_param_value(
+        Parameters.CONSIDER_ACTIVITIES_NOT_IN_MODEL_IN_FITNESS, parameters, False)
+    show_progress_bar = exec_utils.get_param_value(Parameters.SHOW_PROGRESS_BAR, parameters,
+                                                   constants.SHOW_PROGRESS_BAR)
+    case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME)
+    enable_multiprocessing = exec_utils.get_param_value(Parameters.MULTIPROCESSING, parameters,
+                                                        constants.ENABLE_MULTIPROCESSING_DEFAULT)
+
+    if places_shortest_path_by_hidden is None:
+        places_shortest_path_by_hidden = get_places_shortest_path_by_hidden(net,
+                                                                            TechnicalParameters.MAX_REC_DEPTH.value)
+
+    cnet = CompiledNet(net, initial_marking, final_marking, places_shortest_path_by_hidden)
+
+    if pandas_utils.check_is_pandas_dataframe(log):
+        traces = [tuple(x) for x in log.groupby(case_id_key)[activity_key].agg(list).to_dict().values()]
+    else:
+        log = log_converter.apply(log, variant=log_converter.Variants.TO_EVENT_LOG, parameters=parameters)
+        traces = [tuple(x[activity_key] for x in trace) for trace in log]
+
+    variants = dict()
+    for i, t in enumerate(traces):
+        if t not in variants:
+            variants[t] = list()
+        variants[t].append(i)
+
+    # same order of the classic variant (relevant for the activities not in the model)
+    vc = list(sorted(variants.items(), key=lambda x: (len(x[1]), x[0]), reverse=True))
+    vc_variants = [x[0] for x in vc]
+
+    replay_parameters = {"consider_remaining_in_fitness": consider_remaining_in_fitness,
+                         "reach_mark_through_hidden": try_to_reach_final_marking_through_hidden,
+                         "stop_immediately_unfit": stop_immediately_unfit,
+                         "walk_through_hidden_trans": walk_through_hidden_trans}
+
+    progress = None
+    if show_progress_bar and len(vc) > 1:
+        import importlib.util
+        if importlib.util.find_spec("tqdm"):
+            from tqdm.auto import tqdm
+            progress = tqdm(total=len(vc), desc="replaying log with TBR, completed traces :: ")
+
+    if enable_multiprocessing and len(vc) > 1:
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        num_cores = max(1, exec_utils.get_param_value(Parameters.CORES, parameters, multiprocessing.cpu_count() - 2))
+        chunk_size = max(1, len(vc_variants) // (4 * num_cores))
+        chunks = [vc_variants[i:i + chunk_size] for i in range(0, len(vc_variants), chunk_size)]
+        replay_results = []
+        with ProcessPoolExecutor(max_workers=num_cores, initializer=_init_worker, initargs=(cnet,)) as executor:
+            for chunk_results in executor.map(_replay_variants_worker, chunks, [replay_parameters] * len(chunks)):
+                replay_results.extend(chunk_results)
+                if progress is not None:
+                    progress.update(len(chunk_results))
+    else:
+        replay_results = []
+        for variant in vc_variants:
+            replay_results.append(replay_variant(cnet, variant, **replay_parameters))
+            if progress is not None:
+                progress.update()
+
+    if progress is not None:
+        progress.close()
+    del progress
+
+    aligned_traces = [None] * len(traces)
+    # as in the classic variant, once an activity not in the model is met, the following variants are not fit
+    activities_not_in_model = False
+    for i in range(len(vc)):
+        replay_result = replay_results[i]
+        activities_not_in_model = activities_not_in_model or replay_result[10]
+        is_fit = replay_result[0]
+        if consider_activities_not_in_model_in_fitness and activities_not_in_model:
+            is_fit = False
+        t = __to_result(cnet, replay_result, is_fit, return_names)
+        for case_position in vc[i][1]:
+            aligned_traces[case_position] = token_replay.transcribe_result(t, return_object_names=return_names)
+
+    return aligned_traces
+
+
+def get_diagnostics_dataframe(log: EventLog, tbr_output: typing.ListAlignments, parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> pd.DataFrame:
+    """
+    Gets the results of token-based replay in a dataframe
+
+    Parameters
+    --------------
+    log
+        Event log
+    tbr_output
+        Output of the token-based replay technique
+
+    Returns
+    --------------
+    dataframe
+        Diagnostics dataframe
+    """
+    return token_replay.get_diagnostics_dataframe(log, tbr_output, parameters=parameters)
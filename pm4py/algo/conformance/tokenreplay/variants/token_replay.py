@@ -23,6 +23,7 @@ from copy import copy
 from enum import Enum
 from pm4py.util import exec_utils, constants
 from pm4py.util import variants_util, pandas_utils
+from pm4py.objects.log.util import variant_index
 import importlib.util
 from typing import Optional, Dict, Any, Union
 from pm4py.objects.log.obj import EventLog
@@ -1027,18 +1028,21 @@ def apply_log(log, net, initial_marking, final_marking, enable_pltr_fitness=Fals
         trans_map[t.label] = t
 
     if pandas_utils.check_is_pandas_dataframe(log):
-        traces = [(tuple(x), y) for y, x in log.groupby(case_id_key)[activity_key].agg(list).to_dict().items()]
-        traces = [(traces[i][0], i) for i in range(len(traces))]
+        # reuses the variant index of the dataframe
+        index = variant_index.get_variant_index(log, parameters={variant_index.Parameters.CASE_ID_KEY: case_id_key,
+                                                                 variant_index.Parameters.ACTIVITY_KEY: activity_key})
+        variants = index.get_variants_cases()
+        traces = [index.variants[v] for v in index.case_variants[index.sorted_cases].tolist()]
     else:
         traces = [(tuple(x[activity_key] for x in log[i]), i) for i in range(len(log))]
 
-    variants = dict()
-    for t in traces:
-        if t[0] not in variants:
-            variants[t[0]] = list()
-        variants[t[0]].append(t[1])
+        variants = dict()
+        for t in traces:
+            if t[0] not in variants:
+                variants[t[0]] = list()
+            variants[t[0]].append(t[1])
 
-    traces = [t[0] for t in traces]
+        traces = [t[0] for t in traces]
 
     vc = [(k, v) for k, v in variants.items()]
     vc = list(sorted(vc, key=lambda x: (len(x[1]), x[0]), reverse=True))
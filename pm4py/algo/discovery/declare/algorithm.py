@@ -17,7 +17,7 @@
 
 from pm4py.util import exec_utils
 from enum import Enum
-from pm4py.algo.discovery.declare.variants import classic
+from pm4py.algo.discovery.declare.variants import classic, columnar
 from pm4py.objects.log.obj import EventLog
 import pandas as pd
 from typing import Union, Dict, Optional, Any
@@ -25,9 +25,10 @@ from typing import Union, Dict, Optional, Any
 
 class Variants(Enum):
     CLASSIC = classic
+    COLUMNAR = columnar
 
 
-def apply(log: Union[EventLog, pd.DataFrame], variant=Variants.CLASSIC, parameters: Optional[Dict[Any, Any]] = None) -> Dict[str, Dict[Any, Dict[str, int]]]:
+def apply(log: Union[EventLog, pd.DataFrame], variant=Variants.COLUMNAR, parameters: Optional[Dict[Any, Any]] = None) -> Dict[str, Dict[Any, Dict[str, int]]]:
     """
     Discovers a DECLARE model from the provided event log
 
@@ -38,6 +39,7 @@ def apply(log: Union[EventLog, pd.DataFrame], variant=Variants.CLASSIC, paramete
     variant
         Variant of the algorithm to be used, including:
         - Variants.CLASSIC
+        - Variants.COLUMNAR (default): same model of Variants.CLASSIC, computed on integer-encoded variants
     parameters
         Variant-specific parameters
 
@@ -15,4 +15,4 @@
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
 
-from pm4py.algo.discovery.declare.variants import classic
+from pm4py.algo.discovery.declare.variants import classic, columnar
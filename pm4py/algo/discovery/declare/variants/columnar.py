@@ -0,0 +1,489 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+"""
+Columnar variant of the DECLARE discovery.
+
+The (projected) variants are encoded once in integer arrays and, for every variant, the first/last position and the
+number of occurrences of the activities are computed. The templates are then evaluated for all the couples of
+activities of the variants at once, weighted by the number of occurrences of the variants, and accumulated in
+activity x activity matrices (from which the support and the confidence of all the rules are derived).
+The variants can be sharded among a pool of processes, whose partial matrices are summed.
+
+The discovered model is the same of the classic variant.
+"""
+from collections import Counter
+from enum import Enum
+from itertools import chain
+from typing import Union, Dict, Optional, Any, Tuple, List, Collection
+
+import numpy as np
+import pandas as pd
+
+from pm4py.algo.discovery.declare.templates import *
+from pm4py.objects.log.obj import EventLog
+from pm4py.objects.log.util import variant_index
+from pm4py.util import exec_utils, constants, xes_constants
+
+
+class Parameters(Enum):
+    ACTIVITY_KEY = constants.PARAMETER_CONSTANT_ACTIVITY_KEY
+    CASE_ID_KEY = constants.PARAMETER_CONSTANT_CASEID_KEY
+    CONSIDERED_ACTIVITIES = "considered_activities"
+    MIN_SUPPORT_RATIO = "min_support_ratio"
+    MIN_CONFIDENCE_RATIO = "min_confidence_ratio"
+    AUTO_SELECTION_MULTIPLIER = "auto_selection_multiplier"
+    ALLOWED_TEMPLATES = "allowed_templates"
+    CORES = "cores"
+
+
+# maximum number of couples of (variant, activity) materialized at once
+DEFAULT_MAX_PAIRS = 2 ** 22
+
+# keys of the aggregates
+TRACES = "traces"
+OCCURRENCES = "occurrences"
+EXACTLY_ONE_OCCURRENCES = "exactly_one_occurrences"
+INIT_OCCURRENCES = "init_occurrences"
+CO_OCCURRENCES = "co_occurrences"
+RESPONSE_OCCURRENCES = "response_occurrences"
+PRECEDENCE_OCCURRENCES = "precedence_occurrences"
+SUCCESSION_OCCURRENCES = "succession_occurrences"
+ALTERNATE_OCCURRENCES = "alternate_occurrences"
+CHAIN_OCCURRENCES = "chain_occurrences"
+
+DEFAULT_ALLOWED_TEMPLATES = {EXISTENCE, EXACTLY_ONE, INIT, RESPONDED_EXISTENCE, RESPONSE, PRECEDENCE, SUCCESSION,
+                             ALTRESPONSE, ALTPRECEDENCE, ALTSUCCESSION, CHAINRESPONSE, CHAINPRECEDENCE,
+                             CHAINSUCCESSION, ABSENCE, COEXISTENCE}
+
+
+def get_variants(log: Union[EventLog, pd.DataFrame], parameters: Optional[Dict[Any, Any]] = None) -> Dict[
+    Tuple[Any, ...], int]:
+    """
+    Gets the variants of the log (as tuples of activities), along with their number of occurrences
+
+    Parameters
+    ---------------
+    log
+        Log object (EventLog, Pandas dataframe)
+    parameters
+        Parameters of the algorithm, including:
+        - Parameters.ACTIVITY_KEY
+        - Parameters.CASE_ID_KEY
+
+    Returns
+    ---------------
+    variants
+        Dictionary associating to every variant its number of occurrences
+    """
+    if parameters is None:
+        parameters = {}
+
+    activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, xes_constants.DEFAULT_NAME_KEY)
+    case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME)
+
+    if isinstance(log, pd.DataFrame):
+        return variant_index.get_variant_index(log, parameters={variant_index.Parameters.CASE_ID_KEY: case_id_key,
+                                                                variant_index.Parameters.ACTIVITY_KEY: activity_key}).get_variants_count()
+
+    return Counter(tuple(x[activity_key] for x in trace) for trace in log)
+
+
+def get_aggregates(variants: List[Tuple[int, ...]], counts: List[int], num_activities: int,
+                   max_pairs: int = DEFAULT_MAX_PAIRS) -> Dict[str, np.ndarray]:
+    """
+    Computes the aggregates from which the support and the confidence of the DECLARE rules are derived
+
+    Parameters
+    ---------------
+    variants
+        Variants (as tuples of activity codes)
+    counts
+        Number of occurrences of the variants
+    num_activities
+        Number of activities
+    max_pairs
+        Maximum number of couples of (variant, activity) materialized at once
+
+    Returns
+    ---------------
+    aggregates
+        Dictionary containing (weighted by the number of occurrences of the variants):
+        - TRACES: the number of traces
+        - OCCURRENCES: for every activity, the number of traces containing it
+        - EXACTLY_ONE_OCCURRENCES: for every activity, the number of traces containing it exactly once
+        - INIT_OCCURRENCES: for every activity, the number of traces starting with it
+        - CO_OCCURRENCES: for every (a, b), the number of traces containing both a and b
+        - RESPONSE_OCCURRENCES: for every (a, b), the number of traces in which the last b follows the last a
+        - PRECEDENCE_OCCURRENCES: for every (a, b), the number of traces in which the first a precedes the first b
+        - SUCCESSION_OCCURRENCES: for every (a, b), the number of traces satisfying both the previous conditions
+        - ALTERNATE_OCCURRENCES: for every (a, b), the number of traces in which a and b occur the same number of
+            times, and alternate as a1 < b1 < a2 < b2 < ... < an < bn
+        - CHAIN_OCCURRENCES: for every (a, b), the number of traces in which a and b occur the same number of times,
+            and every occurrence of a is directly followed by an occurrence of b
+    """
+    size = num_activities * num_activities
+    weights = np.asarray(counts, dtype=np.float64)
+    lengths = np.fromiter((len(v) for v in variants), dtype=np.int64, count=len(variants))
+    codes = np.fromiter(chain.from_iterable(variants), dtype=np.int64, count=int(lengths.sum()))
+    variant_starts = np.cumsum(lengths) - lengths
+    event_variants = np.repeat(np.arange(len(variants), dtype=np.int64), lengths)
+    positions = np.arange(len(codes), dtype=np.int64) - np.repeat(variant_starts, lengths)
+
+    occurrences = np.zeros(num_activities)
+    exactly_one = np.zeros(num_activities)
+    init = np.zeros(num_activities)
+    pair_aggregates = {key: np.zeros(size) for key in [CO_OCCURRENCES, RESPONSE_OCCURRENCES, PRECEDENCE_OCCURRENCES,
+                                                        SUCCESSION_OCCURRENCES, ALTERNATE_OCCURRENCES,
+                                                        CHAIN_OCCURRENCES]}
+
+    if len(codes) > 0:
+        non_empty = lengths > 0
+        init = np.bincount(codes[variant_starts[non_empty]], weights=weights[non_empty], minlength=num_activities)
+
+        # groups the events by (variant, activity), keeping the positions sorted inside every group
+        order = np.argsort(event_variants * num_activities + codes, kind="stable")
+        sorted_variants = event_variants[order]
+        sorted_codes = codes[order]
+        sorted_positions = positions[order]
+        boundaries = np.flatnonzero(np.concatenate(([True], (sorted_variants[1:] != sorted_variants[:-1]) | (
+                sorted_codes[1:] != sorted_codes[:-1]), [True])))
+        group_starts = boundaries[:-1]
+        group_sizes = np.diff(boundaries)
+        group_variants = sorted_variants[group_starts]
+        group_activities = sorted_codes[group_starts]
+        group_weights = weights[group_variants]
+        firsts = sorted_positions[group_starts]
+        lasts = sorted_positions[boundaries[1:] - 1]
+
+        occurrences = np.bincount(group_activities, weights=group_weights, minlength=num_activities)
+        is_one = group_sizes == 1
+        exactly_one = np.bincount(group_activities[is_one], weights=group_weights[is_one], minlength=num_activities)
+
+        # the groups of the same variant are contiguous
+        variant_num_groups = np.bincount(group_variants, minlength=len(variants))
+        variant_group_starts = np.cumsum(variant_num_groups) - variant_num_groups
+        num_partners = variant_num_groups[group_variants]
+        cumulative = np.cumsum(num_partners)
+        group_positions = np.arange(len(group_starts), dtype=np.int64)
+
+        start = 0
+        while start < len(group_starts):
+            offset = cumulative[start - 1] if start > 0 else 0
+            end = max(start + 1, int(np.searchsorted(cumulative, offset + max_pairs, side="right")))
+            partners = num_partners[start:end]
+            total = int(partners.sum())
+            sources = np.repeat(group_positions[start:end], partners)
+            ranks = np.arange(total, dtype=np.int64) - np.repeat(np.cumsum(partners) - partners, partners)
+            targets = variant_group_starts[group_variants[sources]] + ranks
+            keep = sources != targets
+            sources = sources[keep]
+            targets = targets[keep]
+            start = end
+
+            pairs = group_activities[sources] * num_activities + group_activities[targets]
+            pair_weights = group_weights[sources]
+            response = lasts[sources] < lasts[targets]
+            precedence = firsts[sources] < firsts[targets]
+            pair_aggregates[CO_OCCURRENCES] += np.bincount(pairs, weights=pair_weights, minlength=size)
+            pair_aggregates[RESPONSE_OCCURRENCES] += np.bincount(pairs[response], weights=pair_weights[response],
+                                                                 minlength=size)
+            pair_aggregates[PRECEDENCE_OCCURRENCES] += np.bincount(pairs[precedence],
+                                                                   weights=pair_weights[precedence], minlength=size)
+            succession = response & precedence
+            pair_aggregates[SUCCESSION_OCCURRENCES] += np.bincount(pairs[succession],
+                                                                   weights=pair_weights[succession], minlength=size)
+
+            # alternate and chain conditions (only for the couples of activities occurring the same number of times)
+            same_size = group_sizes[sources] == group_sizes[targets]
+            single = same_size & (group_sizes[sources] == 1)
+            alternate = single & precedence
+            chained = single & (firsts[targets] == firsts[sources] + 1)
+
+            multiple = np.flatnonzero(same_size & (group_sizes[sources] > 1))
+            if len(multiple) > 0:
+                n = group_sizes[sources[multiple]]
+                couple = np.repeat(np.arange(len(multiple), dtype=np.int64), n)
+                index = np.arange(int(n.sum()), dtype=np.int64) - np.repeat(np.cumsum(n) - n, n)
+                x_starts = group_starts[sources[multiple]][couple]
+                y = sorted_positions[group_starts[targets[multiple]][couple] + index]
+                x = sorted_positions[x_starts + index]
+                is_last = index == n[couple] - 1
+                x_next = sorted_positions[x_starts + np.where(is_last, index, index + 1)]
+                alternate_violations = ~((x < y) & (is_last | (y < x_next)))
+                chain_violations = y != x + 1
+                alternate[multiple] = np.bincount(couple[alternate_violations], minlength=len(multiple)) == 0
+                chained[multiple] = np.bincount(couple[chain_violations], minlength=len(multiple)) == 0
+
+            pair_aggregates[ALTERNATE_OCCURRENCES] += np.bincount(pairs[alternate], weights=pair_weights[alternate],
+                                                                  minlength=size)
+            pair_aggregates[CHAIN_OCCURRENCES] += np.bincount(pairs[chained], weights=pair_weights[chained],
+                                                              minlength=size)
+
+    ret = {TRACES: np.array(int(weights.sum()), dtype=np.int64),
+           OCCURRENCES: np.rint(occurrences).astype(np.int64),
+           EXACTLY_ONE_OCCURRENCES: np.rint(exactly_one).astype(np.int64),
+           INIT_OCCURRENCES: np.rint(init).astype(np.int64)}
+    for key, value in pair_aggregates.items():
+        ret[key] = np.rint(value).astype(np.int64).reshape((num_activities, num_activities))
+    return ret
+
+
+def get_aggregates_sharded(variants: List[Tuple[int, ...]], counts: List[int], num_activities: int,
+                           cores: int = 1) -> Dict[str, np.ndarray]:
+    """
+    Computes the aggregates sharding the variants among a pool of processes (the partial aggregates are summed)
+
+    Parameters
+    ---------------
+    variants
+        Variants (as tuples of activity codes)
+    counts
+        Number of occurrences of the variants
+    num_activities
+        Number of activities
+    cores
+        Number of processes
+
+    Returns
+    ---------------
+    aggregates
+        Aggregates (see get_aggregates)
+    """
+    if cores <= 1 or len(variants) < 2:
+        return get_aggregates(variants, counts, num_activities)
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    # the variants are assigned (from the longest) to the shards in round-robin
+    order = sorted(range(len(variants)), key=lambda i: len(variants[i]), reverse=True)
+    shards = [([variants[i] for i in order[j::cores]], [counts[i] for i in order[j::cores]], num_activities)
+              for j in range(min(cores, len(variants)))]
+
+    ret = None
+    with ProcessPoolExecutor(max_workers=len(shards)) as executor:
+        for aggregates in executor.map(get_aggregates, *zip(*shards)):
+            if ret is None:
+                ret = aggregates
+            else:
+                for key in ret:
+                    ret[key] = ret[key] + aggregates[key]
+    return ret
+
+
+def get_support_confidence(aggregates: Dict[str, np.ndarray], allowed_templates: Optional[Collection[str]] = None) -> \
+        Dict[str, Tuple[np.ndarray, np.ndarray]]:
+    """
+    Derives, for every template, the support and the confidence of its rules from the aggregates
+
+    Parameters
+    ---------------
+    aggregates
+        Aggregates (see get_aggregates)
+    allowed_templates
+        Templates to consider
+
+    Returns
+    ---------------
+    support_confidence
+        Dictionary associating to every template a couple (support, confidence), where support and confidence are
+        arrays (indexed by the activity for the unary templates, and by the couple of activities for the binary
+        templates; the support of the couples (a, a) is set to 0)
+    """
+    if allowed_templates is None:
+        allowed_templates = DEFAULT_ALLOWED_TEMPLATES
+    allowed_templates = set(allowed_templates)
+
+    traces = int(aggregates[TRACES])
+    occurrences = aggregates[OCCURRENCES]
+    num_activities = len(occurrences)
+    co_occurrences = aggregates[CO_OCCURRENCES].copy()
+    np.fill_diagonal(co_occurrences, 0)
+    activated = np.repeat(occurrences.reshape((num_activities, 1)), num_activities, axis=1)
+    np.fill_diagonal(activated, 0)
+    coexistence_support = activated + activated.T - co_occurrences
+    np.fill_diagonal(coexistence_support, 0)
+
+    def __response(key: str) -> Tuple[np.ndarray, np.ndarray]:
+        return activated, aggregates[key]
+
+    def __precedence(key: str) -> Tuple[np.ndarray, np.ndarray]:
+        return co_occurrences, aggregates[key]
+
+    all_traces = np.full(num_activities, traces, dtype=np.int64)
+    templates = [(EXISTENCE, set(), lambda: (all_traces, occurrences)),
+                 (EXACTLY_ONE, set(), lambda: (occurrences, aggregates[EXACTLY_ONE_OCCURRENCES])),
+                 (INIT, set(), lambda: (all_traces, aggregates[INIT_OCCURRENCES])),
+                 (RESPONDED_EXISTENCE, set(), lambda: __response(CO_OCCURRENCES)),
+                 (RESPONSE, set(), lambda: __response(RESPONSE_OCCURRENCES)),
+                 (PRECEDENCE, set(), lambda: __precedence(PRECEDENCE_OCCURRENCES)),
+                 (SUCCESSION, {RESPONSE, PRECEDENCE}, lambda: __response(SUCCESSION_OCCURRENCES)),
+                 (ALTRESPONSE, set(), lambda: __response(ALTERNATE_OCCURRENCES)),
+                 (ALTPRECEDENCE, set(), lambda: __precedence(ALTERNATE_OCCURRENCES)),
+                 (ALTSUCCESSION, {ALTRESPONSE, ALTPRECEDENCE}, lambda: __response(ALTERNATE_OCCURRENCES)),
+                 (CHAINRESPONSE, set(), lambda: __response(CHAIN_OCCURRENCES)),
+                 (CHAINPRECEDENCE, set(), lambda: __precedence(CHAIN_OCCURRENCES)),
+                 (CHAINSUCCESSION, {CHAINRESPONSE, CHAINPRECEDENCE}, lambda: __response(CHAIN_OCCURRENCES)),
+                 (ABSENCE, {EXISTENCE}, lambda: (all_traces, traces - occurrences)),
+                 (COEXISTENCE, {RESPONDED_EXISTENCE}, lambda: (coexistence_support, co_occurrences)),
+                 (NONCOEXISTENCE, {COEXISTENCE, RESPONDED_EXISTENCE},
+                  lambda: (coexistence_support, coexistence_support - co_occurrences)),
+                 (NONSUCCESSION, {SUCCESSION, RESPONSE, PRECEDENCE},
+                  lambda: (activated, activated - aggregates[SUCCESSION_OCCURRENCES])),
+                 (NONCHAINSUCCESSION, {CHAINSUCCESSION, CHAINRESPONSE, CHAINPRECEDENCE},
+                  lambda: (activated, activated - aggregates[CHAIN_OCCURRENCES]))]
+
+    ret = {}
+    for template, requirements, function in templates:
+        if template in allowed_templates and requirements.issubset(allowed_templates):
+            support, confidence = function()
+            if support.ndim == 2:
+                confidence = np.where(support > 0, confidence, 0)
+            ret[template] = (support, confidence)
+    return ret
+
+
+def __get_rule_key(activities: List[Any], index: Tuple[int, ...]) -> Any:
+    if len(index) == 1:
+        return activities[index[0]]
+    act, act2 = activities[index[0]], activities[index[1]]
+    if act2 is None or pd.isna(act2) or not act2:
+        return act
+    return (act, act2)
+
+
+def get_rules(support_confidence: Dict[str, Tuple[np.ndarray, np.ndarray]], traces: int, activities: List[Any],
+              parameters: Optional[Dict[Any, Any]] = None) -> Dict[str, Dict[Any, Dict[str, int]]]:
+    """
+    Selects the rules satisfying the thresholds on the support and on the confidence
+
+    Parameters
+    ---------------
+    support_confidence
+        Support and confidence of the rules, for every template (see get_support_confidence)
+    traces
+        Number of traces of the log
+    activities
+        Activities (indexed by their code)
+    parameters
+        Parameters of the algorithm, including:
+        - Parameters.MIN_SUPPORT_RATIO
+        - Parameters.MIN_CONFIDENCE_RATIO
+        - Parameters.AUTO_SELECTION_MULTIPLIER
+
+    Returns
+    ---------------
+    declare_model
+        DECLARE model (as Python dictionary), where each template is associated with its own rules
+    """
+    if parameters is None:
+        parameters = {}
+
+    min_support_ratio = exec_utils.get_param_value(Parameters.MIN_SUPPORT_RATIO, parameters, None)
+    min_confidence_ratio = exec_utils.get_param_value(Parameters.MIN_CONFIDENCE_RATIO, parameters, None)
+    rules = {}
+
+    if traces == 0:
+        return rules
+
+    if min_support_ratio is None and min_confidence_ratio is None:
+        # auto determine the minimum support and confidence ratio by identifying the values for the best rule
+        # (among the rules having the best product, the one with the greatest column name of the classic variant)
+        auto_selection_multiplier = exec_utils.get_param_value(Parameters.AUTO_SELECTION_MULTIPLIER, parameters, 0.8)
+        best = None
+        for template, (support, confidence) in support_confidence.items():
+            positive = support > 0
+            if not np.any(positive):
+                continue
+            prod = np.full(support.shape, -1.0)
+            prod[positive] = (support[positive].astype(np.float64) / float(traces)) * (
+                    confidence[positive].astype(np.float64) / support[positive].astype(np.float64))
+            max_prod = float(prod.max())
+            for index in zip(*np.nonzero(prod == max_prod)):
+                index = tuple(int(i) for i in index)
+                candidate = ((max_prod, (template,) + tuple(activities[i] for i in index)),
+                             int(support[index]), int(confidence[index]))
+                if best is None or candidate[0] > best[0]:
+                    best = candidate
+        if best is None:
+            return rules
+        min_support_ratio = float(best[1]) / float(traces) * auto_selection_multiplier
+        min_confidence_ratio = float(best[2]) / float(best[1]) * auto_selection_multiplier
+
+    for template, (support, confidence) in support_confidence.items():
+        selected = (support > traces * min_support_ratio) & (support > 0)
+        selected &= confidence > support * min_confidence_ratio
+        for index in zip(*np.nonzero(selected)):
+            index = tuple(int(i) for i in index)
+            if template not in rules:
+                rules[template] = {}
+            rules[template][__get_rule_key(activities, index)] = {"support": int(support[index]),
+                                                                  "confidence": int(confidence[index])}
+
+    return rules
+
+
+def apply(log: Union[EventLog, pd.DataFrame], parameters: Optional[Dict[Any, Any]] = None) -> Dict[
+    str, Dict[Any, Dict[str, int]]]:
+    """
+    Discovers a DECLARE model from the provided event log, evaluating the templates on integer-encoded variants
+
+    Paper:
+    F. M. Maggi, A. J. Mooij and W. M. P. van der Aalst, "User-guided discovery of declarative process models," 2011 IEEE Symposium on Computational Intelligence and Data Mining (CIDM), Paris, France, 2011, pp. 192-199, doi: 10.1109/CIDM.2011.5949297.
+
+    Parameters
+    ---------------
+    log
+        Log object (EventLog, Pandas table)
+    parameters
+        Possible parameters of the algorithm, including:
+        - Parameters.ACTIVITY_KEY
+        - Parameters.CASE_ID_KEY
+        - Parameters.CONSIDERED_ACTIVITIES
+        - Parameters.MIN_SUPPORT_RATIO
+        - Parameters.MIN_CONFIDENCE_RATIO
+        - Parameters.AUTO_SELECTION_MULTIPLIER
+        - Parameters.ALLOWED_TEMPLATES: collection of templates to consider (see the classic variant)
+        - Parameters.CORES: number of processes among which the variants are sharded (default: 1)
+
+    Returns
+    -------------
+    declare_model
+        DECLARE model (as Python dictionary), where each template is associated with its own rules
+    """
+    if parameters is None:
+        parameters = {}
+
+    allowed_templates = exec_utils.get_param_value(Parameters.ALLOWED_TEMPLATES, parameters, None)
+    activities = exec_utils.get_param_value(Parameters.CONSIDERED_ACTIVITIES, parameters, None)
+    cores = exec_utils.get_param_value(Parameters.CORES, parameters, 1)
+
+    variants = get_variants(log, parameters=parameters)
+    if activities is None:
+        activities = set(y for x in variants for y in x)
+    activities = sorted(activities)
+    activities_codes = {act: i for i, act in enumerate(activities)}
+
+    encoded_variants = Counter()
+    for variant, count in variants.items():
+        encoded_variants[tuple(activities_codes[y] for y in variant if y in activities_codes)] += count
+    encoded_variants = list(encoded_variants.items())
+
+    aggregates = get_aggregates_sharded([x[0] for x in encoded_variants], [x[1] for x in encoded_variants],
+                                        len(activities), cores=cores)
+    support_confidence = get_support_confidence(aggregates, allowed_templates=allowed_templates)
+
+    return get_rules(support_confidence, int(aggregates[TRACES]), activities, parameters=parameters)
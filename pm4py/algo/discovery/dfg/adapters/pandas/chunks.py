@@ -0,0 +1,77 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+from enum import Enum
+from typing import Optional, Dict, Any, Iterable, Tuple
+
+import pandas as pd
+
+from pm4py.algo.discovery.dfg.adapters.pandas import mergeable
+from pm4py.util import exec_utils, constants, xes_constants
+
+
+class Parameters(Enum):
+    ACTIVITY_KEY = constants.PARAMETER_CONSTANT_ACTIVITY_KEY
+    TIMESTAMP_KEY = constants.PARAMETER_CONSTANT_TIMESTAMP_KEY
+    CASE_ID_KEY = constants.PARAMETER_CONSTANT_CASEID_KEY
+
+
+def apply(chunks: Iterable[pd.DataFrame], parameters: Optional[Dict[Any, Any]] = None) -> Tuple[
+    Dict[Tuple[str, str], int], Dict[str, int], Dict[str, int], Dict[str, int]]:
+    """
+    Computes incrementally the frequency DFG, the start/end activities and the number of occurrences of the activities
+    from a sequence of dataframes (e.g., the chunks returned by pm4py.read_xes(..., chunk_size=...)).
+    Only one chunk at a time is kept in memory.
+
+    The events of a case should be contained in a single chunk (this is guaranteed by the chunked XES importer).
+
+    Parameters
+    ---------------
+    chunks
+        Iterable of dataframes (or Pyarrow tables)
+    parameters
+        Parameters of the algorithm, including:
+        - Parameters.ACTIVITY_KEY => the attribute to be used as activity
+        - Parameters.TIMESTAMP_KEY => the attribute to be used as timestamp
+        - Parameters.CASE_ID_KEY => the attribute to be used as case identifier
+
+    Returns
+    ---------------
+    dfg
+        Frequency DFG
+    start_activities
+        Start activities
+    end_activities
+        End activities
+    activities
+        Number of occurrences of the activities
+    """
+    if parameters is None:
+        parameters = {}
+
+    activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, xes_constants.DEFAULT_NAME_KEY)
+    timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters,
+                                               xes_constants.DEFAULT_TIMESTAMP_KEY)
+    case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME)
+
+    # every chunk is summarized, and the summaries are merged, one chunk at a time
+    summary = mergeable.apply(chunks, parameters={mergeable.Parameters.ACTIVITY_KEY: activity_key,
+                                                  mergeable.Parameters.TIMESTAMP_KEY: timestamp_key,
+                                                  mergeable.Parameters.CASE_ID_KEY: case_id_key,
+                                                  mergeable.Parameters.INCLUDE_VARIANTS: False,
+                                                  mergeable.Parameters.INCLUDE_PERFORMANCE: False})
+
+    return summary.get_dfg(), summary.get_start_activities(), summary.get_end_activities(), summary.get_activities()
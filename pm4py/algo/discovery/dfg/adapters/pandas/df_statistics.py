@@ -14,8 +14,11 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
+import numpy as np
+
+from pm4py.algo.discovery.dfg.adapters.pandas import fused_statistics, eventually_follows
 from pm4py.util import xes_constants, pandas_utils, constants
-from pm4py.util.business_hours import soj_time_business_hours_diff
+from pm4py.util.business_hours import soj_time_business_hours_diff_vectorized
 
 
 def get_dfg_graph(df, measure="frequency", activity_key="concept:name", case_id_glue="case:concept:name",
@@ -123,8 +126,8 @@ def get_dfg_graph(df, measure="frequency", activity_key="concept:name", case_id_
         if business_hours:
             if business_hours_slot is None:
                 business_hours_slot = constants.DEFAULT_BUSINESS_HOUR_SLOTS
-            df_successive_rows[constants.DEFAULT_FLOW_TIME] = df_successive_rows.apply(
-            lambda x: soj_time_business_hours_diff(x[timestamp_key], x[start_timestamp_key + '_2'], business_hours_slot, workcalendar), axis=1)
+            df_successive_rows[constants.DEFAULT_FLOW_TIME] = soj_time_business_hours_diff_vectorized(
+                df_successive_rows[timestamp_key], df_successive_rows[start_timestamp_key + '_2'], business_hours_slot, workcalendar)
         else:
             difference = df_successive_rows[start_timestamp_key + '_2'] - df_successive_rows[timestamp_key]
             df_successive_rows[constants.DEFAULT_FLOW_TIME] = pandas_utils.get_total_seconds(difference)
@@ -170,6 +173,48 @@ def get_dfg_graph(df, measure="frequency", activity_key="concept:name", case_id_
         return [dfg_frequency, dfg_performance]
 
 
+def __join_eventually_follows(df, timestamp_key, start_timestamp_key, event_index,
+                              max_pairs=eventually_follows.DEFAULT_MAX_PAIRS):
+    """
+    Couples the events of the same case (the case identifier is the index of the dataframe) such that the first
+    event precedes the second (according to the event index) and the complete timestamp of the first event is lower
+    or equal than the start timestamp of the second. Equivalent to the self-join of the dataframe on the case
+    identifier (followed by the filters), but the couples are generated in chunks on the integer-encoded columns.
+    """
+    import pandas as pd
+
+    case_codes = pd.factorize(df.index)[0]
+    # groups the events of the same case, keeping their relative order
+    grouping = np.argsort(case_codes, kind="stable")
+    case_codes = case_codes[grouping]
+    timestamps = fused_statistics.to_nanoseconds(df[timestamp_key])[grouping]
+    start_timestamps = fused_statistics.to_nanoseconds(df[start_timestamp_key])[grouping]
+    order = df[event_index].to_numpy()[grouping]
+    if len(order) < 2 or np.all((order[1:] > order[:-1]) | (case_codes[1:] != case_codes[:-1])):
+        # the events are already sorted by event index inside the cases
+        order = None
+
+    sources = [np.zeros(0, dtype=np.int64)]
+    targets = [np.zeros(0, dtype=np.int64)]
+    for chunk_sources, chunk_targets in eventually_follows.iterate_pairs(case_codes, timestamps, start_timestamps,
+                                                                         order=order, max_pairs=max_pairs):
+        sources.append(grouping[chunk_sources])
+        targets.append(grouping[chunk_targets])
+    sources = np.concatenate(sources)
+    targets = np.concatenate(targets)
+    if np.any(grouping[1:] < grouping[:-1]):
+        # restores the order of the rows of the join
+        join_order = np.lexsort((targets, sources))
+        sources = sources[join_order]
+        targets = targets[join_order]
+
+    left = df.iloc[sources].reset_index()
+    right = df.iloc[targets].reset_index(drop=True)
+    right.columns = [str(col) + "_2" for col in right.columns]
+
+    return pandas_utils.concat([left, right], axis=1)
+
+
 def get_partial_order_dataframe(df, start_timestamp_key=None, timestamp_key="time:timestamp",
                                 case_id_glue="case:concept:name", activity_key="concept:name",
                                 sort_caseid_required=True,
@@ -234,17 +279,13 @@ def get_partial_order_dataframe(df, start_timestamp_key=None, timestamp_key="tim
 
     df = df.set_index(case_id_glue)
 
-    df = df.join(df, rsuffix="_2")
-    df = df[df[event_index] < df[event_index + "_2"]]
-    df = df[df[timestamp_key] <= df[start_timestamp_key + '_2']]
-
-    df = df.reset_index()
+    df = __join_eventually_follows(df, timestamp_key, start_timestamp_key, event_index)
 
     if business_hours:
         if business_hours_slot is None:
             business_hours_slot = constants.DEFAULT_BUSINESS_HOUR_SLOTS
-        df[constants.DEFAULT_FLOW_TIME] = df.apply(
-            lambda x: soj_time_business_hours_diff(x[timestamp_key], x[start_timestamp_key + '_2'], business_hours_slot, workcalendar), axis=1)
+        df[constants.DEFAULT_FLOW_TIME] = soj_time_business_hours_diff_vectorized(
+            df[timestamp_key], df[start_timestamp_key + '_2'], business_hours_slot, workcalendar)
     else:
         df[constants.DEFAULT_FLOW_TIME] = pandas_utils.get_total_seconds(df[start_timestamp_key + "_2"] - df[timestamp_key])
 
@@ -0,0 +1,288 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+"""
+Eventually-follows engine on integer-encoded arrays.
+
+The couples (i, j) of events of the same case, where i precedes j and the complete timestamp of i is lower or equal
+than the start timestamp of j, are either aggregated without being materialized (counts, sums and sums of the squared
+deviations from the mean of the flow times, per couple of activities), or generated in chunks of bounded size.
+"""
+from typing import Optional, Dict, Tuple, Iterator
+
+import numpy as np
+import pandas as pd
+
+from pm4py.algo.discovery.dfg.adapters.pandas import fused_statistics
+from pm4py.util import xes_constants, constants
+
+# maximum number of couples materialized at once
+DEFAULT_MAX_PAIRS = 2 ** 22
+
+
+def get_case_bounds(case_codes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gets, for every event, the position of the first event of its case and the position following the last event
+    of its case (the events of the same case should be contiguous)
+
+    Parameters
+    --------------
+    case_codes
+        Case codes of the events
+
+    Returns
+    --------------
+    case_starts
+        Position of the first event of the case, for every event
+    case_ends
+        Position following the last event of the case, for every event
+    """
+    n = len(case_codes)
+    if n == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    boundaries = np.flatnonzero(np.concatenate(([True], case_codes[1:] != case_codes[:-1], [True])))
+    lengths = np.diff(boundaries)
+    return np.repeat(boundaries[:-1], lengths), np.repeat(boundaries[1:], lengths)
+
+
+def iterate_pairs(case_codes: np.ndarray, timestamps: np.ndarray, start_timestamps: Optional[np.ndarray] = None,
+                  order: Optional[np.ndarray] = None, max_pairs: int = DEFAULT_MAX_PAIRS) -> Iterator[
+    Tuple[np.ndarray, np.ndarray]]:
+    """
+    Iterates, in chunks of bounded size, over the couples (i, j) of events of the same case such that i precedes j
+    and the complete timestamp of i is lower or equal than the start timestamp of j.
+    The couples are generated sorted by i and then by j.
+
+    Parameters
+    --------------
+    case_codes
+        Case codes of the events (the events of the same case should be contiguous)
+    timestamps
+        Complete timestamps of the events (as integers)
+    start_timestamps
+        Start timestamps of the events (if not provided, the complete timestamps are considered)
+    order
+        (if provided) the precedence between the events is established by this array instead of the positions
+    max_pairs
+        Maximum number of couples (before filtering on the timestamps) generated in a chunk
+
+    Returns
+    --------------
+    iterator
+        Iterator over the chunks (positions of the source events, positions of the target events)
+    """
+    if start_timestamps is None:
+        start_timestamps = timestamps
+
+    case_starts, case_ends = get_case_bounds(case_codes)
+    positions = np.arange(len(case_codes), dtype=np.int64)
+
+    if order is None:
+        # the targets are the following events of the same case
+        num_targets = case_ends - positions - 1
+    else:
+        # the targets are all the other events of the same case (filtered on the order)
+        num_targets = case_ends - case_starts - 1
+
+    cumulative = np.cumsum(num_targets)
+    start = 0
+    while start < len(case_codes):
+        # the chunk contains the sources for which the cumulative number of couples does not exceed max_pairs
+        offset = cumulative[start - 1] if start > 0 else 0
+        end = max(start + 1, int(np.searchsorted(cumulative, offset + max_pairs, side="right")))
+        counts = num_targets[start:end]
+        total = int(counts.sum())
+        if total > 0:
+            sources = np.repeat(positions[start:end], counts)
+            ranks = np.arange(total, dtype=np.int64) - np.repeat(np.cumsum(counts) - counts, counts)
+            if order is None:
+                targets = sources + 1 + ranks
+            else:
+                targets = case_starts[sources] + ranks
+                targets = targets + (targets >= sources)
+                keep = order[sources] < order[targets]
+                sources = sources[keep]
+                targets = targets[keep]
+            keep = timestamps[sources] <= start_timestamps[targets]
+            sources = sources[keep]
+            targets = targets[keep]
+            yield sources, targets
+        start = end
+
+
+def __get_aggregates_prefix(encoded_log: fused_statistics.EncodedLog, relative_times: np.ndarray) -> Tuple[
+    np.ndarray, np.ndarray, np.ndarray]:
+    # for every activity a, the (exclusive) prefix count/sum/sum of squares of the times of its occurrences in the
+    # case is computed for every event, and the contributions are then accumulated on the activity of the event.
+    # The times of the occurrences of a are taken relative to the first occurrence of a in the case, and the squared
+    # deviations are computed around the mean of the prefix, to avoid the cancellation of large terms
+    num_activities = len(encoded_log.activities)
+    act = encoded_log.activity_codes
+    case_codes = encoded_log.case_codes
+    counts = np.zeros((num_activities, num_activities), dtype=np.int64)
+    sums = np.zeros((num_activities, num_activities))
+    squared_deviations = np.zeros((num_activities, num_activities))
+    valid = act >= 0
+    for a in range(num_activities):
+        is_a = act == a
+        references = pd.Series(np.where(is_a, relative_times, np.nan)).groupby(case_codes, sort=False).transform(
+            "first").fillna(0.0).to_numpy()
+        shifted = relative_times - references
+        is_a = is_a.astype(np.float64)
+        prefix = pd.DataFrame({"c": is_a, "s": is_a * shifted, "q": is_a * shifted * shifted}).groupby(
+            case_codes, sort=False).cumsum().to_numpy()
+        prefix_count = prefix[:, 0] - is_a
+        prefix_sum = prefix[:, 1] - is_a * shifted
+        prefix_squares = prefix[:, 2] - is_a * shifted * shifted
+        counts[a] = np.round(np.bincount(act[valid], weights=prefix_count[valid], minlength=num_activities)).astype(
+            np.int64)
+        sums[a] = np.bincount(act[valid], weights=(prefix_count * shifted - prefix_sum)[valid],
+                              minlength=num_activities)
+        # second step: deviations of the flow times from the mean of the couple of activities
+        means = sums[a] / np.maximum(counts[a], 1)
+        has_prefix = valid & (prefix_count > 0)
+        prefix_count = prefix_count[has_prefix]
+        prefix_mean = prefix_sum[has_prefix] / prefix_count
+        prefix_deviations = np.maximum(prefix_squares[has_prefix] - prefix_sum[has_prefix] * prefix_mean, 0.0)
+        deviations = shifted[has_prefix] - prefix_mean - means[act[has_prefix]]
+        squared_deviations[a] = np.bincount(act[has_prefix],
+                                            weights=prefix_count * deviations * deviations + prefix_deviations,
+                                            minlength=num_activities)
+    return counts, sums, squared_deviations
+
+
+def __get_aggregates_pairs(encoded_log: fused_statistics.EncodedLog, max_pairs: int) -> Tuple[
+    np.ndarray, np.ndarray, np.ndarray]:
+    num_activities = len(encoded_log.activities)
+    size = num_activities * num_activities
+    act = encoded_log.activity_codes
+    counts = np.zeros(size, dtype=np.int64)
+    sums = np.zeros(size)
+    squared_deviations = np.zeros(size)
+    for sources, targets in iterate_pairs(encoded_log.case_codes, encoded_log.timestamps,
+                                          encoded_log.start_timestamps, max_pairs=max_pairs):
+        keep = (act[sources] >= 0) & (act[targets] >= 0)
+        sources = sources[keep]
+        targets = targets[keep]
+        pairs = act[sources] * num_activities + act[targets]
+        flow_times = fused_statistics.get_total_seconds(
+            encoded_log.start_timestamps[targets] - encoded_log.timestamps[sources])
+        chunk_counts = np.bincount(pairs, minlength=size)
+        chunk_sums = np.bincount(pairs, weights=flow_times, minlength=size)
+        chunk_means = chunk_sums / np.maximum(chunk_counts, 1)
+        deviations = flow_times - chunk_means[pairs]
+        chunk_squared_deviations = np.bincount(pairs, weights=deviations * deviations, minlength=size)
+        # the moments of the chunk are merged with the ones of the previous chunks (Chan et al.)
+        total_counts = counts + chunk_counts
+        delta = chunk_means - sums / np.maximum(counts, 1)
+        squared_deviations += chunk_squared_deviations + delta * delta * counts * chunk_counts / np.maximum(
+            total_counts, 1)
+        counts = total_counts
+        sums += chunk_sums
+    return counts.reshape((num_activities, num_activities)), sums.reshape(
+        (num_activities, num_activities)), squared_deviations.reshape((num_activities, num_activities))
+
+
+def get_aggregates(df: pd.DataFrame, activity_key: str = xes_constants.DEFAULT_NAME_KEY,
+                   case_id_glue: str = constants.CASE_CONCEPT_NAME,
+                   timestamp_key: str = xes_constants.DEFAULT_TIMESTAMP_KEY,
+                   start_timestamp_key: Optional[str] = None, max_pairs: int = DEFAULT_MAX_PAIRS) -> Dict[
+    Tuple[str, str], Tuple[int, float, float]]:
+    """
+    Computes, for every couple of activities (a, b), the number of couples of events (of the same case) in which
+    an event of b eventually follows an event of a, along with the sum of the flow times and the sum of their squared
+    deviations from the mean (computed on centered values, to keep the precision when the flow times are large).
+    Provides the same aggregations of the partial order dataframe (get_partial_order_dataframe with
+    keep_first_following=False), without materializing it.
+
+    When the start timestamps coincide with the complete timestamps, the aggregations are computed with prefix sums
+    over the activities (cost proportional to the number of events times the number of activities); otherwise,
+    or when this is cheaper, the couples are generated and aggregated in chunks of bounded size.
+
+    Parameters
+    --------------
+    df
+        Dataframe
+    activity_key
+        Attribute to be used as activity
+    case_id_glue
+        Attribute to be used as case identifier
+    timestamp_key
+        Attribute to be used as complete timestamp
+    start_timestamp_key
+        (optional) Attribute to be used as start timestamp
+    max_pairs
+        Maximum number of couples materialized at once
+
+    Returns
+    --------------
+    aggregates
+        Dictionary associating to every couple of activities a tuple (count, sum of the flow times,
+        sum of the squared deviations of the flow times from their mean)
+    """
+    if start_timestamp_key is None:
+        start_timestamp_key = xes_constants.DEFAULT_START_TIMESTAMP_KEY
+    encoded_log = fused_statistics.encode_dataframe(df, activity_key=activity_key, case_id_glue=case_id_glue,
+                                                    timestamp_key=timestamp_key,
+                                                    start_timestamp_key=start_timestamp_key)
+    if len(encoded_log.activity_codes) == 0:
+        return {}
+
+    case_lengths = np.diff(encoded_log.case_boundaries)
+    num_pairs = int(np.sum(case_lengths * (case_lengths - 1) // 2))
+    num_activities = len(encoded_log.activities)
+
+    if encoded_log.start_timestamps is encoded_log.timestamps and len(
+            encoded_log.activity_codes) * num_activities < num_pairs:
+        # the events are sorted by timestamp inside the case, hence all the couples of events satisfy the condition
+        first_timestamps = np.repeat(encoded_log.timestamps[encoded_log.case_boundaries[:-1]], case_lengths)
+        relative_times = fused_statistics.get_total_seconds(encoded_log.timestamps - first_timestamps)
+        counts, sums, squared_deviations = __get_aggregates_prefix(encoded_log, relative_times)
+    else:
+        counts, sums, squared_deviations = __get_aggregates_pairs(encoded_log, max_pairs)
+
+    activities = encoded_log.activities
+    ret = {}
+    for a, b in zip(*np.nonzero(counts)):
+        ret[(activities[a], activities[b])] = (int(counts[a, b]), float(sums[a, b]),
+                                                   float(squared_deviations[a, b]))
+    return ret
+
+
+def get_mean_std(aggregates: Dict[Tuple[str, str], Tuple[int, float, float]]) -> Dict[
+    Tuple[str, str], Tuple[float, float]]:
+    """
+    Computes the mean and the (sample) standard deviation of the flow times from the aggregates
+    (the standard deviation is 0 if the couple occurs only once)
+
+    Parameters
+    --------------
+    aggregates
+        Aggregates (count, sum, sum of the squared deviations from the mean) for every couple of activities
+
+    Returns
+    --------------
+    mean_std
+        Dictionary associating to every couple of activities a tuple (mean, standard deviation)
+    """
+    ret = {}
+    for pair, (count, total, squared_deviations) in aggregates.items():
+        mean = total / count
+        std = 0.0
+        if count > 1:
+            std = float(np.sqrt(max(0.0, squared_deviations / (count - 1))))
+        ret[pair] = (mean, std)
+    return ret
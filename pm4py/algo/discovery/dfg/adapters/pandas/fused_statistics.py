@@ -0,0 +1,384 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+"""
+Fused computation, on a Pandas dataframe, of the frequency DFG, the performance DFG (all the aggregation measures),
+the start/end activities and the number of occurrences of the activities.
+
+The dataframe is encoded once into integer arrays (activity codes, case codes, timestamps as nanoseconds) sorted
+by case and timestamp, and all the statistics are computed on such arrays with vectorized NumPy operations.
+"""
+from typing import Optional, Dict, Any, Tuple, List
+
+import numpy as np
+import pandas as pd
+
+from pm4py.util import xes_constants, constants
+
+DFG_FREQUENCY = "dfg_frequency"
+DFG_PERFORMANCE = "dfg_performance"
+START_ACTIVITIES = "start_activities"
+END_ACTIVITIES = "end_activities"
+ACTIVITIES = "activities"
+
+PERFORMANCE_MEASURES = ["mean", "median", "max", "min", "sum", "stdev"]
+
+# maximum number of couples of activities for which a dense counting is used
+MAX_DENSE_PAIRS = 2 ** 24
+
+
+class EncodedLog(object):
+    """
+    Integer encoding of the (case, activity, timestamp) columns of a dataframe, sorted by case and timestamp
+    """
+
+    def __init__(self, activities: List[Any], cases: pd.Index, activity_codes: np.ndarray, case_codes: np.ndarray,
+                 timestamps: Optional[np.ndarray], start_timestamps: Optional[np.ndarray],
+                 original_positions: np.ndarray, clamp_start_timestamps: bool = False):
+        self.activities = activities
+        self.cases = cases
+        self.activity_codes = activity_codes
+        self.case_codes = case_codes
+        self.timestamps = timestamps
+        self.start_timestamps = start_timestamps
+        self.original_positions = original_positions
+        # if True, the start timestamp of the target event is considered only when it follows the complete timestamp
+        # of the source event
+        self.clamp_start_timestamps = clamp_start_timestamps
+
+        n = len(case_codes)
+        case_change = np.ones(n + 1, dtype=bool)
+        if n > 1:
+            case_change[1:n] = case_codes[1:] != case_codes[:-1]
+        # positions at which a case starts, and position where the following case starts (or end of the log)
+        self.case_boundaries = np.flatnonzero(case_change)
+        if n == 0:
+            self.case_boundaries = np.zeros(1, dtype=np.int64)
+        # for each couple of successive events, tells if they belong to the same case
+        self.same_case = ~case_change[1:n] if n > 1 else np.zeros(0, dtype=bool)
+
+
+# integer representation of the missing timestamps (NaT) in the arrays returned by to_nanoseconds
+NAT_NANOSECONDS = np.iinfo(np.int64).min
+
+
+def to_nanoseconds(series: pd.Series) -> np.ndarray:
+    """
+    Converts a series of timestamps to an array of integers (nanoseconds since the epoch, in UTC). The missing
+    timestamps are represented by NAT_NANOSECONDS
+    """
+    if not pd.api.types.is_datetime64_any_dtype(series):
+        series = pd.to_datetime(series, utc=True)
+    if getattr(series.dt, "tz", None) is not None:
+        series = series.dt.tz_convert("UTC").dt.tz_localize(None)
+    return series.to_numpy(dtype="datetime64[ns]").view(np.int64)
+
+
+def __missing_last(nanoseconds: np.ndarray) -> np.ndarray:
+    return np.where(nanoseconds == NAT_NANOSECONDS, np.iinfo(np.int64).max, nanoseconds)
+
+
+def encode_dataframe(df: pd.DataFrame, activity_key: str = xes_constants.DEFAULT_NAME_KEY,
+                     case_id_glue: str = constants.CASE_CONCEPT_NAME,
+                     timestamp_key: Optional[str] = xes_constants.DEFAULT_TIMESTAMP_KEY,
+                     start_timestamp_key: Optional[str] = None, sort_caseid_required: bool = True,
+                     sort_timestamp_along_case_id: bool = True) -> EncodedLog:
+    """
+    Encodes a dataframe into integer arrays, sorted by case and timestamp
+
+    Parameters
+    ---------------
+    df
+        Dataframe
+    activity_key
+        Attribute to be used as activity (categorical columns are encoded through their codes)
+    case_id_glue
+        Attribute to be used as case identifier
+    timestamp_key
+        Attribute to be used as (complete) timestamp (if None, the timestamps are not encoded)
+    start_timestamp_key
+        (optional) Attribute to be used as start timestamp (if not provided, the default start timestamp column is
+        used when it is contained in the dataframe, as done by df_statistics.get_dfg_graph)
+    sort_caseid_required
+        Sorts the events by case identifier
+    sort_timestamp_along_case_id
+        Sorts the events of the same case by their timestamps
+
+    Returns
+    ---------------
+    encoded_log
+        Encoded log
+    """
+    if isinstance(df[activity_key].dtype, pd.CategoricalDtype):
+        activity_codes = df[activity_key].cat.codes.to_numpy().astype(np.int64)
+        activities = list(df[activity_key].cat.categories)
+    else:
+        activity_codes, activities = pd.factorize(df[activity_key])
+        activity_codes = activity_codes.astype(np.int64)
+        activities = list(activities)
+
+    case_codes, cases = pd.factorize(df[case_id_glue], sort=True)
+    case_codes = case_codes.astype(np.int64)
+
+    timestamps = to_nanoseconds(df[timestamp_key]) if timestamp_key is not None else None
+    clamp_start_timestamps = start_timestamp_key is not None and start_timestamp_key != timestamp_key
+    if start_timestamp_key is None:
+        start_timestamp_key = xes_constants.DEFAULT_START_TIMESTAMP_KEY
+
+    start_timestamps = timestamps
+    if timestamps is not None and start_timestamp_key != timestamp_key and start_timestamp_key in df.columns:
+        start_timestamps = to_nanoseconds(df[start_timestamp_key])
+
+    # the events without case identifier are not considered (as done by the groupby on the case identifier)
+    rows = np.flatnonzero(case_codes >= 0)
+    if sort_caseid_required:
+        if sort_timestamp_along_case_id and timestamps is not None:
+            # same ordering of sort_values([case_id_glue, start_timestamp_key, timestamp_key]), which is stable and
+            # places the missing timestamps last
+            order = rows[np.lexsort((__missing_last(timestamps[rows]), __missing_last(start_timestamps[rows]),
+                                     case_codes[rows]))]
+        else:
+            order = rows[np.argsort(case_codes[rows], kind="stable")]
+    else:
+        order = rows
+
+    sorted_timestamps = timestamps[order] if timestamps is not None else None
+    # when the start timestamps coincide with the complete timestamps, the same array is shared
+    sorted_start_timestamps = start_timestamps[order] if start_timestamps is not timestamps else sorted_timestamps
+
+    return EncodedLog(activities, cases, activity_codes[order], case_codes[order], sorted_timestamps,
+                      sorted_start_timestamps, order, clamp_start_timestamps=clamp_start_timestamps)
+
+
+def get_total_seconds(nanoseconds: np.ndarray) -> np.ndarray:
+    """
+    Converts an array of time differences (expressed in nanoseconds) to seconds, with the same arithmetic
+    of pandas_utils.get_total_seconds
+    """
+    days, remainder = np.divmod(nanoseconds, 86400 * 10 ** 9)
+    seconds, remainder = np.divmod(remainder, 10 ** 9)
+    microseconds, nanoseconds = np.divmod(remainder, 1000)
+    return 86400 * days + seconds + 10 ** -6 * microseconds + 10 ** -9 * nanoseconds
+
+
+def __count(codes: np.ndarray, size: int) -> Tuple[np.ndarray, np.ndarray]:
+    if size <= MAX_DENSE_PAIRS:
+        counts = np.bincount(codes, minlength=size)
+        keys = np.flatnonzero(counts)
+        return keys, counts[keys]
+    return np.unique(codes, return_counts=True)
+
+
+def __decode_pairs(keys: np.ndarray, values, activities: List[Any], num_activities: int) -> Dict[Tuple[Any, Any], Any]:
+    sources = (keys // num_activities).tolist()
+    targets = (keys % num_activities).tolist()
+    return {(activities[sources[i]], activities[targets[i]]): values[i] for i in range(len(sources))}
+
+
+def __get_groups(pairs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    group_starts = np.flatnonzero(np.concatenate(([True], pairs[1:] != pairs[:-1])))
+    group_ends = np.concatenate((group_starts[1:], [len(pairs)]))
+    return group_starts, group_ends
+
+
+def __get_performance(pairs: np.ndarray, flow_times: np.ndarray, perf_aggregation_key: str,
+                      activities: List[Any], num_activities: int) -> Dict[Tuple[Any, Any], Any]:
+    if len(pairs) == 0:
+        return {}
+
+    if perf_aggregation_key == "raw_values":
+        # the flow times of every couple of activities are kept in their order of occurrence (as the list
+        # aggregation of pandas)
+        order = np.argsort(pairs, kind="stable")
+        pairs = pairs[order]
+        group_starts, _ = __get_groups(pairs)
+        values = [x.tolist() for x in np.split(flow_times[order], group_starts[1:])]
+        return __decode_pairs(pairs[group_starts], values, activities, num_activities)
+
+    # the missing flow times are skipped by the aggregations (as done by pandas); the couples of activities having
+    # only missing flow times are added at the end
+    present = ~np.isnan(flow_times)
+    missing_keys = np.setdiff1d(pairs[~present], pairs[present]) if not np.all(present) else np.zeros(0, np.int64)
+    pairs = pairs[present]
+    flow_times = flow_times[present]
+
+    # sorts the flow times by couple of activities, and then by value
+    order = np.lexsort((flow_times, pairs))
+    pairs = pairs[order]
+    flow_times = flow_times[order]
+    ret = __get_measures(pairs, flow_times, perf_aggregation_key, activities, num_activities) if len(pairs) else {}
+    if len(missing_keys) > 0:
+        empty = {m: (0.0 if m == "sum" else np.nan) for m in PERFORMANCE_MEASURES}
+        values = [dict(empty) if perf_aggregation_key == "all" else empty.get(perf_aggregation_key, np.nan) for _ in
+                  range(len(missing_keys))]
+        ret.update(__decode_pairs(missing_keys, values, activities, num_activities))
+    return ret
+
+
+def __get_measures(pairs: np.ndarray, flow_times: np.ndarray, perf_aggregation_key: str,
+                   activities: List[Any], num_activities: int) -> Dict[Tuple[Any, Any], Any]:
+    # the flow times are sorted by couple of activities, and then by value
+    group_starts, group_ends = __get_groups(pairs)
+    counts = group_ends - group_starts
+    keys = pairs[group_starts]
+
+    measures = {}
+    needed = PERFORMANCE_MEASURES if perf_aggregation_key == "all" else [perf_aggregation_key]
+    sums = np.add.reduceat(flow_times, group_starts)
+    if "sum" in needed:
+        measures["sum"] = sums
+    if "mean" in needed or "stdev" in needed:
+        measures["mean"] = sums / counts
+    if "min" in needed:
+        # the values are sorted inside each group
+        measures["min"] = flow_times[group_starts]
+    if "max" in needed:
+        measures["max"] = flow_times[group_ends - 1]
+    if "median" in needed:
+        measures["median"] = (flow_times[group_starts + (counts - 1) // 2] + flow_times[group_starts + counts // 2]) / 2.0
+    if "stdev" in needed or "std" in needed:
+        deviations = flow_times - np.repeat(measures["mean"], counts)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            variances = np.add.reduceat(deviations * deviations, group_starts) / (counts - 1)
+        variances[counts < 2] = np.nan
+        measures["stdev"] = np.sqrt(variances)
+        measures["std"] = measures["stdev"]
+
+    if perf_aggregation_key == "all":
+        values = [dict(zip(PERFORMANCE_MEASURES, x)) for x in
+                  zip(*[measures[m].tolist() for m in PERFORMANCE_MEASURES])]
+    else:
+        values = measures[perf_aggregation_key].tolist()
+
+    return __decode_pairs(keys, values, activities, num_activities)
+
+
+def apply_encoded(encoded_log: EncodedLog, measure: str = "both", perf_aggregation_key: str = "all",
+                  start_end_in_original_order: bool = True) -> Dict[str, Any]:
+    """
+    Computes the statistics on an encoded log
+
+    Parameters
+    ---------------
+    encoded_log
+        Encoded log
+    measure
+        Measures of the DFG to compute (frequency/performance/both)
+    perf_aggregation_key
+        Performance aggregation measure (mean, median, min, max, sum, stdev, all, raw_values)
+    start_end_in_original_order
+        Computes the start/end activities as the first/last events of the cases in the original order of the dataframe
+        (as done by pm4py.get_start_activities / pm4py.get_end_activities); otherwise, the order sorted by
+        timestamp is considered.
+
+    Returns
+    ---------------
+    statistics
+        Dictionary containing the frequency DFG, the performance DFG, the start activities, the end activities and
+        the number of occurrences of the activities
+    """
+    activities = encoded_log.activities
+    num_activities = max(1, len(activities))
+    act = encoded_log.activity_codes
+    same_case = encoded_log.same_case
+    case_starts = encoded_log.case_boundaries[:-1]
+
+    ret = {}
+
+    # couples of successive events of the same case (events without activity are not considered)
+    valid = same_case & (act[:-1] >= 0) & (act[1:] >= 0)
+    pairs = act[:-1][valid] * num_activities + act[1:][valid]
+
+    if measure in ["frequency", "both"]:
+        keys, counts = __count(pairs, num_activities * num_activities)
+        ret[DFG_FREQUENCY] = __decode_pairs(keys, counts.tolist(), activities, num_activities)
+
+    if measure in ["performance", "both"]:
+        complete = encoded_log.timestamps[:-1][valid]
+        start_next = encoded_log.start_timestamps[1:][valid]
+        missing = (complete == NAT_NANOSECONDS) | (start_next == NAT_NANOSECONDS)
+        if encoded_log.clamp_start_timestamps:
+            # in the arc performance calculation, make sure to consider positive or null values
+            start_next = np.maximum(start_next, complete)
+        flow_times = get_total_seconds(start_next - complete)
+        # the flow times involving a missing timestamp are missing (NaN)
+        flow_times[missing] = np.nan
+        ret[DFG_PERFORMANCE] = __get_performance(pairs, flow_times, perf_aggregation_key, activities, num_activities)
+
+    if len(act) > 0:
+        ranks = encoded_log.original_positions if start_end_in_original_order else np.arange(len(act))
+        # the first/last events having an activity are considered (as done by the first/last aggregations of pandas)
+        with_activity = act >= 0
+        first_ranks = np.minimum.reduceat(np.where(with_activity, ranks, np.iinfo(np.int64).max), case_starts)
+        last_ranks = np.maximum.reduceat(np.where(with_activity, ranks, -1), case_starts)
+        inverse = np.zeros(int(ranks.max()) + 1, dtype=np.int64)
+        inverse[ranks] = np.arange(len(ranks))
+        start_codes = act[inverse[first_ranks[last_ranks >= 0]]]
+        end_codes = act[inverse[last_ranks[last_ranks >= 0]]]
+    else:
+        start_codes = end_codes = act
+
+    for key, codes in [(START_ACTIVITIES, start_codes), (END_ACTIVITIES, end_codes), (ACTIVITIES, act)]:
+        codes = codes[codes >= 0]
+        keys, counts = __count(codes, num_activities)
+        keys = keys.tolist()
+        counts = counts.tolist()
+        ret[key] = {activities[keys[i]]: counts[i] for i in range(len(keys))}
+
+    return ret
+
+
+def apply(df: pd.DataFrame, measure: str = "both", activity_key: str = xes_constants.DEFAULT_NAME_KEY,
+          case_id_glue: str = constants.CASE_CONCEPT_NAME, timestamp_key: str = xes_constants.DEFAULT_TIMESTAMP_KEY,
+          start_timestamp_key: Optional[str] = None, perf_aggregation_key: str = "all",
+          sort_caseid_required: bool = True, sort_timestamp_along_case_id: bool = True) -> Dict[str, Any]:
+    """
+    Computes in a single pass, from a dataframe, the frequency DFG, the performance DFG, the start/end activities
+    and the number of occurrences of the activities
+
+    Parameters
+    ---------------
+    df
+        Dataframe
+    measure
+        Measures of the DFG to compute (frequency/performance/both)
+    activity_key
+        Attribute to be used as activity
+    case_id_glue
+        Attribute to be used as case identifier
+    timestamp_key
+        Attribute to be used as timestamp
+    start_timestamp_key
+        (optional) Attribute to be used as start timestamp
+    perf_aggregation_key
+        Performance aggregation measure (mean, median, min, max, sum, stdev, all, raw_values)
+    sort_caseid_required
+        Sorts the events by case identifier
+    sort_timestamp_along_case_id
+        Sorts the events of the same case by their timestamps
+
+    Returns
+    ---------------
+    statistics
+        Dictionary containing (at the keys DFG_FREQUENCY, DFG_PERFORMANCE, START_ACTIVITIES, END_ACTIVITIES,
+        ACTIVITIES) the frequency DFG, the performance DFG, the start activities, the end activities and
+        the number of occurrences of the activities
+    """
+    encoded_log = encode_dataframe(df, activity_key=activity_key, case_id_glue=case_id_glue,
+                                   timestamp_key=timestamp_key, start_timestamp_key=start_timestamp_key,
+                                   sort_caseid_required=sort_caseid_required,
+                                   sort_timestamp_along_case_id=sort_timestamp_along_case_id)
+    return apply_encoded(encoded_log, measure=measure, perf_aggregation_key=perf_aggregation_key)
@@ -0,0 +1,369 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+"""
+Incremental maintenance of the frequency/performance DFG on an append-only event table.
+
+The accumulator keeps, for every open case, the last activity and the last timestamp, and the aggregates of the
+directly-follows relations (count, sum, min, max, mean and sum of squared deviations, and a quantile sketch
+for the median). Each batch of rows is processed with the vectorized encoding of fused_statistics,
+hence the cost of an update is proportional to the size of the batch, and not to the size of the history.
+"""
+import os
+import pickle
+import tempfile
+from collections import Counter
+from enum import Enum
+from typing import Optional, Dict, Any, Tuple, Iterable
+
+import numpy as np
+import pandas as pd
+
+from pm4py.algo.discovery.dfg.adapters.pandas import fused_statistics
+from pm4py.util import exec_utils, constants, xes_constants
+from pm4py.util.quantile_sketch import QuantileSketch, DEFAULT_RELATIVE_ACCURACY
+
+
+class Parameters(Enum):
+    ACTIVITY_KEY = constants.PARAMETER_CONSTANT_ACTIVITY_KEY
+    TIMESTAMP_KEY = constants.PARAMETER_CONSTANT_TIMESTAMP_KEY
+    CASE_ID_KEY = constants.PARAMETER_CONSTANT_CASEID_KEY
+    RELATIVE_ACCURACY = "relative_accuracy"
+
+
+class IncrementalDfg(object):
+    def __init__(self, parameters: Optional[Dict[Any, Any]] = None):
+        """
+        Initialize the accumulator of the DFG
+
+        Parameters
+        ---------------
+        parameters
+            Parameters of the algorithm, including:
+            - Parameters.ACTIVITY_KEY => the attribute to be used as activity
+            - Parameters.TIMESTAMP_KEY => the attribute to be used as timestamp
+            - Parameters.CASE_ID_KEY => the attribute to be used as case identifier
+            - Parameters.RELATIVE_ACCURACY => relative accuracy of the sketches used for the median (default: 0.01)
+        """
+        if parameters is None:
+            parameters = {}
+
+        self.activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters,
+                                                       xes_constants.DEFAULT_NAME_KEY)
+        self.timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters,
+                                                        xes_constants.DEFAULT_TIMESTAMP_KEY)
+        self.case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME)
+        self.relative_accuracy = exec_utils.get_param_value(Parameters.RELATIVE_ACCURACY, parameters,
+                                                            DEFAULT_RELATIVE_ACCURACY)
+
+        self.activities = []
+        self.activities_codes = {}
+        self.activities_count = np.zeros(0, dtype=np.int64)
+        self.start_activities = Counter()
+        # end activities of the cases that have been closed
+        self.closed_end_activities = Counter()
+        # for every open case, the code of the last activity and the last timestamp (in nanoseconds)
+        self.open_cases: Dict[Any, Tuple[int, int]] = {}
+
+        # aggregates of the directly-follows relations, indexed by the position of the couple in self.pairs
+        self.pairs = []
+        self.pairs_index = {}
+        self.count = np.zeros(0, dtype=np.int64)
+        self.sum = np.zeros(0, dtype=np.float64)
+        self.min = np.zeros(0, dtype=np.float64)
+        self.max = np.zeros(0, dtype=np.float64)
+        self.mean = np.zeros(0, dtype=np.float64)
+        self.m2 = np.zeros(0, dtype=np.float64)
+        self.sketches = []
+
+    def __get_activity_codes(self, activities) -> np.ndarray:
+        codes = np.zeros(len(activities), dtype=np.int64)
+        for i, act in enumerate(activities):
+            if act not in self.activities_codes:
+                self.activities_codes[act] = len(self.activities)
+                self.activities.append(act)
+            codes[i] = self.activities_codes[act]
+        if len(self.activities) > len(self.activities_count):
+            self.activities_count = np.concatenate(
+                (self.activities_count, np.zeros(len(self.activities) - len(self.activities_count), dtype=np.int64)))
+        return codes
+
+    def __get_pairs_indexes(self, sources: np.ndarray, targets: np.ndarray) -> np.ndarray:
+        indexes = np.zeros(len(sources), dtype=np.int64)
+        for i, pair in enumerate(zip(sources.tolist(), targets.tolist())):
+            if pair not in self.pairs_index:
+                self.pairs_index[pair] = len(self.pairs)
+                self.pairs.append(pair)
+                self.sketches.append(QuantileSketch(relative_accuracy=self.relative_accuracy))
+            indexes[i] = self.pairs_index[pair]
+        missing = len(self.pairs) - len(self.count)
+        if missing > 0:
+            # grows the arrays of the aggregates geometrically to keep the updates amortized
+            missing = max(missing, len(self.count))
+            self.count = np.concatenate((self.count, np.zeros(missing, dtype=np.int64)))
+            self.sum = np.concatenate((self.sum, np.zeros(missing)))
+            self.min = np.concatenate((self.min, np.full(missing, np.inf)))
+            self.max = np.concatenate((self.max, np.full(missing, -np.inf)))
+            self.mean = np.concatenate((self.mean, np.zeros(missing)))
+            self.m2 = np.concatenate((self.m2, np.zeros(missing)))
+        return indexes
+
+    def __update_performance(self, pairs: np.ndarray, flow_times: np.ndarray):
+        if len(pairs) == 0:
+            return
+        # groups the flow times by couple of activities (sorting them by value inside each group)
+        order = np.lexsort((flow_times, pairs))
+        pairs = pairs[order]
+        flow_times = flow_times[order]
+        group_starts = np.flatnonzero(np.concatenate(([True], pairs[1:] != pairs[:-1])))
+        group_ends = np.concatenate((group_starts[1:], [len(pairs)]))
+        counts = group_ends - group_starts
+        sums = np.add.reduceat(flow_times, group_starts)
+        means = sums / counts
+        deviations = flow_times - np.repeat(means, counts)
+        m2s = np.add.reduceat(deviations * deviations, group_starts)
+
+        indexes = self.__get_pairs_indexes(pairs[group_starts] // len(self.activities),
+                                           pairs[group_starts] % len(self.activities))
+
+        # combines the mean and the sum of squared deviations with the ones of the history (Chan et al.)
+        old_counts = self.count[indexes]
+        new_counts = old_counts + counts
+        delta = means - self.mean[indexes]
+        self.mean[indexes] += delta * counts / new_counts
+        self.m2[indexes] += m2s + delta * delta * old_counts * counts / new_counts
+        self.count[indexes] = new_counts
+        self.sum[indexes] += sums
+        self.min[indexes] = np.minimum(self.min[indexes], flow_times[group_starts])
+        self.max[indexes] = np.maximum(self.max[indexes], flow_times[group_ends - 1])
+
+        # updates the sketches with the counts of the bins
+        signs, bins = self.sketches[0].get_bins(flow_times)
+        groups = np.repeat(np.arange(len(group_starts)), counts)
+        keys, bin_counts = np.unique(np.stack([groups, signs, bins], axis=1), axis=0, return_counts=True)
+        bin_starts = np.flatnonzero(np.concatenate(([True], keys[1:, 0] != keys[:-1, 0])))
+        bin_ends = np.concatenate((bin_starts[1:], [len(keys)]))
+        for g, s, e in zip(keys[bin_starts, 0].tolist(), bin_starts.tolist(), bin_ends.tolist()):
+            self.sketches[indexes[g]].add_bins(keys[s:e, 1], keys[s:e, 2], bin_counts[s:e],
+                                               float(flow_times[group_starts[g]]),
+                                               float(flow_times[group_ends[g] - 1]))
+
+    def append(self, df: pd.DataFrame) -> "IncrementalDfg":
+        """
+        Updates the DFG with a new batch of events.
+
+        The events of a case contained in the batch are supposed to follow (in time) the events of the same case
+        contained in the previous batches.
+
+        Parameters
+        ---------------
+        df
+            Dataframe containing the new events
+
+        Returns
+        ---------------
+        accumulator
+            The current accumulator
+        """
+        df = df[[self.case_id_key, self.activity_key, self.timestamp_key]]
+        df = df[df[self.case_id_key].notna() & df[self.activity_key].notna()]
+        if len(df) == 0:
+            return self
+
+        encoded_log = fused_statistics.encode_dataframe(df, activity_key=self.activity_key,
+                                                        case_id_glue=self.case_id_key,
+                                                        timestamp_key=self.timestamp_key)
+        act = self.__get_activity_codes(encoded_log.activities)[encoded_log.activity_codes]
+        timestamps = encoded_log.timestamps
+        num_activities = len(self.activities)
+        self.activities_count += np.bincount(act, minlength=num_activities)
+
+        case_starts = encoded_log.case_boundaries[:-1]
+        case_ends = encoded_log.case_boundaries[1:] - 1
+        cases = encoded_log.cases[encoded_log.case_codes[case_starts]].tolist()
+        first_acts = act[case_starts].tolist()
+        first_timestamps = timestamps[case_starts].tolist()
+        last_acts = act[case_ends].tolist()
+        last_timestamps = timestamps[case_ends].tolist()
+
+        # couples between the last event of the open cases and their first event in the batch
+        bridge_sources = []
+        bridge_targets = []
+        bridge_durations = []
+        for i, case in enumerate(cases):
+            state = self.open_cases.get(case)
+            if state is None:
+                self.start_activities[self.activities[first_acts[i]]] += 1
+            else:
+                bridge_sources.append(state[0])
+                bridge_targets.append(first_acts[i])
+                bridge_durations.append(first_timestamps[i] - state[1])
+            self.open_cases[case] = (last_acts[i], last_timestamps[i])
+
+        same_case = encoded_log.same_case
+        sources = np.concatenate((act[:-1][same_case], np.array(bridge_sources, dtype=np.int64)))
+        targets = np.concatenate((act[1:][same_case], np.array(bridge_targets, dtype=np.int64)))
+        durations = np.concatenate((timestamps[1:][same_case] - timestamps[:-1][same_case],
+                                    np.array(bridge_durations, dtype=np.int64)))
+
+        self.__update_performance(sources * num_activities + targets, fused_statistics.get_total_seconds(durations))
+
+        return self
+
+    def close_cases(self, cases: Iterable[Any]):
+        """
+        Closes some cases, releasing their state (their last activity is kept among the end activities).
+        Further events of a closed case are considered as the beginning of a new case.
+
+        Parameters
+        ---------------
+        cases
+            Identifiers of the cases to close
+        """
+        for case in cases:
+            state = self.open_cases.pop(case, None)
+            if state is not None:
+                self.closed_end_activities[self.activities[state[0]]] += 1
+
+    def get_dfg(self) -> Dict[Tuple[str, str], int]:
+        """
+        Gets the current frequency DFG
+        """
+        count = self.count.tolist()
+        return {(self.activities[p[0]], self.activities[p[1]]): count[i] for i, p in enumerate(self.pairs)}
+
+    def get_performance_dfg(self, perf_aggregation_key: str = "all") -> Dict[Tuple[str, str], Any]:
+        """
+        Gets the current performance DFG
+
+        Parameters
+        ---------------
+        perf_aggregation_key
+            Performance aggregation measure (mean, median, min, max, sum, stdev, all)
+
+        Returns
+        ---------------
+        performance_dfg
+            Performance DFG (if perf_aggregation_key is "all", a dictionary of measures is associated to every arc)
+        """
+        n = len(self.pairs)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            stdev = np.sqrt(self.m2[:n] / (self.count[:n] - 1))
+        stdev[self.count[:n] < 2] = np.nan
+        measures = {"mean": self.mean[:n].tolist(), "median": [s.median() for s in self.sketches],
+                    "max": self.max[:n].tolist(), "min": self.min[:n].tolist(), "sum": self.sum[:n].tolist(),
+                    "stdev": stdev.tolist()}
+        measures["std"] = measures["stdev"]
+        ret = {}
+        for i, p in enumerate(self.pairs):
+            arc = (self.activities[p[0]], self.activities[p[1]])
+            if perf_aggregation_key == "all":
+                ret[arc] = {m: measures[m][i] for m in fused_statistics.PERFORMANCE_MEASURES}
+            else:
+                ret[arc] = measures[perf_aggregation_key][i]
+        return ret
+
+    def get_start_activities(self) -> Dict[str, int]:
+        """
+        Gets the start activities of the cases
+        """
+        return dict(self.start_activities)
+
+    def get_end_activities(self) -> Dict[str, int]:
+        """
+        Gets the end activities of the cases (for the open cases, the last activity seen so far)
+        """
+        end_activities = Counter(self.closed_end_activities)
+        end_activities.update(self.activities[state[0]] for state in self.open_cases.values())
+        return dict(end_activities)
+
+    def get_activities(self) -> Dict[str, int]:
+        """
+        Gets the number of occurrences of the activities
+        """
+        count = self.activities_count.tolist()
+        return {act: count[i] for i, act in enumerate(self.activities)}
+
+    def snapshot(self, file_path: str):
+        """
+        Stores the state of the accumulator on disk (atomically replacing the previous snapshot)
+
+        Parameters
+        ---------------
+        file_path
+            Path of the snapshot
+        """
+        directory = os.path.dirname(os.path.abspath(file_path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, file_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+
+def restore(file_path: str) -> IncrementalDfg:
+    """
+    Restores an accumulator from a snapshot stored on disk
+
+    Parameters
+    ---------------
+    file_path
+        Path of the snapshot
+
+    Returns
+    ---------------
+    accumulator
+        Accumulator of the DFG
+    """
+    with open(file_path, "rb") as f:
+        accumulator = pickle.load(f)
+    if not isinstance(accumulator, IncrementalDfg):
+        raise Exception("the file does not contain a snapshot of an incremental DFG")
+    return accumulator
+
+
+def apply(parameters: Optional[Dict[Any, Any]] = None) -> IncrementalDfg:
+    """
+    Creates an (empty) accumulator of the DFG, which can be updated with the batches of events
+    appended to the event table
+
+    Parameters
+    ---------------
+    parameters
+        Parameters of the algorithm, including:
+        - Parameters.ACTIVITY_KEY => the attribute to be used as activity
+        - Parameters.TIMESTAMP_KEY => the attribute to be used as timestamp
+        - Parameters.CASE_ID_KEY => the attribute to be used as case identifier
+        - Parameters.RELATIVE_ACCURACY => relative accuracy of the sketches used for the median (default: 0.01)
+
+    Returns
+    ---------------
+    accumulator
+        Accumulator of the DFG
+
+    Example
+    ---------------
+    accumulator = incremental.apply()
+    for batch in batches:
+        accumulator.append(batch)
+    dfg = accumulator.get_dfg()
+    accumulator.snapshot("dfg.snapshot")
+    """
+    return IncrementalDfg(parameters=parameters)
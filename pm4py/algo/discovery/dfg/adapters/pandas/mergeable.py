@@ -0,0 +1,481 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+"""
+Mergeable summaries of dataframes (frequency DFG, performance DFG, start/end activities, activities and variants),
+to compute the DFG as a map-reduce over shards of the log partitioned by case.
+
+Every shard (containing complete cases) is summarized independently, the summaries can be serialized to bytes
+(to be exchanged between processes or nodes), and are combined with an associative merge operation.
+The serialization contains only data (a JSON header and NumPy arrays, loaded without pickle), so the bytes received
+from other nodes cannot execute code.
+"""
+import io
+import json
+from collections import Counter
+from enum import Enum
+from typing import Optional, Dict, Any, Tuple, Iterable, Iterator, Union
+
+import numpy as np
+import pandas as pd
+
+from pm4py.algo.discovery.dfg.adapters.pandas import fused_statistics
+from pm4py.util import exec_utils, constants, xes_constants
+from pm4py.util.quantile_sketch import QuantileSketch, DEFAULT_RELATIVE_ACCURACY
+
+
+class Parameters(Enum):
+    ACTIVITY_KEY = constants.PARAMETER_CONSTANT_ACTIVITY_KEY
+    TIMESTAMP_KEY = constants.PARAMETER_CONSTANT_TIMESTAMP_KEY
+    CASE_ID_KEY = constants.PARAMETER_CONSTANT_CASEID_KEY
+    RELATIVE_ACCURACY = "relative_accuracy"
+    EXACT_PERFORMANCE = "exact_performance"
+    INCLUDE_VARIANTS = "include_variants"
+    INCLUDE_PERFORMANCE = "include_performance"
+    CORES = "cores"
+
+
+SERIALIZATION_VERSION = 2
+
+
+def _to_json_value(value: Any) -> Any:
+    # the NumPy scalars (e.g., the activities of integer columns) are stored as Python values
+    if isinstance(value, np.generic):
+        return value.item()
+    raise Exception("the DFG summary contains a value that cannot be serialized: %r" % (value,))
+
+
+class ArcPerformance(object):
+    """
+    Mergeable aggregates of the flow times of an arc of the DFG
+    """
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY, exact: bool = False):
+        self.count = 0
+        self.sum = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.sketch = QuantileSketch(relative_accuracy=relative_accuracy)
+        # if the computation is exact, the flow times themselves are kept
+        self.values = np.zeros(0, dtype=np.float64) if exact else None
+
+    def add(self, values: np.ndarray):
+        """
+        Adds some flow times to the aggregates
+
+        Parameters
+        --------------
+        values
+            NumPy array of flow times (in seconds)
+        """
+        if len(values) == 0:
+            return
+        other = ArcPerformance(relative_accuracy=self.sketch.relative_accuracy, exact=self.values is not None)
+        other.count = len(values)
+        other.sum = float(np.sum(values))
+        other.min = float(np.min(values))
+        other.max = float(np.max(values))
+        other.mean = other.sum / other.count
+        other.m2 = float(np.sum((values - other.mean) ** 2))
+        other.sketch.add(values)
+        if other.values is not None:
+            other.values = np.asarray(values, dtype=np.float64)
+        self.merge(other)
+
+    def merge(self, other: "ArcPerformance") -> "ArcPerformance":
+        """
+        Merges (in-place) the aggregates of another arc into the current ones
+
+        Parameters
+        --------------
+        other
+            Aggregates of another arc
+
+        Returns
+        --------------
+        arc_performance
+            The current aggregates
+        """
+        count = self.count + other.count
+        if count > 0:
+            # combines the mean and the sum of squared deviations (Chan et al.)
+            delta = other.mean - self.mean
+            self.mean = self.mean + delta * other.count / count
+            self.m2 = self.m2 + other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.sketch.merge(other.sketch)
+        if self.values is not None and other.values is not None:
+            self.values = np.concatenate((self.values, other.values))
+        else:
+            self.values = None
+        return self
+
+    def get_measures(self) -> Dict[str, float]:
+        """
+        Gets the performance measures (mean, median, max, min, sum, stdev) of the arc
+        """
+        if self.values is not None:
+            # same computation of fused_statistics, on the whole set of flow times
+            values = np.sort(self.values, kind="stable")
+            total = float(np.add.reduceat(values, [0])[0])
+            mean = total / len(values)
+            deviations = values - mean
+            stdev = float(np.sqrt(np.add.reduceat(deviations * deviations, [0])[0] / (len(values) - 1))) \
+                if len(values) > 1 else np.nan
+            median = float((values[(len(values) - 1) // 2] + values[len(values) // 2]) / 2.0)
+            return {"mean": mean, "median": median, "max": float(values[-1]), "min": float(values[0]),
+                    "sum": total, "stdev": stdev}
+        stdev = float(np.sqrt(self.m2 / (self.count - 1))) if self.count > 1 else np.nan
+        return {"mean": self.mean, "median": self.sketch.median(), "max": self.max, "min": self.min,
+                "sum": self.sum, "stdev": stdev}
+
+
+class DfgSummary(object):
+    """
+    Mergeable summary of a set of complete cases
+    """
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY, exact_performance: bool = False):
+        self.relative_accuracy = relative_accuracy
+        self.exact_performance = exact_performance
+        self.dfg = Counter()
+        self.performance: Dict[Tuple[Any, Any], ArcPerformance] = {}
+        self.start_activities = Counter()
+        self.end_activities = Counter()
+        self.activities = Counter()
+        self.variants = Counter()
+
+    def merge(self, other: "DfgSummary") -> "DfgSummary":
+        """
+        Merges (in-place) the summary of another shard (containing different cases) into the current summary.
+        The operation is associative and commutative.
+
+        Parameters
+        --------------
+        other
+            Summary of another shard
+
+        Returns
+        --------------
+        summary
+            The current summary
+        """
+        self.dfg.update(other.dfg)
+        self.start_activities.update(other.start_activities)
+        self.end_activities.update(other.end_activities)
+        self.activities.update(other.activities)
+        self.variants.update(other.variants)
+        for arc, arc_performance in other.performance.items():
+            if arc not in self.performance:
+                self.performance[arc] = ArcPerformance(relative_accuracy=self.relative_accuracy,
+                                                       exact=self.exact_performance)
+            self.performance[arc].merge(arc_performance)
+        self.exact_performance = self.exact_performance and other.exact_performance
+        return self
+
+    def get_dfg(self) -> Dict[Tuple[str, str], int]:
+        """
+        Gets the frequency DFG
+        """
+        return dict(self.dfg)
+
+    def get_performance_dfg(self, perf_aggregation_key: str = "all") -> Dict[Tuple[str, str], Any]:
+        """
+        Gets the performance DFG
+
+        Parameters
+        --------------
+        perf_aggregation_key
+            Performance aggregation measure (mean, median, min, max, sum, stdev, all)
+
+        Returns
+        --------------
+        performance_dfg
+            Performance DFG (if perf_aggregation_key is "all", a dictionary of measures is associated to every arc)
+        """
+        ret = {}
+        for arc, arc_performance in self.performance.items():
+            measures = arc_performance.get_measures()
+            ret[arc] = measures if perf_aggregation_key == "all" else measures[perf_aggregation_key]
+        return ret
+
+    def get_start_activities(self) -> Dict[str, int]:
+        """
+        Gets the start activities
+        """
+        return dict(self.start_activities)
+
+    def get_end_activities(self) -> Dict[str, int]:
+        """
+        Gets the end activities
+        """
+        return dict(self.end_activities)
+
+    def get_activities(self) -> Dict[str, int]:
+        """
+        Gets the number of occurrences of the activities
+        """
+        return dict(self.activities)
+
+    def get_variants(self) -> Dict[Tuple[str, ...], int]:
+        """
+        Gets the variants (along with their number of occurrences)
+        """
+        return dict(self.variants)
+
+    def to_bytes(self) -> bytes:
+        """
+        Serializes the summary to bytes (a NumPy archive containing a JSON header and the exact flow times)
+        """
+        performance = []
+        values = []
+        for arc, arc_performance in self.performance.items():
+            sketch = arc_performance.sketch
+            performance.append({"arc": list(arc), "count": arc_performance.count, "sum": arc_performance.sum,
+                                "min": arc_performance.min, "max": arc_performance.max,
+                                "mean": arc_performance.mean, "m2": arc_performance.m2,
+                                "positive_bins": list(sketch.positive_bins.items()),
+                                "negative_bins": list(sketch.negative_bins.items()),
+                                "zero_count": sketch.zero_count, "sketch_count": sketch.count,
+                                "sketch_min": sketch.min, "sketch_max": sketch.max,
+                                "exact": arc_performance.values is not None})
+            if arc_performance.values is not None:
+                values.append(arc_performance.values)
+        header = {"version": SERIALIZATION_VERSION, "relative_accuracy": self.relative_accuracy,
+                  "exact_performance": self.exact_performance,
+                  "dfg": [[a, b, c] for (a, b), c in self.dfg.items()],
+                  "start_activities": list(self.start_activities.items()),
+                  "end_activities": list(self.end_activities.items()),
+                  "activities": list(self.activities.items()),
+                  "variants": [[list(v), c] for v, c in self.variants.items()],
+                  "performance": performance}
+        lengths = np.array([len(x) for x in values], dtype=np.int64)
+        buffer = io.BytesIO()
+        header = json.dumps(header, default=_to_json_value)
+        np.savez(buffer, header=np.frombuffer(header.encode("utf-8"), dtype=np.uint8),
+                 values=np.concatenate(values) if values else np.zeros(0, dtype=np.float64), lengths=lengths)
+        return buffer.getvalue()
+
+
+def from_bytes(serialization: bytes) -> DfgSummary:
+    """
+    Deserializes a summary from bytes
+
+    Parameters
+    --------------
+    serialization
+        Bytes obtained from DfgSummary.to_bytes()
+
+    Returns
+    --------------
+    summary
+        Summary
+    """
+    try:
+        with np.load(io.BytesIO(serialization), allow_pickle=False) as archive:
+            header = json.loads(archive["header"].tobytes().decode("utf-8"))
+            values = archive["values"].astype(np.float64)
+            lengths = archive["lengths"].astype(np.int64)
+    except (ValueError, KeyError, OSError) as e:
+        raise Exception("unsupported serialization of the DFG summary") from e
+    if not isinstance(header, dict) or header.get("version") != SERIALIZATION_VERSION:
+        raise Exception("unsupported serialization of the DFG summary")
+
+    summary = DfgSummary(relative_accuracy=float(header["relative_accuracy"]),
+                         exact_performance=bool(header["exact_performance"]))
+    summary.dfg = Counter({(a, b): int(c) for a, b, c in header["dfg"]})
+    for key in ["start_activities", "end_activities", "activities"]:
+        setattr(summary, key, Counter({a: int(c) for a, c in header[key]}))
+    summary.variants = Counter({tuple(v): int(c) for v, c in header["variants"]})
+    offsets = np.concatenate(([0], np.cumsum(lengths)))
+    exact_index = 0
+    for entry in header["performance"]:
+        arc_performance = ArcPerformance(relative_accuracy=summary.relative_accuracy, exact=bool(entry["exact"]))
+        arc_performance.count = int(entry["count"])
+        for key in ["sum", "min", "max", "mean", "m2"]:
+            setattr(arc_performance, key, float(entry[key]))
+        sketch = arc_performance.sketch
+        sketch.positive_bins = {int(i): int(c) for i, c in entry["positive_bins"]}
+        sketch.negative_bins = {int(i): int(c) for i, c in entry["negative_bins"]}
+        sketch.zero_count = int(entry["zero_count"])
+        sketch.count = int(entry["sketch_count"])
+        sketch.min = float(entry["sketch_min"])
+        sketch.max = float(entry["sketch_max"])
+        if arc_performance.values is not None:
+            arc_performance.values = values[offsets[exact_index]:offsets[exact_index + 1]]
+            exact_index += 1
+        summary.performance[tuple(entry["arc"])] = arc_performance
+    return summary
+
+
+def from_dataframe(df: pd.DataFrame, parameters: Optional[Dict[Any, Any]] = None) -> DfgSummary:
+    """
+    Summarizes a dataframe containing complete cases (map step)
+
+    Parameters
+    --------------
+    df
+        Dataframe (or Pyarrow table)
+    parameters
+        Parameters of the algorithm, including:
+        - Parameters.ACTIVITY_KEY => the attribute to be used as activity
+        - Parameters.TIMESTAMP_KEY => the attribute to be used as timestamp
+        - Parameters.CASE_ID_KEY => the attribute to be used as case identifier
+        - Parameters.RELATIVE_ACCURACY => relative accuracy of the sketches used for the median (default: 0.01)
+        - Parameters.EXACT_PERFORMANCE => keeps the flow times, to obtain the same performance measures of the
+            single-node computation (default: False)
+        - Parameters.INCLUDE_VARIANTS => computes also the variants (default: True)
+        - Parameters.INCLUDE_PERFORMANCE => computes also the performance DFG (default: True)
+
+    Returns
+    --------------
+    summary
+        Summary of the dataframe
+    """
+    if parameters is None:
+        parameters = {}
+
+    activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, xes_constants.DEFAULT_NAME_KEY)
+    timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters,
+                                               xes_constants.DEFAULT_TIMESTAMP_KEY)
+    case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME)
+    relative_accuracy = exec_utils.get_param_value(Parameters.RELATIVE_ACCURACY, parameters,
+                                                   DEFAULT_RELATIVE_ACCURACY)
+    exact_performance = exec_utils.get_param_value(Parameters.EXACT_PERFORMANCE, parameters, False)
+    include_variants = exec_utils.get_param_value(Parameters.INCLUDE_VARIANTS, parameters, True)
+    include_performance = exec_utils.get_param_value(Parameters.INCLUDE_PERFORMANCE, parameters, True)
+
+    if not isinstance(df, pd.DataFrame):
+        # Pyarrow table
+        df = df.select([case_id_key, activity_key, timestamp_key]).to_pandas()
+
+    summary = DfgSummary(relative_accuracy=relative_accuracy, exact_performance=exact_performance)
+    if len(df) == 0:
+        return summary
+
+    statistics = fused_statistics.apply(df, measure="both" if include_performance else "frequency",
+                                        activity_key=activity_key, case_id_glue=case_id_key,
+                                        timestamp_key=timestamp_key, perf_aggregation_key="raw_values")
+    summary.dfg.update(statistics[fused_statistics.DFG_FREQUENCY])
+    summary.start_activities.update(statistics[fused_statistics.START_ACTIVITIES])
+    summary.end_activities.update(statistics[fused_statistics.END_ACTIVITIES])
+    summary.activities.update(statistics[fused_statistics.ACTIVITIES])
+    if include_performance:
+        for arc, values in statistics[fused_statistics.DFG_PERFORMANCE].items():
+            summary.performance[arc] = ArcPerformance(relative_accuracy=relative_accuracy, exact=exact_performance)
+            summary.performance[arc].add(np.asarray(values, dtype=np.float64))
+
+    if include_variants:
+        from pm4py.statistics.variants.pandas import get as variants_get
+        summary.variants.update(variants_get.get_variants_count(df, parameters={
+            constants.PARAMETER_CONSTANT_ACTIVITY_KEY: activity_key,
+            constants.PARAMETER_CONSTANT_TIMESTAMP_KEY: timestamp_key,
+            constants.PARAMETER_CONSTANT_CASEID_KEY: case_id_key}))
+
+    return summary
+
+
+def _summarize_to_bytes(df: pd.DataFrame, parameters: Dict[Any, Any]) -> bytes:
+    """
+    Summarizes a shard and serializes the summary (executed by the workers)
+    """
+    return from_dataframe(df, parameters=parameters).to_bytes()
+
+
+def __summarize_in_parallel(shards: Iterable[pd.DataFrame], parameters: Dict[Any, Any], cores: int) -> Iterator[
+        bytes]:
+    """
+    Summarizes the shards in a pool of processes, yielding the serialized summaries as soon as they are available.
+    At most 2 * cores shards are submitted at once, so that an iterator of shards is consumed progressively
+    """
+    from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+    with ProcessPoolExecutor(max_workers=cores) as executor:
+        pending = set()
+        for shard in shards:
+            if len(pending) >= 2 * cores:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+            pending.add(executor.submit(_summarize_to_bytes, shard, parameters))
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+
+def merge(summaries: Iterable[Union[DfgSummary, bytes]]) -> DfgSummary:
+    """
+    Merges a collection of summaries (reduce step)
+
+    Parameters
+    --------------
+    summaries
+        Summaries (or their serializations to bytes)
+
+    Returns
+    --------------
+    summary
+        Merged summary
+    """
+    ret = None
+    for summary in summaries:
+        if isinstance(summary, bytes):
+            summary = from_bytes(summary)
+        ret = summary if ret is None else ret.merge(summary)
+    return ret if ret is not None else DfgSummary()
+
+
+def apply(shards: Iterable[pd.DataFrame], parameters: Optional[Dict[Any, Any]] = None) -> DfgSummary:
+    """
+    Computes the summary of a log partitioned by case in shards (map-reduce).
+    The shards are consumed progressively, and their summaries are merged as soon as they are available.
+
+    Parameters
+    --------------
+    shards
+        Dataframes or Pyarrow tables (each one containing complete cases, different cases in different shards)
+    parameters
+        Parameters of the algorithm, including:
+        - Parameters.ACTIVITY_KEY => the attribute to be used as activity
+        - Parameters.TIMESTAMP_KEY => the attribute to be used as timestamp
+        - Parameters.CASE_ID_KEY => the attribute to be used as case identifier
+        - Parameters.RELATIVE_ACCURACY => relative accuracy of the sketches used for the median (default: 0.01)
+        - Parameters.EXACT_PERFORMANCE => keeps the flow times, to obtain the same performance measures of the
+            single-node computation (default: False)
+        - Parameters.INCLUDE_VARIANTS => computes also the variants (default: True)
+        - Parameters.INCLUDE_PERFORMANCE => computes also the performance DFG (default: True)
+        - Parameters.CORES => number of processes summarizing the shards (default: 1)
+
+    Returns
+    --------------
+    summary
+        Summary of the log
+    """
+    if parameters is None:
+        parameters = {}
+
+    cores = exec_utils.get_param_value(Parameters.CORES, parameters, 1)
+
+    if cores > 1:
+        return merge(__summarize_in_parallel(shards, parameters, cores))
+
+    return merge(from_dataframe(shard, parameters=parameters) for shard in shards)
@@ -24,7 +24,7 @@ from pm4py.util import constants, pandas_utils
 from enum import Enum
 from typing import Optional, Dict, Any, Union, Tuple
 from pm4py.objects.log.obj import EventLog, EventStream
-from pm4py.algo.discovery.dfg.adapters.pandas import df_statistics
+from pm4py.algo.discovery.dfg.adapters.pandas import fused_statistics
 import pandas as pd
 
 
@@ -99,14 +99,14 @@ def apply(log: Union[EventLog, EventStream, pd.DataFrame], parameters: Optional[
     case_id_glue = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, pmutil.constants.CASE_CONCEPT_NAME)
 
     if pandas_utils.check_is_pandas_dataframe(log) and not variant == Variants.FREQ_TRIPLES:
-        dfg_frequency, dfg_performance = df_statistics.get_dfg_graph(log, measure="both",
-                                                                     activity_key=activity_key,
-                                                                     timestamp_key=timestamp_key,
-                                                                     case_id_glue=case_id_glue,
-                                                                     start_timestamp_key=start_timestamp_key)
         if variant in [Variants.PERFORMANCE, Variants.PERFORMANCE_GREEDY]:
-            return dfg_performance
+            return fused_statistics.apply(log, measure="performance", activity_key=activity_key,
+                                          timestamp_key=timestamp_key, case_id_glue=case_id_glue,
+                                          start_timestamp_key=start_timestamp_key,
+                                          perf_aggregation_key="mean")[fused_statistics.DFG_PERFORMANCE]
         else:
-            return dfg_frequency
+            return fused_statistics.apply(log, measure="frequency", activity_key=activity_key,
+                                          timestamp_key=timestamp_key, case_id_glue=case_id_glue,
+                                          start_timestamp_key=start_timestamp_key)[fused_statistics.DFG_FREQUENCY]
 
     return exec_utils.get_variant(variant).apply(log_conversion.apply(log, parameters, log_conversion.TO_EVENT_LOG), parameters=parameters)
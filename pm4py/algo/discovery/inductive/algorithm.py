@@ -14,6 +14,7 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
+from collections import Counter
 from enum import Enum
 from typing import Optional, Dict, Any, Union
 
@@ -21,13 +22,15 @@ import pandas as pd
 
 from pm4py import util as pmutil
 from pm4py.algo.discovery.inductive.dtypes.im_dfg import InductiveDFG
-from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructureUVCL, IMDataStructureDFG
+from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructureUVCL, IMDataStructureDFG, \
+    IMDataStructureEncodedUVCL
 from pm4py.algo.discovery.inductive.variants.im import IMUVCL
 from pm4py.algo.discovery.inductive.variants.imf import IMFUVCL
 from pm4py.algo.discovery.inductive.variants.imd import IMD
 from pm4py.algo.discovery.inductive.variants.instances import IMInstance
 from pm4py.objects.dfg.obj import DFG
 from pm4py.objects.log.obj import EventLog
+from pm4py.objects.log.util import variant_index
 from pm4py.objects.process_tree.obj import ProcessTree
 from pm4py.objects.process_tree.utils import generic as pt_util
 from pm4py.objects.process_tree.utils.generic import tree_sort
@@ -37,12 +40,15 @@ from pm4py.util import exec_utils
 from pm4py.util import xes_constants as xes_util
 from pm4py.util.compression import util as comut
 from pm4py.util.compression.dtypes import UVCL
+from pm4py.util.compression import encoded_uvcl
+from pm4py.util.compression.encoded_uvcl import EncodedUVCL
 
 
 class Parameters(Enum):
     ACTIVITY_KEY = constants.PARAMETER_CONSTANT_ACTIVITY_KEY
     TIMESTAMP_KEY = constants.PARAMETER_CONSTANT_TIMESTAMP_KEY
     CASE_ID_KEY = constants.PARAMETER_CONSTANT_CASEID_KEY
+    USE_ENCODED_UVCL = "use_encoded_uvcl"
 
 
 class Variants(Enum):
@@ -51,12 +57,13 @@ class Variants(Enum):
     IMd = IMInstance.IMd
 
 
-def apply(obj: Union[EventLog, pd.DataFrame, DFG, UVCL], parameters: Optional[Dict[Any, Any]] = None, variant=Variants.IM) -> ProcessTree:
+def apply(obj: Union[EventLog, pd.DataFrame, DFG, UVCL, EncodedUVCL], parameters: Optional[Dict[Any, Any]] = None, variant=Variants.IM) -> ProcessTree:
     if parameters is None:
         parameters = {}
     ack = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, xes_util.DEFAULT_NAME_KEY)
     tk = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters, xes_util.DEFAULT_TIMESTAMP_KEY)
     cidk = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, pmutil.constants.CASE_CONCEPT_NAME)
+    use_encoded_uvcl = exec_utils.get_param_value(Parameters.USE_ENCODED_UVCL, parameters, False)
 
     process_tree = ProcessTree()
     if type(obj) is DFG:
@@ -66,9 +73,32 @@ def apply(obj: Union[EventLog, pd.DataFrame, DFG, UVCL], parameters: Optional[Di
         imd = IMD(parameters)
         idfg = InductiveDFG(dfg=obj, skip=False)
         process_tree = imd.apply(IMDataStructureDFG(idfg), parameters)
+    elif type(obj) is EncodedUVCL or use_encoded_uvcl:
+        if type(obj) is EncodedUVCL:
+            uvcl = obj
+        elif type(obj) in [UVCL]:
+            uvcl = encoded_uvcl.from_uvcl(obj)
+        else:
+            uvcl = encoded_uvcl.encode(obj, key=ack, df_glue=cidk, df_sorting_criterion_key=tk)
+
+        if variant is Variants.IM:
+            im = IMUVCL(parameters)
+            process_tree = im.apply(IMDataStructureEncodedUVCL(uvcl), parameters)
+        if variant is Variants.IMf:
+            imf = IMFUVCL(parameters)
+            process_tree = imf.apply(IMDataStructureEncodedUVCL(uvcl), parameters)
+        if variant is Variants.IMd:
+            imd = IMD(parameters)
+            idfg = InductiveDFG(dfg=uvcl.get_dfg(), skip=() in uvcl)
+            process_tree = imd.apply(IMDataStructureDFG(idfg), parameters)
     else:
         if type(obj) in [UVCL]:
             uvcl = obj
+        elif type(obj) is pd.DataFrame:
+            # reuses the variant index of the dataframe (the events of the cases are sorted by timestamp)
+            uvcl = Counter(variant_index.get_variant_index(obj, parameters={
+                variant_index.Parameters.CASE_ID_KEY: cidk, variant_index.Parameters.ACTIVITY_KEY: ack,
+                variant_index.Parameters.TIMESTAMP_KEY: tk}).get_variants_count())
         else:
             uvcl = comut.get_variants(comut.project_univariate(obj, key=ack, df_glue=cidk, df_sorting_criterion_key=tk))
 
@@ -19,8 +19,9 @@ from typing import List, TypeVar, Optional, Dict, Any
 from pm4py.algo.discovery.inductive.base_case.abc import BaseCase
 from pm4py.algo.discovery.inductive.base_case.empty_log import EmptyLogBaseCaseUVCL, EmptyLogBaseCaseDFG
 from pm4py.algo.discovery.inductive.base_case.single_activity import SingleActivityBaseCaseUVCL, \
-    SingleActivityBaseCaseDFG
-from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructure, IMDataStructureUVCL, IMDataStructureDFG
+    SingleActivityBaseCaseDFG, SingleActivityBaseCaseEncodedUVCL
+from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructure, IMDataStructureUVCL, IMDataStructureDFG, \
+    IMDataStructureEncodedUVCL
 from pm4py.algo.discovery.inductive.variants.instances import IMInstance
 from pm4py.objects.process_tree.obj import ProcessTree
 
@@ -35,6 +36,8 @@ class BaseCaseFactory:
         if inst is IMInstance.IM or inst is IMInstance.IMf:
             if type(obj) is IMDataStructureUVCL:
                 return [EmptyLogBaseCaseUVCL, SingleActivityBaseCaseUVCL]
+            if type(obj) is IMDataStructureEncodedUVCL:
+                return [EmptyLogBaseCaseUVCL, SingleActivityBaseCaseEncodedUVCL]
         if inst is IMInstance.IMd:
             if type(obj) is IMDataStructureDFG:
                 return [EmptyLogBaseCaseDFG, SingleActivityBaseCaseDFG]
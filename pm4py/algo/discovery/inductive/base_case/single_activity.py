@@ -15,7 +15,8 @@
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
 from pm4py.algo.discovery.inductive.base_case.abc import BaseCase
-from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructureUVCL, IMDataStructureDFG
+from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructureUVCL, IMDataStructureDFG, \
+    IMDataStructureEncodedUVCL
 from pm4py.objects.process_tree.obj import ProcessTree
 from typing import Optional, Dict, Any
 
@@ -38,6 +39,19 @@ class SingleActivityBaseCaseUVCL(BaseCase[IMDataStructureUVCL]):
                 return ProcessTree()
 
 
+class SingleActivityBaseCaseEncodedUVCL(BaseCase[IMDataStructureEncodedUVCL]):
+    @classmethod
+    def holds(cls, obj=IMDataStructureEncodedUVCL, parameters: Optional[Dict[str, Any]] = None) -> bool:
+        return len(obj.data_structure) == 1 and obj.data_structure.lengths[0] <= 1
+
+    @classmethod
+    def leaf(cls, obj=IMDataStructureEncodedUVCL, parameters: Optional[Dict[str, Any]] = None) -> ProcessTree:
+        log = obj.data_structure
+        if log.lengths[0] > 0:
+            return ProcessTree(label=log.activities[log.events[0]])
+        return ProcessTree()
+
+
 class SingleActivityBaseCaseDFG(BaseCase[IMDataStructureDFG]):
 
     @classmethod
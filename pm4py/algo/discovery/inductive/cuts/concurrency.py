@@ -20,8 +20,9 @@ from typing import List, Collection, Any, Optional, Generic, Dict
 
 from pm4py.algo.discovery.inductive.cuts.abc import Cut, T
 from pm4py.algo.discovery.inductive.dtypes.im_dfg import InductiveDFG
-from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructureUVCL, IMDataStructureDFG
-from pm4py.objects.dfg import util as dfu
+from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructureUVCL, IMDataStructureDFG, \
+    IMDataStructureEncodedUVCL
+from pm4py.algo.discovery.inductive.dtypes.im_indexed_dfg import complement_components
 from pm4py.objects.dfg.obj import DFG
 from pm4py.objects.process_tree.obj import Operator, ProcessTree
 
@@ -35,37 +36,16 @@ class ConcurrencyCut(Cut[T], ABC, Generic[T]):
     @classmethod
     def holds(cls, obj: T, parameters: Optional[Dict[str, Any]] = None) -> Optional[List[Collection[Any]]]:
         dfg = obj.dfg
-        alphabet = dfu.get_vertices(dfg)
-        alphabet = sorted(list(alphabet))
-        edges = dfu.get_edges(dfg)
-        edges = sorted(list(edges))
-
-        groups = [{a} for a in alphabet]
-        if len(groups) == 0:
+        indexed_dfg = obj.indexed_dfg
+        if len(indexed_dfg.vertices) == 0:
             return None
 
-        cont = True
-        while cont:
-            cont = False
-            i = 0
-            while i < len(groups):
-                j = i + 1
-                while j < len(groups):
-                    for act1 in groups[i]:
-                        for act2 in groups[j]:
-                            if (act1, act2) not in edges or (act2, act1) not in edges:
-                                groups[i] = groups[i].union(groups[j])
-                                del groups[j]
-                                cont = True
-                                break
-                        if cont:
-                            break
-                    if cont:
-                        break
-                    j = j + 1
-                if cont:
-                    break
-                i = i + 1
+        # two activities are merged in the same group unless they are connected in both directions, hence the groups
+        # are the connected components of the complement of the 'bidirectional' graph (sorted by their minimum
+        # activity)
+        groups = [indexed_dfg.get_activities(c) for c in
+                  complement_components(indexed_dfg.get_bidirectional_bitsets())]
+        groups = sorted(groups, key=lambda g: min(g))
 
         groups = list(sorted(groups, key=lambda g: len(g)))
         i = 0
@@ -97,25 +77,34 @@ class ConcurrencyCutUVCL(ConcurrencyCut[IMDataStructureUVCL]):
         return list(map(lambda l: IMDataStructureUVCL(l), r))
 
 
+class ConcurrencyCutEncodedUVCL(ConcurrencyCut[IMDataStructureEncodedUVCL]):
+
+    @classmethod
+    def project(cls, obj: IMDataStructureEncodedUVCL, groups: List[Collection[Any]], parameters: Optional[Dict[str, Any]] = None) -> List[IMDataStructureEncodedUVCL]:
+        log = obj.data_structure
+        r = list()
+        for g in groups:
+            # as in ConcurrencyCutUVCL, a projected variant gets the count of the last variant projected on it
+            r.append(log.filter_events(log.get_activity_codes(g)[log.events], keep_last_count=True))
+        return list(map(lambda l: IMDataStructureEncodedUVCL(l), r))
+
+
 class ConcurrencyCutDFG(ConcurrencyCut[IMDataStructureDFG]):
 
     @classmethod
     def project(cls, obj: IMDataStructureDFG, groups: List[Collection[Any]], parameters: Optional[Dict[str, Any]] = None) -> List[IMDataStructureDFG]:
-        dfgs = []
-        skippable = []
-        for g in groups:
-            dfn = DFG()
-            for a in obj.dfg.start_activities:
-                if a in g:
-                    dfn.start_activities[a] = obj.dfg.start_activities[a]
-            for a in obj.dfg.end_activities:
-                if a in g:
-                    dfn.end_activities[a] = obj.dfg.end_activities[a]
-            for (a, b) in obj.dfg.graph:
-                if a in g and b in g:
-                    dfn.graph[(a, b)] = obj.dfg.graph[(a, b)]
-            skippable.append(False)
-            dfgs.append(dfn)
+        dfgs = [DFG() for g in groups]
+        skippable = [False for g in groups]
+        activities_idx = {a: i for i, g in enumerate(groups) for a in g}
+        for a in obj.dfg.start_activities:
+            if a in activities_idx:
+                dfgs[activities_idx[a]].start_activities[a] = obj.dfg.start_activities[a]
+        for a in obj.dfg.end_activities:
+            if a in activities_idx:
+                dfgs[activities_idx[a]].end_activities[a] = obj.dfg.end_activities[a]
+        for (a, b) in obj.dfg.graph:
+            if a in activities_idx and activities_idx[a] == activities_idx.get(b):
+                dfgs[activities_idx[a]].graph[(a, b)] = obj.dfg.graph[(a, b)]
         r = list()
         [r.append(IMDataStructureDFG(InductiveDFG(dfg=dfgs[i], skip=skippable[i]))) for i in range(len(dfgs))]
         return r
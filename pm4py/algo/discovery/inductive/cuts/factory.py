@@ -17,11 +17,13 @@
 from typing import List, Optional, Tuple, TypeVar, Dict, Any
 
 from pm4py.algo.discovery.inductive.cuts.abc import Cut
-from pm4py.algo.discovery.inductive.cuts.concurrency import ConcurrencyCutUVCL, ConcurrencyCutDFG
-from pm4py.algo.discovery.inductive.cuts.loop import LoopCutUVCL, LoopCutDFG
-from pm4py.algo.discovery.inductive.cuts.sequence import StrictSequenceCutUVCL, StrictSequenceCutDFG, SequenceCutUVCL, SequenceCutDFG
-from pm4py.algo.discovery.inductive.cuts.xor import ExclusiveChoiceCutUVCL, ExclusiveChoiceCutDFG
-from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructure, IMDataStructureUVCL, IMDataStructureDFG
+from pm4py.algo.discovery.inductive.cuts.concurrency import ConcurrencyCutUVCL, ConcurrencyCutDFG, ConcurrencyCutEncodedUVCL
+from pm4py.algo.discovery.inductive.cuts.loop import LoopCutUVCL, LoopCutDFG, LoopCutEncodedUVCL
+from pm4py.algo.discovery.inductive.cuts.sequence import StrictSequenceCutUVCL, StrictSequenceCutDFG, SequenceCutUVCL, SequenceCutDFG, \
+    StrictSequenceCutEncodedUVCL, SequenceCutEncodedUVCL
+from pm4py.algo.discovery.inductive.cuts.xor import ExclusiveChoiceCutUVCL, ExclusiveChoiceCutDFG, ExclusiveChoiceCutEncodedUVCL
+from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructure, IMDataStructureUVCL, IMDataStructureDFG, \
+    IMDataStructureEncodedUVCL
 from pm4py.algo.discovery.inductive.variants.instances import IMInstance
 from pm4py.objects.process_tree.obj import ProcessTree
 from pm4py.util import exec_utils
@@ -51,6 +53,11 @@ class CutFactory:
                 if disable_strict_sequence_cut:
                     sequence_cut = SequenceCutUVCL
                 return [ExclusiveChoiceCutUVCL, sequence_cut, ConcurrencyCutUVCL, LoopCutUVCL]
+            if type(obj) is IMDataStructureEncodedUVCL:
+                sequence_cut = StrictSequenceCutEncodedUVCL
+                if disable_strict_sequence_cut:
+                    sequence_cut = SequenceCutEncodedUVCL
+                return [ExclusiveChoiceCutEncodedUVCL, sequence_cut, ConcurrencyCutEncodedUVCL, LoopCutEncodedUVCL]
         if inst is IMInstance.IMd:
             if type(obj) is IMDataStructureDFG:
                 sequence_cut = StrictSequenceCutDFG
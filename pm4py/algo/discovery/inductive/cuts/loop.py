@@ -18,15 +18,17 @@ from abc import ABC
 from collections import Counter
 from typing import List, Optional, Collection, Any, Tuple, Generic, Dict
 
-from pm4py.util import nx_utils
+import numpy as np
 
 from pm4py.algo.discovery.inductive.cuts.abc import Cut, T
 from pm4py.algo.discovery.inductive.dtypes.im_dfg import InductiveDFG
-from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructureUVCL, IMDataStructureDFG
-from pm4py.objects.dfg import util as dfu
+from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructureUVCL, IMDataStructureDFG, \
+    IMDataStructureEncodedUVCL
+from pm4py.algo.discovery.inductive.dtypes.im_indexed_dfg import IndexedDFG
 from pm4py.objects.dfg.obj import DFG
 from pm4py.objects.process_tree.obj import Operator, ProcessTree
 from pm4py.util.compression.dtypes import UVCL
+from pm4py.util.compression import encoded_uvcl
 
 
 class LoopCut(Cut[T], ABC, Generic[T]):
@@ -51,107 +53,68 @@ class LoopCut(Cut[T], ABC, Generic[T]):
 
         """
         dfg = obj.dfg
-        start_activities = set(dfg.start_activities.keys())
-        end_activities = set(dfg.end_activities.keys())
         if len(dfg.graph) == 0:
             return None
 
-        groups = [start_activities.union(end_activities)]
-        for c in cls._compute_connected_components(dfg, start_activities, end_activities):
-            groups.append(set(c.nodes))
-
-        groups = cls._exclude_sets_non_reachable_from_start(dfg, start_activities, end_activities, groups)
-        groups = cls._exclude_sets_no_reachable_from_end(dfg, start_activities, end_activities, groups)
-        groups = cls._check_start_completeness(dfg, start_activities, end_activities, groups)
-        groups = cls._check_end_completeness(dfg, start_activities, end_activities, groups)
-
+        indexed_dfg = obj.indexed_dfg
+        start, end = indexed_dfg.start_mask, indexed_dfg.end_mask
+        do_mask = start | end
+
+        # the 'do' group gets the label 0, the connected components of the reduced graph the labels 1, 2, ...
+        labels = np.zeros(len(indexed_dfg.vertices), dtype=np.int64)
+        components = indexed_dfg.get_connected_components(~do_mask)
+        for i, c in enumerate(components):
+            labels[c] = i + 1
+        merge = np.zeros(len(components) + 1, dtype=bool)
+
+        merge |= cls._exclude_sets_non_reachable_from_start(indexed_dfg, labels, len(merge))
+        merge |= cls._exclude_sets_no_reachable_from_end(indexed_dfg, labels, len(merge))
+        merge |= cls._check_start_completeness(indexed_dfg, labels, len(merge))
+        merge |= cls._check_end_completeness(indexed_dfg, labels, len(merge))
+        labels[merge[labels]] = 0
+
+        groups = [set() for _ in range(len(merge))]
+        for v, l in zip(indexed_dfg.vertices, labels.tolist()):
+            groups[l].add(v)
         groups = list(filter(lambda g: len(g) > 0, groups))
 
         return groups if len(groups) > 1 else None
 
     @classmethod
-    def _check_start_completeness(cls, dfg: DFG, start_activities: Collection[Any], end_activities: Collection[Any],
-                                  groups: List[Collection[Any]], parameters: Optional[Dict[str, Any]] = None) -> List[Collection[Any]]:
-        i = 1
-        while i < len(groups):
-            merge = False
-            for a in groups[i]:
-                if merge:
-                    break
-                for (x, b) in dfg.graph:
-                    if x == a and b in start_activities:
-                        for s in start_activities:
-                            if not (a, s) in dfg.graph:
-                                merge = True
-            if merge:
-                groups[0] = set(groups[0]).union(groups[i])
-                del groups[i]
-                continue
-            i = i + 1
-        return groups
-
-    @classmethod
-    def _check_end_completeness(cls, dfg: DFG, start_activities: Collection[Any], end_activities: Collection[Any],
-                                groups: List[Collection[Any]], parameters: Optional[Dict[str, Any]] = None) -> List[Collection[Any]]:
-        i = 1
-        while i < len(groups):
-            merge = False
-            for a in groups[i]:
-                if merge:
-                    break
-                for (b, x) in dfg.graph:
-                    if x == a and b in end_activities:
-                        for e in end_activities:
-                            if not (e, a) in dfg.graph:
-                                merge = True
-            if merge:
-                groups[0] = set(groups[0]).union(groups[i])
-                del groups[i]
-                continue
-            i = i + 1
-        return groups
+    def _check_start_completeness(cls, indexed_dfg: IndexedDFG, labels: np.ndarray, num_groups: int,
+                                  parameters: Optional[Dict[str, Any]] = None) -> np.ndarray:
+        # a group should be merged with the 'do' group if one of its activities is followed by some, but not all,
+        # the start activities
+        to_start = indexed_dfg.start_mask[indexed_dfg.targets]
+        count = np.bincount(indexed_dfg.sources[to_start], minlength=len(labels))
+        incomplete = (count > 0) & (count < int(indexed_dfg.start_mask.sum()))
+        return np.bincount(labels[incomplete], minlength=num_groups) > 0
 
     @classmethod
-    def _exclude_sets_non_reachable_from_start(cls, dfg: DFG, start_activities: Collection[Any],
-                                               end_activities: Collection[Any],
-                                               groups: List[Collection[Any]], parameters: Optional[Dict[str, Any]] = None) -> List[Collection[Any]]:
-        for a in set(start_activities).difference(set(end_activities)):
-            for (x, b) in dfg.graph:
-                if x == a:
-                    group_a, group_b = None, None
-                    for group in groups:
-                        group_a = group if a in group else group_a
-                        group_b = group if b in group else group_b
-                    groups = [group for group in groups if group != group_a and group != group_b]
-                    # we are always merging on the do-part
-                    groups.insert(0, group_a.union(group_b))
-        return groups
+    def _check_end_completeness(cls, indexed_dfg: IndexedDFG, labels: np.ndarray, num_groups: int,
+                                parameters: Optional[Dict[str, Any]] = None) -> np.ndarray:
+        # a group should be merged with the 'do' group if one of its activities is preceded by some, but not all,
+        # the end activities
+        from_end = indexed_dfg.end_mask[indexed_dfg.sources]
+        count = np.bincount(indexed_dfg.targets[from_end], minlength=len(labels))
+        incomplete = (count > 0) & (count < int(indexed_dfg.end_mask.sum()))
+        return np.bincount(labels[incomplete], minlength=num_groups) > 0
 
     @classmethod
-    def _exclude_sets_no_reachable_from_end(cls, dfg: DFG, start_activities: Collection[Any],
-                                            end_activities: Collection[Any],
-                                            groups: List[Collection[Any]], parameters: Optional[Dict[str, Any]] = None) -> List[Collection[Any]]:
-        for b in set(end_activities).difference(start_activities):
-            for (a, x) in dfg.graph:
-                if x == b:
-                    group_a, group_b = None, None
-                    for group in groups:
-                        group_a = group if a in group else group_a
-                        group_b = group if b in group else group_b
-                    groups = [group for group in groups if group != group_a and group != group_b]
-                    groups.insert(0, group_a.union(group_b))
-        return groups
+    def _exclude_sets_non_reachable_from_start(cls, indexed_dfg: IndexedDFG, labels: np.ndarray, num_groups: int,
+                                               parameters: Optional[Dict[str, Any]] = None) -> np.ndarray:
+        # the groups directly following a start activity (which is not an end activity) are merged with the 'do' group
+        start_not_end = indexed_dfg.start_mask & ~indexed_dfg.end_mask
+        targets = indexed_dfg.targets[start_not_end[indexed_dfg.sources]]
+        return np.bincount(labels[targets], minlength=num_groups) > 0
 
     @classmethod
-    def _compute_connected_components(cls, dfg: DFG, start_activities: Collection[Any],
-                                      end_activities: Collection[Any], parameters: Optional[Dict[str, Any]] = None):
-        nxd = dfu.as_nx_graph(dfg)
-        [nxd.remove_edge(a, b) for (a, b) in dfg.graph if
-         a in start_activities or a in end_activities or b in start_activities or b in end_activities]
-        [nxd.remove_node(a) for a in start_activities if nxd.has_node(a)]
-        [nxd.remove_node(a) for a in end_activities if nxd.has_node(a)]
-        nxu = nxd.to_undirected()
-        return [nxd.subgraph(c).copy() for c in nx_utils.connected_components(nxu)]
+    def _exclude_sets_no_reachable_from_end(cls, indexed_dfg: IndexedDFG, labels: np.ndarray, num_groups: int,
+                                            parameters: Optional[Dict[str, Any]] = None) -> np.ndarray:
+        # the groups directly preceding an end activity (which is not a start activity) are merged with the 'do' group
+        end_not_start = indexed_dfg.end_mask & ~indexed_dfg.start_mask
+        sources = indexed_dfg.sources[end_not_start[indexed_dfg.targets]]
+        return np.bincount(labels[sources], minlength=num_groups) > 0
 
 
 class LoopCutUVCL(LoopCut[IMDataStructureUVCL]):
@@ -196,6 +159,68 @@ class LoopCutUVCL(LoopCut[IMDataStructureUVCL]):
         return redo_logs
 
 
+class LoopCutEncodedUVCL(LoopCut[IMDataStructureEncodedUVCL]):
+
+    @classmethod
+    def project(cls, obj: IMDataStructureEncodedUVCL, groups: List[Collection[Any]], parameters: Optional[Dict[str, Any]] = None) -> List[IMDataStructureEncodedUVCL]:
+        """
+        Same projection of LoopCutUVCL: every maximal run of 'do' activities of a variant is a trace of the 'do' log,
+        and every maximal run of 'redo' activities is a trace of the 'redo' log sharing most activities with it
+        """
+        log = obj.data_structure
+        num_redo = len(groups) - 1
+        num_activities = len(log.activities)
+        is_do = log.get_activity_codes(groups[0])[log.events]
+        redo_lookup = log.get_group_lookup(groups[1:])
+        # the events not belonging to any group are ignored
+        relevant = is_do | (redo_lookup[log.events] >= 0)
+        events = log.events[relevant]
+        is_do = is_do[relevant]
+        variant_ids = log.variant_ids[relevant]
+        lengths = np.bincount(variant_ids, minlength=len(log))
+        offsets = np.concatenate(([0], np.cumsum(lengths))).astype(np.int64)
+
+        run_starts = np.flatnonzero(np.concatenate(([True], (is_do[1:] != is_do[:-1]) | (
+                variant_ids[1:] != variant_ids[:-1])))) if len(events) > 0 else np.zeros(0, dtype=np.int64)
+        run_ends = np.concatenate((run_starts[1:], [len(events)])).astype(np.int64)
+        run_variants = variant_ids[run_starts]
+        run_is_do = is_do[run_starts]
+
+        # an empty trace is inserted in the 'do' log for the variants not ending with a 'do' activity
+        last_positions = offsets[1:][lengths > 0] - 1
+        no_final_do = np.ones(len(log), dtype=bool)
+        no_final_do[variant_ids[last_positions[is_do[last_positions]]]] = False
+        do_starts = np.concatenate((run_starts[run_is_do], offsets[1:][no_final_do]))
+        do_ends = np.concatenate((run_ends[run_is_do], offsets[1:][no_final_do]))
+        do_variants = np.concatenate((run_variants[run_is_do], np.flatnonzero(no_final_do)))
+        order = np.lexsort((do_starts, do_variants))
+        do_log = encoded_uvcl.extract_segments(log.activities, events, do_starts[order], do_ends[order],
+                                               log.counts[do_variants[order]])
+
+        # every 'redo' run is assigned to the group sharing more (distinct) activities with it (ties are broken
+        # towards the highest index of the group)
+        redo_runs = np.flatnonzero(~run_is_do)
+        run_of_event = np.repeat(np.arange(len(run_starts), dtype=np.int64), run_ends - run_starts)
+        redo_events = ~is_do
+        pairs = np.unique(run_of_event[redo_events] * num_activities + events[redo_events])
+        keys, shared = np.unique((pairs // num_activities) * num_redo + redo_lookup[pairs % num_activities],
+                                 return_counts=True)
+        assignment = np.zeros(len(run_starts), dtype=np.int64)
+        if len(keys) > 0:
+            runs = keys // num_redo
+            order = np.lexsort((shared * num_redo + keys % num_redo, runs))
+            last = np.concatenate((runs[order][1:] != runs[order][:-1], [True]))
+            assignment[runs[order][last]] = (keys % num_redo)[order][last]
+        redo_logs = []
+        for i in range(num_redo):
+            selected = redo_runs[assignment[redo_runs] == i]
+            redo_logs.append(encoded_uvcl.extract_segments(log.activities, events, run_starts[selected],
+                                                           run_ends[selected], log.counts[run_variants[selected]]))
+        logs = [do_log]
+        logs.extend(redo_logs)
+        return list(map(lambda l: IMDataStructureEncodedUVCL(l), logs))
+
+
 class LoopCutDFG(LoopCut[IMDataStructureDFG]):
 
     @classmethod
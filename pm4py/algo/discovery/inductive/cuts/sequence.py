@@ -21,13 +21,17 @@ from collections import Counter
 from typing import Collection, Any, List, Optional, Generic, Dict
 from typing import Tuple
 
+import numpy as np
+
 from pm4py.algo.discovery.inductive.cuts.abc import Cut
 from pm4py.algo.discovery.inductive.cuts.abc import T
 from pm4py.algo.discovery.inductive.dtypes.im_dfg import InductiveDFG
-from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructureUVCL, IMDataStructureDFG
-from pm4py.objects.dfg import util as dfu
+from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructureUVCL, IMDataStructureDFG, \
+    IMDataStructureEncodedUVCL
+from pm4py.algo.discovery.inductive.dtypes.im_indexed_dfg import complement_components
 from pm4py.objects.dfg.obj import DFG
 from pm4py.objects.process_tree.obj import Operator, ProcessTree
+from pm4py.util.compression import encoded_uvcl
 
 
 class SequenceCut(Cut[T], ABC, Generic[T]):
@@ -70,21 +74,32 @@ class SequenceCut(Cut[T], ABC, Generic[T]):
         2. merge pairwise reachable nodes (based on transitive relations)
         3. merge pairwise unreachable nodes (based on transitive relations)
         4. sort the groups based on their reachability
+
+        The pairwise reachable nodes are the nodes of the same strongly connected component, hence the groups are
+        the connected components of the complement of the reachability relation between the strongly connected
+        components (which is computed on bitsets).
         '''
-        dfg = obj.dfg
-        alphabet = dfu.get_vertices(dfg)
-        transitive_predecessors, transitive_successors = dfu.get_transitive_relations(dfg)
-        groups = [{a} for a in alphabet]
-        if len(groups) == 0:
+        indexed_dfg = obj.indexed_dfg
+        n = len(indexed_dfg.vertices)
+        if n == 0:
             return None
 
-        old_size = None
-        while old_size != len(groups):
-            old_size = len(groups)
-            groups = SequenceCut.merge_groups(groups, transitive_successors)
+        num_components, labels = indexed_dfg.get_strongly_connected_components()
+        descendants, ancestors = indexed_dfg.get_reachability()
+        component_groups = complement_components([descendants[c] | ancestors[c] for c in range(num_components)])
+        group_of_component = np.empty(num_components, dtype=np.int64)
+        for i, g in enumerate(component_groups):
+            group_of_component[g] = i
+        vertices_groups = [[] for _ in component_groups]
+        for v, g in enumerate(group_of_component[labels].tolist()):
+            vertices_groups[g].append(v)
+        vertices_groups = sorted(vertices_groups, key=lambda g: g[0])
 
-        groups = list(sorted(groups, key=lambda g: len(
-            transitive_predecessors[next(iter(g))]) + (len(alphabet) - len(transitive_successors[next(iter(g))]))))
+        def key(g):
+            num_predecessors, num_successors = indexed_dfg.get_transitive_counts(g[0])
+            return num_predecessors + (n - num_successors)
+
+        groups = [indexed_dfg.get_activities(g) for g in sorted(vertices_groups, key=key)]
 
         return groups if len(groups) > 1 else None
 
@@ -92,27 +107,18 @@ class SequenceCut(Cut[T], ABC, Generic[T]):
 class StrictSequenceCut(SequenceCut[T], ABC, Generic[T]):
 
     @classmethod
-    def _skippable(cls, p: int, dfg: DFG, start: Collection[Any], end: Collection[Any],
-                   groups: List[Collection[Any]], parameters: Optional[Dict[str, Any]] = None) -> bool:
+    def _skippable(cls, p: int, sources: np.ndarray, targets: np.ndarray, start: np.ndarray, end: np.ndarray,
+                   parameters: Optional[Dict[str, Any]] = None) -> bool:
         """
         This method implements the function SKIPPABLE as defined on page 233 of
         "Robust Process Mining with Guarantees" by Sander J.J. Leemans (ISBN: 978-90-386-4257-4)
         The function is used as a helper function for the strict sequence cut detection mechanism, which detects
         larger groups of skippable activities.
+
+        The groups are provided as the index of the group of the source/target of every arc of the DFG, and of every
+        start/end activity.
         """
-        for i, j in itertools.product(range(0, p), range(p + 1, len(groups))):
-            for a, b in itertools.product(groups[i], groups[j]):
-                if (a, b) in dfg.graph:
-                    return True
-        for i in range(p + 1, len(groups)):
-            for a in groups[i]:
-                if a in start:
-                    return True
-        for i in range(0, p):
-            for a in groups[i]:
-                if a in end:
-                    return True
-        return False
+        return bool(np.any((sources < p) & (targets > p)) or np.any(start > p) or np.any(end < p))
 
     @classmethod
     def holds(cls, obj: T, parameters: Optional[Dict[str, Any]] = None) -> Optional[List[Collection[Any]]]:
@@ -121,29 +127,38 @@ class StrictSequenceCut(SequenceCut[T], ABC, Generic[T]):
         "Robust Process Mining with Guarantees" by Sander J.J. Leemans (ISBN: 978-90-386-4257-4)
         The function merges groups that together can be skipped.
         """
-        dfg = obj.dfg
         c = SequenceCut.holds(obj)
-        start = set(dfg.start_activities.keys())
-        end = set(dfg.end_activities.keys())
         if c is not None:
-            mf = [-1 * sys.maxsize if len(set(G).intersection(start)) > 0 else sys.maxsize for G in c]
-            mt = [sys.maxsize if len(set(G).intersection(end)) > 0 else -1 * sys.maxsize for G in c]
+            indexed_dfg = obj.indexed_dfg
             cmap = cls._construct_alphabet_cluster_map(c)
-            for (a, b) in dfg.graph:
-                mf[cmap[b]] = min(mf[cmap[b]], cmap[a])
-                mt[cmap[a]] = max(mt[cmap[a]], cmap[b])
-
+            group = np.array([cmap[a] for a in indexed_dfg.vertices], dtype=np.int64)
+            source_group = group[indexed_dfg.sources]
+            target_group = group[indexed_dfg.targets]
+            mf = np.full(len(c), sys.maxsize, dtype=np.int64)
+            mf[group[indexed_dfg.start_mask]] = -1 * sys.maxsize
+            mt = np.full(len(c), -1 * sys.maxsize, dtype=np.int64)
+            mt[group[indexed_dfg.end_mask]] = sys.maxsize
+            np.minimum.at(mf, target_group, source_group)
+            np.maximum.at(mt, source_group, target_group)
+            mf = mf.tolist()
+            mt = mt.tolist()
+
+            # position of the (possibly merged) group of every group
+            position = np.arange(len(c), dtype=np.int64)
             for p in range(0, len(c)):
-                if cls._skippable(p, dfg, start, end, c):
+                if cls._skippable(p, position[source_group], position[target_group],
+                                  position[group[indexed_dfg.start_mask]], position[group[indexed_dfg.end_mask]]):
                     q = p - 1
                     while q >= 0 and mt[q] <= p:
                         c[p] = c[p].union(c[q])
                         c[q] = set()
+                        position[position == q] = p
                         q -= 1
                     q = p + 1
                     while q < len(mf) and mf[q] >= p:
                         c[p] = c[p].union(c[q])
                         c[q] = set()
+                        position[position == q] = p
                         q += 1
             return list(filter(lambda g: len(g) > 0, c))
         return None
@@ -209,85 +224,106 @@ class StrictSequenceCutUVCL(StrictSequenceCut[IMDataStructureUVCL], SequenceCutU
         return StrictSequenceCut.holds(obj, parameters)
 
 
+class SequenceCutEncodedUVCL(SequenceCut[IMDataStructureEncodedUVCL]):
+
+    @classmethod
+    def project(cls, obj: IMDataStructureEncodedUVCL, groups: List[Collection[Any]], parameters: Optional[Dict[str, Any]] = None) -> List[IMDataStructureEncodedUVCL]:
+        """
+        Same projection of SequenceCutUVCL, computing the split points of all the variants at once
+        """
+        log = obj.data_structure
+        group_of = log.get_group_lookup(groups)[log.events]
+        variant_ids = log.variant_ids
+        positions = log.positions
+        split_points = np.zeros(len(log), dtype=np.int64)
+        logs = []
+        for i in range(len(groups)):
+            active = positions >= split_points[variant_ids]
+            # the cost decreases on the events of the group, and increases on the events not belonging to the
+            # group or to one of the previous groups
+            cost = np.where(group_of == i, -1, np.where((group_of >= 0) & (group_of < i), 0, 1))
+            cost[~active] = 0
+            # cumulative cost inside the variant
+            cost = np.cumsum(cost)
+            cost = cost - np.concatenate(([0], cost))[log.offsets[:-1]][variant_ids]
+            least_cost = np.zeros(len(log), dtype=np.int64)
+            np.minimum.at(least_cost, variant_ids[active], cost[active])
+            # the new split point follows the first position having the least (negative) cost
+            hits = np.flatnonzero(active & (cost == least_cost[variant_ids]) & (least_cost[variant_ids] < 0))
+            hit_variants, first_hits = np.unique(variant_ids[hits], return_index=True)
+            new_split_points = split_points.copy()
+            new_split_points[hit_variants] = positions[hits[first_hits]] + 1
+            mask = active & (positions < new_split_points[variant_ids]) & (group_of == i)
+            lengths = np.bincount(variant_ids[mask], minlength=len(log))
+            logs.append(encoded_uvcl.compact(log.activities, log.events[mask], lengths, log.counts))
+            split_points = new_split_points
+        return list(map(lambda l: IMDataStructureEncodedUVCL(l), logs))
+
+
+class StrictSequenceCutEncodedUVCL(StrictSequenceCut[IMDataStructureEncodedUVCL], SequenceCutEncodedUVCL):
+
+    @classmethod
+    def holds(cls, obj: T, parameters: Optional[Dict[str, Any]] = None) -> Optional[List[Collection[Any]]]:
+        return StrictSequenceCut.holds(obj, parameters)
+
+
 class SequenceCutDFG(SequenceCut[IMDataStructureDFG]):
 
     @classmethod
     def project(cls, obj: IMDataStructureDFG, groups: List[Collection[Any]], parameters: Optional[Dict[str, Any]] = None) -> List[IMDataStructureDFG]:
         dfg = obj.dfg
-        start_activities = []
-        end_activities = []
-        activities = []
-        dfgs = []
-        skippable = []
-        for g in groups:
-            skippable.append(False)
+        skippable = [False for g in groups]
         activities_idx = {}
         for gind, g in enumerate(groups):
             for act in g:
                 activities_idx[act] = int(gind)
-        i = 0
-        while i < len(groups):
-            to_succ_arcs = Counter()
-            from_prev_arcs = Counter()
-            if i < len(groups) - 1:
-                for (a, b) in dfg.graph:
-                    if a in groups[i] and b in groups[i + 1]:
-                        to_succ_arcs[a] += dfg.graph[(a, b)]
-
-            if i > 0:
-                for (a, b) in dfg.graph:
-                    if a in groups[i - 1] and b in groups[i]:
-                        from_prev_arcs[b] += dfg.graph[(a, b)]
-
-            if i == 0:
-                start_activities.append({})
-                for a in dfg.start_activities:
-                    if a in groups[i]:
-                        start_activities[i][a] = dfg.start_activities[a]
-                    else:
-                        j = i
-                        while j < activities_idx[a]:
-                            skippable[j] = True
-                            j = j + 1
+        dfgs = [DFG() for g in groups]
+
+        # the arcs are visited once: the arcs inside a group are kept, the arcs between two consecutive groups provide
+        # the end activities of the first group and the start activities of the second group
+        to_succ_arcs = [Counter() for g in groups]
+        from_prev_arcs = [Counter() for g in groups]
+        # number of arcs skipping the group (difference array over the positions of the groups)
+        skipping_arcs = [0] * (len(groups) + 1)
+        for (a, b) in dfg.graph:
+            i, z = activities_idx[a], activities_idx[b]
+            if i == z:
+                dfgs[i].graph[(a, b)] = dfg.graph[(a, b)]
+            elif z == i + 1:
+                to_succ_arcs[i][a] += dfg.graph[(a, b)]
+                from_prev_arcs[z][b] += dfg.graph[(a, b)]
+            if i + 1 < z:
+                skipping_arcs[i + 1] += 1
+                skipping_arcs[z] -= 1
+
+        for a in dfg.start_activities:
+            if a in groups[0]:
+                dfgs[0].start_activities[a] = dfg.start_activities[a]
             else:
-                start_activities.append(from_prev_arcs)
-
-            if i == len(groups) - 1:
-                end_activities.append({})
-                for a in dfg.end_activities:
-                    if a in groups[i]:
-                        end_activities[i][a] = dfg.end_activities[a]
-                    else:
-                        j = activities_idx[a] + 1
-                        while j <= i:
-                            skippable[j] = True
-                            j = j + 1
+                j = 0
+                while j < activities_idx[a]:
+                    skippable[j] = True
+                    j = j + 1
+        for a in dfg.end_activities:
+            if a in groups[-1]:
+                dfgs[-1].end_activities[a] = dfg.end_activities[a]
             else:
-                end_activities.append(to_succ_arcs)
-
-            activities.append({})
-            act_count = dfu.get_vertex_frequencies(dfg)
-            for a in groups[i]:
-                activities[i][a] = act_count[a]
-            dfgs.append({})
-            for (a, b) in dfg.graph:
-                if a in groups[i] and b in groups[i]:
-                    dfgs[i][(a, b)] = dfg.graph[(a, b)]
-            i = i + 1
-        i = 0
-        while i < len(dfgs):
-            dfi = DFG()
-            [dfi.graph.update({(a, b): dfgs[i][(a, b)]}) for (a, b) in dfgs[i]]
-            [dfi.start_activities.update({a: start_activities[i][a]}) for a in start_activities[i]]
-            [dfi.end_activities.update({a: end_activities[i][a]}) for a in end_activities[i]]
-            dfgs[i] = dfi
-            i = i + 1
-        for (a, b) in dfg.graph:
-            z = activities_idx[b]
-            j = activities_idx[a] + 1
-            while j < z:
+                j = activities_idx[a] + 1
+                while j <= len(groups) - 1:
+                    skippable[j] = True
+                    j = j + 1
+        for i in range(len(groups)):
+            if i > 0:
+                dfgs[i].start_activities.update(from_prev_arcs[i])
+            if i < len(groups) - 1:
+                dfgs[i].end_activities.update(to_succ_arcs[i])
+
+        # a group skipped by an arc of the DFG is not marked as skippable
+        skipping = 0
+        for j in range(len(groups)):
+            skipping += skipping_arcs[j]
+            if skipping > 0:
                 skippable[j] = False
-                j = j + 1
 
         return [IMDataStructureDFG(InductiveDFG(dfg=dfgs[i], skip=skippable[i])) for i in range(len(dfgs))]
 
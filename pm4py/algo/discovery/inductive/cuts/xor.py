@@ -18,12 +18,13 @@ from abc import ABC
 from collections import Counter
 from typing import Optional, List, Collection, Any, Generic, Dict
 
-from pm4py.util import nx_utils
+import numpy as np
+
 
 from pm4py.algo.discovery.inductive.cuts.abc import Cut, T
 from pm4py.algo.discovery.inductive.dtypes.im_dfg import InductiveDFG
-from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructureUVCL, IMDataStructureDFG
-from pm4py.objects.dfg import util as dfu
+from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructureUVCL, IMDataStructureDFG, \
+    IMDataStructureEncodedUVCL
 from pm4py.objects.dfg.obj import DFG
 from pm4py.objects.process_tree.obj import Operator, ProcessTree
 
@@ -46,13 +47,12 @@ class ExclusiveChoiceCut(Cut[T], ABC, Generic[T]):
         2.) we detect the connected components in the graph.
         3.) if there are more than one connected components, the cut exists and is non-minimal.
         '''
-        nx_dfg = dfu.as_nx_graph(obj.dfg)
-        nx_und = nx_dfg.to_undirected()
-        conn_comps = [nx_und.subgraph(c).copy() for c in nx_utils.connected_components(nx_und)]
+        indexed_dfg = obj.indexed_dfg
+        conn_comps = indexed_dfg.get_connected_components()
         if len(conn_comps) > 1:
             cuts = list()
             for comp in conn_comps:
-                cuts.append(set(comp.nodes))
+                cuts.append(indexed_dfg.get_activities(comp))
             return cuts
         else:
             return None
@@ -77,22 +77,57 @@ class ExclusiveChoiceCutUVCL(ExclusiveChoiceCut[IMDataStructureUVCL]):
         return list(map(lambda l: IMDataStructureUVCL(l), logs))
 
 
+class ExclusiveChoiceCutEncodedUVCL(ExclusiveChoiceCut[IMDataStructureEncodedUVCL]):
+    @classmethod
+    def project(cls, obj: IMDataStructureEncodedUVCL, groups: List[Collection[Any]], parameters: Optional[Dict[str, Any]] = None) -> List[IMDataStructureEncodedUVCL]:
+        log = obj.data_structure
+        num_groups = len(groups)
+        group_of = log.get_group_lookup(groups)[log.events]
+        variant_ids = log.variant_ids
+        in_group = group_of >= 0
+        # every variant is assigned to the group containing most of its events (ties are broken towards the highest
+        # index of the group, as in ExclusiveChoiceCutUVCL)
+        assignment = np.full(len(log), num_groups - 1, dtype=np.int64)
+        keys, occurrences = np.unique(variant_ids[in_group] * num_groups + group_of[in_group], return_counts=True)
+        if len(keys) > 0:
+            variants = keys // num_groups
+            order = np.lexsort((occurrences * num_groups + keys % num_groups, variants))
+            last = np.concatenate((variants[order][1:] != variants[order][:-1], [True]))
+            assignment[variants[order][last]] = (keys % num_groups)[order][last]
+        keep = group_of == assignment[variant_ids]
+        logs = log.partition(keep, assignment, num_groups)
+        if np.all(keep):
+            # every variant is entirely contained in a group, hence the DFGs are the restrictions of the parent's DFG
+            dfg = log.get_dfg()
+            for g, sub_log in zip(groups, logs):
+                dfg_new = DFG()
+                for a in dfg.start_activities:
+                    if a in g:
+                        dfg_new.start_activities[a] = dfg.start_activities[a]
+                for a in dfg.end_activities:
+                    if a in g:
+                        dfg_new.end_activities[a] = dfg.end_activities[a]
+                for (a, b) in dfg.graph:
+                    if a in g and b in g:
+                        dfg_new.graph[(a, b)] = dfg.graph[(a, b)]
+                sub_log.set_dfg(dfg_new)
+        return list(map(lambda l: IMDataStructureEncodedUVCL(l), logs))
+
+
 class ExclusiveChoiceCutDFG(ExclusiveChoiceCut[IMDataStructureDFG]):
 
     @classmethod
     def project(cls, obj: IMDataStructureDFG, groups: List[Collection[Any]], parameters: Optional[Dict[str, Any]] = None) -> List[IMDataStructureDFG]:
         dfg = obj.dfg
-        dfgs = []
-        for g in groups:
-            dfg_new = DFG()
-            for a in dfg.start_activities:
-                if a in g:
-                    dfg_new.start_activities[a] = dfg.start_activities[a]
-            for a in dfg.end_activities:
-                if a in g:
-                    dfg_new.end_activities[a] = dfg.end_activities[a]
-            for (a, b) in dfg.graph:
-                if a in g and b in g:
-                    dfg_new.graph[(a, b)] = dfg.graph[(a, b)]
-            dfgs.append(dfg_new)
+        dfgs = [DFG() for g in groups]
+        activities_idx = {a: i for i, g in enumerate(groups) for a in g}
+        for a in dfg.start_activities:
+            if a in activities_idx:
+                dfgs[activities_idx[a]].start_activities[a] = dfg.start_activities[a]
+        for a in dfg.end_activities:
+            if a in activities_idx:
+                dfgs[activities_idx[a]].end_activities[a] = dfg.end_activities[a]
+        for (a, b) in dfg.graph:
+            if a in activities_idx and activities_idx[a] == activities_idx.get(b):
+                dfgs[activities_idx[a]].graph[(a, b)] = dfg.graph[(a, b)]
         return list(map(lambda d: IMDataStructureDFG(InductiveDFG(dfg=d, skip=False)), dfgs))
@@ -18,9 +18,11 @@ from abc import ABC
 from typing import TypeVar, Generic, Optional
 
 from pm4py.algo.discovery.inductive.dtypes.im_dfg import InductiveDFG
+from pm4py.algo.discovery.inductive.dtypes.im_indexed_dfg import IndexedDFG
 from pm4py.objects.dfg.obj import DFG
 from pm4py.util.compression import util as comut
 from pm4py.util.compression.dtypes import UVCL
+from pm4py.util.compression.encoded_uvcl import EncodedUVCL
 
 T = TypeVar('T')
 
@@ -35,11 +37,21 @@ class IMDataStructure(ABC, Generic[T]):
 
     def __init__(self, obj: T):
         self._obj = obj
+        self._indexed_dfg = None
 
     @property
     def dfg(self) -> DFG:
         pass
 
+    @property
+    def indexed_dfg(self) -> IndexedDFG:
+        """
+        Integer-indexed representation of the DFG (computed once, and shared by the cut detectors)
+        """
+        if self._indexed_dfg is None:
+            self._indexed_dfg = IndexedDFG(self.dfg)
+        return self._indexed_dfg
+
     @property
     def data_structure(self) -> T:
         return self._obj
@@ -68,6 +80,24 @@ class IMDataStructureUVCL(IMDataStructureLog[UVCL]):
         return self._dfg
 
 
+class IMDataStructureEncodedUVCL(IMDataStructureUVCL):
+    """
+    Log-Based data structure class that represents the event log as an array-backed (integer-encoded) UVCL.
+    The projections of the cuts and of the fall-throughs are computed on the arrays.
+    """
+
+    def __init__(self, obj: EncodedUVCL, dfg: Optional[DFG] = None):
+        IMDataStructureLog.__init__(self, obj)
+        if dfg is None:
+            self._dfg = self._obj.get_dfg()
+        else:
+            self._dfg = dfg
+
+    @property
+    def data_structure(self) -> EncodedUVCL:
+        return self._obj
+
+
 class IMDataStructureDFG(IMDataStructure[InductiveDFG]):
     """
     DFG-Based data structure class
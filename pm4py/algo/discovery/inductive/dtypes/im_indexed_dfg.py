@@ -0,0 +1,219 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+from collections import deque
+from typing import List, Optional, Tuple, Any, Set
+
+import numpy as np
+
+from pm4py.objects.dfg import util as dfu
+from pm4py.objects.dfg.obj import DFG
+
+
+def bitset_to_mask(bitset: int, size: int) -> np.ndarray:
+    """
+    Converts a bitset (Python integer) into a boolean mask of the given size
+    """
+    num_bytes = (size + 7) // 8
+    return np.unpackbits(np.frombuffer(bitset.to_bytes(num_bytes, "little"), dtype=np.uint8), count=size,
+                         bitorder="little").astype(bool)
+
+
+def mask_to_bitset(mask: np.ndarray) -> int:
+    """
+    Converts a boolean mask into a bitset (Python integer)
+    """
+    return int.from_bytes(np.packbits(mask, bitorder="little").tobytes(), "little")
+
+
+def complement_components(bitsets: List[int]) -> List[List[int]]:
+    """
+    Computes the connected components of the complement of a graph, whose (symmetric) adjacency is given as a list of
+    bitsets (a node is always considered adjacent to itself). The components are sorted by their first node, and the
+    nodes of a component are sorted.
+
+    The visit keeps the bitset of the nodes not yet visited, hence every node costs a constant number of operations
+    on bitsets.
+    """
+    size = len(bitsets)
+    unvisited = (1 << size) - 1
+    components = []
+    while unvisited:
+        first = (unvisited & -unvisited).bit_length() - 1
+        unvisited &= ~(1 << first)
+        component = [first]
+        queue = deque([first])
+        while queue:
+            node = queue.popleft()
+            neighbors = unvisited & ~bitsets[node]
+            unvisited &= ~neighbors
+            while neighbors:
+                lowest = neighbors & -neighbors
+                neighbor = lowest.bit_length() - 1
+                neighbors ^= lowest
+                component.append(neighbor)
+                queue.append(neighbor)
+        components.append(sorted(component))
+    return components
+
+
+class IndexedDFG(object):
+    """
+    Integer-indexed representation of a DFG, computed once per recursion node of the inductive miner and shared by
+    the cut detectors: the vertices are numbered following the order of the networkx graphs built on the DFG
+    (dfu.as_nx_graph), the arcs are stored as arrays of indexes, and the reachability is stored as bitsets
+    (Python integers) over the strongly connected components.
+    """
+
+    def __init__(self, dfg: DFG):
+        self.vertices = list(dfu.get_vertices(dfg))
+        self.index = {a: i for i, a in enumerate(self.vertices)}
+        self.sources = np.fromiter((self.index[a] for (a, b) in dfg.graph), dtype=np.int64, count=len(dfg.graph))
+        self.targets = np.fromiter((self.index[b] for (a, b) in dfg.graph), dtype=np.int64, count=len(dfg.graph))
+        self.start_mask = self.get_mask(dfg.start_activities)
+        self.end_mask = self.get_mask(dfg.end_activities)
+        self._scc = None
+        self._reachability = None
+
+    def get_mask(self, activities: Any) -> np.ndarray:
+        """
+        Gets a boolean mask over the vertices, which is true for the provided activities
+        """
+        mask = np.zeros(len(self.vertices), dtype=bool)
+        mask[[self.index[a] for a in activities if a in self.index]] = True
+        return mask
+
+    def get_activities(self, indexes: Any) -> Set[Any]:
+        return set(self.vertices[i] for i in indexes)
+
+    def __get_matrix(self, sources: np.ndarray, targets: np.ndarray):
+        # the CSR matrix is built directly in the format expected by scipy.sparse.csgraph (avoiding the conversions,
+        # which dominate the cost on the small DFGs of the deep recursion nodes)
+        from scipy.sparse import csr_matrix
+
+        n = len(self.vertices)
+        indptr = np.zeros(n + 1, dtype=np.int32)
+        np.cumsum(np.bincount(sources, minlength=n), out=indptr[1:])
+        indices = targets[np.argsort(sources, kind="stable")].astype(np.int32)
+        return csr_matrix((np.ones(len(indices)), indices, indptr), shape=(n, n))
+
+    def get_connected_components(self, mask: Optional[np.ndarray] = None) -> List[List[int]]:
+        """
+        Gets the connected components of the undirected version of the graph (restricted to the vertices of the mask,
+        if provided), sorted by their first vertex
+
+        Parameters
+        ---------------
+        mask
+            (optional) boolean mask of the vertices to consider
+
+        Returns
+        ---------------
+        components
+            List of components (lists of vertex indexes)
+        """
+        from scipy.sparse.csgraph import connected_components
+
+        n = len(self.vertices)
+        if mask is None:
+            mask = np.ones(n, dtype=bool)
+        keep = mask[self.sources] & mask[self.targets]
+        _, labels = connected_components(self.__get_matrix(self.sources[keep], self.targets[keep]), directed=False)
+        vertices = np.flatnonzero(mask)
+        labels = labels[vertices]
+        # the components are numbered following the order of their first vertex
+        _, first, inverse = np.unique(labels, return_index=True, return_inverse=True)
+        rank = np.empty(len(first), dtype=np.int64)
+        rank[np.argsort(first, kind="stable")] = np.arange(len(first))
+        components = [[] for _ in range(len(first))]
+        for v, c in zip(vertices.tolist(), rank[inverse].tolist()):
+            components[c].append(v)
+        return components
+
+    def get_strongly_connected_components(self) -> Tuple[int, np.ndarray]:
+        """
+        Gets the number of strongly connected components and the component of every vertex
+        """
+        if self._scc is None:
+            from scipy.sparse.csgraph import connected_components
+
+            self._scc = connected_components(self.__get_matrix(self.sources, self.targets), directed=True,
+                                             connection="strong")
+        return self._scc
+
+    def get_reachability(self) -> Tuple[List[int], List[int]]:
+        """
+        Gets, for every strongly connected component, the bitset of the components reachable from it and the bitset
+        of the components from which it is reachable (excluding the component itself)
+        """
+        if self._reachability is None:
+            num_components, labels = self.get_strongly_connected_components()
+            arcs = np.unique(labels[self.sources] * num_components + labels[self.targets])
+            arcs = arcs[arcs // num_components != arcs % num_components] if num_components > 0 else arcs
+            successors = [[] for _ in range(num_components)]
+            predecessors = [[] for _ in range(num_components)]
+            in_degree = [0] * num_components
+            for arc in arcs.tolist():
+                successors[arc // num_components].append(arc % num_components)
+                predecessors[arc % num_components].append(arc // num_components)
+                in_degree[arc % num_components] += 1
+            # topological order of the condensation
+            order = [c for c in range(num_components) if in_degree[c] == 0]
+            i = 0
+            while i < len(order):
+                for s in successors[order[i]]:
+                    in_degree[s] -= 1
+                    if in_degree[s] == 0:
+                        order.append(s)
+                i += 1
+            descendants = [0] * num_components
+            for c in reversed(order):
+                for s in successors[c]:
+                    descendants[c] |= descendants[s] | (1 << s)
+            ancestors = [0] * num_components
+            for c in order:
+                for p in predecessors[c]:
+                    ancestors[c] |= ancestors[p] | (1 << p)
+            self._reachability = (descendants, ancestors)
+        return self._reachability
+
+    def get_transitive_counts(self, vertex: int) -> Tuple[int, int]:
+        """
+        Gets the number of vertices that can reach the given vertex, and the number of vertices reachable from it
+        (the same counts of the transitive relations computed by dfu.get_transitive_relations)
+        """
+        num_components, labels = self.get_strongly_connected_components()
+        descendants, ancestors = self.get_reachability()
+        sizes = np.bincount(labels, minlength=num_components)
+        component = labels[vertex]
+        # the other vertices of the same strongly connected component are both predecessors and successors
+        same = int(sizes[component]) - 1
+        num_predecessors = int(sizes[bitset_to_mask(ancestors[component], num_components)].sum()) + same
+        num_successors = int(sizes[bitset_to_mask(descendants[component], num_components)].sum()) + same
+        return num_predecessors, num_successors
+
+    def get_bidirectional_bitsets(self) -> List[int]:
+        """
+        Gets, for every vertex a, the bitset of the vertices b (b != a) such that both (a, b) and (b, a) are arcs
+        of the DFG
+        """
+        n = len(self.vertices)
+        codes = self.sources * n + self.targets
+        reverse = np.isin(self.targets * n + self.sources, codes) & (self.sources != self.targets)
+        bitsets = [0] * n
+        for a, b in zip(self.sources[reverse].tolist(), self.targets[reverse].tolist()):
+            bitsets[a] |= 1 << b
+        return bitsets
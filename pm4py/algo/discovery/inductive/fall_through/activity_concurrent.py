@@ -18,12 +18,13 @@ from collections import Counter
 from typing import Optional, Tuple, List, Any, Dict
 
 from pm4py.algo.discovery.inductive.cuts.factory import CutFactory
-from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructureUVCL
+from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructureUVCL, IMDataStructureEncodedUVCL
 from pm4py.algo.discovery.inductive.fall_through.abc import FallThrough
 from pm4py.algo.discovery.inductive.variants.instances import IMInstance
 from pm4py.objects.process_tree.obj import ProcessTree, Operator
 from pm4py.util.compression import util as comut
 from pm4py.util.compression.dtypes import UVCL
+from pm4py.util.compression.encoded_uvcl import EncodedUVCL
 from enum import Enum
 from pm4py.util import exec_utils, constants
 
@@ -45,6 +46,10 @@ class ActivityConcurrentUVCL(FallThrough[IMDataStructureUVCL]):
             queue.put((c, cut))
         return cut if cut is not None else None
 
+    @classmethod
+    def _get_alphabet(cls, log: UVCL) -> List[Any]:
+        return sorted(list(comut.get_alphabet(log)))
+
     @classmethod
     def _get_candidate(cls, obj: IMDataStructureUVCL, pool, manager, parameters: Optional[Dict[str, Any]] = None) -> Optional[Any]:
         if parameters is None:
@@ -53,7 +58,7 @@ class ActivityConcurrentUVCL(FallThrough[IMDataStructureUVCL]):
         enable_multiprocessing = exec_utils.get_param_value(Parameters.MULTIPROCESSING, parameters, constants.ENABLE_MULTIPROCESSING_DEFAULT)
 
         log = obj.data_structure
-        candidates = sorted(list(comut.get_alphabet(log)))
+        candidates = cls._get_alphabet(log)
         if pool is None or manager is None or not enable_multiprocessing or len(candidates) <= ActivityConcurrentUVCL.MULTI_PROCESSING_LOWER_BOUND:
             for a in candidates:
                 cut = cls._process_candidate(a, log, parameters=parameters)
@@ -106,3 +111,29 @@ class ActivityConcurrentUVCL(FallThrough[IMDataStructureUVCL]):
             l_a.update({tuple(filter(lambda e: e == candidate, t)): log[t]})
             l_other.update({tuple(filter(lambda e: e != candidate, t)): log[t]})
         return ProcessTree(operator=Operator.PARALLEL), [IMDataStructureUVCL(l_a), IMDataStructureUVCL(l_other)]
+
+
+class ActivityConcurrentEncodedUVCL(ActivityConcurrentUVCL):
+
+    @classmethod
+    def _get_alphabet(cls, log: EncodedUVCL) -> List[Any]:
+        return [log.activities[c] for c in log.get_alphabet_codes().tolist()]
+
+    @classmethod
+    def _process_candidate(cls, c: Any, log: EncodedUVCL, queue=None, ev=None, parameters: Optional[Dict[str, Any]] = None):
+        l_alt = log.filter_events(log.events != log.get_activity_code(c))
+        cut = cls._find_cut(IMDataStructureEncodedUVCL(l_alt), ev, parameters=parameters)
+        if queue is not None:
+            queue.put((c, cut))
+        return cut if cut is not None else None
+
+    @classmethod
+    def apply(cls, obj: IMDataStructureEncodedUVCL, pool=None, manager=None, parameters: Optional[Dict[str, Any]] = None) -> Optional[
+        Tuple[ProcessTree, List[IMDataStructureEncodedUVCL]]]:
+        candidate = cls._get_candidate(obj, pool, manager, parameters)
+        if candidate is None:
+            return None
+        log = obj.data_structure
+        is_candidate = log.events == log.get_activity_code(candidate)
+        return ProcessTree(operator=Operator.PARALLEL), [IMDataStructureEncodedUVCL(log.filter_events(is_candidate)),
+                                                         IMDataStructureEncodedUVCL(log.filter_events(~is_candidate))]
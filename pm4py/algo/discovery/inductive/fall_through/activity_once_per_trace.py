@@ -17,8 +17,11 @@
 import copy
 from typing import Any, Optional, Dict
 
-from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructureUVCL
-from pm4py.algo.discovery.inductive.fall_through.activity_concurrent import ActivityConcurrentUVCL
+import numpy as np
+
+from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructureUVCL, IMDataStructureEncodedUVCL
+from pm4py.algo.discovery.inductive.fall_through.activity_concurrent import ActivityConcurrentUVCL, \
+    ActivityConcurrentEncodedUVCL
 from pm4py.util.compression import util as comut
 
 
@@ -35,3 +38,18 @@ class ActivityOncePerTraceUVCL(ActivityConcurrentUVCL):
             if len(candidates) == 0:
                 return None
         return next(iter(candidates))
+
+
+class ActivityOncePerTraceEncodedUVCL(ActivityConcurrentEncodedUVCL):
+
+    @classmethod
+    def _get_candidate(cls, obj: IMDataStructureEncodedUVCL, pool=None, manager=None, parameters: Optional[Dict[str, Any]] = None) -> Optional[Any]:
+        log = obj.data_structure
+        num_activities = len(log.activities)
+        occurrences, counts = np.unique(log.variant_ids * num_activities + log.events, return_counts=True)
+        # number of variants in which every activity occurs exactly once
+        once = np.bincount(occurrences[counts == 1] % num_activities, minlength=num_activities)
+        candidates = np.flatnonzero(once == len(log))
+        if len(log) == 0 or len(candidates) == 0:
+            return None
+        return log.activities[candidates[0]]
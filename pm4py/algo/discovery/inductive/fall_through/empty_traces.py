@@ -17,13 +17,17 @@
 from collections import Counter
 from typing import Tuple, List, Optional, Dict, Any
 
-from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructureUVCL, IMDataStructureDFG
+from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructureUVCL, IMDataStructureDFG, \
+    IMDataStructureEncodedUVCL
 from pm4py.algo.discovery.inductive.fall_through.abc import FallThrough
 from pm4py.objects.process_tree.obj import ProcessTree, Operator
 from pm4py.objects.dfg.obj import DFG
 from pm4py.algo.discovery.inductive.dtypes.im_dfg import InductiveDFG
+from pm4py.util.compression import encoded_uvcl
 from copy import copy
 
+import numpy as np
+
 
 class EmptyTracesUVCL(FallThrough[IMDataStructureUVCL]):
 
@@ -46,6 +50,30 @@ class EmptyTracesUVCL(FallThrough[IMDataStructureUVCL]):
         return len(list(filter(lambda t: len(t) == 0, obj.data_structure))) > 0
 
 
+class EmptyTracesEncodedUVCL(EmptyTracesUVCL):
+
+    @classmethod
+    def apply(cls, obj: IMDataStructureEncodedUVCL, pool=None, manager=None, parameters: Optional[Dict[str, Any]] = None) -> Optional[
+        Tuple[ProcessTree, List[IMDataStructureEncodedUVCL]]]:
+        if cls.holds(obj, parameters):
+            log = obj.data_structure
+            data_structure = log.select_variants(log.lengths > 0)
+            if data_structure:
+                # the empty traces do not contribute to the DFG
+                data_structure.set_dfg(log.get_dfg())
+                return ProcessTree(operator=Operator.XOR), [
+                    IMDataStructureEncodedUVCL(encoded_uvcl.empty_log(log.activities)),
+                    IMDataStructureEncodedUVCL(data_structure)]
+            else:
+                return ProcessTree(), []
+        else:
+            return None
+
+    @classmethod
+    def holds(cls, obj: IMDataStructureEncodedUVCL, parameters: Optional[Dict[str, Any]] = None) -> bool:
+        return bool(np.any(obj.data_structure.lengths == 0))
+
+
 class EmptyTracesDFG(FallThrough[IMDataStructureDFG]):
     @classmethod
     def apply(cls, obj: IMDataStructureDFG, pool=None, manager=None, parameters: Optional[Dict[str, Any]] = None) -> Optional[
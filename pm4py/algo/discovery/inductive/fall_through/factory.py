@@ -17,14 +17,18 @@
 
 from typing import List, TypeVar, Tuple, Optional, Dict, Any
 
-from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructure, IMDataStructureUVCL
+from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructure, IMDataStructureUVCL, \
+    IMDataStructureEncodedUVCL
 from pm4py.algo.discovery.inductive.fall_through.abc import FallThrough
-from pm4py.algo.discovery.inductive.fall_through.activity_concurrent import ActivityConcurrentUVCL
-from pm4py.algo.discovery.inductive.fall_through.activity_once_per_trace import ActivityOncePerTraceUVCL
-from pm4py.algo.discovery.inductive.fall_through.empty_traces import EmptyTracesUVCL, EmptyTracesDFG
-from pm4py.algo.discovery.inductive.fall_through.flower import FlowerModelUVCL, FlowerModelDFG
-from pm4py.algo.discovery.inductive.fall_through.strict_tau_loop import StrictTauLoopUVCL
-from pm4py.algo.discovery.inductive.fall_through.tau_loop import TauLoopUVCL
+from pm4py.algo.discovery.inductive.fall_through.activity_concurrent import ActivityConcurrentUVCL, \
+    ActivityConcurrentEncodedUVCL
+from pm4py.algo.discovery.inductive.fall_through.activity_once_per_trace import ActivityOncePerTraceUVCL, \
+    ActivityOncePerTraceEncodedUVCL
+from pm4py.algo.discovery.inductive.fall_through.empty_traces import EmptyTracesUVCL, EmptyTracesDFG, \
+    EmptyTracesEncodedUVCL
+from pm4py.algo.discovery.inductive.fall_through.flower import FlowerModelUVCL, FlowerModelDFG, FlowerModelEncodedUVCL
+from pm4py.algo.discovery.inductive.fall_through.strict_tau_loop import StrictTauLoopUVCL, StrictTauLoopEncodedUVCL
+from pm4py.algo.discovery.inductive.fall_through.tau_loop import TauLoopUVCL, TauLoopEncodedUVCL
 from pm4py.algo.discovery.inductive.variants.instances import IMInstance
 from pm4py.objects.process_tree.obj import ProcessTree
 from pm4py.util import exec_utils
@@ -55,6 +59,12 @@ class FallThroughFactory:
                 else:
                     return [EmptyTracesUVCL, ActivityOncePerTraceUVCL, ActivityConcurrentUVCL, StrictTauLoopUVCL,
                             TauLoopUVCL, FlowerModelUVCL]
+            if type(obj) is IMDataStructureEncodedUVCL:
+                if disable_fallthroughs:
+                    return [EmptyTracesEncodedUVCL, FlowerModelEncodedUVCL]
+                else:
+                    return [EmptyTracesEncodedUVCL, ActivityOncePerTraceEncodedUVCL, ActivityConcurrentEncodedUVCL,
+                            StrictTauLoopEncodedUVCL, TauLoopEncodedUVCL, FlowerModelEncodedUVCL]
         if inst is IMInstance.IMd:
             if disable_fallthroughs:
                 return [EmptyTracesDFG, FlowerModelDFG]
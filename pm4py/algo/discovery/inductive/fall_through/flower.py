@@ -17,12 +17,16 @@
 
 from typing import Optional, Tuple, List, Dict, Any
 
-from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructureUVCL, IMDataStructureDFG
+import numpy as np
+
+from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructureUVCL, IMDataStructureDFG, \
+    IMDataStructureEncodedUVCL
 from pm4py.algo.discovery.inductive.fall_through.abc import FallThrough
-from pm4py.algo.discovery.inductive.fall_through.empty_traces import EmptyTracesUVCL
+from pm4py.algo.discovery.inductive.fall_through.empty_traces import EmptyTracesUVCL, EmptyTracesEncodedUVCL
 from pm4py.objects.process_tree.obj import ProcessTree, Operator
 from pm4py.util.compression import util as comut
 from pm4py.util.compression.dtypes import UVCL
+from pm4py.util.compression import encoded_uvcl
 from pm4py.objects.dfg.obj import DFG
 from pm4py.algo.discovery.inductive.dtypes.im_dfg import InductiveDFG
 
@@ -46,6 +50,24 @@ class FlowerModelUVCL(FallThrough[IMDataStructureUVCL]):
         return ProcessTree(operator=Operator.LOOP), [im_uvcl_do, im_uvcl_redo]
 
 
+class FlowerModelEncodedUVCL(FallThrough[IMDataStructureEncodedUVCL]):
+
+    @classmethod
+    def holds(cls, obj: IMDataStructureEncodedUVCL, parameters: Optional[Dict[str, Any]] = None) -> bool:
+        return not EmptyTracesEncodedUVCL.holds(obj, parameters)
+
+    @classmethod
+    def apply(cls, obj: IMDataStructureEncodedUVCL, pool=None, manager=None, parameters: Optional[Dict[str, Any]] = None) -> Optional[
+        Tuple[ProcessTree, List[IMDataStructureEncodedUVCL]]]:
+        log = obj.data_structure
+        alphabet = log.get_alphabet_codes()
+        uvcl_do = encoded_uvcl.EncodedUVCL(log.activities, alphabet, np.arange(len(alphabet) + 1, dtype=np.int64),
+                                           np.ones(len(alphabet), dtype=np.int64))
+        uvcl_redo = encoded_uvcl.empty_log(log.activities)
+        return ProcessTree(operator=Operator.LOOP), [IMDataStructureEncodedUVCL(uvcl_do),
+                                                     IMDataStructureEncodedUVCL(uvcl_redo)]
+
+
 class FlowerModelDFG(FallThrough[IMDataStructureDFG]):
     @classmethod
     def holds(cls, obj: IMDataStructureDFG, parameters: Optional[Dict[str, Any]] = None) -> bool:
@@ -17,11 +17,15 @@
 from collections import Counter
 from typing import Optional, Tuple, List, Dict, Any
 
-from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructureUVCL
+import numpy as np
+
+from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructureUVCL, IMDataStructureEncodedUVCL
 from pm4py.algo.discovery.inductive.fall_through.abc import FallThrough
 from pm4py.objects.process_tree.obj import ProcessTree, Operator
 from pm4py.util.compression import util as comut
 from pm4py.util.compression.dtypes import UVCL
+from pm4py.util.compression import encoded_uvcl
+from pm4py.util.compression.encoded_uvcl import EncodedUVCL
 
 
 class StrictTauLoopUVCL(FallThrough[IMDataStructureUVCL]):
@@ -51,3 +55,43 @@ class StrictTauLoopUVCL(FallThrough[IMDataStructureUVCL]):
         proj = cls._get_projected_log(log)
         if sum(proj.values()) > sum(log.values()):
             return ProcessTree(operator=Operator.LOOP), [IMDataStructureUVCL(proj), IMDataStructureUVCL(Counter())]
+
+
+class StrictTauLoopEncodedUVCL(StrictTauLoopUVCL):
+
+    @classmethod
+    def _get_split_positions(cls, log: EncodedUVCL, parameters: Optional[Dict[str, Any]] = None) -> np.ndarray:
+        """
+        Gets the positions (in the flat array of events) at which the variants are split: an end activity followed
+        by a start activity
+        """
+        is_start = np.zeros(len(log.activities), dtype=bool)
+        is_start[log.get_start_codes()] = True
+        is_end = np.zeros(len(log.activities), dtype=bool)
+        is_end[log.get_end_codes()] = True
+        variant_ids = log.variant_ids
+        split = is_start[log.events[1:]] & is_end[log.events[:-1]] & (variant_ids[1:] == variant_ids[:-1])
+        return np.flatnonzero(split) + 1
+
+    @classmethod
+    def holds(cls, obj: IMDataStructureEncodedUVCL, parameters: Optional[Dict[str, Any]] = None) -> bool:
+        return len(cls._get_split_positions(obj.data_structure)) > 0
+
+    @classmethod
+    def apply(cls, obj: IMDataStructureEncodedUVCL, pool=None, manager=None, parameters: Optional[Dict[str, Any]] = None) -> Optional[Tuple[ProcessTree, List[IMDataStructureEncodedUVCL]]]:
+        log = obj.data_structure
+        split_positions = cls._get_split_positions(log)
+        if len(split_positions) > 0:
+            variant_ids = np.concatenate((np.arange(len(log), dtype=np.int64), log.variant_ids[split_positions]))
+            starts = np.concatenate((log.offsets[:-1], split_positions))
+            order = np.lexsort((starts, variant_ids))
+            variant_ids = variant_ids[order]
+            starts = starts[order]
+            # every segment ends where the following segment of the same variant starts (or at the end of the variant)
+            ends = log.offsets[1:][variant_ids]
+            same_variant = variant_ids[1:] == variant_ids[:-1]
+            ends[:-1][same_variant] = starts[1:][same_variant]
+            proj = log.get_segments(starts, ends, log.counts[variant_ids])
+            return ProcessTree(operator=Operator.LOOP), [IMDataStructureEncodedUVCL(proj),
+                                                         IMDataStructureEncodedUVCL(
+                                                             encoded_uvcl.empty_log(log.activities))]
@@ -17,9 +17,12 @@
 from collections import Counter
 from typing import Optional, Dict, Any
 
-from pm4py.algo.discovery.inductive.fall_through.strict_tau_loop import StrictTauLoopUVCL
+import numpy as np
+
+from pm4py.algo.discovery.inductive.fall_through.strict_tau_loop import StrictTauLoopUVCL, StrictTauLoopEncodedUVCL
 from pm4py.util.compression import util as comut
 from pm4py.util.compression.dtypes import UVCL
+from pm4py.util.compression.encoded_uvcl import EncodedUVCL
 
 
 class TauLoopUVCL(StrictTauLoopUVCL):
@@ -36,3 +39,14 @@ class TauLoopUVCL(StrictTauLoopUVCL):
                     x = i
             proj.update({t[x:len(t)]: log[t]})
         return proj
+
+
+class TauLoopEncodedUVCL(StrictTauLoopEncodedUVCL):
+
+    @classmethod
+    def _get_split_positions(cls, log: EncodedUVCL, parameters: Optional[Dict[str, Any]] = None) -> np.ndarray:
+        is_start = np.zeros(len(log.activities), dtype=bool)
+        is_start[log.get_start_codes()] = True
+        variant_ids = log.variant_ids
+        split = is_start[log.events[1:]] & (variant_ids[1:] == variant_ids[:-1])
+        return np.flatnonzero(split) + 1
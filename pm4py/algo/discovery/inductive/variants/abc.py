@@ -20,7 +20,8 @@ from typing import Optional, Tuple, List, TypeVar, Generic, Dict, Any
 
 from pm4py.algo.discovery.inductive.base_case.factory import BaseCaseFactory
 from pm4py.algo.discovery.inductive.cuts.factory import CutFactory
-from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructure
+from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructure, IMDataStructureUVCL, \
+    IMDataStructureEncodedUVCL
 from pm4py.algo.discovery.inductive.fall_through.factory import FallThroughFactory
 from pm4py.algo.discovery.inductive.variants.instances import IMInstance
 from pm4py.objects.process_tree.obj import ProcessTree
@@ -33,6 +34,31 @@ T = TypeVar('T', bound=IMDataStructure)
 
 class Parameters(Enum):
     MULTIPROCESSING = "multiprocessing"
+    PARALLEL_RECURSION = "parallel_recursion"
+    PARALLEL_RECURSION_MIN_SIZE = "parallel_recursion_min_size"
+    PARALLEL_RECURSION_MAX_DEPTH = "parallel_recursion_max_depth"
+    CORES = "cores"
+
+
+def _apply_subtree(miner_class, obj: IMDataStructure, parameters: Dict[Any, Any]) -> ProcessTree:
+    """
+    Discovers (sequentially) the process tree of a sub-log in a worker process
+    """
+    return miner_class(parameters).apply(obj, parameters)
+
+
+def _get_sequential_parameters(parameters: Dict[Any, Any]) -> Dict[Any, Any]:
+    """
+    Gets a copy of the parameters in which the multiprocessing options are disabled
+    """
+    sequential_parameters = {}
+    for key, value in parameters.items():
+        if key not in [Parameters.MULTIPROCESSING, Parameters.MULTIPROCESSING.value, Parameters.PARALLEL_RECURSION,
+                       Parameters.PARALLEL_RECURSION.value]:
+            sequential_parameters[key] = value
+    sequential_parameters[Parameters.MULTIPROCESSING.value] = False
+    sequential_parameters[Parameters.PARALLEL_RECURSION.value] = False
+    return sequential_parameters
 
 
 class InductiveMinerFramework(ABC, Generic[T]):
@@ -43,6 +69,12 @@ class InductiveMinerFramework(ABC, Generic[T]):
     2. Create dedicated Base Cases, Cuts and Fall Throughs for the newly constructed IMDataStructure
     3. Extend the BaseCaseFactory, CutFactory and FallThroughFactory with the newly created functions
     4. Create a subclass of this class indicating the type on which it is defined and the corresponding IMInstance.
+
+    When the parallel recursion is enabled (Parameters.PARALLEL_RECURSION), the sub-logs obtained from the cuts in the
+    first levels of the recursion (Parameters.PARALLEL_RECURSION_MAX_DEPTH) are discovered in a process pool
+    (Parameters.CORES processes), provided that they are big enough (Parameters.PARALLEL_RECURSION_MIN_SIZE), while
+    the biggest sub-log is kept in the current process (so it can be further split).
+    The sub-logs are independent, hence the resulting process tree is the same of the sequential run.
     """
 
     def __init__(self, parameters: Optional[Dict[str, Any]] = None):
@@ -61,6 +93,15 @@ class InductiveMinerFramework(ABC, Generic[T]):
             self._pool = None
             self._manager = None
 
+        self._parallel_recursion = exec_utils.get_param_value(Parameters.PARALLEL_RECURSION, parameters, False)
+        self._parallel_recursion_min_size = exec_utils.get_param_value(Parameters.PARALLEL_RECURSION_MIN_SIZE,
+                                                                       parameters, 1000)
+        self._parallel_recursion_max_depth = exec_utils.get_param_value(Parameters.PARALLEL_RECURSION_MAX_DEPTH,
+                                                                        parameters, 3)
+        self._cores = exec_utils.get_param_value(Parameters.CORES, parameters, os.cpu_count())
+        self._recursion_executor = None
+        self._depth = 0
+
     def apply_base_cases(self, obj: T, parameters: Optional[Dict[str, Any]] = None) -> Optional[ProcessTree]:
         return BaseCaseFactory.apply_base_cases(obj, self.instance(), parameters=parameters)
 
@@ -82,12 +123,57 @@ class InductiveMinerFramework(ABC, Generic[T]):
         return tree
 
     def _recurse(self, tree: ProcessTree, objs: List[T], parameters: Optional[Dict[str, Any]] = None):
-        children = [self.apply(obj, parameters=parameters) for obj in objs]
+        self._depth += 1
+        try:
+            if self._parallel_recursion and self._depth <= self._parallel_recursion_max_depth:
+                children = self._apply_parallel(objs, parameters=parameters)
+            else:
+                children = [self.apply(obj, parameters=parameters) for obj in objs]
+        finally:
+            self._depth -= 1
+            if self._depth == 0 and self._recursion_executor is not None:
+                self._recursion_executor.shutdown()
+                self._recursion_executor = None
         for c in children:
             c.parent = tree
         tree.children.extend(children)
         return tree
 
+    def _get_size(self, obj: T) -> int:
+        """
+        Estimates the cost of the discovery on the given data structure (number of events of the variants
+        for logs, number of arcs of the DFG otherwise)
+        """
+        if isinstance(obj, IMDataStructureEncodedUVCL):
+            return len(obj.data_structure.events)
+        if isinstance(obj, IMDataStructureUVCL):
+            return sum(len(variant) for variant in obj.data_structure)
+        return len(obj.dfg.graph)
+
+    def _apply_parallel(self, objs: List[T], parameters: Optional[Dict[str, Any]] = None) -> List[ProcessTree]:
+        sizes = [self._get_size(obj) for obj in objs]
+        candidates = [i for i in range(len(objs)) if sizes[i] >= self._parallel_recursion_min_size]
+        if len(candidates) < 2:
+            return [self.apply(obj, parameters=parameters) for obj in objs]
+
+        # the biggest sub-log is discovered in the current process
+        candidates.remove(max(candidates, key=lambda i: sizes[i]))
+
+        if self._recursion_executor is None:
+            from concurrent.futures import ProcessPoolExecutor
+            self._recursion_executor = ProcessPoolExecutor(max_workers=self._cores)
+
+        sequential_parameters = _get_sequential_parameters(parameters if parameters is not None else {})
+        futures = {i: self._recursion_executor.submit(_apply_subtree, type(self), objs[i], sequential_parameters)
+                   for i in candidates}
+        children = [None] * len(objs)
+        for i in range(len(objs)):
+            if i not in futures:
+                children[i] = self.apply(objs[i], parameters=parameters)
+        for i in futures:
+            children[i] = futures[i].result()
+        return children
+
     @abstractmethod
     def instance(self) -> IMInstance:
         pass
@@ -16,8 +16,9 @@
 '''
 from typing import TypeVar, Generic, Dict, Any, Optional
 
-from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructureUVCL, IMDataStructureLog
-from pm4py.algo.discovery.inductive.fall_through.empty_traces import EmptyTracesUVCL
+from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructureUVCL, IMDataStructureLog, \
+    IMDataStructureEncodedUVCL
+from pm4py.algo.discovery.inductive.fall_through.empty_traces import EmptyTracesUVCL, EmptyTracesEncodedUVCL
 from pm4py.algo.discovery.inductive.variants.abc import InductiveMinerFramework
 from pm4py.algo.discovery.inductive.variants.instances import IMInstance
 from pm4py.objects.process_tree.obj import ProcessTree
@@ -33,7 +34,8 @@ class IM(Generic[T], InductiveMinerFramework[T]):
 
 class IMUVCL(IM[IMDataStructureUVCL]):
     def apply(self, obj: IMDataStructureUVCL, parameters: Optional[Dict[str, Any]] = None) -> ProcessTree:
-        empty_traces = EmptyTracesUVCL.apply(obj, parameters)
+        empty_traces_class = EmptyTracesEncodedUVCL if type(obj) is IMDataStructureEncodedUVCL else EmptyTracesUVCL
+        empty_traces = empty_traces_class.apply(obj, parameters)
         if empty_traces is not None:
             return self._recurse(empty_traces[0], empty_traces[1], parameters)
         return super().apply(obj, parameters)
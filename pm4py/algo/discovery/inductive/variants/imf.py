@@ -16,8 +16,9 @@
 '''
 from typing import TypeVar, Generic, Dict, Any, Optional
 
-from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructureUVCL, IMDataStructureLog
-from pm4py.algo.discovery.inductive.fall_through.empty_traces import EmptyTracesUVCL
+from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructureUVCL, IMDataStructureLog, \
+    IMDataStructureEncodedUVCL
+from pm4py.algo.discovery.inductive.fall_through.empty_traces import EmptyTracesUVCL, EmptyTracesEncodedUVCL
 from pm4py.algo.discovery.inductive.variants.abc import InductiveMinerFramework
 from pm4py.algo.discovery.inductive.variants.instances import IMInstance
 from pm4py.objects.process_tree.obj import ProcessTree
@@ -44,7 +45,8 @@ class IMFUVCL(IMF[IMDataStructureUVCL]):
     def apply(self, obj: IMDataStructureUVCL, parameters: Optional[Dict[str, Any]] = None, second_iteration: bool = False) -> ProcessTree:
         noise_threshold = exec_utils.get_param_value(IMFParameters.NOISE_THRESHOLD, parameters, 0.0)
 
-        empty_traces = EmptyTracesUVCL.apply(obj, parameters)
+        empty_traces_class = EmptyTracesEncodedUVCL if type(obj) is IMDataStructureEncodedUVCL else EmptyTracesUVCL
+        empty_traces = empty_traces_class.apply(obj, parameters)
         if empty_traces is not None and empty_traces[1]:
             number_original_traces = sum(y for y in obj.data_structure.values())
             number_filtered_traces = sum(y for y in empty_traces[1][1].data_structure.values())
@@ -95,4 +97,4 @@ class IMFUVCL(IMF[IMDataStructureUVCL]):
         for act in graph:
             dfg.graph[act] = graph[act]
 
-        return IMDataStructureUVCL(obj.data_structure, dfg)
+        return type(obj)(obj.data_structure, dfg)
@@ -16,16 +16,17 @@
 '''
 from pm4py.objects.ocel.obj import OCEL
 from typing import Optional, Dict, Any
-from pm4py.algo.discovery.ocel.ocdfg.variants import classic
+from pm4py.algo.discovery.ocel.ocdfg.variants import classic, columnar
 from enum import Enum
 from pm4py.util import exec_utils
 
 
 class Variants(Enum):
     CLASSIC = classic
+    COLUMNAR = columnar
 
 
-def apply(ocel: OCEL, variant=Variants.CLASSIC, parameters: Optional[Dict[Any, Any]] = None) -> Dict[str, Any]:
+def apply(ocel: OCEL, variant=Variants.COLUMNAR, parameters: Optional[Dict[Any, Any]] = None) -> Dict[str, Any]:
     """
     Discovers an OC-DFG model from an object-centric event log
     Reference paper:
@@ -38,6 +39,7 @@ def apply(ocel: OCEL, variant=Variants.CLASSIC, parameters: Optional[Dict[Any, A
     variant
         Variant of the algorithm to use:
         - Variants.CLASSIC
+        - Variants.COLUMNAR (default; same model as the classic variant, computed on the integer-encoded relations)
     parameters
         Variant-specific parameters
 
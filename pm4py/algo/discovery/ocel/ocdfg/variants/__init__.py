@@ -15,3 +15,4 @@
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
 from pm4py.algo.discovery.ocel.ocdfg.variants import classic
+from pm4py.algo.discovery.ocel.ocdfg.variants import columnar
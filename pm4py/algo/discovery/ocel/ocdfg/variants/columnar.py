@@ -0,0 +1,377 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+"""
+Columnar variant of the OC-DFG discovery.
+
+The relations of the object-centric event log are interned to integer codes (through the OCEL index). The
+directly-follows occurrences are obtained by sorting the relations by object and event and comparing every relation
+with the previous one, while the activity, edge and performance annotations are computed with sorts and groupby
+aggregations on the integer codes. The sets of identifiers of the model returned by apply are built once, at the end,
+from the columns; get_annotations returns only the aggregated frames, without materializing any identifier.
+"""
+from enum import Enum
+from typing import Optional, Dict, Any, Tuple, List
+
+import numpy as np
+import pandas as pd
+
+from pm4py.algo.discovery.ocel.ocdfg.variants import classic
+from pm4py.objects.ocel import constants as ocel_constants
+from pm4py.objects.ocel.obj import OCEL
+from pm4py.objects.ocel.util import ocel_index
+from pm4py.statistics.ocel import edge_metrics
+from pm4py.util import exec_utils, pandas_utils, constants
+from pm4py.util.business_hours import BusinessHoursCalendar
+
+
+class Parameters(Enum):
+    EVENT_ACTIVITY = ocel_constants.PARAM_EVENT_ACTIVITY
+    OBJECT_TYPE = ocel_constants.PARAM_OBJECT_TYPE
+    COMPUTE_EDGES_PERFORMANCE = "compute_edges_performance"
+    BUSINESS_HOURS = "business_hours"
+    BUSINESS_HOUR_SLOTS = "business_hour_slots"
+    WORKCALENDAR = "workcalendar"
+
+
+ACTIVITIES_INDEP = "activities_indep"
+ACTIVITIES_OT = "activities_ot"
+START_ACTIVITIES = "start_activities"
+END_ACTIVITIES = "end_activities"
+EDGES = "edges"
+
+EVENTS = "events"
+UNIQUE_OBJECTS = "unique_objects"
+TOTAL_OBJECTS = "total_objects"
+EVENT_COUPLES = "event_couples"
+
+PERFORMANCE_MEASURES = ["mean", "median", "min", "max", "sum"]
+
+
+class _Relations(object):
+    def __init__(self, ocel: OCEL, index: ocel_index.OcelIndex):
+        # the activities and the object types are taken from the relations table (as in the classic variant), and
+        # interned following their sorted order
+        activity_codes, activities = pd.factorize(ocel.relations[ocel.event_activity].to_numpy(), sort=True)
+        type_codes, object_types = pd.factorize(ocel.relations[ocel.object_type_column].to_numpy(), sort=True)
+        rows = np.flatnonzero((index.relation_events >= 0) & (index.relation_objects >= 0) & (activity_codes >= 0))
+        self.events = index.relation_events[rows]
+        self.objects = index.relation_objects[rows]
+        self.activity_codes = activity_codes[rows].astype(np.int64)
+        self.type_codes = type_codes[rows].astype(np.int64)
+        self.activities = np.asarray(activities, dtype=object)
+        self.object_types = np.asarray(object_types, dtype=object)
+
+
+def __get_group_boundaries(keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    # stable sort of the keys, and boundaries of the groups of equal keys in the sorted order
+    order = np.argsort(keys, kind="stable")
+    if len(keys) == 0:
+        return order, np.zeros(1, dtype=np.int64)
+    sorted_keys = keys[order]
+    boundaries = np.flatnonzero(np.concatenate(([True], sorted_keys[1:] != sorted_keys[:-1], [True])))
+    return order, boundaries
+
+
+def __get_first_rows(keys: np.ndarray) -> np.ndarray:
+    # position of the first occurrence of every key
+    order, boundaries = __get_group_boundaries(keys)
+    return order[boundaries[:-1]]
+
+
+def __prefilter(relations: _Relations, index: ocel_index.OcelIndex, last: bool) -> np.ndarray:
+    # keeps the first (last) relation of every object of every object type, sorting the kept relations by object
+    # identifier (as groupby(object_id).first() / .last() on the relations of every object type)
+    rows = np.flatnonzero(relations.type_codes >= 0)
+    if last:
+        rows = rows[::-1]
+    keys = relations.type_codes[rows] * max(index.get_num_objects(), 1) + relations.objects[rows]
+    rows = rows[__get_first_rows(keys)]
+    object_ranks = pd.factorize(index.object_ids, sort=True)[0]
+    return rows[np.lexsort((object_ranks[relations.objects[rows]], relations.type_codes[rows]))]
+
+
+def __get_association_groups(relations: _Relations, rows: np.ndarray, per_type: bool) -> Tuple[
+    np.ndarray, np.ndarray, np.ndarray]:
+    # groups the given relations by (object type and) activity, keeping the order of the relations inside the groups
+    if per_type:
+        rows = rows[relations.type_codes[rows] >= 0]
+        keys = relations.type_codes[rows] * len(relations.activities) + relations.activity_codes[rows]
+    else:
+        keys = relations.activity_codes[rows]
+    order, boundaries = __get_group_boundaries(keys)
+    return rows[order], boundaries, keys[order][boundaries[:-1]]
+
+
+def __associations_to_dict(relations: _Relations, index: ocel_index.OcelIndex, rows: np.ndarray,
+                           per_type: bool) -> Tuple[Dict[Any, Any], Dict[Any, Any], Dict[Any, Any]]:
+    rows, boundaries, keys = __get_association_groups(relations, rows, per_type)
+    event_ids = index.event_ids[relations.events[rows]].tolist()
+    object_ids = index.object_ids[relations.objects[rows]].tolist()
+    num_activities = len(relations.activities)
+
+    events, unique_objects, total_objects = {}, {}, {}
+    for g, key in enumerate(keys.tolist()):
+        start, end = int(boundaries[g]), int(boundaries[g + 1])
+        act = relations.activities[key % num_activities]
+        ev_set = set(event_ids[start:end])
+        obj_set = set(object_ids[start:end])
+        ev_obj = list(zip(event_ids[start:end], object_ids[start:end]))
+        if per_type:
+            ot = relations.object_types[key // num_activities]
+            if ot not in events:
+                events[ot], unique_objects[ot], total_objects[ot] = {}, {}, {}
+            events[ot][act], unique_objects[ot][act], total_objects[ot][act] = ev_set, obj_set, ev_obj
+        else:
+            events[act], unique_objects[act], total_objects[act] = ev_set, obj_set, ev_obj
+    return events, unique_objects, total_objects
+
+
+def __associations_to_frame(ocel: OCEL, relations: _Relations, rows: np.ndarray, per_type: bool) -> pd.DataFrame:
+    rows, boundaries, keys = __get_association_groups(relations, rows, per_type)
+    frame = pandas_utils.instantiate_dataframe({"key": np.repeat(keys, np.diff(boundaries)),
+                                                "event": relations.events[rows],
+                                                "object": relations.objects[rows]})
+    frame = frame.groupby("key", sort=True).agg(**{EVENTS: ("event", "nunique"),
+                                                   UNIQUE_OBJECTS: ("object", "nunique"),
+                                                   TOTAL_OBJECTS: ("event", "size")})
+    keys = frame.index.to_numpy()
+    num_activities = len(relations.activities)
+    columns = {}
+    if per_type:
+        columns[ocel.object_type_column] = relations.object_types[keys // num_activities]
+    columns[ocel.event_activity] = relations.activities[keys % num_activities]
+    for col in [EVENTS, UNIQUE_OBJECTS, TOTAL_OBJECTS]:
+        columns[col] = frame[col].to_numpy()
+    return pandas_utils.instantiate_dataframe(columns)
+
+
+def __get_edge_groups(index: ocel_index.OcelIndex) -> Tuple[
+    np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    # occurrences of the edges, grouped by (object type, source activity, target activity); the groups are sorted
+    # following their first occurrence
+    sources, targets, objects = edge_metrics.get_edge_occurrences(index)
+    num_activities = max(len(index.activities), 1)
+    keys = (index.object_object_types[objects].astype(np.int64) * num_activities + index.event_activities[
+        sources]) * num_activities + index.event_activities[targets]
+    order, boundaries = __get_group_boundaries(keys)
+    groups_order = np.argsort(order[boundaries[:-1]], kind="stable")
+    # renumbers the groups following their first occurrence
+    group_ids = np.empty(len(groups_order), dtype=np.int64)
+    group_ids[groups_order] = np.arange(len(groups_order))
+    occurrence_groups = np.repeat(group_ids, np.diff(boundaries))
+    order = order[np.argsort(occurrence_groups, kind="stable")]
+    boundaries = np.concatenate(([0], np.cumsum(np.diff(boundaries)[groups_order]))).astype(np.int64)
+    group_keys = keys[order][boundaries[:-1]]
+    return sources[order], targets[order], objects[order], np.sort(occurrence_groups), boundaries, group_keys
+
+
+def __get_unique_occurrences(groups: np.ndarray, columns: List[np.ndarray]) -> np.ndarray:
+    # positions of the first occurrence of every distinct (group, columns) combination, sorted by group
+    order = np.lexsort(tuple(reversed(columns)) + (groups,))
+    if len(order) == 0:
+        return order
+    stacked = np.vstack([groups[order]] + [c[order] for c in columns])
+    keep = np.concatenate(([True], (stacked[:, 1:] != stacked[:, :-1]).any(axis=0)))
+    return order[keep]
+
+
+def __get_durations(ocel: OCEL, index: ocel_index.OcelIndex, sources: np.ndarray, targets: np.ndarray,
+                    parameters: Dict[Any, Any]) -> np.ndarray:
+    # durations (in seconds) between the source and the target events
+    business_hours = exec_utils.get_param_value(Parameters.BUSINESS_HOURS, parameters, False)
+    if business_hours:
+        business_hours_slots = exec_utils.get_param_value(Parameters.BUSINESS_HOUR_SLOTS, parameters,
+                                                          constants.DEFAULT_BUSINESS_HOUR_SLOTS)
+        workcalendar = exec_utils.get_param_value(Parameters.WORKCALENDAR, parameters,
+                                                  constants.DEFAULT_BUSINESS_HOURS_WORKCALENDAR)
+        # the business hours are computed on the wall-clock time of the timestamps of the events table
+        timestamps = ocel.events.drop_duplicates(ocel.event_id_column)[ocel.event_timestamp].reset_index(drop=True)
+        calendar = BusinessHoursCalendar(business_hour_slots=business_hours_slots, work_calendar=workcalendar)
+        return calendar.get_seconds(timestamps.iloc[sources], timestamps.iloc[targets])
+    return (index.event_timestamps[targets] - index.event_timestamps[sources]) / 10 ** 9
+
+
+def __get_sorted_durations(ocel: OCEL, index: ocel_index.OcelIndex, sources: np.ndarray, targets: np.ndarray,
+                           groups: np.ndarray, unique: np.ndarray, num_groups: int,
+                           parameters: Dict[Any, Any]) -> Tuple[np.ndarray, np.ndarray]:
+    # durations of the distinct occurrences, sorted by group and duration
+    durations = __get_durations(ocel, index, sources[unique], targets[unique], parameters)
+    occurrence_groups = groups[unique]
+    order = np.lexsort((durations, occurrence_groups))
+    offsets = np.searchsorted(occurrence_groups[order], np.arange(num_groups + 1))
+    return durations[order], offsets
+
+
+def get_annotations(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None) -> Dict[str, pd.DataFrame]:
+    """
+    Computes the annotations of the OC-DFG (number of events, unique objects and total objects of the activities,
+    number of event couples, unique objects and total objects of the edges, and the performance of the edges)
+    as dataframes, without materializing the sets of identifiers of the model
+
+    Parameters
+    -----------------
+    ocel
+        Object-centric event log
+    parameters
+        Parameters of the algorithm, including:
+        - Parameters.COMPUTE_EDGES_PERFORMANCE => (boolean) enables/disables the computation of the performance on the edges
+        - Parameters.BUSINESS_HOURS => enables/disables the business hours in the computation of the performance
+        - Parameters.BUSINESS_HOUR_SLOTS => work schedule of the company
+        - Parameters.WORKCALENDAR => work calendar
+
+    Returns
+    -----------------
+    annotations
+        Dictionary containing the following dataframes:
+        - activities_indep: the number of events, unique objects and total objects of every activity
+        - activities_ot: the number of events, unique objects and total objects of every object type and activity
+        - start_activities: the same metrics for the start activities of every object type
+        - end_activities: the same metrics for the end activities of every object type
+        - edges: the number of event couples, unique objects and total objects of every edge (object type, source
+                 activity, target activity), and (if required) the mean, median, min, max and sum of the times
+                 between the event couples (event_couples_mean, ...) and the total objects (total_objects_mean, ...)
+    """
+    if parameters is None:
+        parameters = {}
+
+    compute_edges_performance = exec_utils.get_param_value(Parameters.COMPUTE_EDGES_PERFORMANCE, parameters, True)
+
+    index = ocel_index.get_index(ocel)
+    relations = _Relations(ocel, index)
+    all_rows = np.arange(len(relations.events))
+
+    ret = {}
+    ret[ACTIVITIES_INDEP] = __associations_to_frame(ocel, relations, all_rows, False)
+    ret[ACTIVITIES_OT] = __associations_to_frame(ocel, relations, all_rows, True)
+    ret[START_ACTIVITIES] = __associations_to_frame(ocel, relations, __prefilter(relations, index, False), True)
+    ret[END_ACTIVITIES] = __associations_to_frame(ocel, relations, __prefilter(relations, index, True), True)
+
+    sources, targets, objects, groups, boundaries, group_keys = __get_edge_groups(index)
+    num_groups = len(group_keys)
+    num_activities = max(len(index.activities), 1)
+    couples = __get_unique_occurrences(groups, [sources, targets])
+    triples = __get_unique_occurrences(groups, [sources, targets, objects])
+    unique_objects = __get_unique_occurrences(groups, [objects])
+
+    columns = {}
+    columns[ocel.object_type_column] = index.object_types[group_keys // (num_activities * num_activities)]
+    columns[ocel.event_activity] = index.activities[(group_keys // num_activities) % num_activities]
+    columns[ocel.event_activity + "_2"] = index.activities[group_keys % num_activities]
+    columns[EVENT_COUPLES] = np.bincount(groups[couples], minlength=num_groups)
+    columns[UNIQUE_OBJECTS] = np.bincount(groups[unique_objects], minlength=num_groups)
+    columns[TOTAL_OBJECTS] = np.bincount(groups[triples], minlength=num_groups)
+
+    if compute_edges_performance:
+        for metric, unique in [(EVENT_COUPLES, couples), (TOTAL_OBJECTS, triples)]:
+            durations = __get_durations(ocel, index, sources[unique], targets[unique], parameters)
+            performance = pandas_utils.instantiate_dataframe({"group": groups[unique], "duration": durations})
+            performance = performance.groupby("group", sort=True)["duration"].agg(PERFORMANCE_MEASURES)
+            for measure in PERFORMANCE_MEASURES:
+                columns[metric + "_" + measure] = performance[measure].to_numpy()
+
+    ret[EDGES] = pandas_utils.instantiate_dataframe(columns)
+
+    return ret
+
+
+def apply(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None) -> Dict[str, Any]:
+    """
+    Discovers an OC-DFG model from an object-centric event log (columnar implementation, returning the same model
+    as the classic variant).
+    Reference paper:
+    Berti, Alessandro, and Wil van der Aalst. "Extracting multiple viewpoint models from relational databases." Data-Driven Process Discovery and Analysis. Springer, Cham, 2018. 24-51.
+
+    Parameters
+    -----------------
+    ocel
+        Object-centric event log
+    parameters
+        Parameters of the algorithm, including:
+        - Parameters.EVENT_ACTIVITY => the attribute to be used as activity
+        - Parameters.OBJECT_TYPE => the attribute to be used as object type
+        - Parameters.COMPUTE_EDGES_PERFORMANCE => (boolean) enables/disables the computation of the performance on the edges
+        - Parameters.BUSINESS_HOURS => enables/disables the business hours in the computation of the performance
+        - Parameters.BUSINESS_HOUR_SLOTS => work schedule of the company
+        - Parameters.WORKCALENDAR => work calendar
+
+    Returns
+    -----------------
+    ocdfg
+        Object-centric directly-follows graph (see the classic variant for a description of its properties)
+    """
+    if parameters is None:
+        parameters = {}
+
+    object_type = exec_utils.get_param_value(Parameters.OBJECT_TYPE, parameters, ocel.object_type_column)
+    event_activity = exec_utils.get_param_value(Parameters.EVENT_ACTIVITY, parameters, ocel.event_activity)
+
+    if (object_type, event_activity) != (ocel.object_type_column, ocel.event_activity):
+        # the index is built on the default columns of the log
+        return classic.apply(ocel, parameters=parameters)
+
+    compute_edges_performance = exec_utils.get_param_value(Parameters.COMPUTE_EDGES_PERFORMANCE, parameters, True)
+
+    index = ocel_index.get_index(ocel)
+    relations = _Relations(ocel, index)
+    all_rows = np.arange(len(relations.events))
+
+    ret = {}
+    ret["activities"] = set(pandas_utils.format_unique(ocel.events[event_activity].unique()))
+    ret["object_types"] = set(pandas_utils.format_unique(ocel.objects[object_type].unique()))
+
+    sources, targets, objects, groups, boundaries, group_keys = __get_edge_groups(index)
+    num_activities = max(len(index.activities), 1)
+    source_ids = index.event_ids[sources].tolist()
+    target_ids = index.event_ids[targets].tolist()
+    object_ids = index.object_ids[objects].tolist()
+    edges = [(index.object_types[key // (num_activities * num_activities)],
+              (index.activities[(key // num_activities) % num_activities], index.activities[key % num_activities]))
+             for key in group_keys.tolist()]
+
+    ret["edges"] = {"event_couples": {}, "unique_objects": {}, "total_objects": {}}
+    for g, (ot, act_couple) in enumerate(edges):
+        start, end = int(boundaries[g]), int(boundaries[g + 1])
+        if ot not in ret["edges"]["event_couples"]:
+            for metric in ret["edges"]:
+                ret["edges"][metric][ot] = {}
+        ret["edges"]["event_couples"][ot][act_couple] = set(zip(source_ids[start:end], target_ids[start:end]))
+        ret["edges"]["unique_objects"][ot][act_couple] = set(object_ids[start:end])
+        ret["edges"]["total_objects"][ot][act_couple] = set(
+            zip(source_ids[start:end], target_ids[start:end], object_ids[start:end]))
+
+    for key, rows, per_type in [("activities_indep", all_rows, False), ("activities_ot", all_rows, True),
+                                ("start_activities", __prefilter(relations, index, False), True),
+                                ("end_activities", __prefilter(relations, index, True), True)]:
+        events, unique_objects, total_objects = __associations_to_dict(relations, index, rows, per_type)
+        ret[key] = {"events": events, "unique_objects": unique_objects, "total_objects": total_objects}
+
+    ret["edges_performance"] = {}
+    ret["edges_performance"]["event_couples"] = {}
+    ret["edges_performance"]["total_objects"] = {}
+
+    if compute_edges_performance:
+        for metric, columns in [("event_couples", [sources, targets]), ("total_objects", [sources, targets, objects])]:
+            unique = __get_unique_occurrences(groups, columns)
+            durations, offsets = __get_sorted_durations(ocel, index, sources, targets, groups, unique, len(edges),
+                                                        parameters)
+            durations = durations.tolist()
+            for g, (ot, act_couple) in enumerate(edges):
+                if ot not in ret["edges_performance"][metric]:
+                    ret["edges_performance"][metric][ot] = {}
+                ret["edges_performance"][metric][ot][act_couple] = durations[offsets[g]:offsets[g + 1]]
+
+    return ret
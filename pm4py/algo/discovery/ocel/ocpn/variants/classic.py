@@ -106,6 +106,11 @@ def apply(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None) -> Dict[str,
     double_arcs_on_activity = {}
     tbr_results = {}
 
+    flat_logs = {}
+    if inductive_miner_variant == "im" or diagnostics_with_tbr:
+        # do the flattening only if it is required (on all the object types at once)
+        flat_logs = flattening.flatten_object_types(ocel, ocpn["object_types"], parameters=parameters)
+
     for ot in ocpn["object_types"]:
         activities_eo = ocpn["activities_ot"]["total_objects"][ot]
 
@@ -139,11 +144,7 @@ def apply(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None) -> Dict[str,
         im_parameters["disable_strict_sequence_cut"] = True
         
         process_tree = None
-        flat_log = None
-
-        if inductive_miner_variant == "im" or diagnostics_with_tbr:
-            # do the flattening only if it is required
-            flat_log = flattening.flatten(ocel, ot, parameters=parameters)
+        flat_log = flat_logs.pop(ot, None)
 
         if inductive_miner_variant == "imd":
             obj = DFG()
@@ -19,6 +19,7 @@ from typing import Optional, Dict, Any
 
 import pandas as pd
 
+from pm4py.algo.discovery.dfg.adapters.pandas import eventually_follows
 from pm4py.algo.discovery.dfg.adapters.pandas.df_statistics import get_partial_order_dataframe
 from pm4py.util import exec_utils, constants, xes_constants
 from pm4py.util import typing
@@ -72,6 +73,13 @@ def apply(df: pd.DataFrame, parameters: Optional[Dict[Any, Any]] = None) -> typi
 
     workcalendar = exec_utils.get_param_value(Parameters.WORKCALENDAR, parameters, constants.DEFAULT_BUSINESS_HOURS_WORKCALENDAR)
 
+    if not business_hours:
+        # the flow times are aggregated without materializing the couples of events
+        aggregates = eventually_follows.get_aggregates(df, activity_key=activity_key, case_id_glue=case_id_key,
+                                                       timestamp_key=timestamp_key,
+                                                       start_timestamp_key=start_timestamp_key)
+        return eventually_follows.get_mean_std(aggregates)
+
     efg = get_partial_order_dataframe(df, activity_key=activity_key, timestamp_key=timestamp_key,
                                       start_timestamp_key=start_timestamp_key, case_id_glue=case_id_key,
                                       keep_first_following=False, business_hours=business_hours, business_hours_slot=business_hours_slots, workcalendar=workcalendar)
@@ -17,6 +17,7 @@
 from enum import Enum
 from pm4py.util import exec_utils, constants
 from pm4py.objects.ocel.util import filtering_utils
+from pm4py.objects.ocel.util.ocel_view import OCELView
 from copy import deepcopy
 from typing import Dict, Any, Optional, Collection
 from pm4py.objects.ocel.obj import OCEL
@@ -67,13 +68,19 @@ def apply(ocel: OCEL, correspondence_dict: Dict[str, Collection[str]],
     temp_column = exec_utils.get_param_value(Parameters.TEMP_COLUMN, parameters, "@@temp_column")
     temp_separator = exec_utils.get_param_value(Parameters.TEMP_SEPARATOR, parameters, "@#@#")
 
-    ocel = deepcopy(ocel)
-
     inv_dict = set()
     for ot in correspondence_dict:
         for act in correspondence_dict[ot]:
             inv_dict.add(act + temp_separator + ot)
 
+    if isinstance(ocel, OCELView):
+        # the filters on a view are composed, and propagated only once
+        relations = ocel.get_base().relations
+        return ocel.filter_relations(
+            (relations[activity_key] + temp_separator + relations[object_type_column]).isin(inv_dict).to_numpy())
+
+    ocel = deepcopy(ocel)
+
     ocel.relations[temp_column] = ocel.relations[activity_key] + temp_separator + ocel.relations[object_type_column]
     ocel.relations = ocel.relations[ocel.relations[temp_column].isin(inv_dict)]
 
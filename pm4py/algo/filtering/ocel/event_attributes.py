@@ -17,6 +17,7 @@
 from enum import Enum
 from pm4py.util import exec_utils, constants
 from pm4py.objects.ocel.util import filtering_utils
+from pm4py.objects.ocel.util.ocel_view import OCELView
 from copy import copy
 from typing import Dict, Any, Optional, Collection, Union
 from pm4py.algo.filtering.common.timestamp.timestamp_common import get_dt_from_string
@@ -56,6 +57,11 @@ def apply(ocel: OCEL, values: Collection[Any], parameters: Optional[Dict[Any, An
     attribute_key = exec_utils.get_param_value(Parameters.ATTRIBUTE_KEY, parameters, ocel.event_activity)
     positive = exec_utils.get_param_value(Parameters.POSITIVE, parameters, True)
 
+    if isinstance(ocel, OCELView):
+        # the filters on a view are composed, and propagated only once
+        mask = ocel.get_base().events[attribute_key].isin(values).to_numpy()
+        return ocel.filter_events(mask if positive else ~mask)
+
     ocel = copy(ocel)
     if positive:
         ocel.events = ocel.events[ocel.events[attribute_key].isin(values)]
@@ -93,6 +99,10 @@ def apply_timestamp(ocel: OCEL, min_timest: Union[datetime.datetime, str], max_t
     min_timest = get_dt_from_string(min_timest)
     max_timest = get_dt_from_string(max_timest)
 
+    if isinstance(ocel, OCELView):
+        timestamps = ocel.get_base().events[timestamp_key]
+        return ocel.filter_events(((timestamps >= min_timest) & (timestamps <= max_timest)).to_numpy())
+
     ocel = copy(ocel)
     ocel.events = ocel.events[ocel.events[timestamp_key] >= min_timest]
     ocel.events = ocel.events[ocel.events[timestamp_key] <= max_timest]
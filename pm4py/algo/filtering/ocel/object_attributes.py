@@ -17,6 +17,7 @@
 from enum import Enum
 from pm4py.util import exec_utils, constants
 from pm4py.objects.ocel.util import filtering_utils
+from pm4py.objects.ocel.util.ocel_view import OCELView
 from copy import copy
 from typing import Dict, Any, Optional, Collection
 from pm4py.objects.ocel.obj import OCEL
@@ -53,6 +54,11 @@ def apply(ocel: OCEL, values: Collection[Any], parameters: Optional[Dict[Any, An
     attribute_key = exec_utils.get_param_value(Parameters.ATTRIBUTE_KEY, parameters, ocel.object_type_column)
     positive = exec_utils.get_param_value(Parameters.POSITIVE, parameters, True)
 
+    if isinstance(ocel, OCELView):
+        # the filters on a view are composed, and propagated only once
+        mask = ocel.get_base().objects[attribute_key].isin(values).to_numpy()
+        return ocel.filter_objects(mask if positive else ~mask)
+
     ocel = copy(ocel)
     if positive:
         ocel.objects = ocel.objects[ocel.objects[attribute_key].isin(values)]
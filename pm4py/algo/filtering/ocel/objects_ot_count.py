@@ -21,7 +21,9 @@ from collections import Counter
 from pm4py.objects.ocel.obj import OCEL
 from typing import Optional, Dict, Any
 from pm4py.statistics.ocel import objects_ot_count
-from pm4py.objects.ocel.util import filtering_utils
+from pm4py.objects.ocel.util import filtering_utils, ocel_index
+from pm4py.objects.ocel.util.ocel_view import OCELView
+import numpy as np
 from copy import copy
 
 
@@ -69,6 +71,22 @@ def apply(ocel: OCEL, min_num_obj_type: Dict[str, int], parameters: Optional[Dic
     object_id = exec_utils.get_param_value(Parameters.OBJECT_ID, parameters, ocel.object_id_column)
     object_type = exec_utils.get_param_value(Parameters.OBJECT_TYPE, parameters, ocel.object_type_column)
 
+    if isinstance(ocel, OCELView) and (event_id, object_id) == (ocel.event_id_column, ocel.object_id_column):
+        # counts the (current) relations of every event per object type on the codes of the index
+        index = ocel_index.get_index(ocel.get_base())
+        _, _, relations_mask = ocel.get_masks()
+        relations_mask = relations_mask & (index.relation_events >= 0)
+        relation_types = ocel.get_base().relations[object_type].to_numpy()
+        num_events = index.get_num_events()
+        # the last position corresponds to the code -1 of the missing identifiers
+        is_ok = np.bincount(index.relation_events[relations_mask], minlength=num_events + 1) > 0
+        for k, v in min_num_obj_type.items():
+            count = np.bincount(index.relation_events[relations_mask & (relation_types == k)],
+                                minlength=num_events + 1)
+            is_ok &= count >= max(v, 1)
+        is_ok[-1] = False
+        return ocel.filter_events(is_ok[index.table_events])
+
     num_obj = objects_ot_count.get_objects_ot_count(ocel, parameters=parameters)
 
     filt_evs = set()
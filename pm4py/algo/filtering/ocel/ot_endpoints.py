@@ -20,7 +20,9 @@ from pm4py.objects.ocel import constants as ocel_constants
 from pm4py.objects.ocel.obj import OCEL
 from typing import Optional, Dict, Any
 from copy import copy
-from pm4py.objects.ocel.util import filtering_utils
+from pm4py.objects.ocel.util import filtering_utils, ocel_index
+from pm4py.objects.ocel.util.ocel_view import OCELView
+import numpy as np
 
 
 class Parameters(Enum):
@@ -29,6 +31,25 @@ class Parameters(Enum):
     OBJECT_TYPE = ocel_constants.PARAM_OBJECT_TYPE
 
 
+def __get_endpoints_mask(view: OCELView, object_type: str, object_type_column: str, last: bool) -> np.ndarray:
+    # mask over the events table of the base log, keeping the first (last) event of the (current) relations of every
+    # object of the given type
+    index = ocel_index.get_index(view.get_base())
+    _, _, relations_mask = view.get_masks()
+    rows = np.flatnonzero(relations_mask & (view.get_base().relations[object_type_column].to_numpy() == object_type) & (
+            index.relation_objects >= 0) & (index.relation_events >= 0))
+    if last:
+        rows = rows[::-1]
+    objects = index.relation_objects[rows]
+    order = np.argsort(objects, kind="stable")
+    first = order[np.concatenate(([True], objects[order][1:] != objects[order][:-1]))] if len(rows) > 0 else order
+    # the last position corresponds to the code -1 of the missing identifiers
+    selected = np.zeros(index.get_num_events() + 1, dtype=bool)
+    selected[index.relation_events[rows[first]]] = True
+    selected[-1] = False
+    return selected[index.table_events]
+
+
 def filter_start_events_per_object_type(ocel: OCEL, object_type: str, parameters: Optional[Dict[Any, Any]] = None) -> OCEL:
     """
     Filters the events in which a new object for the given object type is spawn.
@@ -58,6 +79,9 @@ def filter_start_events_per_object_type(ocel: OCEL, object_type: str, parameters
     object_id = exec_utils.get_param_value(Parameters.OBJECT_ID, parameters, ocel.object_id_column)
     object_type_column = exec_utils.get_param_value(Parameters.OBJECT_TYPE, parameters, ocel.object_type_column)
 
+    if isinstance(ocel, OCELView) and (event_id, object_id) == (ocel.event_id_column, ocel.object_id_column):
+        return ocel.filter_events(__get_endpoints_mask(ocel, object_type, object_type_column, False))
+
     evs = ocel.relations[ocel.relations[object_type_column] == object_type].groupby(object_id).first()[event_id].to_numpy().tolist()
 
     ocel = copy(ocel)
@@ -95,6 +119,9 @@ def filter_end_events_per_object_type(ocel: OCEL, object_type: str, parameters:
     object_id = exec_utils.get_param_value(Parameters.OBJECT_ID, parameters, ocel.object_id_column)
     object_type_column = exec_utils.get_param_value(Parameters.OBJECT_TYPE, parameters, ocel.object_type_column)
 
+    if isinstance(ocel, OCELView) and (event_id, object_id) == (ocel.event_id_column, ocel.object_id_column):
+        return ocel.filter_events(__get_endpoints_mask(ocel, object_type, object_type_column, True))
+
     evs = ocel.relations[ocel.relations[object_type_column] == object_type].groupby(object_id).last()[event_id]
 
     ocel = copy(ocel)
@@ -0,0 +1,439 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+"""
+Compiled LTL checker: the dataframe is encoded once in integer arrays (events sorted by case, activity and resource
+codes, timestamps), and many rules are then evaluated on the encoded arrays, each returning a boolean mask over
+the cases.
+
+The rules are expressed as tuples (rule type, arguments, parameters), for example:
+- (EVENTUALLY_FOLLOWS, ["A", "B", "C"], {}) or, with timestamp constraints,
+  (EVENTUALLY_FOLLOWS, ["A", "B"], {Parameters.TIMESTAMP_DIFF_BOUNDARIES: [(0, 86400)]})
+- (A_NEXT_B_NEXT_C, ["A", "B", "C"], {})
+- (FOUR_EYES_PRINCIPLE, ["A", "B"], {})
+- (ATTR_VALUE_DIFFERENT_PERSONS, ["A"], {})
+where the parameters of the rule accept Parameters.POSITIVE (and, for the eventually follows rule,
+Parameters.TIMESTAMP_DIFF_BOUNDARIES), with the same meaning as in the functions of ltl_checker.
+"""
+from enum import Enum
+from typing import Optional, Dict, Any, Union, List, Tuple, Collection
+
+import numpy as np
+import pandas as pd
+
+from pm4py.objects.log.util import variant_index
+from pm4py.util import exec_utils, constants, xes_constants, pandas_utils
+
+EVENTUALLY_FOLLOWS = "eventually_follows"
+A_NEXT_B_NEXT_C = "A_next_B_next_C"
+FOUR_EYES_PRINCIPLE = "four_eyes_principle"
+ATTR_VALUE_DIFFERENT_PERSONS = "attr_value_different_persons"
+
+
+class Parameters(Enum):
+    CASE_ID_KEY = constants.PARAMETER_CONSTANT_CASEID_KEY
+    ATTRIBUTE_KEY = constants.PARAMETER_CONSTANT_ATTRIBUTE_KEY
+    TIMESTAMP_KEY = constants.PARAMETER_CONSTANT_TIMESTAMP_KEY
+    RESOURCE_KEY = constants.PARAMETER_CONSTANT_RESOURCE_KEY
+    POSITIVE = "positive"
+    TIMESTAMP_DIFF_BOUNDARIES = "timestamp_diff_boundaries"
+
+
+class EncodedLog(object):
+    def __init__(self, df: pd.DataFrame, case_id_key: str, attribute_key: str, timestamp_key: str, resource_key: str):
+        """
+        Dataframe encoded in integer arrays, with the events sorted by case (keeping the order of the rows inside
+        the case). The resource and timestamp arrays are encoded at the first usage.
+
+        Parameters
+        --------------
+        df
+            Dataframe
+        case_id_key
+            Column to be used as case identifier
+        attribute_key
+            Column on which the rules are expressed (e.g., the activity)
+        timestamp_key
+            Column to be used as timestamp
+        resource_key
+            Column to be used as resource
+        """
+        self.df = df
+        self.timestamp_key = timestamp_key
+        self.resource_key = resource_key
+        self.index = variant_index.get_variant_index(df, parameters={
+            variant_index.Parameters.CASE_ID_KEY: case_id_key, variant_index.Parameters.ACTIVITY_KEY: attribute_key})
+        self.case_ids = self.index.case_ids
+        self.num_cases = len(self.case_ids)
+        # rows of the dataframe, sorted by case, and case of every (sorted) event
+        self.rows = self.index.order
+        self.cases = self.index.row_cases[self.rows]
+        activity_codes, activities = pd.factorize(df[attribute_key])
+        self.activity_codes = activity_codes[self.rows]
+        self.activities = {a: i for i, a in enumerate(activities.tolist())}
+        # for every activity, the (sorted) events in which it occurs
+        events = np.argsort(self.activity_codes, kind="stable")
+        self.__activity_events = np.split(events, np.cumsum(np.bincount(self.activity_codes[events] + 1,
+                                                                         minlength=len(activities) + 1))[:-1])[1:]
+        self.__resource_codes = None
+        self.__timestamps = None
+        self.__case_resources = {}
+        self.__num_resources = None
+
+    def get_events(self, activity: Any) -> np.ndarray:
+        """
+        Gets the (sorted) events in which the given activity occurs
+        """
+        if activity in self.activities:
+            return self.__activity_events[self.activities[activity]]
+        return np.zeros(0, dtype=np.int64)
+
+    def get_resource_codes(self) -> np.ndarray:
+        """
+        Gets the codes of the resources of the (sorted) events (-1 for missing resources)
+        """
+        if self.__resource_codes is None:
+            self.__resource_codes = pd.factorize(self.df[self.resource_key])[0][self.rows]
+        return self.__resource_codes
+
+    def get_case_resources(self, activity: Any) -> np.ndarray:
+        """
+        Gets the (sorted) distinct couples (case, resource) of the events of the activity having a resource,
+        encoded as case * (number of resources) + resource
+        """
+        if activity not in self.__case_resources:
+            events = self.get_events(activity)
+            resources = self.get_resource_codes()[events]
+            events = events[resources >= 0]
+            couples = np.sort(self.cases[events] * self.get_num_resources() + resources[resources >= 0])
+            self.__case_resources[activity] = couples[np.append(True, couples[1:] != couples[:-1])] if len(
+                couples) > 0 else couples
+        return self.__case_resources[activity]
+
+    def get_num_resources(self) -> int:
+        """
+        Gets the number of distinct resources (at least 1)
+        """
+        if self.__num_resources is None:
+            self.__num_resources = max(int(self.get_resource_codes().max(initial=-1)) + 1, 1)
+        return self.__num_resources
+
+    def get_timestamps(self) -> pd.Series:
+        """
+        Gets the timestamps of the (sorted) events
+        """
+        if self.__timestamps is None:
+            self.__timestamps = self.df[self.timestamp_key].iloc[self.rows].reset_index(drop=True)
+        return self.__timestamps
+
+    def get_cases_mask(self, events: np.ndarray) -> np.ndarray:
+        """
+        Gets the boolean mask of the cases containing at least one of the provided events
+        """
+        return np.bincount(self.cases[events], minlength=self.num_cases) > 0
+
+    def get_rows_mask(self, cases_mask: np.ndarray) -> np.ndarray:
+        """
+        Gets the boolean mask of the rows of the dataframe belonging to the provided cases (the rows without a case
+        identifier are not included)
+        """
+        return np.append(cases_mask, False)[self.index.row_cases]
+
+
+def encode(df: pd.DataFrame, parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> EncodedLog:
+    """
+    Encodes a dataframe for the evaluation of the rules
+
+    Parameters
+    ---------------
+    df
+        Dataframe
+    parameters
+        Parameters of the algorithm, including:
+        - Parameters.CASE_ID_KEY => the case identifier
+        - Parameters.ATTRIBUTE_KEY => the attribute on which the rules are expressed
+        - Parameters.TIMESTAMP_KEY => the timestamp
+        - Parameters.RESOURCE_KEY => the resource
+
+    Returns
+    ---------------
+    encoded_log
+        Encoded log
+    """
+    if parameters is None:
+        parameters = {}
+
+    case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME)
+    attribute_key = exec_utils.get_param_value(Parameters.ATTRIBUTE_KEY, parameters, xes_constants.DEFAULT_NAME_KEY)
+    timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters,
+                                               xes_constants.DEFAULT_TIMESTAMP_KEY)
+    resource_key = exec_utils.get_param_value(Parameters.RESOURCE_KEY, parameters,
+                                              xes_constants.DEFAULT_RESOURCE_KEY)
+
+    return EncodedLog(df, case_id_key, attribute_key, timestamp_key, resource_key)
+
+
+def __eventually_follows_greedy(encoded_log: EncodedLog, attribute_values: List[Any]) -> np.ndarray:
+    # per-case state machine: the state of a case is the (sorted) event matching the last satisfied step of the
+    # rule; every step is advanced to the first occurrence of the next attribute value following the state
+    state = np.full(encoded_log.num_cases, -1, dtype=np.int64)
+    events = encoded_log.get_events(attribute_values[0])
+    # the events of an attribute value are sorted by case, hence the first one of every case is taken
+    first = np.flatnonzero(np.append(True, encoded_log.cases[events][1:] != encoded_log.cases[events][:-1])) \
+        if len(events) > 0 else events
+    state[encoded_log.cases[events[first]]] = events[first]
+    for value in attribute_values[1:]:
+        events = encoded_log.get_events(value)
+        active = np.flatnonzero(state >= 0)
+        following = np.searchsorted(events, state[active], side="right")
+        found = following < len(events)
+        found[found] = encoded_log.cases[events[following[found]]] == active[found]
+        state[active[~found]] = -1
+        state[active[found]] = events[following[found]]
+    return state >= 0
+
+
+def __eventually_follows_timestamps(encoded_log: EncodedLog, attribute_values: List[Any],
+                                    timestamp_diff_boundaries: List[Tuple[float, float]]) -> np.ndarray:
+    # the events of every step which are reachable from an event of the previous step, respecting the order
+    # and the boundaries on the time differences, are computed step by step
+    cases = encoded_log.cases
+    timestamps = encoded_log.get_timestamps()
+    reachable = encoded_log.get_events(attribute_values[0])
+    for i in range(1, len(attribute_values)):
+        events = encoded_log.get_events(attribute_values[i])
+        pairs = pd.DataFrame({"c": cases[reachable], "s": reachable}).merge(
+            pd.DataFrame({"c": cases[events], "t": events}), on="c")
+        pairs = pairs[pairs["t"] > pairs["s"]]
+        if i - 1 < len(timestamp_diff_boundaries):
+            diff = pandas_utils.get_total_seconds(
+                timestamps.iloc[pairs["t"].to_numpy()].reset_index(drop=True) - timestamps.iloc[
+                    pairs["s"].to_numpy()].reset_index(drop=True)).to_numpy()
+            pairs = pairs[(diff >= timestamp_diff_boundaries[i - 1][0]) & (diff <= timestamp_diff_boundaries[i - 1][1])]
+        reachable = np.unique(pairs["t"].to_numpy())
+    return encoded_log.get_cases_mask(reachable)
+
+
+def eventually_follows(encoded_log: EncodedLog, attribute_values: List[Any],
+                       parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> np.ndarray:
+    """
+    Evaluates the eventually follows rule: attribute_values[i + 1] eventually follows attribute_values[i]
+    (optionally, with boundaries on the time difference between the events)
+
+    Parameters
+    ---------------
+    encoded_log
+        Encoded log
+    attribute_values
+        Sequence of attribute values
+    parameters
+        Parameters of the rule, including:
+        - Parameters.POSITIVE => if True, the cases satisfying the rule are returned; if False, the other cases
+        - Parameters.TIMESTAMP_DIFF_BOUNDARIES => boundaries (in seconds) on the time difference between the events
+          of two consecutive steps
+
+    Returns
+    ---------------
+    cases_mask
+        Boolean mask over the cases of the encoded log
+    """
+    if parameters is None:
+        parameters = {}
+
+    positive = exec_utils.get_param_value(Parameters.POSITIVE, parameters, True)
+    timestamp_diff_boundaries = exec_utils.get_param_value(Parameters.TIMESTAMP_DIFF_BOUNDARIES, parameters, [])
+
+    if timestamp_diff_boundaries:
+        mask = __eventually_follows_timestamps(encoded_log, attribute_values, timestamp_diff_boundaries)
+    else:
+        mask = __eventually_follows_greedy(encoded_log, attribute_values)
+
+    return mask if positive else ~mask
+
+
+def A_next_B_next_C(encoded_log: EncodedLog, A: Any, B: Any, C: Any,
+                    parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> np.ndarray:
+    """
+    Evaluates the A next B next C rule: an occurrence of A is directly followed by B, which is directly followed by C
+
+    Parameters
+    ---------------
+    encoded_log
+        Encoded log
+    A
+        A attribute value
+    B
+        B attribute value
+    C
+        C attribute value
+    parameters
+        Parameters of the rule, including:
+        - Parameters.POSITIVE => if True, the cases satisfying the rule are returned; if False, the other cases
+
+    Returns
+    ---------------
+    cases_mask
+        Boolean mask over the cases of the encoded log
+    """
+    if parameters is None:
+        parameters = {}
+
+    positive = exec_utils.get_param_value(Parameters.POSITIVE, parameters, True)
+
+    events = encoded_log.get_events(A)
+    events = events[events + 2 < len(encoded_log.cases)]
+    cases = encoded_log.cases
+    codes = encoded_log.activity_codes
+    events = events[(cases[events + 2] == cases[events]) & (codes[events + 1] == encoded_log.activities.get(B, -2)) &
+                    (codes[events + 2] == encoded_log.activities.get(C, -2))]
+    mask = encoded_log.get_cases_mask(events)
+
+    return mask if positive else ~mask
+
+
+def four_eyes_principle(encoded_log: EncodedLog, A: Any, B: Any,
+                        parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> np.ndarray:
+    """
+    Evaluates the four eyes principle on the activities A and B
+
+    Parameters
+    ---------------
+    encoded_log
+        Encoded log
+    A
+        A attribute value
+    B
+        B attribute value
+    parameters
+        Parameters of the rule, including:
+        - Parameters.POSITIVE => if True, the cases containing A and B in which the resources doing A and B are
+          different; if False, the cases containing A and B in which a resource does both A and B
+
+    Returns
+    ---------------
+    cases_mask
+        Boolean mask over the cases of the encoded log
+    """
+    if parameters is None:
+        parameters = {}
+
+    positive = exec_utils.get_param_value(Parameters.POSITIVE, parameters, True)
+
+    resources_a = encoded_log.get_case_resources(A)
+    resources_b = encoded_log.get_case_resources(B)
+    num_resources = encoded_log.get_num_resources()
+    num_cases = encoded_log.num_cases
+    shared = np.bincount(np.intersect1d(resources_a, resources_b, assume_unique=True) // num_resources,
+                         minlength=num_cases) > 0
+
+    if positive:
+        both = (np.bincount(resources_a // num_resources, minlength=num_cases) > 0) & (
+                np.bincount(resources_b // num_resources, minlength=num_cases) > 0)
+        return both & ~shared
+    return shared
+
+
+def attr_value_different_persons(encoded_log: EncodedLog, A: Any,
+                                 parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> np.ndarray:
+    """
+    Evaluates if the attribute value A is assumed by events done by different resources
+
+    Parameters
+    ---------------
+    encoded_log
+        Encoded log
+    A
+        A attribute value
+    parameters
+        Parameters of the rule, including:
+        - Parameters.POSITIVE => if True, the cases satisfying the rule are returned; if False, the other cases
+
+    Returns
+    ---------------
+    cases_mask
+        Boolean mask over the cases of the encoded log
+    """
+    if parameters is None:
+        parameters = {}
+
+    positive = exec_utils.get_param_value(Parameters.POSITIVE, parameters, True)
+
+    resources_a = encoded_log.get_case_resources(A)
+    mask = np.bincount(resources_a // encoded_log.get_num_resources(), minlength=encoded_log.num_cases) > 1
+
+    return mask if positive else ~mask
+
+
+def check(encoded_log: EncodedLog, rules: Collection[Tuple[str, List[Any], Dict[Any, Any]]]) -> List[np.ndarray]:
+    """
+    Evaluates a collection of rules on an encoded log
+
+    Parameters
+    ---------------
+    encoded_log
+        Encoded log
+    rules
+        Rules, expressed as tuples (rule type, arguments, parameters of the rule)
+
+    Returns
+    ---------------
+    cases_masks
+        For every rule, the boolean mask over the cases of the encoded log
+    """
+    ret = []
+    for rule_type, arguments, rule_parameters in rules:
+        if rule_type == EVENTUALLY_FOLLOWS:
+            ret.append(eventually_follows(encoded_log, arguments, parameters=rule_parameters))
+        elif rule_type == A_NEXT_B_NEXT_C:
+            ret.append(A_next_B_next_C(encoded_log, *arguments, parameters=rule_parameters))
+        elif rule_type == FOUR_EYES_PRINCIPLE:
+            ret.append(four_eyes_principle(encoded_log, *arguments, parameters=rule_parameters))
+        elif rule_type == ATTR_VALUE_DIFFERENT_PERSONS:
+            ret.append(attr_value_different_persons(encoded_log, *arguments, parameters=rule_parameters))
+        else:
+            raise Exception("unsupported rule: " + str(rule_type))
+    return ret
+
+
+def apply(df: pd.DataFrame, rules: Collection[Tuple[str, List[Any], Dict[Any, Any]]],
+          parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> pd.DataFrame:
+    """
+    Evaluates a collection of rules on a dataframe, encoding it once
+
+    Parameters
+    ---------------
+    df
+        Dataframe
+    rules
+        Rules, expressed as tuples (rule type, arguments, parameters of the rule)
+    parameters
+        Parameters of the algorithm, including:
+        - Parameters.CASE_ID_KEY => the case identifier
+        - Parameters.ATTRIBUTE_KEY => the attribute on which the rules are expressed
+        - Parameters.TIMESTAMP_KEY => the timestamp
+        - Parameters.RESOURCE_KEY => the resource
+
+    Returns
+    ---------------
+    results
+        Dataframe indexed by the case identifier, having a boolean column for every rule (in the order of the rules)
+    """
+    encoded_log = encode(df, parameters=parameters)
+    cases_masks = check(encoded_log, rules)
+    return pd.DataFrame({i: mask for i, mask in enumerate(cases_masks)},
+                        index=pd.Index(encoded_log.case_ids, name=exec_utils.get_param_value(
+                            Parameters.CASE_ID_KEY, parameters if parameters is not None else {},
+                            constants.CASE_CONCEPT_NAME)))
@@ -0,0 +1,436 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+"""
+Lazy filtering pipeline on dataframes.
+
+The filters are accumulated and executed only when the result is collected. The execution keeps a boolean mask
+of the alive rows of the original dataframe, and materializes a single dataframe at the end:
+- consecutive event-level filters (which decide on every event in isolation) are evaluated from the cheapest one,
+  each one only on the rows which survived the previous ones;
+- consecutive case-level filters share the same case aggregates (first and last event, size, variant), computed
+  once on the alive rows with the (cached) variant index of the dataframe.
+The result is the same as applying the corresponding functions of pm4py.filtering one after the other.
+"""
+import heapq
+import warnings
+from copy import copy
+from enum import Enum
+from typing import Optional, Dict, Any, Union, List, Tuple, Callable, Collection
+
+import numpy as np
+import pandas as pd
+
+from pm4py.algo.filtering.common.timestamp.timestamp_common import get_dt_from_string
+from pm4py.objects.log.util import variant_index
+from pm4py.util import exec_utils, constants, xes_constants, pandas_utils
+
+
+class Parameters(Enum):
+    CASE_ID_KEY = constants.PARAMETER_CONSTANT_CASEID_KEY
+    ACTIVITY_KEY = constants.PARAMETER_CONSTANT_ACTIVITY_KEY
+    TIMESTAMP_KEY = constants.PARAMETER_CONSTANT_TIMESTAMP_KEY
+
+
+# level of the filters deciding on every event in isolation
+EVENT_LEVEL = "event"
+# level of the filters deciding on every case in isolation
+CASE_LEVEL = "case"
+# level of the filters deciding on a case considering the other (alive) cases
+LOG_LEVEL = "log"
+
+# cost of the event-level filters (the cheapest ones are evaluated first)
+COMPARISON_COST = 1
+ISIN_COST = 2
+
+
+class CaseAggregates(object):
+    def __init__(self, context: "PipelineContext", alive: np.ndarray, trimmed: bool):
+        """
+        Aggregates of the cases computed on the alive rows of the dataframe
+
+        Parameters
+        --------------
+        context
+            Context of the execution
+        alive
+            Boolean mask of the alive rows
+        trimmed
+            Boolean value telling if some events of the (alive) cases have been removed
+        """
+        index = context.index
+        num_cases = len(index.case_ids)
+        self.context = context
+        self.trimmed = trimmed
+        # alive rows, sorted by case
+        self.rows = index.order[alive[index.order]]
+        self.row_cases = index.row_cases[self.rows]
+        self.sizes = np.bincount(self.row_cases, minlength=num_cases)
+        self.ends = np.cumsum(self.sizes)
+        self.starts = self.ends - self.sizes
+        self.present = self.sizes > 0
+        self.first_rows = self.rows[self.starts[self.present]]
+        self.last_rows = self.rows[self.ends[self.present] - 1]
+        self.__case_variants = None
+        self.__variants = None
+
+    def get_first_values(self, key: str) -> pd.Series:
+        """
+        Gets the values of the given column at the first event of the cases having some alive event
+        """
+        return self.context.df[key].iloc[self.first_rows]
+
+    def get_last_values(self, key: str) -> pd.Series:
+        """
+        Gets the values of the given column at the last event of the cases having some alive event
+        """
+        return self.context.df[key].iloc[self.last_rows]
+
+    def get_any(self, row_mask: np.ndarray) -> np.ndarray:
+        """
+        Gets, for every case, if the provided mask (on the alive rows sorted by case) is true for at least one event
+        """
+        return np.bincount(self.row_cases[row_mask], minlength=len(self.sizes)) > 0
+
+    def from_present(self, values: np.ndarray) -> np.ndarray:
+        """
+        Extends a boolean array over the cases having some alive event to all the cases
+        """
+        ret = np.zeros(len(self.sizes), dtype=bool)
+        ret[self.present] = values
+        return ret
+
+    def get_variants(self) -> Tuple[np.ndarray, List[Tuple[Any, ...]]]:
+        """
+        Gets the variant of every case (-1 for the cases without alive events) and the tuples of the variants
+        """
+        if self.__case_variants is None:
+            index = self.context.index
+            if not self.trimmed:
+                # the alive cases are complete, hence their variants are the ones of the index
+                self.__case_variants = np.where(self.present, index.case_variants, -1)
+                self.__variants = index.variants
+            else:
+                cases = index.sorted_cases[self.present[index.sorted_cases]]
+                activity_codes, activities = self.context.get_activity_codes()
+                self.__case_variants, first_cases = variant_index.encode_variants(
+                    activity_codes[self.rows], self.starts, self.ends, cases)
+                self.__variants = [tuple(activities[activity_codes[self.rows[self.starts[c]:self.ends[c]]]].tolist())
+                                   for c in first_cases]
+        return self.__case_variants, self.__variants
+
+
+class PipelineContext(object):
+    def __init__(self, df: pd.DataFrame, case_id_key: str, activity_key: str, timestamp_key: str):
+        """
+        Context of the execution of a pipeline on a dataframe
+
+        Parameters
+        --------------
+        df
+            Dataframe
+        case_id_key
+            Column to be used as case identifier
+        activity_key
+            Column to be used as activity
+        timestamp_key
+            Column to be used as timestamp
+        """
+        self.df = df
+        self.case_id_key = case_id_key
+        self.activity_key = activity_key
+        self.timestamp_key = timestamp_key
+        self.index = variant_index.get_variant_index(df, parameters={
+            variant_index.Parameters.CASE_ID_KEY: case_id_key, variant_index.Parameters.ACTIVITY_KEY: activity_key})
+        self.__activity_codes = None
+
+    def get_values(self, key: str, positions: np.ndarray) -> pd.Series:
+        """
+        Gets the values of a column at the provided (sorted) positions
+        """
+        column = self.df[key]
+        return column if len(positions) == len(column) else column.iloc[positions]
+
+    def get_activity_codes(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Gets the integer codes of the activities of the rows, along with the activities
+        """
+        if self.__activity_codes is None:
+            codes, uniques = pd.factorize(self.df[self.activity_key])
+            self.__activity_codes = (codes, np.asarray(uniques, dtype=object))
+        return self.__activity_codes
+
+
+class FilterPipeline(object):
+    def __init__(self, df: pd.DataFrame, parameters: Optional[Dict[Union[str, Parameters], Any]] = None,
+                 operations: Optional[List[Tuple[str, int, Callable]]] = None):
+        """
+        Lazy filtering pipeline on a dataframe. Every method returns a new pipeline including the additional filter;
+        the dataframe is filtered only when collect() is called.
+
+        Parameters
+        --------------
+        df
+            Dataframe
+        parameters
+            Parameters of the pipeline, including:
+            - Parameters.CASE_ID_KEY => the case identifier
+            - Parameters.ACTIVITY_KEY => the activity
+            - Parameters.TIMESTAMP_KEY => the timestamp
+        operations
+            Filters accumulated so far, as tuples (level, cost, function)
+        """
+        if parameters is None:
+            parameters = {}
+        self.df = df
+        self.parameters = parameters
+        self.case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME)
+        self.activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters,
+                                                       xes_constants.DEFAULT_NAME_KEY)
+        self.timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters,
+                                                        xes_constants.DEFAULT_TIMESTAMP_KEY)
+        self.operations = operations if operations is not None else []
+
+    def __append(self, level: str, cost: int, function: Callable) -> "FilterPipeline":
+        return FilterPipeline(self.df, parameters=self.parameters, operations=self.operations + [(level, cost, function)])
+
+    def event_attribute_values(self, attribute_key: str, values: Collection[Any], level: str = "case",
+                               retain: bool = True) -> "FilterPipeline":
+        """
+        Filters on the values of an event attribute ('case' keeps the cases where at least one occurrence happens,
+        'event' keeps the events, eventually trimming the cases)
+        """
+        if level == "event":
+            def function(context, positions):
+                mask = context.get_values(attribute_key, positions).isin(values).to_numpy()
+                return mask if retain else ~mask
+
+            return self.__append(EVENT_LEVEL, ISIN_COST, function)
+
+        def function(context, aggregates):
+            mask = aggregates.get_any(context.df[attribute_key].iloc[aggregates.rows].isin(values).to_numpy())
+            return mask if retain else ~mask
+
+        return self.__append(CASE_LEVEL, ISIN_COST, function)
+
+    def trace_attribute_values(self, attribute_key: str, values: Collection[Any],
+                               retain: bool = True) -> "FilterPipeline":
+        """
+        Filters the cases on the values of a trace attribute
+        """
+        return self.event_attribute_values(attribute_key, values, level="case", retain=retain)
+
+    def start_activities(self, activities: Collection[str], retain: bool = True) -> "FilterPipeline":
+        """
+        Filters the cases having a start activity in the provided collection
+        """
+        def function(context, aggregates):
+            mask = aggregates.from_present(aggregates.get_first_values(context.activity_key).isin(activities).to_numpy())
+            return mask if retain else ~mask
+
+        return self.__append(CASE_LEVEL, ISIN_COST, function)
+
+    def end_activities(self, activities: Collection[str], retain: bool = True) -> "FilterPipeline":
+        """
+        Filters the cases having an end activity in the provided collection
+        """
+        def function(context, aggregates):
+            mask = aggregates.from_present(aggregates.get_last_values(context.activity_key).isin(activities).to_numpy())
+            return mask if retain else ~mask
+
+        return self.__append(CASE_LEVEL, ISIN_COST, function)
+
+    def variants(self, variants: Collection[Collection[str]], retain: bool = True) -> "FilterPipeline":
+        """
+        Filters the cases following one of the provided variants
+        """
+        def function(context, aggregates):
+            case_variants, variants_tuples = aggregates.get_variants()
+            allowed = set(tuple(v) for v in variants)
+            variants_mask = np.array([v in allowed for v in variants_tuples] + [False], dtype=bool)
+            mask = variants_mask[case_variants]
+            return mask if retain else ~mask
+
+        return self.__append(CASE_LEVEL, ISIN_COST, function)
+
+    def time_range(self, dt1: Any, dt2: Any, mode: str = "events") -> "FilterPipeline":
+        """
+        Filters on a time interval (mode: events, traces_contained, traces_intersecting)
+        """
+        dt1 = get_dt_from_string(dt1)
+        dt2 = get_dt_from_string(dt2)
+
+        if mode == "events":
+            def function(context, positions):
+                timestamps = context.get_values(context.timestamp_key, positions)
+                return ((timestamps >= dt1) & (timestamps <= dt2)).to_numpy()
+
+            return self.__append(EVENT_LEVEL, COMPARISON_COST, function)
+        elif mode == "traces_contained":
+            def function(context, aggregates):
+                first = aggregates.get_first_values(context.timestamp_key).reset_index(drop=True)
+                last = aggregates.get_last_values(context.timestamp_key).reset_index(drop=True)
+                return aggregates.from_present(((first >= dt1) & (last <= dt2)).to_numpy())
+
+            return self.__append(CASE_LEVEL, COMPARISON_COST, function)
+        elif mode == "traces_intersecting":
+            def function(context, aggregates):
+                first = aggregates.get_first_values(context.timestamp_key).reset_index(drop=True)
+                last = aggregates.get_last_values(context.timestamp_key).reset_index(drop=True)
+                mask = ((first > dt1) & (first < dt2)) | ((last > dt1) & (last < dt2)) | ((first < dt1) & (last > dt2))
+                return aggregates.from_present(mask.to_numpy())
+
+            return self.__append(CASE_LEVEL, COMPARISON_COST, function)
+
+        if constants.SHOW_INTERNAL_WARNINGS:
+            warnings.warn('mode provided: ' + mode + ' is not recognized; the filter is ignored!')
+        return self
+
+    def case_size(self, min_size: int, max_size: Optional[int] = None) -> "FilterPipeline":
+        """
+        Filters the cases having a number of events included between min_size and max_size
+        """
+        def function(context, aggregates):
+            mask = aggregates.sizes >= min_size
+            if max_size is not None:
+                mask = mask & (aggregates.sizes <= max_size)
+            return mask
+
+        return self.__append(CASE_LEVEL, COMPARISON_COST, function)
+
+    def case_performance(self, min_performance: float, max_performance: float) -> "FilterPipeline":
+        """
+        Filters the cases having a duration (in seconds) included between min_performance and max_performance
+        """
+        def function(context, aggregates):
+            first = aggregates.get_first_values(context.timestamp_key).reset_index(drop=True)
+            last = aggregates.get_last_values(context.timestamp_key).reset_index(drop=True)
+            durations = pandas_utils.get_total_seconds(last - first).to_numpy()
+            return aggregates.from_present((durations >= min_performance) & (durations <= max_performance))
+
+        return self.__append(CASE_LEVEL, COMPARISON_COST, function)
+
+    def variants_top_k(self, k: int) -> "FilterPipeline":
+        """
+        Keeps the cases of the top-k variants
+        """
+        def function(context, aggregates, alive_cases):
+            case_variants, variants_tuples = aggregates.get_variants()
+            counts = np.bincount(case_variants[alive_cases], minlength=len(variants_tuples)).tolist()
+            variant_count = heapq.nlargest(k, [[variants_tuples[i], c, i] for i, c in enumerate(counts) if c > 0],
+                                           key=lambda x: (x[1], x[0]))
+            variants_mask = np.zeros(len(variants_tuples) + 1, dtype=bool)
+            variants_mask[[x[2] for x in variant_count]] = True
+            return variants_mask[case_variants]
+
+        return self.__append(LOG_LEVEL, ISIN_COST, function)
+
+    def variants_by_coverage_percentage(self, min_coverage_percentage: float) -> "FilterPipeline":
+        """
+        Keeps the cases of the variants covering at least the provided percentage of the cases
+        """
+        def function(context, aggregates, alive_cases):
+            case_variants, variants_tuples = aggregates.get_variants()
+            counts = np.bincount(case_variants[alive_cases], minlength=len(variants_tuples))
+            variants_mask = np.append(counts >= min_coverage_percentage * np.count_nonzero(alive_cases), False)
+            return variants_mask[case_variants]
+
+        return self.__append(LOG_LEVEL, ISIN_COST, function)
+
+    def get_mask(self) -> np.ndarray:
+        """
+        Executes the pipeline, returning the boolean mask of the rows of the dataframe which are kept
+        """
+        return apply(self.df, self.operations, parameters=self.parameters)
+
+    def collect(self) -> pd.DataFrame:
+        """
+        Executes the pipeline, returning the filtered dataframe
+        """
+        ret = self.df[self.get_mask()]
+        ret.attrs = copy(self.df.attrs) if hasattr(self.df, 'attrs') else {}
+        return ret
+
+
+def apply(df: pd.DataFrame, operations: List[Tuple[str, int, Callable]],
+          parameters: Optional[Dict[Union[str, Parameters], Any]] = None) -> np.ndarray:
+    """
+    Executes a sequence of filters on a dataframe
+
+    Parameters
+    --------------
+    df
+        Dataframe
+    operations
+        Filters, as tuples (level, cost, function)
+    parameters
+        Parameters of the algorithm, including:
+        - Parameters.CASE_ID_KEY => the case identifier
+        - Parameters.ACTIVITY_KEY => the activity
+        - Parameters.TIMESTAMP_KEY => the timestamp
+
+    Returns
+    --------------
+    mask
+        Boolean mask of the rows of the dataframe which are kept
+    """
+    if parameters is None:
+        parameters = {}
+
+    case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME)
+    activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, xes_constants.DEFAULT_NAME_KEY)
+    timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters,
+                                               xes_constants.DEFAULT_TIMESTAMP_KEY)
+
+    alive = np.ones(len(df), dtype=bool)
+    if not operations:
+        return alive
+
+    context = PipelineContext(df, case_id_key, activity_key, timestamp_key)
+    trimmed = False
+
+    # groups the consecutive event-level filters, and the consecutive case/log-level filters
+    groups = []
+    for operation in operations:
+        is_event = operation[0] == EVENT_LEVEL
+        if groups and groups[-1][0] == is_event:
+            groups[-1][1].append(operation)
+        else:
+            groups.append((is_event, [operation]))
+
+    for is_event, group in groups:
+        if is_event:
+            # the filters on the single events commute, hence the cheapest ones are evaluated first
+            positions = np.flatnonzero(alive)
+            num_alive = len(positions)
+            for level, cost, function in sorted(group, key=lambda x: x[1]):
+                positions = positions[function(context, positions)]
+            if len(positions) < num_alive:
+                trimmed = True
+                alive = np.zeros(len(df), dtype=bool)
+                alive[positions] = True
+        else:
+            aggregates = CaseAggregates(context, alive, trimmed)
+            alive_cases = aggregates.present.copy()
+            for level, cost, function in group:
+                if level == LOG_LEVEL:
+                    alive_cases = alive_cases & function(context, aggregates, alive_cases)
+                else:
+                    alive_cases = alive_cases & function(context, aggregates)
+            # the rows without a case identifier (code -1) are removed by the case-level filters
+            alive = alive & np.append(alive_cases, False)[context.index.row_cases]
+
+    return alive
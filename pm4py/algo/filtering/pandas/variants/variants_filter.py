@@ -15,7 +15,8 @@
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
 from pm4py.util.constants import CASE_CONCEPT_NAME
-from pm4py.statistics.traces.generic.pandas.case_statistics import get_variants_df
+from pm4py.util.xes_constants import DEFAULT_NAME_KEY
+from pm4py.objects.log.util import variant_index
 from pm4py.statistics.variants.pandas import get as variants_get
 from pm4py.util.constants import PARAMETER_CONSTANT_CASEID_KEY, PARAMETER_CONSTANT_ACTIVITY_KEY
 from enum import Enum
@@ -59,16 +60,24 @@ def apply(df: pd.DataFrame, admitted_variants: List[List[str]], parameters: Opti
         parameters = {}
 
     case_id_glue = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, CASE_CONCEPT_NAME)
+    activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, DEFAULT_NAME_KEY)
     positive = exec_utils.get_param_value(Parameters.POSITIVE, parameters, True)
-    variants_df = parameters["variants_df"] if "variants_df" in parameters else get_variants_df(df,
-                                                                                                parameters=parameters)
-    variants_df = variants_df[variants_df["variant"].isin(admitted_variants)]
-    i1 = df.set_index(case_id_glue).index
-    i2 = variants_df.index
+    if "variants_df" in parameters:
+        variants_df = parameters["variants_df"]
+        variants_df = variants_df[variants_df["variant"].isin(admitted_variants)]
+        i1 = df.set_index(case_id_glue).index
+        i2 = variants_df.index
+        mask = i1.isin(i2)
+    else:
+        # the rows are selected from the variant index of the dataframe, without building the variants dataframe
+        index = variant_index.get_variant_index(df, parameters={variant_index.Parameters.CASE_ID_KEY: case_id_glue,
+                                                                variant_index.Parameters.ACTIVITY_KEY: activity_key})
+        variant_ids = [index.get_variant_id(v) for v in admitted_variants]
+        mask = index.get_rows_mask([v for v in variant_ids if v is not None])
     if positive:
-        ret = df[i1.isin(i2)]
+        ret = df[mask]
     else:
-        ret = df[~i1.isin(i2)]
+        ret = df[~mask]
 
     ret.attrs = copy(df.attrs) if hasattr(df, 'attrs') else {}
     return ret
@@ -133,7 +142,8 @@ def filter_variants_by_coverage_percentage(log, min_coverage_percentage, paramet
     case_id_glue = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, CASE_CONCEPT_NAME)
 
     variants = variants_get.get_variants_count(log, parameters=parameters)
-    allowed_variants = [x for x, y in variants.items() if y >= min_coverage_percentage * log[case_id_glue].nunique()]
+    num_cases = log[case_id_glue].nunique()
+    allowed_variants = [x for x, y in variants.items() if y >= min_coverage_percentage * num_cases]
 
     return apply(log, allowed_variants, parameters=parameters)
 
@@ -165,6 +175,7 @@ def filter_variants_by_maximum_coverage_percentage(log, max_coverage_percentage,
     case_id_glue = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, CASE_CONCEPT_NAME)
 
     variants = variants_get.get_variants_count(log, parameters=parameters)
-    allowed_variants = [x for x, y in variants.items() if y <= max_coverage_percentage * log[case_id_glue].nunique()]
+    num_cases = log[case_id_glue].nunique()
+    allowed_variants = [x for x, y in variants.items() if y <= max_coverage_percentage * num_cases]
 
     return apply(log, allowed_variants, parameters=parameters)
\ No newline at end of file
@@ -15,6 +15,7 @@
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
 from pm4py.objects.ocel.obj import OCEL
+from pm4py.objects.ocel.util import ocel_index
 from typing import Optional, Dict, Any
 
 
@@ -42,7 +43,7 @@ def apply(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None):
     ordered_events = parameters["ordered_events"] if "ordered_events" in parameters else ocel.events[
         ocel.event_id_column].to_numpy()
 
-    rel_objs = ocel.relations.groupby(ocel.event_id_column)[ocel.object_id_column].agg(list).to_dict()
+    rel_objs = ocel_index.get_index(ocel).get_event_objects_dict()
 
     data = []
     feature_names = ["@@event_num_rel_objs"]
@@ -16,6 +16,7 @@
 '''
 
 from pm4py.objects.ocel.obj import OCEL
+from pm4py.objects.ocel.util import ocel_index
 from typing import Optional, Dict, Any
 
 
@@ -43,7 +44,7 @@ def apply(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None):
     ordered_events = parameters["ordered_events"] if "ordered_events" in parameters else ocel.events[
         ocel.event_id_column].to_numpy()
 
-    rel_objs = ocel.relations.groupby(ocel.event_id_column)[ocel.object_id_column].agg(list).to_dict()
+    rel_objs = ocel_index.get_index(ocel).get_event_objects_dict()
 
     interactions = set()
     data = []
@@ -15,9 +15,9 @@
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
 from pm4py.objects.ocel.obj import OCEL
-from pm4py.util import nx_utils
+from pm4py.objects.ocel.util import ocel_index
 from typing import Optional, Dict, Any
-from pm4py.algo.transformation.ocel.graphs import object_interaction_graph
+from pm4py.algo.transformation.ocel.graphs import object_interaction_graph, incidence_matrix
 
 
 def apply(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None):
@@ -44,19 +44,17 @@ def apply(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None):
     ordered_objects = parameters["ordered_objects"] if "ordered_objects" in parameters else ocel.objects[
         ocel.object_id_column].to_numpy()
 
-    g0 = object_interaction_graph.apply(ocel, parameters=parameters)
-    g = nx_utils.Graph()
-    for edge in g0:
-        g.add_edge(edge[0], edge[1])
-
-    centrality = nx_utils.degree_centrality(g)
+    index = ocel_index.get_index(ocel)
+    adjacency = object_interaction_graph.apply_sparse(ocel, parameters=parameters)
+    centrality = incidence_matrix.get_degree_centrality(adjacency).tolist()
 
     data = []
     feature_names = ["@@object_degree_centrality"]
 
     for obj in ordered_objects:
-        if obj in centrality:
-            data.append([float(centrality[obj])])
+        code = index.get_object_code(obj)
+        if code is not None:
+            data.append([float(centrality[code])])
         else:
             data.append([0.0])
 
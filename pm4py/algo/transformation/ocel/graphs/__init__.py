@@ -14,4 +14,4 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from pm4py.algo.transformation.ocel.graphs import object_descendants_graph, object_interaction_graph, object_cobirth_graph, object_codeath_graph, object_inheritance_graph
+from pm4py.algo.transformation.ocel.graphs import object_descendants_graph, object_interaction_graph, object_cobirth_graph, object_codeath_graph, object_inheritance_graph, incidence_matrix
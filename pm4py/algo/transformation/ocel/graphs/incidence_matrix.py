@@ -0,0 +1,207 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+"""
+Sparse (scipy.sparse) matrices supporting the computation of the object graphs.
+
+The events and the objects are identified by their codes in the OCEL index. The graphs are obtained as products of
+event x object incidence matrices: for example, the object interaction graph is the off-diagonal support of
+B^T * B, where B is the incidence matrix of the relations. The resulting object x object adjacency matrices contain
+1 for every arc of the graph (both directions are stored for the undirected graphs).
+"""
+from typing import Optional, Set, Tuple, Any
+
+import numpy as np
+import pandas as pd
+
+from pm4py.objects.ocel.util import ocel_index
+
+
+def get_incidence_matrix(index: ocel_index.OcelIndex, events: np.ndarray, objects: np.ndarray):
+    """
+    Builds the (binary) event x object incidence matrix of the provided couples
+
+    Parameters
+    --------------
+    index
+        Index of the object-centric event log
+    events
+        Codes of the events
+    objects
+        Codes of the objects
+
+    Returns
+    --------------
+    incidence_matrix
+        Sparse (CSR) incidence matrix
+    """
+    from scipy.sparse import csr_matrix
+
+    matrix = csr_matrix((np.ones(len(events), dtype=np.int64), (events, objects)),
+                        shape=(index.get_num_events(), index.get_num_objects()))
+    matrix.sum_duplicates()
+    matrix.data[:] = 1
+    return matrix
+
+
+def get_relations(index: ocel_index.OcelIndex, table_events_only: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gets the codes of the events and of the objects of the relations of the object-centric event log
+
+    Parameters
+    --------------
+    index
+        Index of the object-centric event log
+    table_events_only
+        Only the relations of the events of the events table are considered
+
+    Returns
+    --------------
+    events
+        Codes of the events
+    objects
+        Codes of the objects
+    """
+    mask = (index.relation_events >= 0) & (index.relation_objects >= 0)
+    if table_events_only:
+        mask = mask & (index.relation_events < index.num_table_events)
+    return index.relation_events[mask], index.relation_objects[mask]
+
+
+def get_lifecycle_events(index: ocel_index.OcelIndex) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gets the first and the last event (following the order of the events table) related to every object
+
+    Parameters
+    --------------
+    index
+        Index of the object-centric event log
+
+    Returns
+    --------------
+    first_events
+        Code of the first event related to every object (-1 if the object is not related to any event of the table)
+    last_events
+        Code of the last event related to every object (-1 if the object is not related to any event of the table)
+    """
+    events, objects = get_relations(index, table_events_only=True)
+    num_objects = index.get_num_objects()
+    first_events = np.full(num_objects, np.iinfo(np.int64).max, dtype=np.int64)
+    np.minimum.at(first_events, objects, events)
+    first_events[first_events == np.iinfo(np.int64).max] = -1
+    last_events = np.full(num_objects, -1, dtype=np.int64)
+    np.maximum.at(last_events, objects, events)
+    return first_events, last_events
+
+
+def get_lifecycle_matrix(index: ocel_index.OcelIndex, lifecycle_events: np.ndarray):
+    """
+    Builds the event x object incidence matrix connecting every object to one event of its lifecycle
+    (e.g., the first or the last one)
+
+    Parameters
+    --------------
+    index
+        Index of the object-centric event log
+    lifecycle_events
+        Code of the event associated to every object (-1 if missing)
+
+    Returns
+    --------------
+    incidence_matrix
+        Sparse (CSR) incidence matrix
+    """
+    objects = np.flatnonzero(lifecycle_events >= 0)
+    return get_incidence_matrix(index, lifecycle_events[objects], objects)
+
+
+def to_adjacency(matrix, exclude_loops: bool = True):
+    """
+    Transforms the result of a product of incidence matrices into a (binary) object x object adjacency matrix
+
+    Parameters
+    --------------
+    matrix
+        Sparse matrix
+    exclude_loops
+        Excludes the diagonal (self-loops)
+
+    Returns
+    --------------
+    adjacency_matrix
+        Sparse (CSR) adjacency matrix
+    """
+    from scipy.sparse import csr_matrix
+
+    matrix = matrix.tocoo()
+    keep = matrix.data != 0
+    if exclude_loops:
+        keep = keep & (matrix.row != matrix.col)
+    adjacency = csr_matrix((np.ones(int(np.count_nonzero(keep)), dtype=np.int64), (matrix.row[keep], matrix.col[keep])),
+                           shape=matrix.shape)
+    adjacency.sum_duplicates()
+    adjacency.data[:] = 1
+    return adjacency
+
+
+def to_tuples(index: ocel_index.OcelIndex, adjacency, directed: bool) -> Set[Tuple[Any, Any]]:
+    """
+    Transforms an object x object adjacency matrix into a set of tuples of object identifiers
+
+    Parameters
+    --------------
+    index
+        Index of the object-centric event log
+    adjacency
+        Sparse adjacency matrix
+    directed
+        If False, the graph is undirected and every edge is reported once, as (o1, o2) with o1 < o2
+
+    Returns
+    --------------
+    graph
+        Set of tuples of object identifiers
+    """
+    adjacency = adjacency.tocoo()
+    rows, cols = adjacency.row, adjacency.col
+    if not directed:
+        ranks = pd.factorize(index.object_ids, sort=True)[0]
+        keep = ranks[rows] < ranks[cols]
+        rows, cols = rows[keep], cols[keep]
+    return set(zip(index.object_ids[rows].tolist(), index.object_ids[cols].tolist()))
+
+
+def get_degree_centrality(adjacency) -> np.ndarray:
+    """
+    Computes the degree centrality of the objects in an undirected graph (expressed as a symmetric adjacency matrix),
+    i.e., the number of neighbors divided by the number of the other objects of the graph (only the objects having at
+    least one neighbor are considered part of the graph)
+
+    Parameters
+    --------------
+    adjacency
+        Sparse (symmetric) adjacency matrix
+
+    Returns
+    --------------
+    centrality
+        Degree centrality of every object (0 for the objects without neighbors)
+    """
+    degrees = np.diff(adjacency.tocsr().indptr)
+    num_nodes = int(np.count_nonzero(degrees))
+    if num_nodes <= 1:
+        return (degrees > 0).astype(np.float64)
+    return degrees * (1.0 / (num_nodes - 1))
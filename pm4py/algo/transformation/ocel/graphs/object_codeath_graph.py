@@ -15,9 +15,39 @@
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
 from pm4py.objects.ocel.obj import OCEL
+from pm4py.objects.ocel.util import ocel_index
+from pm4py.algo.transformation.ocel.graphs import incidence_matrix
 from typing import Optional, Dict, Any, Set, Tuple
 
 
+def apply_sparse(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None):
+    """
+    Calculates the object codeath graph as a sparse adjacency matrix (undirected: both directions are stored).
+    The graph is the off-diagonal support of L^T * L, where L connects every object to its last event.
+
+    Parameters
+    -----------------
+    ocel
+        Object-centric event log
+    parameters
+        Parameters of the algorithm
+
+    Returns
+    -----------------
+    adjacency_matrix
+        Sparse (CSR) object x object adjacency matrix, where the objects are identified by their codes in the index
+        of the log (ocel_index.get_index(ocel).object_ids)
+    """
+    if parameters is None:
+        parameters = {}
+
+    index = ocel_index.get_index(ocel)
+    _, last_events = incidence_matrix.get_lifecycle_events(index)
+    deaths = incidence_matrix.get_lifecycle_matrix(index, last_events)
+
+    return incidence_matrix.to_adjacency(deaths.T @ deaths)
+
+
 def apply(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None) -> Set[Tuple[str, str]]:
     """
     Calculates the object codeath graph.
@@ -40,25 +70,5 @@ def apply(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None) -> Set[Tuple[
     if parameters is None:
         parameters = {}
 
-    graph = set()
-
-    ordered_events = ocel.events[ocel.event_id_column].to_numpy().tolist()
-    ev_rel_obj = ocel.relations.groupby(ocel.event_id_column)[ocel.object_id_column].agg(list).to_dict()
-    set_objects = set()
-
-    ordered_events.reverse()
-
-    for ev in ordered_events:
-        rel_obj = ev_rel_obj[ev]
-        rel_obj_seen = {x for x in rel_obj if x in set_objects}
-        rel_obj_unseen = {x for x in rel_obj if x not in rel_obj_seen}
-
-        for o1 in rel_obj_unseen:
-            for o2 in rel_obj_unseen:
-                if o1 < o2:
-                    graph.add((o1, o2))
-
-        for obj in rel_obj_unseen:
-            set_objects.add(obj)
-
-    return graph
+    return incidence_matrix.to_tuples(ocel_index.get_index(ocel), apply_sparse(ocel, parameters=parameters),
+                                      directed=False)
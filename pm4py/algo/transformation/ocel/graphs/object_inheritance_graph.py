@@ -15,8 +15,40 @@
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
 from pm4py.objects.ocel.obj import OCEL
+from pm4py.objects.ocel.util import ocel_index
+from pm4py.algo.transformation.ocel.graphs import incidence_matrix
 from typing import Optional, Dict, Any, Set, Tuple
-from copy import copy
+
+
+def apply_sparse(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None):
+    """
+    Calculates the object inheritance graph as a sparse adjacency matrix (directed).
+    The graph is the off-diagonal support of L^T * F, where L connects every object to its last event and F
+    connects every object to its first event, excluding the couples of objects connected in both directions.
+
+    Parameters
+    -----------------
+    ocel
+        Object-centric event log
+    parameters
+        Parameters of the algorithm
+
+    Returns
+    -----------------
+    adjacency_matrix
+        Sparse (CSR) object x object adjacency matrix, where the objects are identified by their codes in the index
+        of the log (ocel_index.get_index(ocel).object_ids)
+    """
+    if parameters is None:
+        parameters = {}
+
+    index = ocel_index.get_index(ocel)
+    first_events, last_events = incidence_matrix.get_lifecycle_events(index)
+    births = incidence_matrix.get_lifecycle_matrix(index, first_events)
+    deaths = incidence_matrix.get_lifecycle_matrix(index, last_events)
+    graph = incidence_matrix.to_adjacency(deaths.T @ births)
+
+    return incidence_matrix.to_adjacency(graph - graph.multiply(graph.T))
 
 
 def apply(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None) -> Set[Tuple[str, str]]:
@@ -41,43 +73,5 @@ def apply(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None) -> Set[Tuple[
     if parameters is None:
         parameters = {}
 
-    graph = set()
-
-    ordered_events = ocel.events[ocel.event_id_column].to_numpy().tolist()
-    ev_rel_obj = ocel.relations.groupby(ocel.event_id_column)[ocel.object_id_column].agg(list).to_dict()
-    last_event_per_obj = {}
-    set_objects = set()
-
-    ordered_events_revert = copy(ordered_events)
-    ordered_events_revert.reverse()
-
-    for ev in ordered_events_revert:
-        rel_obj = ev_rel_obj[ev]
-        rel_obj_seen = {x for x in rel_obj if x in set_objects}
-        rel_obj_unseen = {x for x in rel_obj if x not in rel_obj_seen}
-
-        for obj in rel_obj_unseen:
-            last_event_per_obj[obj] = ev
-            set_objects.add(obj)
-
-    set_objects = set()
-
-    for ev in ordered_events:
-        rel_obj = ev_rel_obj[ev]
-        rel_obj_seen = {x for x in rel_obj if x in set_objects}
-        rel_obj_unseen = {x for x in rel_obj if x not in rel_obj_seen}
-        rel_obj_last = {x for x in rel_obj if last_event_per_obj[x] == ev}
-
-        for o2 in rel_obj_unseen:
-            for o1 in rel_obj_last:
-                if o1 != o2:
-                    graph.add((o1, o2))
-            set_objects.add(o2)
-
-    graph_it = list(graph)
-    for el in graph_it:
-        if (el[1], el[0]) in graph:
-            graph.remove((el[0], el[1]))
-            graph.remove((el[1], el[0]))
-
-    return graph
+    return incidence_matrix.to_tuples(ocel_index.get_index(ocel), apply_sparse(ocel, parameters=parameters),
+                                      directed=True)
@@ -15,9 +15,38 @@
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
 from pm4py.objects.ocel.obj import OCEL
+from pm4py.objects.ocel.util import ocel_index
+from pm4py.algo.transformation.ocel.graphs import incidence_matrix
 from typing import Optional, Dict, Any, Set, Tuple
 
 
+def apply_sparse(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None):
+    """
+    Calculates the object interaction graph as a sparse adjacency matrix (undirected: both directions are stored).
+    The graph is the off-diagonal support of B^T * B, where B is the event x object incidence matrix.
+
+    Parameters
+    -----------------
+    ocel
+        Object-centric event log
+    parameters
+        Parameters of the algorithm
+
+    Returns
+    -----------------
+    adjacency_matrix
+        Sparse (CSR) object x object adjacency matrix, where the objects are identified by their codes in the index
+        of the log (ocel_index.get_index(ocel).object_ids)
+    """
+    if parameters is None:
+        parameters = {}
+
+    index = ocel_index.get_index(ocel)
+    incidence = incidence_matrix.get_incidence_matrix(index, *incidence_matrix.get_relations(index))
+
+    return incidence_matrix.to_adjacency(incidence.T @ incidence)
+
+
 def apply(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None) -> Set[Tuple[str, str]]:
     """
     Calculates the object interaction graph. Two objects are connected iff they are both related to an event
@@ -38,15 +67,5 @@ def apply(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None) -> Set[Tuple[
     if parameters is None:
         parameters = {}
 
-    graph = set()
-
-    ev_rel_obj = ocel.relations.groupby(ocel.event_id_column)[ocel.object_id_column].agg(list).to_dict()
-
-    for ev in ev_rel_obj:
-        rel_obj = ev_rel_obj[ev]
-        for o1 in rel_obj:
-            for o2 in rel_obj:
-                if o1 < o2:
-                    graph.add((o1, o2))
-
-    return graph
+    return incidence_matrix.to_tuples(ocel_index.get_index(ocel), apply_sparse(ocel, parameters=parameters),
+                                      directed=False)
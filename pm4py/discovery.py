@@ -18,7 +18,7 @@ __doc__ = """
 The ``pm4py.discovery`` module contains the process discovery algorithms implemented in ``pm4py``
 """
 
-from typing import Tuple, Union, List, Dict, Any, Optional, Set
+from typing import Tuple, Union, List, Dict, Any, Optional, Set, Iterator
 
 import pandas as pd
 from pandas import DataFrame
@@ -44,14 +44,14 @@ import deprecation
 import importlib.util
 
 
-def discover_dfg(log: Union[EventLog, pd.DataFrame], activity_key: str = "concept:name", timestamp_key: str = "time:timestamp", case_id_key: str = "case:concept:name") -> Tuple[dict, dict, dict]:
+def discover_dfg(log: Union[EventLog, pd.DataFrame, Iterator[pd.DataFrame]], activity_key: str = "concept:name", timestamp_key: str = "time:timestamp", case_id_key: str = "case:concept:name") -> Tuple[dict, dict, dict]:
     """
     Discovers a Directly-Follows Graph (DFG) from a log.
 
     This method returns a dictionary with the couples of directly-following activities (in the log)
     as keys and the frequency of relation as value.
 
-    :param log: event log / Pandas dataframe
+    :param log: event log / Pandas dataframe / iterator of Pandas dataframes (each containing complete cases)
     :param activity_key: attribute to be used for the activity
     :param timestamp_key: attribute to be used for the timestamp
     :param case_id_key: attribute to be used as case identifier
@@ -62,7 +62,17 @@ def discover_dfg(log: Union[EventLog, pd.DataFrame], activity_key: str = "concep
         import pm4py
 
         dfg, start_activities, end_activities = pm4py.discover_dfg(dataframe, case_id_key='case:concept:name', activity_key='concept:name', timestamp_key='time:timestamp')
+
+        # the chunks of a log can also be consumed incrementally
+        dfg, start_activities, end_activities = pm4py.discover_dfg(pm4py.read_xes("<path_to_xes_file>", chunk_size=100000))
     """
+    if isinstance(log, Iterator):
+        from pm4py.algo.discovery.dfg.adapters.pandas import chunks as dfg_chunks
+        dfg, start_activities, end_activities, activities = dfg_chunks.apply(log, parameters={
+            dfg_chunks.Parameters.ACTIVITY_KEY: activity_key, dfg_chunks.Parameters.TIMESTAMP_KEY: timestamp_key,
+            dfg_chunks.Parameters.CASE_ID_KEY: case_id_key})
+        return dfg, start_activities, end_activities
+
     __event_log_deprecation_warning(log)
 
     properties = get_properties(
@@ -70,18 +80,12 @@ def discover_dfg(log: Union[EventLog, pd.DataFrame], activity_key: str = "concep
     if check_is_pandas_dataframe(log):
         check_pandas_dataframe_columns(
             log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
-        from pm4py.util import constants
-
-        from pm4py.algo.discovery.dfg.adapters.pandas.df_statistics import get_dfg_graph
-        dfg = get_dfg_graph(log, activity_key=activity_key,
-                            timestamp_key=timestamp_key,
-                            case_id_glue=case_id_key)
-        from pm4py.statistics.start_activities.pandas import get as start_activities_module
-        from pm4py.statistics.end_activities.pandas import get as end_activities_module
-        start_activities = start_activities_module.get_start_activities(
-            log, parameters=properties)
-        end_activities = end_activities_module.get_end_activities(
-            log, parameters=properties)
+        from pm4py.algo.discovery.dfg.adapters.pandas import fused_statistics
+        statistics = fused_statistics.apply(log, measure="frequency", activity_key=activity_key,
+                                            timestamp_key=timestamp_key, case_id_glue=case_id_key)
+        dfg = statistics[fused_statistics.DFG_FREQUENCY]
+        start_activities = statistics[fused_statistics.START_ACTIVITIES]
+        end_activities = statistics[fused_statistics.END_ACTIVITIES]
     else:
         from pm4py.algo.discovery.dfg import algorithm as dfg_discovery
         dfg = dfg_discovery.apply(log, parameters=properties)
@@ -139,14 +143,14 @@ def discover_dfg_typed(log: pd.DataFrame, case_id_key: str = "case:concept:name"
         raise TypeError('pm4py.discover_dfg_typed is only defined for dataFrames')
         
 
-def discover_performance_dfg(log: Union[EventLog, pd.DataFrame], business_hours: bool = False, business_hour_slots=constants.DEFAULT_BUSINESS_HOUR_SLOTS, workcalendar=constants.DEFAULT_BUSINESS_HOURS_WORKCALENDAR, activity_key: str = "concept:name", timestamp_key: str = "time:timestamp", case_id_key: str = "case:concept:name") -> Tuple[dict, dict, dict]:
+def discover_performance_dfg(log: Union[EventLog, pd.DataFrame, Iterator[pd.DataFrame]], business_hours: bool = False, business_hour_slots=constants.DEFAULT_BUSINESS_HOUR_SLOTS, workcalendar=constants.DEFAULT_BUSINESS_HOURS_WORKCALENDAR, activity_key: str = "concept:name", timestamp_key: str = "time:timestamp", case_id_key: str = "case:concept:name") -> Tuple[dict, dict, dict]:
     """
     Discovers a performance directly-follows graph from an event log.
 
     This method returns a dictionary with the couples of directly-following activities (in the log)
     as keys and the performance of relation as value.
 
-    :param log: event log / Pandas dataframe
+    :param log: event log / Pandas dataframe / iterator of Pandas dataframes (shards of the log, each containing complete cases)
     :param business_hours: enables/disables the computation based on the business hours (default: False)
     :param business_hour_slots: work schedule of the company, provided as a list of tuples where each tuple represents one time slot of business hours. One slot i.e. one tuple consists of one start and one end time given in seconds since week start, e.g. [(7 * 60 * 60, 17 * 60 * 60), ((24 + 7) * 60 * 60, (24 + 12) * 60 * 60), ((24 + 13) * 60 * 60, (24 + 17) * 60 * 60),] meaning that business hours are Mondays 07:00 - 17:00 and Tuesdays 07:00 - 12:00 and 13:00 - 17:00
     :param activity_key: attribute to be used for the activity
@@ -159,7 +163,20 @@ def discover_performance_dfg(log: Union[EventLog, pd.DataFrame], business_hours:
         import pm4py
 
         performance_dfg, start_activities, end_activities = pm4py.discover_performance_dfg(dataframe, case_id_key='case:concept:name', activity_key='concept:name', timestamp_key='time:timestamp')
+
+        # the shards of a log (partitioned by case) are summarized one at a time and the summaries are merged
+        performance_dfg, start_activities, end_activities = pm4py.discover_performance_dfg(pm4py.read_xes("<path_to_xes_file>", chunk_size=100000))
     """
+    if isinstance(log, Iterator):
+        if business_hours:
+            raise Exception("the business hours are not supported on iterators of dataframes")
+        from pm4py.algo.discovery.dfg.adapters.pandas import mergeable
+        summary = mergeable.apply(log, parameters={
+            mergeable.Parameters.ACTIVITY_KEY: activity_key, mergeable.Parameters.TIMESTAMP_KEY: timestamp_key,
+            mergeable.Parameters.CASE_ID_KEY: case_id_key, mergeable.Parameters.EXACT_PERFORMANCE: True,
+            mergeable.Parameters.INCLUDE_VARIANTS: False})
+        return summary.get_performance_dfg(), summary.get_start_activities(), summary.get_end_activities()
+
     __event_log_deprecation_warning(log)
 
     properties = get_properties(
@@ -168,17 +185,24 @@ def discover_performance_dfg(log: Union[EventLog, pd.DataFrame], business_hours:
     if check_is_pandas_dataframe(log):
         check_pandas_dataframe_columns(
             log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
-        from pm4py.util import constants
-
-        from pm4py.algo.discovery.dfg.adapters.pandas.df_statistics import get_dfg_graph
-        dfg = get_dfg_graph(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_glue=case_id_key, measure="performance", perf_aggregation_key="all",
-                            business_hours=business_hours, business_hours_slot=business_hour_slots, workcalendar=workcalendar)
-        from pm4py.statistics.start_activities.pandas import get as start_activities_module
-        from pm4py.statistics.end_activities.pandas import get as end_activities_module
-        start_activities = start_activities_module.get_start_activities(
-            log, parameters=properties)
-        end_activities = end_activities_module.get_end_activities(
-            log, parameters=properties)
+        if business_hours:
+            from pm4py.algo.discovery.dfg.adapters.pandas.df_statistics import get_dfg_graph
+            dfg = get_dfg_graph(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_glue=case_id_key, measure="performance", perf_aggregation_key="all",
+                                business_hours=business_hours, business_hours_slot=business_hour_slots, workcalendar=workcalendar)
+            from pm4py.statistics.start_activities.pandas import get as start_activities_module
+            from pm4py.statistics.end_activities.pandas import get as end_activities_module
+            start_activities = start_activities_module.get_start_activities(
+                log, parameters=properties)
+            end_activities = end_activities_module.get_end_activities(
+                log, parameters=properties)
+        else:
+            from pm4py.algo.discovery.dfg.adapters.pandas import fused_statistics
+            statistics = fused_statistics.apply(log, measure="performance", activity_key=activity_key,
+                                                timestamp_key=timestamp_key, case_id_glue=case_id_key,
+                                                perf_aggregation_key="all")
+            dfg = statistics[fused_statistics.DFG_PERFORMANCE]
+            start_activities = statistics[fused_statistics.START_ACTIVITIES]
+            end_activities = statistics[fused_statistics.END_ACTIVITIES]
     else:
         from pm4py.algo.discovery.dfg.variants import performance as dfg_discovery
         properties[dfg_discovery.Parameters.AGGREGATION_MEASURE] = "all"
@@ -1039,7 +1039,11 @@ def filter_ocel_object_types(ocel: OCEL, obj_types: Collection[str], positive: b
     """
     from copy import copy
     from pm4py.objects.ocel.util import filtering_utils
+    from pm4py.objects.ocel.util.ocel_view import OCELView
     if level == 1:
+        if isinstance(ocel, OCELView):
+            mask = ocel.get_base().objects[ocel.object_type_column].isin(obj_types).to_numpy()
+            return ocel.filter_objects(mask if positive else ~mask)
         filtered_ocel = copy(ocel)
         if positive:
             filtered_ocel.objects = filtered_ocel.objects[filtered_ocel.objects[filtered_ocel.object_type_column].isin(obj_types)]
@@ -1087,6 +1091,10 @@ def filter_ocel_objects(ocel: OCEL, object_identifiers: Collection[str], positiv
             level = level - 1
     from copy import copy
     from pm4py.objects.ocel.util import filtering_utils
+    from pm4py.objects.ocel.util.ocel_view import OCELView
+    if isinstance(ocel, OCELView):
+        mask = ocel.get_base().objects[ocel.object_id_column].isin(object_identifiers).to_numpy()
+        return ocel.filter_objects(mask if positive else ~mask)
     filtered_ocel = copy(ocel)
     if positive:
         filtered_ocel.objects = filtered_ocel.objects[filtered_ocel.objects[filtered_ocel.object_id_column].isin(object_identifiers)]
@@ -1113,6 +1121,10 @@ def filter_ocel_events(ocel: OCEL, event_identifiers: Collection[str], positive:
     """
     from copy import copy
     from pm4py.objects.ocel.util import filtering_utils
+    from pm4py.objects.ocel.util.ocel_view import OCELView
+    if isinstance(ocel, OCELView):
+        mask = ocel.get_base().events[ocel.event_id_column].isin(event_identifiers).to_numpy()
+        return ocel.filter_events(mask if positive else ~mask)
     filtered_ocel = copy(ocel)
     if positive:
         filtered_ocel.events = filtered_ocel.events[filtered_ocel.events[filtered_ocel.event_id_column].isin(event_identifiers)]
@@ -1275,3 +1287,32 @@ def filter_ocel_cc_activity(ocel: OCEL, activity: str) -> OCEL:
     objs = [y for x in conn_comp for y in x]
 
     return filter_ocel_objects(ocel, objs)
+
+
+def pipeline(log: pd.DataFrame, activity_key: str = "concept:name", timestamp_key: str = "time:timestamp", case_id_key: str = "case:concept:name"):
+    """
+    Creates a lazy filtering pipeline on a Pandas dataframe. The filters (start_activities, end_activities,
+    event_attribute_values, trace_attribute_values, variants, time_range, case_size, case_performance,
+    variants_top_k, variants_by_coverage_percentage) are accumulated and executed together when collect() is called,
+    producing the same result as the corresponding filter_* functions applied one after the other, without
+    materializing the intermediate dataframes.
+
+    :param log: Pandas dataframe
+    :param activity_key: attribute to be used for the activity
+    :param timestamp_key: attribute to be used for the timestamp
+    :param case_id_key: attribute to be used as case identifier
+    :rtype: ``FilterPipeline``
+
+    .. code-block:: python3
+
+        import pm4py
+
+        filtered_dataframe = pm4py.filtering.pipeline(dataframe, activity_key='concept:name', case_id_key='case:concept:name', timestamp_key='time:timestamp').start_activities(['Act. A']).time_range('2010-01-01 00:00:00', '2011-01-01 00:00:00', mode='events').variants_top_k(5).collect()
+    """
+    if not check_is_pandas_dataframe(log):
+        raise Exception("the filtering pipeline is available only for Pandas dataframes")
+
+    check_pandas_dataframe_columns(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
+    from pm4py.algo.filtering.pandas.pipeline import filter_pipeline
+    parameters = get_properties(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
+    return filter_pipeline.FilterPipeline(log, parameters=parameters)
@@ -17,7 +17,7 @@
 from enum import Enum
 from pm4py.util import constants
 
-from pm4py.objects.log.importer.xes.variants import iterparse, line_by_line, iterparse_mem_compressed, iterparse_20, chunk_regex, rustxes
+from pm4py.objects.log.importer.xes.variants import iterparse, line_by_line, iterparse_mem_compressed, iterparse_20, chunk_regex, rustxes, dataframe_chunks, parallel_chunks
 
 
 class Variants(Enum):
@@ -27,6 +27,8 @@ class Variants(Enum):
     ITERPARSE_20 = iterparse_20
     CHUNK_REGEX = chunk_regex
     RUSTXES = rustxes
+    DATAFRAME_CHUNKS = dataframe_chunks
+    PARALLEL_CHUNKS = parallel_chunks
 
 
 def __get_variant(variant_str: str):
@@ -48,6 +50,10 @@ def __get_variant(variant_str: str):
         variant = Variants.ITERPARSE_MEM_COMPRESSED
     elif variant_str == "rustxes":
         variant = Variants.RUSTXES
+    elif variant_str == "dataframe_chunks":
+        variant = Variants.DATAFRAME_CHUNKS
+    elif variant_str == "parallel_chunks":
+        variant = Variants.PARALLEL_CHUNKS
 
     return variant
 
@@ -71,6 +77,8 @@ def apply(path, parameters=None, variant=constants.DEFAULT_XES_PARSER):
         Variant of the algorithm to use, including:
             - Variants.ITERPARSE
             - Variants.LINE_BY_LINE
+            - Variants.DATAFRAME_CHUNKS (returns a generator of dataframes, each containing a set of complete traces)
+            - Variants.PARALLEL_CHUNKS (parses ranges of traces in parallel processes)
 
     Returns
     -----------
@@ -0,0 +1,334 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+"""
+Memory-bounded importer of XES files, which yields the events of the log as a sequence of dataframes (chunks).
+
+Each chunk contains the events of a set of complete traces (a trace is never split across different chunks),
+in the same format as the dataframe obtained by converting the event log (the attributes of the trace are reported
+with the case: prefix). Only the current chunk and the current trace are kept in memory.
+"""
+import codecs
+import gzip
+import html
+import logging
+import re
+import sys
+from enum import Enum
+from io import BytesIO
+from typing import Optional, Dict, Any, Iterator, BinaryIO
+
+import pandas as pd
+
+from pm4py.util import constants, exec_utils, pandas_utils
+from pm4py.util import xes_constants
+from pm4py.util.dt_parsing import parser as dt_parser
+
+
+class Parameters(Enum):
+    CHUNK_SIZE = "chunk_size"
+    MAX_TRACES = "max_traces"
+    ENCODING = "encoding"
+    DECOMPRESS_SERIALIZATION = "decompress_serialization"
+    RETURN_ARROW_TABLES = "return_arrow_tables"
+    CASE_ATTRIBUTE_PREFIX = "case_attribute_prefix"
+
+
+DEFAULT_CHUNK_SIZE = 100000
+READ_BLOCK_SIZE = 2 ** 16
+
+_TAG_REGEX = re.compile(r"<((?:[^<>\"']|\"[^\"]*\"|'[^']*')*)>")
+_ATTRIBUTES_REGEX = re.compile(r"([^\s=]+)\s*=\s*(?:\"([^\"]*)\"|'([^']*)')")
+
+_ATTRIBUTE_TAGS = {xes_constants.TAG_STRING, xes_constants.TAG_DATE, xes_constants.TAG_INT, xes_constants.TAG_FLOAT,
+                   xes_constants.TAG_BOOLEAN, xes_constants.TAG_ID, xes_constants.TAG_LIST}
+
+
+def __iterate_tags(F: BinaryIO, encoding: str) -> Iterator[str]:
+    """
+    Iterates over the content of the tags of a XML file object, reading it in blocks of bytes
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    buffer = ""
+    while True:
+        block = F.read(READ_BLOCK_SIZE)
+        buffer = buffer + decoder.decode(block, final=not block)
+        last_end = 0
+        for match in _TAG_REGEX.finditer(buffer):
+            yield match.group(1)
+            last_end = match.end()
+        buffer = buffer[last_end:]
+        if not block:
+            break
+
+
+def __parse_value(tag: str, value: Optional[str], date_parser):
+    if value is None:
+        return None
+    if "&" in value:
+        value = html.unescape(value)
+    if tag == xes_constants.TAG_DATE:
+        return date_parser.apply(value)
+    elif tag == xes_constants.TAG_INT:
+        return int(value)
+    elif tag == xes_constants.TAG_FLOAT:
+        return float(value)
+    elif tag == xes_constants.TAG_BOOLEAN:
+        return value.lower() == "true"
+    return value
+
+
+def __store(container, key, value):
+    if type(container) is list:
+        container.append((key, value))
+    else:
+        container[key] = value
+
+
+def __to_chunk(rows, properties, return_arrow_tables):
+    df = pandas_utils.instantiate_dataframe(rows)
+    df.attrs = dict(properties)
+    if return_arrow_tables:
+        import pyarrow
+        return pyarrow.Table.from_pandas(df, preserve_index=False)
+    return df
+
+
+def import_log_from_file_object(F: BinaryIO, encoding: str, parameters: Optional[Dict[Any, Any]] = None) -> Iterator[pd.DataFrame]:
+    """
+    Imports the events of a XES log, from a file object, as a sequence of dataframes
+
+    Parameters
+    -----------
+    F
+        File object
+    encoding
+        Encoding
+    parameters
+        Parameters of the algorithm, including:
+            Parameters.CHUNK_SIZE -> (approximate) number of events contained in each chunk
+            Parameters.MAX_TRACES -> maximum number of traces to import from the log
+            Parameters.RETURN_ARROW_TABLES -> returns the chunks as Pyarrow tables instead of Pandas dataframes
+            Parameters.CASE_ATTRIBUTE_PREFIX -> prefix of the attributes of the traces (default: case:)
+
+    Returns
+    -----------
+    chunks
+        Generator of dataframes
+    """
+    if parameters is None:
+        parameters = {}
+
+    chunk_size = exec_utils.get_param_value(Parameters.CHUNK_SIZE, parameters, DEFAULT_CHUNK_SIZE)
+    max_no_traces_to_import = exec_utils.get_param_value(Parameters.MAX_TRACES, parameters, sys.maxsize)
+    return_arrow_tables = exec_utils.get_param_value(Parameters.RETURN_ARROW_TABLES, parameters, False)
+    case_attribute_prefix = exec_utils.get_param_value(Parameters.CASE_ATTRIBUTE_PREFIX, parameters,
+                                                       constants.CASE_ATTRIBUTE_PREFIX)
+
+    properties = {constants.PARAMETER_CONSTANT_ACTIVITY_KEY: xes_constants.DEFAULT_NAME_KEY,
+                  constants.PARAMETER_CONSTANT_ATTRIBUTE_KEY: xes_constants.DEFAULT_NAME_KEY,
+                  constants.PARAMETER_CONSTANT_TIMESTAMP_KEY: xes_constants.DEFAULT_TIMESTAMP_KEY,
+                  constants.PARAMETER_CONSTANT_RESOURCE_KEY: xes_constants.DEFAULT_RESOURCE_KEY,
+                  constants.PARAMETER_CONSTANT_TRANSITION_KEY: xes_constants.DEFAULT_TRANSITION_KEY,
+                  constants.PARAMETER_CONSTANT_GROUP_KEY: xes_constants.DEFAULT_GROUP_KEY}
+
+    date_parser = dt_parser.get()
+
+    # each entry of the stack is a list [kind, container, parent container, key, value]
+    # where the container collects the attributes of the children of the element.
+    # for the attributes, the container is created only when the first child is met.
+    stack = []
+    trace_attributes = None
+    trace_events = None
+    rows = []
+    num_traces = 0
+
+    for el in __iterate_tags(F, encoding):
+        if not el or el[0] in "?!":
+            continue
+        if el[0] == "/":
+            if not stack:
+                break
+            entry = stack.pop()
+            kind = entry[0]
+            if kind == xes_constants.TAG_EVENT:
+                if trace_events is not None:
+                    trace_events.append(entry[1])
+                else:
+                    # event stream: events outside of a trace
+                    rows.append(entry[1])
+            elif kind == xes_constants.TAG_TRACE:
+                for event in trace_events:
+                    for key, value in trace_attributes.items():
+                        event[case_attribute_prefix + key] = value
+                    rows.append(event)
+                num_traces += 1
+                trace_attributes = None
+                trace_events = None
+                if num_traces >= max_no_traces_to_import:
+                    break
+                if len(rows) >= chunk_size:
+                    yield __to_chunk(rows, properties, return_arrow_tables)
+                    rows = []
+            elif kind == xes_constants.TAG_LOG:
+                break
+            continue
+
+        el = el.rstrip()
+        self_closing = el[-1] == "/"
+        if self_closing:
+            el = el[:-1]
+        tag = el.split(None, 1)[0].split(":")[-1]
+
+        parent = stack[-1] if stack else None
+        if parent is not None and parent[0] == "attribute" and parent[1] is None:
+            # first child of an attribute: the attribute becomes a nested attribute
+            parent[1] = list() if tag == xes_constants.TAG_VALUES else dict()
+            __store(parent[2], parent[3], {xes_constants.KEY_VALUE: parent[4], xes_constants.KEY_CHILDREN: parent[1]})
+
+        if tag in _ATTRIBUTE_TAGS:
+            attributes = {m.group(1): m.group(2) if m.group(2) is not None else m.group(3) for m in
+                          _ATTRIBUTES_REGEX.finditer(el)}
+            key = attributes.get(xes_constants.KEY_KEY, None)
+            if key is not None and "&" in key:
+                key = html.unescape(key)
+            container = parent[1] if parent is not None else None
+            value = None
+            if tag != xes_constants.TAG_LIST:
+                try:
+                    value = __parse_value(tag, attributes.get(xes_constants.KEY_VALUE, None), date_parser)
+                except (TypeError, ValueError):
+                    logging.info("failed to parse " + tag + ": " + str(attributes.get(xes_constants.KEY_VALUE, None)))
+                    key = None
+            if container is not None and key is not None:
+                __store(container, key, value)
+            if not self_closing:
+                stack.append(["attribute", None, container if container is not None else dict(), key, value])
+        elif tag == xes_constants.TAG_EVENT:
+            if not self_closing:
+                stack.append([xes_constants.TAG_EVENT, dict()])
+        elif tag == xes_constants.TAG_TRACE:
+            if not self_closing:
+                trace_attributes = dict()
+                trace_events = list()
+                stack.append([xes_constants.TAG_TRACE, trace_attributes])
+        elif tag == xes_constants.TAG_VALUES:
+            if not self_closing:
+                stack.append([xes_constants.TAG_VALUES, parent[1] if parent is not None else list()])
+        elif not self_closing:
+            # log, extensions, globals, classifiers and unknown tags: their content does not belong to the events
+            stack.append([tag, dict()])
+
+    if rows:
+        yield __to_chunk(rows, properties, return_arrow_tables)
+
+
+def apply(filename: str, parameters: Optional[Dict[Any, Any]] = None) -> Iterator[pd.DataFrame]:
+    """
+    Imports a XES file as a sequence of dataframes (chunks)
+
+    Parameters
+    -----------
+    filename
+        Path to the XES file
+    parameters
+        Parameters of the algorithm, including:
+            Parameters.CHUNK_SIZE -> (approximate) number of events contained in each chunk
+            Parameters.MAX_TRACES -> maximum number of traces to import from the log
+            Parameters.ENCODING -> regulates the encoding (default: utf-8)
+            Parameters.RETURN_ARROW_TABLES -> returns the chunks as Pyarrow tables instead of Pandas dataframes
+
+    Returns
+    -----------
+    chunks
+        Generator of dataframes
+    """
+    return import_log(filename, parameters)
+
+
+def import_log(filename: str, parameters: Optional[Dict[Any, Any]] = None) -> Iterator[pd.DataFrame]:
+    """
+    Imports a XES file as a sequence of dataframes (chunks)
+
+    Parameters
+    -----------
+    filename
+        Path to the XES file
+    parameters
+        Parameters of the algorithm, including:
+            Parameters.CHUNK_SIZE -> (approximate) number of events contained in each chunk
+            Parameters.MAX_TRACES -> maximum number of traces to import from the log
+            Parameters.ENCODING -> regulates the encoding (default: utf-8)
+            Parameters.RETURN_ARROW_TABLES -> returns the chunks as Pyarrow tables instead of Pandas dataframes
+
+    Returns
+    -----------
+    chunks
+        Generator of dataframes
+    """
+    if parameters is None:
+        parameters = {}
+
+    encoding = exec_utils.get_param_value(Parameters.ENCODING, parameters, constants.DEFAULT_ENCODING)
+
+    if filename.lower().endswith(".gz"):
+        f = gzip.open(filename, mode="rb")
+    else:
+        f = open(filename, "rb")
+
+    try:
+        yield from import_log_from_file_object(f, encoding, parameters=parameters)
+    finally:
+        f.close()
+
+
+def import_from_string(log_string, parameters: Optional[Dict[Any, Any]] = None) -> Iterator[pd.DataFrame]:
+    """
+    Deserialize a text/binary string representing a XES log as a sequence of dataframes (chunks)
+
+    Parameters
+    -----------
+    log_string
+        String that contains the XES
+    parameters
+        Parameters of the algorithm
+
+    Returns
+    -----------
+    chunks
+        Generator of dataframes
+    """
+    if parameters is None:
+        parameters = {}
+
+    encoding = exec_utils.get_param_value(Parameters.ENCODING, parameters, constants.DEFAULT_ENCODING)
+    decompress_serialization = exec_utils.get_param_value(Parameters.DECOMPRESS_SERIALIZATION, parameters, False)
+
+    if type(log_string) is str:
+        log_string = log_string.encode(constants.DEFAULT_ENCODING)
+
+    b = BytesIO(log_string)
+
+    if decompress_serialization:
+        s = gzip.GzipFile(fileobj=b, mode="rb")
+    else:
+        s = b
+
+    try:
+        yield from import_log_from_file_object(s, encoding, parameters=parameters)
+    finally:
+        s.close()
+        b.close()
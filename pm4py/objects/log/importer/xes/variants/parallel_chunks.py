@@ -0,0 +1,290 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+"""
+Parallel importer of XES files.
+
+The content of the file (or of the decompressed gzip buffer) is split, on the <trace> boundaries, into byte ranges,
+which are parsed in different processes (using the regex-based parser of the dataframe_chunks variant).
+The resulting dataframes are concatenated in the order of the traces in the file. The header of the log (attributes,
+extensions, globals and classifiers), which precedes the first trace, is parsed once in the main process.
+"""
+import gzip
+import mmap
+import re
+import sys
+from copy import copy
+from enum import Enum
+from io import BytesIO
+from typing import Optional, Dict, Any, Union, List, Tuple
+
+import pandas as pd
+
+from pm4py.objects.conversion.log import converter as log_converter
+from pm4py.objects.log.importer.xes.variants import dataframe_chunks, chunk_regex
+from pm4py.objects.log.obj import EventLog
+from pm4py.util import exec_utils, constants, pandas_utils
+
+
+class Parameters(Enum):
+    MAX_TRACES = "max_traces"
+    ENCODING = "encoding"
+    CORES = "cores"
+    MIN_RANGE_SIZE = "min_range_size"
+    DECOMPRESS_SERIALIZATION = "decompress_serialization"
+    RETURN_LEGACY_LOG_OBJECT = "return_legacy_log_object"
+
+
+# minimum size (in bytes) of the ranges parsed by the workers
+DEFAULT_MIN_RANGE_SIZE = 2 ** 22
+
+_TRACE_START_REGEX = re.compile(rb"<trace[\s>/]")
+_LOG_END = b"</log"
+
+
+def __get_ranges(content, num_ranges: int, max_traces: int) -> List[Tuple[int, int]]:
+    """
+    Splits the content of a XES file into byte ranges, each one starting with a <trace> tag
+    """
+    first_trace = _TRACE_START_REGEX.search(content)
+    if first_trace is None:
+        return []
+    start = first_trace.start()
+    end = content.rfind(_LOG_END)
+    if end < start:
+        end = len(content)
+
+    if max_traces < sys.maxsize:
+        # the region ends where the first trace that should not be imported starts
+        for i, match in enumerate(_TRACE_START_REGEX.finditer(content, start, end)):
+            if i == max_traces:
+                end = match.start()
+                break
+
+    boundaries = [start]
+    for i in range(1, num_ranges):
+        target = start + (end - start) * i // num_ranges
+        if target <= boundaries[-1]:
+            continue
+        match = _TRACE_START_REGEX.search(content, target, end)
+        if match is None:
+            break
+        if match.start() > boundaries[-1]:
+            boundaries.append(match.start())
+    boundaries.append(end)
+
+    return [(boundaries[i], boundaries[i + 1]) for i in range(len(boundaries) - 1)]
+
+
+def __parse_header(content, encoding: str) -> EventLog:
+    """
+    Parses the header of a XES file (the content preceding the first trace), returning an empty event log
+    carrying the attributes, the extensions, the globals and the classifiers of the log
+    """
+    first_trace = _TRACE_START_REGEX.search(content)
+    end = first_trace.start() if first_trace is not None else content.rfind(_LOG_END)
+    if end < 0:
+        end = len(content)
+
+    return chunk_regex.import_from_string(bytes(content[:end]) + b"</log>",
+                                          parameters={chunk_regex.Parameters.ENCODING: encoding})
+
+
+def _parse_range(content: Union[str, bytes], start: int, end: int, encoding: str) -> Optional[pd.DataFrame]:
+    """
+    Parses a range of bytes of a XES file, containing a sequence of traces
+
+    Parameters
+    -------------
+    content
+        Path to the (uncompressed) XES file, or the content of the range
+    start
+        Starting position of the range in the file
+    end
+        Ending position of the range in the file
+    encoding
+        Encoding
+
+    Returns
+    -------------
+    dataframe
+        Dataframe containing the events of the traces of the range
+    """
+    if type(content) is str:
+        with open(content, "rb") as f:
+            f.seek(start)
+            content = f.read(end - start)
+
+    F = BytesIO(b"<log>" + content + b"</log>")
+    chunks = list(dataframe_chunks.import_log_from_file_object(F, encoding, parameters={
+        dataframe_chunks.Parameters.CHUNK_SIZE: sys.maxsize}))
+    F.close()
+
+    return chunks[0] if chunks else None
+
+
+def import_from_content(content: Union[bytes, mmap.mmap], path: Optional[str] = None, parameters: Optional[Dict[Any, Any]] = None) -> Union[EventLog, pd.DataFrame]:
+    """
+    Imports a XES log from its (uncompressed) content, parsing the ranges of traces in parallel
+
+    Parameters
+    --------------
+    content
+        Content of the XES file (bytes or memory-mapped file)
+    path
+        (if provided) path of the uncompressed XES file. In such case, the workers read their range from the file
+    parameters
+        Parameters of the algorithm
+
+    Returns
+    --------------
+    log
+        Dataframe (or event log object)
+    """
+    if parameters is None:
+        parameters = {}
+
+    import multiprocessing
+
+    encoding = exec_utils.get_param_value(Parameters.ENCODING, parameters, constants.DEFAULT_ENCODING)
+    max_traces = exec_utils.get_param_value(Parameters.MAX_TRACES, parameters, sys.maxsize)
+    num_cores = exec_utils.get_param_value(Parameters.CORES, parameters, multiprocessing.cpu_count())
+    min_range_size = exec_utils.get_param_value(Parameters.MIN_RANGE_SIZE, parameters, DEFAULT_MIN_RANGE_SIZE)
+    return_legacy_log_object = exec_utils.get_param_value(Parameters.RETURN_LEGACY_LOG_OBJECT, parameters, True)
+
+    num_ranges = max(1, min(4 * num_cores, len(content) // max(1, min_range_size)))
+    ranges = __get_ranges(content, num_ranges, max_traces)
+
+    if len(ranges) > 1 and num_cores > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=num_cores) as executor:
+            futures = []
+            for start, end in ranges:
+                if path is not None:
+                    futures.append(executor.submit(_parse_range, path, start, end, encoding))
+                else:
+                    futures.append(executor.submit(_parse_range, bytes(content[start:end]), 0, end - start, encoding))
+            dataframes = [f.result() for f in futures]
+    else:
+        dataframes = [_parse_range(bytes(content[start:end]), 0, end - start, encoding) for start, end in ranges]
+
+    dataframes = [df for df in dataframes if df is not None]
+    if dataframes:
+        log = pandas_utils.concat(dataframes, ignore_index=True)
+        log.attrs = copy(dataframes[0].attrs)
+    else:
+        log = pandas_utils.instantiate_dataframe()
+
+    if return_legacy_log_object:
+        this_parameters = copy(parameters)
+        this_parameters["stream_postprocessing"] = True
+        log = log_converter.apply(log, variant=log_converter.Variants.TO_EVENT_LOG, parameters=this_parameters)
+        header = __parse_header(content, encoding)
+        log = EventLog(log, attributes=header.attributes, extensions=header.extensions,
+                       omni_present=header.omni_present, classifiers=header.classifiers, properties=log.properties)
+
+    return log
+
+
+def apply(filename: str, parameters: Optional[Dict[Any, Any]] = None) -> Union[EventLog, pd.DataFrame]:
+    """
+    Imports a XES file, parsing the ranges of traces in parallel
+
+    Parameters
+    --------------
+    filename
+        Path to the XES file
+    parameters
+        Parameters of the algorithm, including:
+            Parameters.MAX_TRACES -> maximum number of traces to import from the log (read in order in the XML file)
+            Parameters.ENCODING -> regulates the encoding (default: utf-8)
+            Parameters.CORES -> number of processes used for parsing
+            Parameters.MIN_RANGE_SIZE -> minimum size (in bytes) of the ranges parsed by the workers
+            Parameters.RETURN_LEGACY_LOG_OBJECT -> returns an event log object instead of a dataframe (default: True)
+
+    Returns
+    --------------
+    log
+        Dataframe (or event log object)
+    """
+    return import_log(filename, parameters=parameters)
+
+
+def import_log(filename: str, parameters: Optional[Dict[Any, Any]] = None) -> Union[EventLog, pd.DataFrame]:
+    """
+    Imports a XES file, parsing the ranges of traces in parallel
+
+    Parameters
+    --------------
+    filename
+        Path to the XES file
+    parameters
+        Parameters of the algorithm, including:
+            Parameters.MAX_TRACES -> maximum number of traces to import from the log (read in order in the XML file)
+            Parameters.ENCODING -> regulates the encoding (default: utf-8)
+            Parameters.CORES -> number of processes used for parsing
+            Parameters.MIN_RANGE_SIZE -> minimum size (in bytes) of the ranges parsed by the workers
+            Parameters.RETURN_LEGACY_LOG_OBJECT -> returns an event log object instead of a dataframe (default: True)
+
+    Returns
+    --------------
+    log
+        Dataframe (or event log object)
+    """
+    if parameters is None:
+        parameters = {}
+
+    if filename.lower().endswith(".gz"):
+        with gzip.open(filename, "rb") as f:
+            content = f.read()
+        return import_from_content(content, parameters=parameters)
+
+    with open(filename, "rb") as f:
+        if f.seek(0, 2) == 0:
+            return import_from_content(b"", parameters=parameters)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            return import_from_content(content, path=filename, parameters=parameters)
+
+
+def import_from_string(log_string, parameters: Optional[Dict[Any, Any]] = None) -> Union[EventLog, pd.DataFrame]:
+    """
+    Deserialize a text/binary string representing a XES log, parsing the ranges of traces in parallel
+
+    Parameters
+    --------------
+    log_string
+        String that contains the XES
+    parameters
+        Parameters of the algorithm
+
+    Returns
+    --------------
+    log
+        Dataframe (or event log object)
+    """
+    if parameters is None:
+        parameters = {}
+
+    decompress_serialization = exec_utils.get_param_value(Parameters.DECOMPRESS_SERIALIZATION, parameters, False)
+
+    if type(log_string) is str:
+        log_string = log_string.encode(constants.DEFAULT_ENCODING)
+
+    if decompress_serialization:
+        log_string = gzip.decompress(log_string)
+
+    return import_from_content(log_string, parameters=parameters)
@@ -16,8 +16,8 @@
 '''
 import pandas as pd
 from enum import Enum
-from pm4py.util import constants, xes_constants, pandas_utils, exec_utils
-import numpy as np
+from pm4py.util import constants, xes_constants, exec_utils
+from pm4py.objects.log.util import variant_index
 from collections import Counter
 from typing import Tuple, Dict, Collection
 import importlib.util
@@ -68,13 +68,6 @@ def apply(dataframe: pd.DataFrame, parameters=None) -> Tuple[Dict[Collection[str
 
     case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME)
     activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, xes_constants.DEFAULT_NAME_KEY)
-    timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters, xes_constants.DEFAULT_TIMESTAMP_KEY)
-    index_key = exec_utils.get_param_value(Parameters.INDEX_KEY, parameters, constants.DEFAULT_INDEX_KEY)
-
-    if not (hasattr(dataframe, "attrs") and dataframe.attrs):
-        # dataframe has not been initialized through format_dataframe
-        dataframe = pandas_utils.insert_index(dataframe, index_key)
-        dataframe.sort_values([case_id_key, timestamp_key, index_key])
 
     case_variant = dict()
 
@@ -83,18 +76,11 @@ def apply(dataframe: pd.DataFrame, parameters=None) -> Tuple[Dict[Collection[str
         case_variant = {x: tuple(y) for x, y in case_variant.items()}
         variants_counter = Counter(case_variant.values())
     else:
-        variants_counter = Counter()
-        cases = dataframe[case_id_key].to_numpy()
-        activities = dataframe[activity_key].to_numpy()
-
-        c_unq, c_ind, c_counts = np.unique(cases, return_index=True, return_counts=True)
-
-        for i in range(len(c_ind)):
-            si = c_ind[i]
-            ei = si + c_counts[i]
-            acts = tuple(activities[si:ei])
-            variants_counter[acts] += 1
-            case_variant[c_unq[i]] = acts
+        # the variant index is computed once per dataframe, and shared with the other variant-aware functions
+        index = variant_index.get_variant_index(dataframe, parameters={
+            variant_index.Parameters.CASE_ID_KEY: case_id_key, variant_index.Parameters.ACTIVITY_KEY: activity_key})
+        variants_counter = index.get_variants_count()
+        case_variant = index.get_case_variant()
 
     # return as Python dictionary
     variants_dict = {x: y for x, y in variants_counter.items()}
@@ -0,0 +1,351 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+"""
+Variant index of a dataframe, computed once and shared by the variant-aware functions (statistics, filters,
+process discovery and conformance checking).
+
+The index is kept in a side cache (associated to the identity of the dataframe, and dropped when the dataframe is
+garbage collected) and not in df.attrs, since pandas deep-copies the attributes in every derived dataframe.
+The index is invalidated when the columns of the dataframe are replaced or resized: the number of rows, the types
+and the arrays backing the case identifier, activity and timestamp columns are checked (in constant time) before
+reusing it. The in-place modifications of the values (e.g. df.loc[i, "concept:name"] = x) are not detected: after
+them, invalidate(df) should be called.
+"""
+import weakref
+from enum import Enum
+from typing import Optional, Dict, Any, Tuple, List, Collection
+
+import numpy as np
+import pandas as pd
+
+from pm4py.util import exec_utils, constants, xes_constants
+
+
+class Parameters(Enum):
+    CASE_ID_KEY = constants.PARAMETER_CONSTANT_CASEID_KEY
+    ACTIVITY_KEY = constants.PARAMETER_CONSTANT_ACTIVITY_KEY
+    # if provided, the events of a case are sorted by this column (otherwise, the order of the rows is kept)
+    TIMESTAMP_KEY = constants.PARAMETER_CONSTANT_TIMESTAMP_KEY
+
+
+# identity of the dataframe -> dictionary associating to the keys of an index its fingerprint, the index and the
+# arrays backing the columns of the fingerprint
+_CACHE: Dict[int, Dict[Tuple[str, str, Optional[str]], Tuple[Any, "VariantIndex", List[Any]]]] = {}
+
+
+class VariantIndex(object):
+    def __init__(self, case_ids: np.ndarray, row_cases: np.ndarray, order: np.ndarray, case_starts: np.ndarray,
+                 case_ends: np.ndarray, case_variants: np.ndarray, variants: List[Tuple[Any, ...]],
+                 sorted_cases: np.ndarray):
+        """
+        Variant index of a dataframe
+
+        Parameters
+        --------------
+        case_ids
+            Case identifiers (in the order of their first occurrence in the dataframe)
+        row_cases
+            Case (position in case_ids) of every row of the dataframe (-1 for the rows without a case identifier)
+        order
+            Positions of the rows, sorted by case (and by timestamp, inside the case)
+        case_starts
+            For every case, the position in order of its first event
+        case_ends
+            For every case, the position in order following its last event
+        case_variants
+            Variant of every case
+        variants
+            Tuples of activities of the variants (numbered following the first occurrence of the variant when the
+            cases are sorted by their identifier)
+        sorted_cases
+            Positions of the cases, sorted by their identifier
+        """
+        self.case_ids = case_ids
+        self.row_cases = row_cases
+        self.order = order
+        self.case_starts = case_starts
+        self.case_ends = case_ends
+        self.case_variants = case_variants
+        self.variants = variants
+        self.sorted_cases = sorted_cases
+        self.counts = np.bincount(case_variants, minlength=len(variants)).astype(np.int64)
+        self.__variant_ids = None
+
+    def get_case_rows(self, case: int) -> np.ndarray:
+        """
+        Gets the positions of the rows of a case (identified by its position in case_ids)
+        """
+        return self.order[self.case_starts[case]:self.case_ends[case]]
+
+    def get_variant_id(self, variant: Collection[Any]) -> Optional[int]:
+        """
+        Gets the identifier of a variant (None if the variant does not occur in the dataframe)
+        """
+        if self.__variant_ids is None:
+            self.__variant_ids = {v: i for i, v in enumerate(self.variants)}
+        return self.__variant_ids.get(tuple(variant) if type(variant) is list else variant)
+
+    def get_variants_count(self) -> Dict[Tuple[Any, ...], int]:
+        """
+        Gets the dictionary associating to every variant its number of occurrences
+        """
+        return {v: c for v, c in zip(self.variants, self.counts.tolist())}
+
+    def get_case_variant(self) -> Dict[Any, Tuple[Any, ...]]:
+        """
+        Gets the dictionary associating to every case identifier (sorted) its variant
+        """
+        variants = self.variants
+        return {self.case_ids[c]: variants[v] for c, v in
+                zip(self.sorted_cases.tolist(), self.case_variants[self.sorted_cases].tolist())}
+
+    def get_variants_cases(self) -> Dict[Tuple[Any, ...], List[int]]:
+        """
+        Gets the dictionary associating to every variant the indexes of its cases, when the cases are sorted by
+        their identifier
+        """
+        ret = {v: [] for v in self.variants}
+        variants = self.variants
+        for i, v in enumerate(self.case_variants[self.sorted_cases].tolist()):
+            ret[variants[v]].append(i)
+        return ret
+
+    def get_variants_df(self, case_id_key: str = constants.CASE_CONCEPT_NAME) -> pd.DataFrame:
+        """
+        Gets a dataframe indexed by the case identifier (following the order of the cases in the dataframe),
+        reporting the variant of every case in the column 'variant'
+        """
+        variants = np.empty(len(self.variants), dtype=object)
+        variants[:] = self.variants
+        return pd.DataFrame({"variant": variants[self.case_variants]},
+                            index=pd.Index(self.case_ids, name=case_id_key))
+
+    def get_rows_variant_id(self) -> np.ndarray:
+        """
+        Gets an array reporting, for every row, the identifier of the variant of its case (-1 for the rows without
+        a case identifier)
+        """
+        return np.where(self.row_cases >= 0, self.case_variants[self.row_cases], -1)
+
+    def get_rows_mask(self, variant_ids: Collection[int]) -> np.ndarray:
+        """
+        Gets the boolean mask of the rows belonging to the cases of the provided variants
+        """
+        variants_mask = np.zeros(len(self.variants) + 1, dtype=bool)
+        variants_mask[np.asarray(list(variant_ids), dtype=np.int64)] = True
+        # the rows without a case identifier point to the last (always false) position
+        return variants_mask[self.get_rows_variant_id()]
+
+    def get_rows_variant(self) -> np.ndarray:
+        """
+        Gets an array reporting, for every row, the tuple of the variant of its case (None for the rows without
+        a case identifier)
+        """
+        variants = np.empty(len(self.variants) + 1, dtype=object)
+        variants[:-1] = self.variants
+        return variants[self.get_rows_variant_id()]
+
+
+def build(df: pd.DataFrame, case_id_key: str = constants.CASE_CONCEPT_NAME,
+          activity_key: str = xes_constants.DEFAULT_NAME_KEY, timestamp_key: Optional[str] = None) -> VariantIndex:
+    """
+    Builds the variant index of a dataframe (without caching it)
+
+    Parameters
+    --------------
+    df
+        Dataframe
+    case_id_key
+        Column to be used as case identifier
+    activity_key
+        Column to be used as activity
+    timestamp_key
+        (optional) column used to sort the events inside a case (otherwise, the order of the rows is kept)
+
+    Returns
+    --------------
+    variant_index
+        Variant index
+    """
+    row_cases, case_ids = pd.factorize(df[case_id_key].to_numpy())
+    row_cases = row_cases.astype(np.int64)
+    num_cases = len(case_ids)
+    if timestamp_key is None:
+        order = np.argsort(row_cases, kind="stable")
+    else:
+        timestamps = df[timestamp_key].values
+        if not isinstance(timestamps, np.ndarray) or timestamps.dtype == object:
+            timestamps = pd.factorize(df[timestamp_key], sort=True)[0]
+        order = np.lexsort((timestamps, row_cases))
+    # the rows without a case identifier (code -1) are sorted first
+    order = order[np.count_nonzero(row_cases < 0):]
+    case_ends = np.cumsum(np.bincount(row_cases[order], minlength=num_cases))
+    case_starts = case_ends - np.bincount(row_cases[order], minlength=num_cases)
+
+    activities = df[activity_key].to_numpy()
+    activity_codes, _ = pd.factorize(activities)
+    sorted_cases = np.argsort(case_ids, kind="stable")
+
+    # the variants are numbered following their first occurrence in the cases sorted by identifier
+    case_variants, first_cases = encode_variants(activity_codes[order], case_starts, case_ends, sorted_cases)
+    variants = [tuple(activities[order[case_starts[c]:case_ends[c]]].tolist()) for c in first_cases]
+
+    return VariantIndex(case_ids, row_cases, order, case_starts, case_ends, case_variants, variants, sorted_cases)
+
+
+def encode_variants(sorted_codes: np.ndarray, case_starts: np.ndarray, case_ends: np.ndarray,
+                    cases: np.ndarray) -> Tuple[np.ndarray, List[int]]:
+    """
+    Assigns an integer identifier to the variant of every case
+
+    Parameters
+    --------------
+    sorted_codes
+        Integer codes of the activities of the events, sorted by case
+    case_starts
+        For every case, the position in sorted_codes of its first event
+    case_ends
+        For every case, the position in sorted_codes following its last event
+    cases
+        Cases to encode (the variants are numbered following their first occurrence in this sequence)
+
+    Returns
+    --------------
+    case_variants
+        Variant of every case (-1 for the cases which are not encoded)
+    first_cases
+        For every variant, the first case in which it occurs
+    """
+    buffer = np.ascontiguousarray(sorted_codes, dtype=np.int64).tobytes()
+    itemsize = np.dtype(np.int64).itemsize
+    index = {}
+    case_variants = np.full(len(case_starts), -1, dtype=np.int64)
+    first_cases = []
+    for c, s, e in zip(cases.tolist(), (case_starts[cases] * itemsize).tolist(),
+                       (case_ends[cases] * itemsize).tolist()):
+        v = index.setdefault(buffer[s:e], len(index))
+        if v == len(first_cases):
+            first_cases.append(c)
+        case_variants[c] = v
+    return case_variants, first_cases
+
+
+def get_fingerprint(df: pd.DataFrame, columns: List[str]) -> Tuple[Any, ...]:
+    """
+    Gets a fingerprint of the provided columns of a dataframe, which changes when the columns are replaced or
+    resized (the number of rows, the types and the arrays backing the columns are considered, in constant time).
+    The in-place modifications of the values are not considered.
+
+    Parameters
+    --------------
+    df
+        Dataframe
+    columns
+        Columns
+
+    Returns
+    --------------
+    fingerprint
+        Fingerprint
+    """
+    fingerprint = [len(df)]
+    for col in columns:
+        values = df[col].values
+        if isinstance(values, np.ndarray):
+            # the dataframe keeps a view of the block of the column
+            fingerprint.append((str(values.dtype), values.__array_interface__["data"][0], values.strides))
+        else:
+            fingerprint.append((str(values.dtype), id(values)))
+    return tuple(fingerprint)
+
+
+def get_column_values(df: pd.DataFrame, columns: List[str]) -> List[Any]:
+    """
+    Gets the arrays backing the provided columns of a dataframe. They are kept along with a cached index, so their
+    memory (and identity) is not reused by other arrays while the fingerprint of the index is valid.
+
+    Parameters
+    --------------
+    df
+        Dataframe
+    columns
+        Columns
+
+    Returns
+    --------------
+    values
+        Arrays backing the columns
+    """
+    return [df[col].values for col in columns]
+
+
+def get_variant_index(df: pd.DataFrame, parameters: Optional[Dict[Any, Any]] = None) -> VariantIndex:
+    """
+    Gets the variant index of a dataframe, reusing the index computed by a previous call on the same dataframe with
+    the same parameters (if the columns have not been replaced in the meanwhile; after modifying the values in place,
+    invalidate(df) should be called)
+
+    Parameters
+    --------------
+    df
+        Dataframe
+    parameters
+        Parameters of the algorithm, including:
+        - Parameters.CASE_ID_KEY => the case identifier
+        - Parameters.ACTIVITY_KEY => the activity
+        - Parameters.TIMESTAMP_KEY => (optional) the column used to sort the events inside a case
+
+    Returns
+    --------------
+    variant_index
+        Variant index
+    """
+    if parameters is None:
+        parameters = {}
+
+    case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME)
+    activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, xes_constants.DEFAULT_NAME_KEY)
+    timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters, None)
+
+    key = (case_id_key, activity_key, timestamp_key)
+    columns = [c for c in key if c is not None]
+    fingerprint = get_fingerprint(df, columns)
+
+    df_id = id(df)
+    if df_id not in _CACHE:
+        _CACHE[df_id] = {}
+        weakref.finalize(df, _CACHE.pop, df_id, None)
+    indexes = _CACHE[df_id]
+    if key in indexes and indexes[key][0] == fingerprint:
+        return indexes[key][1]
+
+    variant_index = build(df, case_id_key=case_id_key, activity_key=activity_key, timestamp_key=timestamp_key)
+    indexes[key] = (fingerprint, variant_index, get_column_values(df, columns))
+    return variant_index
+
+
+def invalidate(df: pd.DataFrame):
+    """
+    Drops the variant indexes computed on the dataframe
+
+    Parameters
+    --------------
+    df
+        Dataframe
+    """
+    if id(df) in _CACHE:
+        _CACHE[id(df)].clear()
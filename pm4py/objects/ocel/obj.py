@@ -115,6 +115,15 @@ class OCEL(object):
             "Please use <THIS>.get_extended_table() to get a dataframe representation of the events related to the objects.")
         return "".join(ret)
 
+    def get_index(self):
+        """
+        Gets the index of the object-centric event log (interned identifiers and CSR event-object adjacency),
+        computed lazily and reused until the tables are replaced (after modifying their values in place,
+        pm4py.objects.ocel.util.ocel_index.invalidate should be called)
+        """
+        from pm4py.objects.ocel.util import ocel_index
+        return ocel_index.get_index(self)
+
     def is_ocel20(self):
         unique_qualifiers = []
         if self.qualifier in self.relations.columns:
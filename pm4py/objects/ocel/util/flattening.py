@@ -15,8 +15,9 @@
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
 from enum import Enum
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Collection, List, Tuple
 
+import numpy as np
 import pandas as pd
 
 from pm4py.objects.ocel import constants as ocel_constants
@@ -28,6 +29,8 @@ from pm4py.util import exec_utils
 class Parameters(Enum):
     EVENT_ACTIVITY = ocel_constants.PARAM_EVENT_ACTIVITY
     EVENT_TIMESTAMP = ocel_constants.PARAM_EVENT_TIMESTAMP
+    MINIMAL_COLUMNS = "minimal_columns"
+    SORT_BY_CASE = "sort_by_case"
 
 
 def flatten(ocel: OCEL, ot: str, parameters: Optional[Dict[Any, Any]] = None) -> pd.DataFrame:
@@ -74,3 +77,193 @@ def flatten(ocel: OCEL, ot: str, parameters: Optional[Dict[Any, Any]] = None) ->
         columns={event_activity: xes_constants.DEFAULT_NAME_KEY, event_timestamp: xes_constants.DEFAULT_TIMESTAMP_KEY})
 
     return events
+
+
+def flatten_object_types(ocel: OCEL, object_types: Optional[Collection[str]] = None,
+                         parameters: Optional[Dict[Any, Any]] = None) -> Dict[str, pd.DataFrame]:
+    """
+    Flattens the object-centric event log on several object types at once.
+    The flattened logs are the same returned by flatten(ocel, ot) for every object type, but they are computed
+    from a single pass on the relations of the log (instead of filtering and merging the tables once per
+    object type).
+
+    Parameters
+    -------------------
+    ocel
+        Object-centric event log
+    object_types
+        Object types (if not provided, all the object types of the log are considered)
+    parameters
+        Parameters of the algorithm, including:
+        - Parameters.EVENT_ACTIVITY
+        - Parameters.EVENT_TIMESTAMP
+        - Parameters.MINIMAL_COLUMNS => keeps only the case identifier, the activity and the timestamp
+        (default: False)
+        - Parameters.SORT_BY_CASE => sorts the flattened logs by case identifier and timestamp (default: False)
+
+    Returns
+    ------------------
+    flattened_logs
+        Dictionary associating to every object type the corresponding flattened log
+    """
+    if parameters is None:
+        parameters = {}
+
+    object_types = __get_object_types(ocel, object_types)
+    plan = __get_flattening_plan(ocel, object_types, parameters)
+
+    flattened_logs = {}
+    if plan is None:
+        for ot in object_types:
+            flattened_logs[ot] = __finalize(ocel, flatten(ocel, ot, parameters=parameters), False, parameters)
+    else:
+        event_rows, object_rows, boundaries = plan
+        for i, ot in enumerate(object_types):
+            flattened_logs[ot] = __build_frame(ocel, event_rows[boundaries[i]:boundaries[i + 1]],
+                                               object_rows[boundaries[i]:boundaries[i + 1]], False, parameters)
+
+    return flattened_logs
+
+
+def flatten_long(ocel: OCEL, object_types: Optional[Collection[str]] = None,
+                 parameters: Optional[Dict[Any, Any]] = None) -> pd.DataFrame:
+    """
+    Flattens the object-centric event log on several object types at once, returning a single (long) dataframe
+    where the case identifiers of all the object types are stacked, and the object type of every row is stored in
+    the "case:" + object type column.
+    The rows are the ones of the flattened logs of the single object types, in the order of the provided object
+    types.
+
+    Parameters
+    -------------------
+    ocel
+        Object-centric event log
+    object_types
+        Object types (if not provided, all the object types of the log are considered)
+    parameters
+        Parameters of the algorithm, including:
+        - Parameters.EVENT_ACTIVITY
+        - Parameters.EVENT_TIMESTAMP
+        - Parameters.MINIMAL_COLUMNS => keeps only the object type, the case identifier, the activity and the
+        timestamp (default: False)
+        - Parameters.SORT_BY_CASE => sorts the rows of every object type by case identifier and timestamp
+        (default: False)
+
+    Returns
+    ------------------
+    dataframe
+        Flattened log in the form of a Pandas dataframe
+    """
+    if parameters is None:
+        parameters = {}
+
+    object_types = __get_object_types(ocel, object_types)
+    plan = __get_flattening_plan(ocel, object_types, parameters)
+
+    if plan is None:
+        frames = [__finalize(ocel, flatten(ocel, ot, parameters=parameters), True, parameters) for ot in object_types]
+        if not frames:
+            return __finalize(ocel, flatten(ocel, None, parameters=parameters), True, parameters)
+        return pd.concat(frames, ignore_index=True)
+
+    event_rows, object_rows, boundaries = plan
+    return __build_frame(ocel, event_rows, object_rows, True, parameters)
+
+
+def __get_object_types(ocel: OCEL, object_types: Optional[Collection[str]]) -> List[str]:
+    if object_types is None:
+        return list(ocel.objects[ocel.object_type_column].dropna().unique())
+    return list(dict.fromkeys(object_types))
+
+
+def __get_flattening_plan(ocel: OCEL, object_types: List[str], parameters: Dict[Any, Any]) -> Optional[
+        Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    # returns the rows of the events and objects tables composing the flattened logs (grouped by object type), or
+    # None when the tables do not allow it (duplicated or missing identifiers, clashing columns), in which case the
+    # flattening is done one object type at a time
+    from pm4py.objects.ocel.util import ocel_index
+
+    if set(ocel.events.columns).intersection(constants.CASE_ATTRIBUTE_PREFIX + x for x in ocel.objects.columns):
+        return None
+
+    index = ocel_index.get_index(ocel)
+    num_events = len(ocel.events)
+    num_objects = len(ocel.objects)
+    if np.any(index.table_events < 0) or np.any(index.table_objects < 0) or index.num_table_events != num_events:
+        return None
+    if num_objects > 0 and int(index.table_objects.max()) + 1 != num_objects:
+        return None
+
+    # row of the events/objects table of every event/object code (-1 if the event/object is only in the relations)
+    event_rows = np.full(index.get_num_events(), -1, dtype=np.int64)
+    event_rows[index.table_events] = np.arange(num_events)
+    object_rows = np.full(index.get_num_objects(), -1, dtype=np.int64)
+    object_rows[index.table_objects] = np.arange(num_objects)
+
+    types = pd.Index(object_types)
+    relation_types = types.get_indexer(ocel.relations[ocel.object_type_column])
+    table_types = types.get_indexer(ocel.objects[ocel.object_type_column])
+
+    relation_events = index.relation_events.astype(np.int64)
+    relation_objects = index.relation_objects.astype(np.int64)
+    rel_event_rows = np.where(relation_events >= 0, event_rows[relation_events], -1)
+    rel_object_rows = np.where(relation_objects >= 0, object_rows[relation_objects], -1)
+
+    # a relation contributes to the flattened log of an object type when both the relation and the object have
+    # the given type, and both the event and the object are in the tables
+    keep = np.flatnonzero((relation_types >= 0) & (rel_event_rows >= 0) & (rel_object_rows >= 0))
+    keep = keep[table_types[rel_object_rows[keep]] == relation_types[keep]]
+    relation_types = relation_types[keep]
+    rel_event_rows = rel_event_rows[keep]
+    rel_object_rows = rel_object_rows[keep]
+
+    # the order of the merges: events table, then objects table, then relations table
+    keys = [keep, rel_object_rows, rel_event_rows]
+    if exec_utils.get_param_value(Parameters.SORT_BY_CASE, parameters, False):
+        event_timestamp = exec_utils.get_param_value(Parameters.EVENT_TIMESTAMP, parameters, ocel.event_timestamp)
+        from pm4py.algo.discovery.dfg.adapters.pandas.fused_statistics import to_nanoseconds
+        timestamps = to_nanoseconds(ocel.events[event_timestamp])[rel_event_rows] if len(keep) > 0 else \
+            np.zeros(0, dtype=np.int64)
+        # the missing timestamps are sorted last, as sort_values does
+        timestamps = np.where(timestamps == np.iinfo(np.int64).min, np.iinfo(np.int64).max, timestamps)
+        cases = pd.factorize(ocel.objects[ocel.object_id_column].to_numpy()[rel_object_rows], sort=True)[0]
+        keys = keys + [timestamps, cases]
+    order = np.lexsort(keys + [relation_types]) if len(keep) > 0 else np.zeros(0, dtype=np.int64)
+
+    boundaries = np.searchsorted(relation_types[order], np.arange(len(object_types) + 1))
+    return rel_event_rows[order], rel_object_rows[order], boundaries
+
+
+def __build_frame(ocel: OCEL, event_rows: np.ndarray, object_rows: np.ndarray, include_type: bool,
+                  parameters: Dict[Any, Any]) -> pd.DataFrame:
+    event_activity = exec_utils.get_param_value(Parameters.EVENT_ACTIVITY, parameters, ocel.event_activity)
+    event_timestamp = exec_utils.get_param_value(Parameters.EVENT_TIMESTAMP, parameters, ocel.event_timestamp)
+    minimal_columns = exec_utils.get_param_value(Parameters.MINIMAL_COLUMNS, parameters, False)
+
+    events = ocel.events
+    objects = ocel.objects
+    if minimal_columns:
+        events = events[[event_activity, event_timestamp]]
+        objects = objects[[ocel.object_id_column, ocel.object_type_column] if include_type else [
+            ocel.object_id_column]]
+
+    events = events.iloc[event_rows].reset_index(drop=True).rename(
+        columns={event_activity: xes_constants.DEFAULT_NAME_KEY, event_timestamp: xes_constants.DEFAULT_TIMESTAMP_KEY})
+    objects = objects.iloc[object_rows].reset_index(drop=True).rename(
+        columns={ocel.object_id_column: xes_constants.DEFAULT_TRACEID_KEY})
+    objects = objects.rename(columns={x: constants.CASE_ATTRIBUTE_PREFIX + x for x in objects.columns})
+
+    return pd.concat([events, objects], axis=1)
+
+
+def __finalize(ocel: OCEL, flattened_log: pd.DataFrame, include_type: bool,
+               parameters: Dict[Any, Any]) -> pd.DataFrame:
+    # restricts and sorts a flattened log obtained from flatten(ocel, ot) as requested by the parameters
+    if exec_utils.get_param_value(Parameters.MINIMAL_COLUMNS, parameters, False):
+        columns = [xes_constants.DEFAULT_NAME_KEY, xes_constants.DEFAULT_TIMESTAMP_KEY, constants.CASE_CONCEPT_NAME]
+        type_column = constants.CASE_ATTRIBUTE_PREFIX + ocel.object_type_column
+        flattened_log = flattened_log[columns + [x for x in flattened_log.columns if include_type and x == type_column]]
+    if exec_utils.get_param_value(Parameters.SORT_BY_CASE, parameters, False):
+        flattened_log = flattened_log.sort_values([constants.CASE_CONCEPT_NAME, xes_constants.DEFAULT_TIMESTAMP_KEY],
+                                                  kind="stable").reset_index(drop=True)
+    return flattened_log
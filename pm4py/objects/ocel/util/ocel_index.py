@@ -0,0 +1,343 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+"""
+Index of an object-centric event log, computed lazily once and shared by the OCEL utilities.
+
+The identifiers of the events, objects, activities and object types are interned to integer codes, and the
+event-to-object relationships are stored as CSR adjacency arrays (event -> objects, following the order of the
+relations, and object -> events, sorted by timestamp).
+The index is kept on the OCEL object and invalidated when the tables (or their identifier, activity, timestamp and
+object type columns) are replaced or resized: the identity of the tables and the arrays backing the columns are
+checked, in constant time, before reusing it. The in-place modifications of the values (e.g.
+ocel.relations.loc[i, "ocel:oid"] = x) are not detected: after them, invalidate(ocel) should be called.
+"""
+from typing import Dict, Any, List, Tuple, Optional
+
+import numpy as np
+import pandas as pd
+
+from pm4py.objects.log.util import variant_index
+from pm4py.objects.ocel.obj import OCEL
+
+
+class OcelIndex(object):
+    def __init__(self, event_ids: np.ndarray, num_table_events: int, activities: np.ndarray,
+                 event_activities: np.ndarray, event_timestamps: np.ndarray, object_ids: np.ndarray,
+                 object_types: np.ndarray, object_object_types: np.ndarray, relation_events: np.ndarray,
+                 relation_objects: np.ndarray, table_events: Optional[np.ndarray] = None,
+                 table_objects: Optional[np.ndarray] = None):
+        """
+        Index of an object-centric event log
+
+        Parameters
+        --------------
+        event_ids
+            Event identifiers (the ones of the events table, in the order of the table, followed by the ones occurring
+            only in the relations)
+        num_table_events
+            Number of (distinct) events of the events table
+        activities
+            Activities
+        event_activities
+            Activity (code) of every event
+        event_timestamps
+            Timestamp of every event (as nanoseconds since the epoch)
+        object_ids
+            Object identifiers (the ones of the objects table, in the order of the table, followed by the ones
+            occurring only in the relations)
+        object_types
+            Object types
+        object_object_types
+            Object type (code) of every object
+        relation_events
+            Event (code) of every row of the relations table (-1 if the identifier is missing)
+        relation_objects
+            Object (code) of every row of the relations table (-1 if the identifier is missing)
+        table_events
+            Event (code) of every row of the events table (-1 if the identifier is missing)
+        table_objects
+            Object (code) of every row of the objects table (-1 if the identifier is missing)
+        """
+        self.event_ids = event_ids
+        self.num_table_events = num_table_events
+        self.activities = activities
+        self.event_activities = event_activities
+        self.event_timestamps = event_timestamps
+        self.object_ids = object_ids
+        self.object_types = object_types
+        self.object_object_types = object_object_types
+        self.relation_events = relation_events
+        self.relation_objects = relation_objects
+        self.table_events = table_events
+        self.table_objects = table_objects
+
+        num_events = len(event_ids)
+        num_objects = len(object_ids)
+        valid = np.flatnonzero((relation_events >= 0) & (relation_objects >= 0))
+        rel_events = relation_events[valid]
+        rel_objects = relation_objects[valid]
+
+        # event -> objects (the relations of an event follow the order of the relations table)
+        self.event_relations = valid[np.argsort(rel_events, kind="stable")]
+        self.event_offsets = np.concatenate(([0], np.cumsum(np.bincount(rel_events, minlength=num_events)))).astype(
+            np.int64)
+        self.event_objects = relation_objects[self.event_relations]
+
+        # object -> events (the relations of an object are sorted by timestamp, and then by event code)
+        self.object_relations = valid[np.lexsort((rel_events, event_timestamps[rel_events], rel_objects))]
+        self.object_offsets = np.concatenate(
+            ([0], np.cumsum(np.bincount(rel_objects, minlength=num_objects)))).astype(np.int64)
+        self.object_events = relation_events[self.object_relations]
+
+        self.__object_relations_by_row = None
+        self.__event_codes = None
+        self.__object_codes = None
+
+    def get_num_events(self) -> int:
+        """
+        Gets the number of (distinct) events
+        """
+        return len(self.event_ids)
+
+    def get_num_objects(self) -> int:
+        """
+        Gets the number of (distinct) objects
+        """
+        return len(self.object_ids)
+
+    def get_event_code(self, event_id: Any) -> Optional[int]:
+        """
+        Gets the code of an event identifier (None if the event does not occur in the log)
+        """
+        if self.__event_codes is None:
+            self.__event_codes = {e: i for i, e in enumerate(self.event_ids.tolist())}
+        return self.__event_codes.get(event_id)
+
+    def get_object_code(self, object_id: Any) -> Optional[int]:
+        """
+        Gets the code of an object identifier (None if the object does not occur in the log)
+        """
+        if self.__object_codes is None:
+            self.__object_codes = {o: i for i, o in enumerate(self.object_ids.tolist())}
+        return self.__object_codes.get(object_id)
+
+    def get_event_objects(self, event: int) -> np.ndarray:
+        """
+        Gets the codes of the objects related to an event (identified by its code), following the order of the
+        relations
+        """
+        return self.event_objects[self.event_offsets[event]:self.event_offsets[event + 1]]
+
+    def get_object_events(self, obj: int) -> np.ndarray:
+        """
+        Gets the codes of the events related to an object (identified by its code), sorted by timestamp
+        """
+        return self.object_events[self.object_offsets[obj]:self.object_offsets[obj + 1]]
+
+    def get_event_degrees(self) -> np.ndarray:
+        """
+        Gets the number of relations of every event
+        """
+        return np.diff(self.event_offsets)
+
+    def get_object_degrees(self) -> np.ndarray:
+        """
+        Gets the number of relations of every object
+        """
+        return np.diff(self.object_offsets)
+
+    def get_event_objects_dict(self, object_type: Optional[Any] = None, include_empty: bool = False) -> Dict[
+            Any, List[Any]]:
+        """
+        Gets the dictionary associating to every event identifier the list of the identifiers of its related
+        objects (as groupby(event_id)[object_id].agg(list) on the relations table)
+
+        Parameters
+        --------------
+        object_type
+            (if provided) only the objects of the given type are considered
+        include_empty
+            Includes the events without related objects (otherwise, only the events having at least one related
+            object are included)
+
+        Returns
+        --------------
+        dictio
+            Dictionary
+        """
+        return self.__get_adjacency_dict(self.event_offsets, self.event_objects, self.event_relations,
+                                         self.event_ids, self.object_ids, object_type, include_empty)
+
+    def get_object_events_dict(self, object_type: Optional[Any] = None, include_empty: bool = False,
+                               sort_by_timestamp: bool = True) -> Dict[Any, List[Any]]:
+        """
+        Gets the dictionary associating to every object identifier the list of the identifiers of its related
+        events
+
+        Parameters
+        --------------
+        object_type
+            (if provided) only the objects of the given type are considered
+        include_empty
+            Includes the objects without related events (otherwise, only the objects having at least one related
+            event are included)
+        sort_by_timestamp
+            Sorts the events of an object by timestamp (otherwise, the order of the relations is kept, as
+            groupby(object_id)[event_id].agg(list) on the relations table)
+
+        Returns
+        --------------
+        dictio
+            Dictionary
+        """
+        relations = self.object_relations
+        if not sort_by_timestamp:
+            if self.__object_relations_by_row is None:
+                valid = np.flatnonzero((self.relation_events >= 0) & (self.relation_objects >= 0))
+                self.__object_relations_by_row = valid[np.argsort(self.relation_objects[valid], kind="stable")]
+            relations = self.__object_relations_by_row
+        return self.__get_adjacency_dict(self.object_offsets, self.relation_events[relations], relations,
+                                         self.object_ids, self.event_ids, object_type, include_empty)
+
+    def __get_adjacency_dict(self, offsets: np.ndarray, targets: np.ndarray, relations: np.ndarray,
+                             source_ids: np.ndarray, target_ids: np.ndarray, object_type: Optional[Any],
+                             include_empty: bool) -> Dict[Any, List[Any]]:
+        if object_type is not None:
+            # the relations are kept when the object has the given type
+            codes = np.flatnonzero(self.object_types == object_type)
+            type_code = int(codes[0]) if len(codes) > 0 else -2
+            keep = self.object_object_types[self.relation_objects[relations]] == type_code
+            sources = np.repeat(np.arange(len(offsets) - 1, dtype=np.int64), np.diff(offsets))[keep]
+            targets = targets[keep]
+            offsets = np.concatenate(([0], np.cumsum(np.bincount(sources, minlength=len(offsets) - 1))))
+        values = target_ids[targets].tolist()
+        starts = offsets[:-1].tolist()
+        ends = offsets[1:].tolist()
+        return {source: values[s:e] for source, s, e in zip(source_ids.tolist(), starts, ends) if
+                include_empty or e > s}
+
+
+def build(ocel: OCEL) -> OcelIndex:
+    """
+    Builds the index of an object-centric event log (without caching it)
+
+    Parameters
+    --------------
+    ocel
+        Object-centric event log
+
+    Returns
+    --------------
+    ocel_index
+        Index of the object-centric event log
+    """
+    from pm4py.algo.discovery.dfg.adapters.pandas.fused_statistics import to_nanoseconds
+
+    num_events = len(ocel.events)
+    num_objects = len(ocel.objects)
+
+    # the events occurring only in the relations are interned after the ones of the events table
+    event_codes, event_ids = pd.factorize(np.concatenate((ocel.events[ocel.event_id_column].to_numpy(),
+                                                          ocel.relations[ocel.event_id_column].to_numpy())))
+    first_rows = __get_first_occurrences(event_codes)
+    activities_column = pd.concat([ocel.events[ocel.event_activity], ocel.relations[ocel.event_activity]],
+                                  ignore_index=True) if ocel.event_activity in ocel.relations.columns else \
+        ocel.events[ocel.event_activity]
+    timestamps_column = pd.concat([ocel.events[ocel.event_timestamp], ocel.relations[ocel.event_timestamp]],
+                                  ignore_index=True) if ocel.event_timestamp in ocel.relations.columns else \
+        ocel.events[ocel.event_timestamp]
+    event_activities, activities = pd.factorize(activities_column.to_numpy()[first_rows])
+    event_timestamps = to_nanoseconds(timestamps_column.iloc[first_rows]) if len(first_rows) > 0 else np.zeros(
+        0, dtype=np.int64)
+
+    object_codes, object_ids = pd.factorize(np.concatenate((ocel.objects[ocel.object_id_column].to_numpy(),
+                                                            ocel.relations[ocel.object_id_column].to_numpy())))
+    first_rows = __get_first_occurrences(object_codes)
+    types_column = np.concatenate((ocel.objects[ocel.object_type_column].to_numpy(),
+                                   ocel.relations[ocel.object_type_column].to_numpy()))
+    object_object_types, object_types = pd.factorize(types_column[first_rows])
+
+    num_table_events = int(event_codes[:num_events].max()) + 1 if num_events > 0 else 0
+
+    return OcelIndex(np.asarray(event_ids, dtype=object), num_table_events, np.asarray(activities, dtype=object),
+                     event_activities.astype(np.int32), event_timestamps, np.asarray(object_ids, dtype=object),
+                     np.asarray(object_types, dtype=object), object_object_types.astype(np.int32),
+                     event_codes[num_events:].astype(np.int32), object_codes[num_objects:].astype(np.int32),
+                     event_codes[:num_events].astype(np.int32), object_codes[:num_objects].astype(np.int32))
+
+
+def __get_first_occurrences(codes: np.ndarray) -> np.ndarray:
+    # the codes assigned by pd.factorize follow the order of the first occurrence: the first occurrence of every
+    # code is the position where the running maximum increases
+    if len(codes) == 0:
+        return np.zeros(0, dtype=np.int64)
+    previous_max = np.concatenate(([-1], np.maximum.accumulate(codes)[:-1]))
+    return np.flatnonzero(codes > previous_max)
+
+
+def __get_columns(ocel: OCEL) -> List[Tuple[pd.DataFrame, List[str]]]:
+    return [(ocel.events, [ocel.event_id_column, ocel.event_activity, ocel.event_timestamp]),
+            (ocel.objects, [ocel.object_id_column, ocel.object_type_column]),
+            (ocel.relations, [c for c in [ocel.event_id_column, ocel.object_id_column, ocel.object_type_column,
+                                          ocel.event_activity, ocel.event_timestamp] if c in ocel.relations.columns])]
+
+
+def __get_fingerprint(ocel: OCEL) -> Tuple[Any, ...]:
+    return tuple((id(table), variant_index.get_fingerprint(table, columns)) for table, columns in __get_columns(ocel))
+
+
+def __get_references(ocel: OCEL) -> List[Any]:
+    # the tables and the arrays backing the columns are kept along with the index, so their identity is not reused
+    return [(table, variant_index.get_column_values(table, columns)) for table, columns in __get_columns(ocel)]
+
+
+def get_index(ocel: OCEL) -> OcelIndex:
+    """
+    Gets the index of an object-centric event log, reusing the index computed by a previous call on the same log
+    (if the tables have not been replaced in the meanwhile; after modifying the values in place, invalidate(ocel)
+    should be called)
+
+    Parameters
+    --------------
+    ocel
+        Object-centric event log
+
+    Returns
+    --------------
+    ocel_index
+        Index of the object-centric event log
+    """
+    fingerprint = __get_fingerprint(ocel)
+    cached = getattr(ocel, "_index", None)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+
+    ocel_index = build(ocel)
+    ocel._index = (fingerprint, ocel_index, __get_references(ocel))
+    return ocel_index
+
+
+def invalidate(ocel: OCEL):
+    """
+    Drops the index computed on the object-centric event log
+
+    Parameters
+    --------------
+    ocel
+        Object-centric event log
+    """
+    ocel._index = None
@@ -0,0 +1,230 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+"""
+Filtered view of an object-centric event log.
+
+The view holds boolean masks over the tables (events, objects, relations) of a base object-centric event log. The
+filters are composed by intersecting the masks, without copying the tables; the propagation of the filters across
+the events, objects, relations, O2O, E2E and object changes tables happens only once, on the integer codes of the
+OCEL index, when the tables of the view are accessed (e.g., by a discovery algorithm consuming the view, which is an
+OCEL itself) or the view is materialized.
+
+The propagation follows the semantics of the filtering_utils.propagate_* functions applied after every filter:
+- the relations of the filtered events (objects) are removed;
+- the objects (events) left without relations are removed when some events (objects) have been filtered;
+- a filter on the relations propagates to both the events and the objects.
+"""
+from typing import Optional, Tuple, Collection, Dict, Any
+
+import numpy as np
+import pandas as pd
+
+from pm4py.objects.ocel.obj import OCEL
+from pm4py.objects.ocel.util import ocel_index
+
+EVENTS = "events"
+OBJECTS = "objects"
+RELATIONS = "relations"
+
+
+class OCELView(OCEL):
+    def __init__(self, ocel: OCEL, events_mask: Optional[np.ndarray] = None, objects_mask: Optional[np.ndarray] = None,
+                 relations_mask: Optional[np.ndarray] = None, filtered_tables: Optional[Collection[str]] = None):
+        """
+        Filtered view of an object-centric event log
+
+        Parameters
+        --------------
+        ocel
+            Object-centric event log (if a view is provided, the provided masks are intersected with the ones of the
+            view)
+        events_mask
+            (optional) Boolean mask over the rows of the events table
+        objects_mask
+            (optional) Boolean mask over the rows of the objects table
+        relations_mask
+            (optional) Boolean mask over the rows of the relations table
+        filtered_tables
+            Tables which have been filtered (events, objects, relations), determining the propagation of the filters
+        """
+        filtered_tables = set(filtered_tables) if filtered_tables is not None else set()
+        if isinstance(ocel, OCELView):
+            filtered_tables = filtered_tables.union(ocel.__filtered_tables)
+            events_mask = ocel.__events_mask if events_mask is None else ocel.__events_mask & events_mask
+            objects_mask = ocel.__objects_mask if objects_mask is None else ocel.__objects_mask & objects_mask
+            relations_mask = ocel.__relations_mask if relations_mask is None else ocel.__relations_mask & relations_mask
+            ocel = ocel.__base
+
+        self.__base = ocel
+        self.__events_mask = events_mask if events_mask is not None else np.ones(len(ocel.events), dtype=bool)
+        self.__objects_mask = objects_mask if objects_mask is not None else np.ones(len(ocel.objects), dtype=bool)
+        self.__relations_mask = relations_mask if relations_mask is not None else np.ones(len(ocel.relations),
+                                                                                           dtype=bool)
+        self.__filtered_tables = frozenset(filtered_tables)
+        self.__propagated_masks = None
+        self.__tables = None
+
+        self.event_id_column = ocel.event_id_column
+        self.object_id_column = ocel.object_id_column
+        self.object_type_column = ocel.object_type_column
+        self.event_activity = ocel.event_activity
+        self.event_timestamp = ocel.event_timestamp
+        self.qualifier = ocel.qualifier
+        self.changed_field = ocel.changed_field
+        self.globals = ocel.globals
+        self.parameters = ocel.parameters
+
+    def get_base(self) -> OCEL:
+        """
+        Gets the (unfiltered) object-centric event log on which the view is defined
+        """
+        return self.__base
+
+    def filter_events(self, mask: np.ndarray) -> "OCELView":
+        """
+        Filters the events of the view (the mask is defined over the rows of the events table of the base log)
+        """
+        return OCELView(self, events_mask=np.asarray(mask, dtype=bool), filtered_tables=[EVENTS])
+
+    def filter_objects(self, mask: np.ndarray) -> "OCELView":
+        """
+        Filters the objects of the view (the mask is defined over the rows of the objects table of the base log)
+        """
+        return OCELView(self, objects_mask=np.asarray(mask, dtype=bool), filtered_tables=[OBJECTS])
+
+    def filter_relations(self, mask: np.ndarray) -> "OCELView":
+        """
+        Filters the relations of the view (the mask is defined over the rows of the relations table of the base log)
+        """
+        return OCELView(self, relations_mask=np.asarray(mask, dtype=bool), filtered_tables=[RELATIONS])
+
+    def get_masks(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Gets the masks over the events, objects and relations tables of the base log after the propagation of the
+        filters (computed once, on the integer codes of the OCEL index)
+        """
+        if self.__propagated_masks is None:
+            events_mask, objects_mask, relations_mask = self.__events_mask, self.__objects_mask, self.__relations_mask
+            if self.__filtered_tables:
+                index = ocel_index.get_index(self.__base)
+                events_side = EVENTS in self.__filtered_tables or RELATIONS in self.__filtered_tables
+                objects_side = OBJECTS in self.__filtered_tables or RELATIONS in self.__filtered_tables
+
+                relations_mask = relations_mask.copy()
+                if events_side:
+                    relations_mask &= self.__get_codes_mask(index.table_events[events_mask],
+                                                            index.get_num_events())[index.relation_events]
+                if objects_side:
+                    relations_mask &= self.__get_codes_mask(index.table_objects[objects_mask],
+                                                            index.get_num_objects())[index.relation_objects]
+                if objects_side:
+                    # the events left without relations are removed
+                    events_mask = events_mask & self.__get_codes_mask(index.relation_events[relations_mask],
+                                                                      index.get_num_events())[index.table_events]
+                if events_side:
+                    # the objects left without relations are removed
+                    objects_mask = objects_mask & self.__get_codes_mask(index.relation_objects[relations_mask],
+                                                                        index.get_num_objects())[index.table_objects]
+            self.__propagated_masks = (events_mask, objects_mask, relations_mask)
+        return self.__propagated_masks
+
+    @staticmethod
+    def __get_codes_mask(codes: np.ndarray, num_codes: int) -> np.ndarray:
+        # mask over the codes (the last position, corresponding to the code -1 of the missing identifiers, is False)
+        mask = np.zeros(num_codes + 1, dtype=bool)
+        mask[codes] = True
+        mask[-1] = False
+        return mask
+
+    def __get_tables(self) -> Dict[str, pd.DataFrame]:
+        if self.__tables is None:
+            base = self.__base
+            tables = {"events": base.events, "objects": base.objects, "relations": base.relations,
+                      "o2o": base.o2o, "e2e": base.e2e, "object_changes": base.object_changes}
+            if self.__filtered_tables:
+                index = ocel_index.get_index(base)
+                events_mask, objects_mask, relations_mask = self.get_masks()
+                tables["events"] = base.events[events_mask]
+                tables["objects"] = base.objects[objects_mask]
+                tables["relations"] = base.relations[relations_mask]
+
+                # the remaining tables are filtered on the events (objects) kept in the events (objects) table or
+                # in the relations
+                kept_events = self.__get_codes_mask(np.concatenate((index.table_events[events_mask],
+                                                                    index.relation_events[relations_mask])),
+                                                    index.get_num_events())
+                kept_objects = self.__get_codes_mask(np.concatenate((index.table_objects[objects_mask],
+                                                                     index.relation_objects[relations_mask])),
+                                                     index.get_num_objects())
+                event_ids = pd.Index(index.event_ids)
+                object_ids = pd.Index(index.object_ids)
+                e2e, o2o, object_changes = base.e2e, base.o2o, base.object_changes
+                tables["e2e"] = e2e[kept_events[event_ids.get_indexer(e2e[self.event_id_column])] & kept_events[
+                    event_ids.get_indexer(e2e[self.event_id_column + "_2"])]]
+                tables["o2o"] = o2o[kept_objects[object_ids.get_indexer(o2o[self.object_id_column])] & kept_objects[
+                    object_ids.get_indexer(o2o[self.object_id_column + "_2"])]]
+                tables["object_changes"] = object_changes[
+                    kept_objects[object_ids.get_indexer(object_changes[self.object_id_column])]]
+            self.__tables = tables
+        return self.__tables
+
+    def __get_table(self, name: str) -> pd.DataFrame:
+        return self.__get_tables()[name]
+
+    def __set_table(self, name: str, table: pd.DataFrame):
+        # assigning a table materializes the view
+        self.__get_tables()[name] = table
+
+    events = property(lambda self: self.__get_table("events"), lambda self, t: self.__set_table("events", t))
+    objects = property(lambda self: self.__get_table("objects"), lambda self, t: self.__set_table("objects", t))
+    relations = property(lambda self: self.__get_table("relations"),
+                         lambda self, t: self.__set_table("relations", t))
+    o2o = property(lambda self: self.__get_table("o2o"), lambda self, t: self.__set_table("o2o", t))
+    e2e = property(lambda self: self.__get_table("e2e"), lambda self, t: self.__set_table("e2e", t))
+    object_changes = property(lambda self: self.__get_table("object_changes"),
+                              lambda self, t: self.__set_table("object_changes", t))
+
+    def materialize(self) -> OCEL:
+        """
+        Materializes the view into an object-centric event log (propagating the filters)
+        """
+        tables = self.__get_tables()
+        return OCEL(tables["events"], tables["objects"], tables["relations"], self.globals, self.parameters,
+                    tables["o2o"], tables["e2e"], tables["object_changes"])
+
+
+def apply(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None) -> OCELView:
+    """
+    Gets an (unfiltered) view of an object-centric event log, on which the filters of pm4py.algo.filtering.ocel can
+    be chained without copying and propagating the tables at every step
+
+    Parameters
+    --------------
+    ocel
+        Object-centric event log
+    parameters
+        Parameters of the method
+
+    Returns
+    --------------
+    view
+        View of the object-centric event log
+    """
+    if parameters is None:
+        parameters = {}
+
+    return OCELView(ocel)
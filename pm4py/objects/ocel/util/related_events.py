@@ -17,6 +17,7 @@
 from typing import Dict, Any, Optional, List
 
 from pm4py.objects.ocel.obj import OCEL
+from pm4py.objects.ocel.util import ocel_index
 from pm4py.util import pandas_utils
 
 
@@ -25,8 +26,8 @@ def related_events_dct(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None)
         parameters = {}
 
     object_types = pandas_utils.format_unique(ocel.relations[ocel.object_type_column].unique())
+    index = ocel_index.get_index(ocel)
     dct = {}
     for ot in object_types:
-        dct[ot] = ocel.relations[ocel.relations[ocel.object_type_column] == ot].groupby(ocel.object_id_column)[ocel.event_id_column].apply(
-            list).to_dict()
+        dct[ot] = index.get_object_events_dict(object_type=ot, sort_by_timestamp=False)
     return dct
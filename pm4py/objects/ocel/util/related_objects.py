@@ -17,6 +17,7 @@
 from typing import Dict, Any, Optional, List
 
 from pm4py.objects.ocel.obj import OCEL
+from pm4py.objects.ocel.util import ocel_index
 from pm4py.util import pandas_utils
 
 
@@ -25,10 +26,10 @@ def related_objects_dct_per_type(ocel: OCEL, parameters: Optional[Dict[Any, Any]
         parameters = {}
 
     object_types = pandas_utils.format_unique(ocel.relations[ocel.object_type_column].unique())
+    index = ocel_index.get_index(ocel)
     dct = {}
     for ot in object_types:
-        dct[ot] = ocel.relations[ocel.relations[ocel.object_type_column] == ot].groupby(ocel.event_id_column)[ocel.object_id_column].apply(
-            list).to_dict()
+        dct[ot] = index.get_event_objects_dict(object_type=ot)
     return dct
 
 
@@ -36,11 +37,4 @@ def related_objects_dct_overall(ocel: OCEL, parameters: Optional[Dict[Any, Any]]
     if parameters is None:
         parameters = {}
 
-    evids = pandas_utils.format_unique(ocel.events[ocel.event_id_column].unique())
-    dct = ocel.relations.groupby(ocel.event_id_column)[ocel.object_id_column].agg(list).to_dict()
-
-    for evid in evids:
-        if evid not in dct:
-            dct[evid] = []
-
-    return dct
+    return ocel_index.get_index(ocel).get_event_objects_dict(include_empty=True)
@@ -59,3 +59,49 @@ class IncidenceMatrix(object):
 
 def construct(net):
     return IncidenceMatrix(net)
+
+
+def construct_pre_post_csr(net, incidence_matrix=None):
+    """
+    Constructs a compressed sparse row (CSR) representation of the preset and the postset of the transitions
+    of a Petri net, consistent with the indexing of the places/transitions of the incidence matrix.
+    The arcs of the transition having index i are stored between the positions indptr[i] and indptr[i+1]
+    of the indices (places) and weights arrays.
+
+    Parameters
+    ---------------
+    net
+        Petri net
+    incidence_matrix
+        (if already computed) incidence matrix of the Petri net
+
+    Returns
+    ---------------
+    pre_indptr, pre_indices, pre_weights
+        CSR representation of the presets of the transitions
+    post_indptr, post_indices, post_weights
+        CSR representation of the postsets of the transitions
+    """
+    import numpy as np
+
+    if incidence_matrix is None:
+        incidence_matrix = construct(net)
+
+    p_index = incidence_matrix.places
+    transitions = sorted(incidence_matrix.transitions, key=lambda t: incidence_matrix.transitions[t])
+
+    def to_csr(arcs_per_transition):
+        indptr = [0]
+        indices = []
+        weights = []
+        for arcs in arcs_per_transition:
+            arcs = sorted(arcs)
+            indices.extend(x[0] for x in arcs)
+            weights.extend(x[1] for x in arcs)
+            indptr.append(len(indices))
+        return np.array(indptr, dtype=np.int64), np.array(indices, dtype=np.int64), np.array(weights, dtype=np.int32)
+
+    pre = to_csr([(p_index[a.source], a.weight) for a in t.in_arcs] for t in transitions)
+    post = to_csr([(p_index[a.target], a.weight) for a in t.out_arcs] for t in transitions)
+
+    return pre + post
@@ -14,7 +14,7 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-from typing import Tuple, Dict, Optional
+from typing import Tuple, Dict, Optional, Iterator
 
 from pm4py.objects.bpmn.obj import BPMN
 from pm4py.objects.log.obj import EventLog
@@ -38,15 +38,17 @@ The ``pm4py.read`` module contains all funcationality related to reading files/o
 """
 
 
-def read_xes(file_path: str, variant: Optional[str] = None, return_legacy_log_object: bool = constants.DEFAULT_READ_XES_LEGACY_OBJECT, encoding: str = constants.DEFAULT_ENCODING, **kwargs) -> Union[DataFrame, EventLog]:
+def read_xes(file_path: str, variant: Optional[str] = None, return_legacy_log_object: bool = constants.DEFAULT_READ_XES_LEGACY_OBJECT, encoding: str = constants.DEFAULT_ENCODING, chunk_size: Optional[int] = None, use_cache: Optional[bool] = None, **kwargs) -> Union[DataFrame, EventLog, Iterator[DataFrame]]:
     """
     Reads an event log stored in XES format (see `xes-standard <https://xes-standard.org/>`_)
     Returns a table (``pandas.DataFrame``) view of the event log.
 
     :param file_path: file path of the event log (``.xes`` file) on disk
-    :param variant: the variant of the importer to use. "iterparse" => traditional XML parser; "line_by_line" => text-based line-by-line importer ; "chunk_regex" => chunk-of-bytes importer (default); "iterparse20" => XES 2.0 importer
+    :param variant: the variant of the importer to use. "iterparse" => traditional XML parser; "line_by_line" => text-based line-by-line importer ; "chunk_regex" => chunk-of-bytes importer (default); "iterparse20" => XES 2.0 importer; "parallel_chunks" => parses ranges of traces in parallel processes
     :param return_legacy_log_object: boolean value enabling returning a log object (default: False)
     :param encoding: the encoding to be used (default: utf-8)
+    :param chunk_size: if provided, the log is read in a memory-bounded fashion and a generator of dataframes is returned. Each dataframe contains the events of a set of complete traces (about chunk_size events). The chunked reading has its own importer, hence it cannot be combined with variant
+    :param use_cache: enables/disables the on-disk columnar cache of the parsed dataframe, stored in a per-user cache directory (default: constants.ENABLE_READ_CACHE, disabled unless the PM4PY_ENABLE_READ_CACHE environment variable is set to True; requires pyarrow)
     :rtype: ``DataFrame``
 
     .. code-block:: python3
@@ -54,15 +56,28 @@ def read_xes(file_path: str, variant: Optional[str] = None, return_legacy_log_ob
         import pm4py
 
         log = pm4py.read_xes("<path_to_xes_file>")
+
+        for chunk in pm4py.read_xes("<path_to_xes_file>", chunk_size=100000):
+            print(len(chunk))
     """
     if not os.path.exists(file_path):
         raise Exception("File does not exist")
 
+    if chunk_size is not None and variant is not None:
+        raise Exception("the variant of the importer cannot be specified when reading the log in chunks (chunk_size)")
+
     if variant is None:
         variant = constants.DEFAULT_XES_PARSER
 
     from pm4py.objects.log.importer.xes import importer as xes_importer
 
+    if chunk_size is not None:
+        from copy import copy
+        parameters = copy(kwargs)
+        parameters["encoding"] = encoding
+        parameters["chunk_size"] = chunk_size
+        return xes_importer.apply(file_path, variant=xes_importer.Variants.DATAFRAME_CHUNKS, parameters=parameters)
+
     v = xes_importer.Variants.CHUNK_REGEX
     if variant == "iterparse_20":
         v = xes_importer.Variants.ITERPARSE_20
@@ -78,17 +93,30 @@ def read_xes(file_path: str, variant: Optional[str] = None, return_legacy_log_ob
         v = xes_importer.Variants.CHUNK_REGEX
     elif variant == "rustxes":
         v = xes_importer.Variants.RUSTXES
+    elif variant == "parallel_chunks":
+        v = xes_importer.Variants.PARALLEL_CHUNKS
 
     from copy import copy
     parameters = copy(kwargs)
     parameters["encoding"] = encoding
     parameters["return_legacy_log_object"] = return_legacy_log_object
 
+    from pm4py.util import read_cache
+    use_cache = read_cache.is_enabled(use_cache) and not return_legacy_log_object
+    if use_cache:
+        cache_key = read_cache.get_cache_key("read_xes", dict(parameters, variant=str(v)))
+        log = read_cache.load_dataframe(file_path, cache_key)
+        if log is not None:
+            return log
+
     log = xes_importer.apply(file_path, variant=v, parameters=parameters)
 
     if type(log) is EventLog and not return_legacy_log_object:
         log = log_converter.apply(log, variant=log_converter.Variants.TO_DATA_FRAME)
 
+    if use_cache and isinstance(log, DataFrame):
+        read_cache.store_dataframe(file_path, cache_key, log)
+
     return log
 
 
@@ -305,13 +333,14 @@ def read_ocel_sqlite(file_path: str, encoding: str = constants.DEFAULT_ENCODING)
     return sqlite_importer.apply(file_path, variant=sqlite_importer.Variants.PANDAS_IMPORTER, parameters={"encoding": encoding})
 
 
-def read_ocel2(file_path: str, variant_str: Optional[str] = None, encoding: str = constants.DEFAULT_ENCODING) -> OCEL:
+def read_ocel2(file_path: str, variant_str: Optional[str] = None, encoding: str = constants.DEFAULT_ENCODING, use_cache: Optional[bool] = None) -> OCEL:
     """
     Reads an OCEL2.0 event log
 
     :param file_path: path to the OCEL2.0 event log
     :param variant_str: (optional) specification of the importer variant to be used
     :param encoding: the encoding to be used (default: utf-8)
+    :param use_cache: enables/disables the on-disk columnar cache of the parsed tables, stored in a per-user cache directory (default: constants.ENABLE_READ_CACHE, disabled unless the PM4PY_ENABLE_READ_CACHE environment variable is set to True; requires pyarrow)
     :rtype: ``OCEL``
 
     .. code-block:: python3
@@ -323,12 +352,26 @@ def read_ocel2(file_path: str, variant_str: Optional[str] = None, encoding: str
     if not os.path.exists(file_path):
         raise Exception("File does not exist")
 
+    from pm4py.util import read_cache
+    use_cache = read_cache.is_enabled(use_cache)
+    if use_cache:
+        cache_key = read_cache.get_cache_key("read_ocel2", {"variant_str": variant_str, "encoding": encoding})
+        ocel = read_cache.load_ocel(file_path, cache_key)
+        if ocel is not None:
+            return ocel
+
+    ocel = None
     if file_path.lower().endswith("sqlite"):
-        return read_ocel2_sqlite(file_path, variant_str=variant_str, encoding=encoding)
+        ocel = read_ocel2_sqlite(file_path, variant_str=variant_str, encoding=encoding)
     elif file_path.lower().endswith("xml") or file_path.lower().endswith("xmlocel"):
-        return read_ocel2_xml(file_path, variant_str=variant_str, encoding=encoding)
+        ocel = read_ocel2_xml(file_path, variant_str=variant_str, encoding=encoding)
     elif file_path.lower().endswith("json") or file_path.lower().endswith("jsonocel"):
-        return read_ocel2_json(file_path, variant_str=variant_str, encoding=encoding)
+        ocel = read_ocel2_json(file_path, variant_str=variant_str, encoding=encoding)
+
+    if use_cache and ocel is not None:
+        read_cache.store_ocel(file_path, cache_key, ocel)
+
+    return ocel
 
 
 def read_ocel2_json(file_path: str, variant_str: Optional[str] = None, encoding: str = constants.DEFAULT_ENCODING) -> OCEL:
@@ -16,6 +16,7 @@
 '''
 from enum import Enum
 
+from pm4py.algo.discovery.dfg.adapters.pandas import eventually_follows
 from pm4py.algo.discovery.dfg.adapters.pandas.df_statistics import get_partial_order_dataframe
 from pm4py.util import exec_utils, constants, xes_constants
 from typing import Optional, Dict, Any, Union, Tuple
@@ -44,6 +45,13 @@ def apply(dataframe: pd.DataFrame, parameters: Optional[Dict[Union[str, Paramete
     start_timestamp_key = exec_utils.get_param_value(Parameters.START_TIMESTAMP_KEY, parameters, None)
     keep_first_following = exec_utils.get_param_value(Parameters.KEEP_FIRST_FOLLOWING, parameters, False)
 
+    if not keep_first_following:
+        # the couples of events are counted without materializing them
+        aggregates = eventually_follows.get_aggregates(dataframe, activity_key=activity_key,
+                                                       case_id_glue=case_id_glue, timestamp_key=timestamp_key,
+                                                       start_timestamp_key=start_timestamp_key)
+        return {pair: aggregates[pair][0] for pair in aggregates}
+
     partial_order_dataframe = get_partial_order_dataframe(dataframe, start_timestamp_key=start_timestamp_key,
                                                           timestamp_key=timestamp_key, case_id_glue=case_id_glue,
                                                           activity_key=activity_key,
@@ -15,6 +15,7 @@
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
 from pm4py.objects.ocel.obj import OCEL
+from pm4py.objects.ocel.util import ocel_index
 from typing import Optional, Dict, Any, Tuple, Collection, Set, List
 from enum import Enum
 from pm4py.util import exec_utils, constants
@@ -181,6 +182,71 @@ def aggregate_total_objects(edges: Dict[str, Dict[Tuple[str, str], Collection[An
     return ret
 
 
+def get_edge_occurrences(index: ocel_index.OcelIndex) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Finds all the occurrences of the edges (directly-follows relationships between the events related to the same
+    object) on the index of an object-centric event log, by sorting the relations by object and event and comparing
+    every relation with the previous one.
+
+    Parameters
+    -------------------
+    index
+        Index of the object-centric event log
+
+    Returns
+    -------------------
+    sources
+        Codes of the source events of the occurrences
+    targets
+        Codes of the target events of the occurrences
+    objects
+        Codes of the objects of the occurrences
+    (the occurrences are sorted as the target events, and their relations, are visited in the events table)
+    """
+    # the relations of the events of the events table are sorted by object and then by event (the position of the
+    # event in the table); every relation is associated to the previous relation of the same object
+    rows = np.flatnonzero((index.relation_events >= 0) & (index.relation_events < index.num_table_events) & (
+            index.relation_objects >= 0))
+    rows = rows[np.lexsort((rows, index.relation_events[rows], index.relation_objects[rows]))]
+    objects = index.relation_objects[rows]
+    events = index.relation_events[rows]
+    same_object = np.flatnonzero(objects[1:] == objects[:-1])
+    sources = events[same_object]
+    targets = events[same_object + 1]
+    objects = objects[same_object + 1]
+    # the associations are sorted as the target events (and their relations) are visited in the events table
+    order = np.lexsort((rows[same_object + 1], targets))
+    return sources[order], targets[order], objects[order]
+
+
+def __find_associations_per_edge_index(index: ocel_index.OcelIndex) -> Dict[
+    str, Dict[Tuple[str, str], Collection[Any]]]:
+    sources, targets, objects = get_edge_occurrences(index)
+
+    num_activities = len(index.activities)
+    keys = (index.object_object_types[objects].astype(np.int64) * num_activities + index.event_activities[
+        sources]) * num_activities + index.event_activities[targets]
+    key_order = np.argsort(keys, kind="stable")
+    boundaries = np.flatnonzero(np.concatenate(([True], keys[key_order][1:] != keys[key_order][:-1], [True])))
+    # the edges are inserted following their first occurrence
+    groups = np.argsort(key_order[boundaries[:-1]], kind="stable")
+
+    source_ids = index.event_ids[sources[key_order]].tolist()
+    target_ids = index.event_ids[targets[key_order]].tolist()
+    object_ids = index.object_ids[objects[key_order]].tolist()
+    edges = {}
+    for g in groups.tolist():
+        start, end = int(boundaries[g]), int(boundaries[g + 1])
+        first = key_order[start]
+        objtype = index.object_types[index.object_object_types[objects[first]]]
+        acttup = (index.activities[index.event_activities[sources[first]]],
+                  index.activities[index.event_activities[targets[first]]])
+        if objtype not in edges:
+            edges[objtype] = {}
+        edges[objtype][acttup] = list(zip(source_ids[start:end], target_ids[start:end], object_ids[start:end]))
+    return edges
+
+
 def find_associations_per_edge(ocel: OCEL, parameters: Optional[Dict[Any, Any]] = None) -> Dict[
     str, Dict[Tuple[str, str], Collection[Any]]]:
     """
@@ -211,6 +277,10 @@ def find_associations_per_edge(ocel: OCEL, parameters: Optional[Dict[Any, Any]]
     object_id = exec_utils.get_param_value(Parameters.OBJECT_ID, parameters, ocel.object_id_column)
     object_type = exec_utils.get_param_value(Parameters.OBJECT_TYPE, parameters, ocel.object_type_column)
 
+    if (event_activity, event_id, object_id, object_type) == (ocel.event_activity, ocel.event_id_column,
+                                                               ocel.object_id_column, ocel.object_type_column):
+        return __find_associations_per_edge_index(ocel_index.get_index(ocel))
+
     identifiers = ocel.events[event_id].to_numpy().tolist()
     activities = ocel.events.groupby(event_id)[event_activity].agg(list).to_dict()
     activities = {x: y[0] for x, y in activities.items()}
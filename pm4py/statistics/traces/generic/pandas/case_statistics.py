@@ -19,10 +19,11 @@ from typing import Optional, Dict, Any, Union, Tuple, List
 
 import pandas as pd
 
+from pm4py.objects.log.util import variant_index
 from pm4py.statistics.traces.generic.common import case_duration as case_duration_commons
 from pm4py.util import exec_utils, constants, pandas_utils
 from pm4py.util import xes_constants as xes
-from pm4py.util.business_hours import soj_time_business_hours_diff
+from pm4py.util.business_hours import soj_time_business_hours_diff_vectorized
 from pm4py.util.constants import CASE_CONCEPT_NAME
 from pm4py.util.xes_constants import DEFAULT_TIMESTAMP_KEY
 from collections import Counter
@@ -187,8 +188,8 @@ def get_cases_description(df: pd.DataFrame, parameters: Optional[Dict[Union[str,
         del stacked_df[case_id_glue + "_2"]
 
     if business_hours:
-        stacked_df['caseDuration'] = stacked_df.apply(
-            lambda x: soj_time_business_hours_diff(x[start_timestamp_key], x[timestamp_key + "_2"], business_hours_slots, workcalendar), axis=1)
+        stacked_df['caseDuration'] = soj_time_business_hours_diff_vectorized(
+            stacked_df[start_timestamp_key], stacked_df[timestamp_key + "_2"], business_hours_slots, workcalendar)
     else:
         stacked_df['caseDuration'] = stacked_df[timestamp_key + "_2"] - stacked_df[start_timestamp_key]
         stacked_df['caseDuration'] = pandas_utils.get_total_seconds(stacked_df['caseDuration'])
@@ -229,10 +230,16 @@ def get_variants_df(df, parameters=None):
     case_id_glue = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, CASE_CONCEPT_NAME)
     activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters, xes.DEFAULT_NAME_KEY)
 
-    new_df = df.groupby(case_id_glue, sort=False)[activity_key].agg(tuple).to_frame()
+    if importlib.util.find_spec("cudf"):
+        new_df = df.groupby(case_id_glue, sort=False)[activity_key].agg(tuple).to_frame()
 
-    new_cols = list(new_df.columns)
-    new_df = new_df.rename(columns={new_cols[0]: "variant"})
+        new_cols = list(new_df.columns)
+        new_df = new_df.rename(columns={new_cols[0]: "variant"})
+    else:
+        # reuses the variant index of the dataframe
+        new_df = variant_index.get_variant_index(df, parameters={
+            variant_index.Parameters.CASE_ID_KEY: case_id_glue,
+            variant_index.Parameters.ACTIVITY_KEY: activity_key}).get_variants_df(case_id_glue)
 
     return new_df
 
@@ -288,8 +295,8 @@ def get_variants_df_with_case_duration(df, parameters=None):
     stacked_df['caseDuration'] = stacked_df[timestamp_key + "_2"] - stacked_df[timestamp_key]
     stacked_df['caseDuration'] = pandas_utils.get_total_seconds(stacked_df['caseDuration'])
     if business_hours:
-        stacked_df['caseDuration'] = stacked_df.apply(
-            lambda x: soj_time_business_hours_diff(x[timestamp_key], x[timestamp_key + "_2"], business_hours_slots, workcalendar), axis=1)
+        stacked_df['caseDuration'] = soj_time_business_hours_diff_vectorized(
+            stacked_df[timestamp_key], stacked_df[timestamp_key + "_2"], business_hours_slots, workcalendar)
     else:
         stacked_df['caseDuration'] = stacked_df[timestamp_key + "_2"] - stacked_df[timestamp_key]
         stacked_df['caseDuration'] = pandas_utils.get_total_seconds(stacked_df['caseDuration'])
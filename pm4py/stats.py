@@ -34,7 +34,7 @@ from pm4py.objects.process_tree.obj import ProcessTree
 import deprecation
 
 
-def get_start_activities(log: Union[EventLog, pd.DataFrame], activity_key: str = "concept:name", timestamp_key: str = "time:timestamp", case_id_key: str = "case:concept:name") -> Dict[str, int]:
+def get_start_activities(log: Union[EventLog, pd.DataFrame, Iterator[pd.DataFrame]], activity_key: str = "concept:name", timestamp_key: str = "time:timestamp", case_id_key: str = "case:concept:name") -> Dict[str, int]:
     """
     Returns the start activities from a log object
 
@@ -50,6 +50,11 @@ def get_start_activities(log: Union[EventLog, pd.DataFrame], activity_key: str =
 
         start_activities = pm4py.get_start_activities(dataframe, activity_key='concept:name', case_id_key='case:concept:name', timestamp_key='time:timestamp')
     """
+    if isinstance(log, Iterator):
+        # chunks of a log (e.g., returned by pm4py.read_xes(..., chunk_size=...)), consumed incrementally
+        from pm4py.algo.discovery.dfg.adapters.pandas import chunks as dfg_chunks
+        return dfg_chunks.apply(log, parameters={dfg_chunks.Parameters.ACTIVITY_KEY: activity_key, dfg_chunks.Parameters.TIMESTAMP_KEY: timestamp_key, dfg_chunks.Parameters.CASE_ID_KEY: case_id_key})[1]
+
     __event_log_deprecation_warning(log)
 
     properties = get_properties(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
@@ -63,7 +68,7 @@ def get_start_activities(log: Union[EventLog, pd.DataFrame], activity_key: str =
         return get.get_start_activities(log, parameters=properties)
 
 
-def get_end_activities(log: Union[EventLog, pd.DataFrame], activity_key: str = "concept:name", timestamp_key: str = "time:timestamp", case_id_key: str = "case:concept:name") -> Dict[str, int]:
+def get_end_activities(log: Union[EventLog, pd.DataFrame, Iterator[pd.DataFrame]], activity_key: str = "concept:name", timestamp_key: str = "time:timestamp", case_id_key: str = "case:concept:name") -> Dict[str, int]:
     """
     Returns the end activities of a log
 
@@ -79,6 +84,11 @@ def get_end_activities(log: Union[EventLog, pd.DataFrame], activity_key: str = "
 
         end_activities = pm4py.get_end_activities(dataframe, activity_key='concept:name', case_id_key='case:concept:name', timestamp_key='time:timestamp')
     """
+    if isinstance(log, Iterator):
+        # chunks of a log (e.g., returned by pm4py.read_xes(..., chunk_size=...)), consumed incrementally
+        from pm4py.algo.discovery.dfg.adapters.pandas import chunks as dfg_chunks
+        return dfg_chunks.apply(log, parameters={dfg_chunks.Parameters.ACTIVITY_KEY: activity_key, dfg_chunks.Parameters.TIMESTAMP_KEY: timestamp_key, dfg_chunks.Parameters.CASE_ID_KEY: case_id_key})[2]
+
     __event_log_deprecation_warning(log)
 
     properties = get_properties(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
@@ -291,17 +301,19 @@ def split_by_process_variant(log: Union[EventLog, pd.DataFrame], activity_key: s
     log = pm4py.convert_to_dataframe(log)
     check_pandas_dataframe_columns(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
 
+    # the variant index is computed on the provided dataframe (hence, it is shared with the other calls)
+    from pm4py.objects.log.util import variant_index
+    index = variant_index.get_variant_index(log, parameters={variant_index.Parameters.CASE_ID_KEY: case_id_key,
+                                                             variant_index.Parameters.ACTIVITY_KEY: activity_key})
+
     from pm4py.util import pandas_utils
     log = pandas_utils.insert_ev_in_tr_index(log, case_id=case_id_key, column_name=index_in_trace_column)
-    properties = get_properties(log, activity_key=activity_key, timestamp_key=timestamp_key, case_id_key=case_id_key)
-
-    from pm4py.objects.log.util import pandas_numpy_variants
-    variants_dict, case_variant = pandas_numpy_variants.apply(log, parameters=properties)
 
-    log[variant_column] = log[case_id_key].map(case_variant)
+    log[variant_column] = index.get_rows_variant()
 
-    for variant, filtered_log in log.groupby(variant_column, sort=False):
-        yield variant, filtered_log
+    for variant_id, filtered_log in log.groupby(index.get_rows_variant_id(), sort=False):
+        if variant_id >= 0:
+            yield index.variants[variant_id], filtered_log
 
 
 def get_variants_paths_duration(log: Union[EventLog, pd.DataFrame], activity_key: str = "concept:name",
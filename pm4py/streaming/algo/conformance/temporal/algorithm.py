@@ -17,13 +17,14 @@
 from enum import Enum
 from typing import Optional, Dict, Any
 
-from pm4py.streaming.algo.conformance.temporal.variants import classic
+from pm4py.streaming.algo.conformance.temporal.variants import classic, bounded
 from pm4py.util import exec_utils
 from pm4py.util import typing
 
 
 class Variants(Enum):
     CLASSIC = classic
+    BOUNDED = bounded
 
 
 def apply(temporal_profile: typing.TemporalProfile, variant=Variants.CLASSIC,
@@ -38,6 +39,7 @@ def apply(temporal_profile: typing.TemporalProfile, variant=Variants.CLASSIC,
     variant
         Variant of the algorithm, possible values:
         - Variants.CLASSIC
+        - Variants.BOUNDED: keeps only the completion timestamps of the activities of the open cases
     parameters
         Parameters of the algorithm, including:
          - Parameters.ACTIVITY_KEY => the attribute to use as activity
@@ -48,5 +50,6 @@ def apply(temporal_profile: typing.TemporalProfile, variant=Variants.CLASSIC,
          - Parameters.DICT_VARIANT => the variant of dictionary to use
          - Parameters.CASE_DICT_ID => the identifier of the case dictionary
          - Parameters.DEV_DICT_ID => the identifier of the deviations dictionary
+         - Parameters.MAX_OPEN_CASES => maximum number of open cases (Variants.BOUNDED)
     """
     return exec_utils.get_variant(variant).apply(temporal_profile, parameters=parameters)
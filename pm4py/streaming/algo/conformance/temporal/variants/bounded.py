@@ -0,0 +1,314 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import logging
+import sys
+from bisect import bisect_right
+from collections import OrderedDict
+from enum import Enum
+from typing import Optional, Dict, Any, Tuple, List
+
+from pm4py.objects.log.obj import Event
+from pm4py.streaming.algo.interface import StreamingAlgorithm
+from pm4py.util import exec_utils, constants, xes_constants
+from pm4py.util import typing
+
+
+class Parameters(Enum):
+    ACTIVITY_KEY = constants.PARAMETER_CONSTANT_ACTIVITY_KEY
+    START_TIMESTAMP_KEY = constants.PARAMETER_CONSTANT_START_TIMESTAMP_KEY
+    TIMESTAMP_KEY = constants.PARAMETER_CONSTANT_TIMESTAMP_KEY
+    CASE_ID_KEY = constants.PARAMETER_CONSTANT_CASEID_KEY
+    ZETA = "zeta"
+    MAX_OPEN_CASES = "max_open_cases"
+
+
+class CaseState(object):
+    def __init__(self):
+        """
+        State of an open case: for every activity, the (sorted) completion timestamps of its occurrences, along with
+        the positions of the occurrences in the case
+        """
+        self.num_events = 0
+        self.timestamps: Dict[str, List[float]] = {}
+        self.positions: Dict[str, List[int]] = {}
+        self.deviations: List[Tuple[str, str, str, float, float]] = []
+
+    def add(self, activity: str, end_timestamp: float):
+        """
+        Records the occurrence of an activity in the case
+
+        Parameters
+        ---------------
+        activity
+            Activity
+        end_timestamp
+            Completion timestamp of the occurrence
+        """
+        if activity not in self.timestamps:
+            self.timestamps[activity] = []
+            self.positions[activity] = []
+        timestamps = self.timestamps[activity]
+        index = bisect_right(timestamps, end_timestamp)
+        timestamps.insert(index, end_timestamp)
+        self.positions[activity].insert(index, self.num_events)
+        self.num_events += 1
+
+
+class BoundedTemporalProfileStreamingConformance(StreamingAlgorithm):
+    def __init__(self, temporal_profile: typing.TemporalProfile, parameters: Optional[Dict[Any, Any]] = None):
+        """
+        Initialize the streaming conformance checking, keeping in memory (for every open case) only the completion
+        timestamps of the occurrences of every activity. The deviations of an incoming event are found through a
+        binary search on the completion timestamps of the source activities of the temporal profile.
+        The state of a case is released when the case is terminated (or when it is the least recently updated case,
+        and the maximum number of open cases is exceeded).
+
+        Identifies the same deviations of the classic variant.
+
+        Implements the approach described in:
+        Stertz, Florian, Jürgen Mangler, and Stefanie Rinderle-Ma. "Temporal Conformance Checking at Runtime based on Time-infused Process Models." arXiv preprint arXiv:2008.07262 (2020).
+
+        Parameters
+        ---------------
+        temporal_profile
+            Temporal profile
+        parameters
+            Parameters of the algorithm, including:
+             - Parameters.ACTIVITY_KEY => the attribute to use as activity
+             - Parameters.START_TIMESTAMP_KEY => the attribute to use as start timestamp
+             - Parameters.TIMESTAMP_KEY => the attribute to use as timestamp
+             - Parameters.ZETA => multiplier for the standard deviation
+             - Parameters.CASE_ID_KEY => column to use as case identifier
+             - Parameters.MAX_OPEN_CASES => maximum number of open cases (default: None, no limit)
+        """
+        if parameters is None:
+            parameters = {}
+
+        self.temporal_profile = temporal_profile
+        self.activity_key = exec_utils.get_param_value(Parameters.ACTIVITY_KEY, parameters,
+                                                       xes_constants.DEFAULT_NAME_KEY)
+        self.timestamp_key = exec_utils.get_param_value(Parameters.TIMESTAMP_KEY, parameters,
+                                                        xes_constants.DEFAULT_TIMESTAMP_KEY)
+        self.start_timestamp_key = exec_utils.get_param_value(Parameters.START_TIMESTAMP_KEY, parameters,
+                                                              xes_constants.DEFAULT_TIMESTAMP_KEY)
+        self.case_id_key = exec_utils.get_param_value(Parameters.CASE_ID_KEY, parameters, constants.CASE_CONCEPT_NAME)
+        self.zeta = exec_utils.get_param_value(Parameters.ZETA, parameters, 6.0)
+        self.max_open_cases = exec_utils.get_param_value(Parameters.MAX_OPEN_CASES, parameters, None)
+        # for every target activity, the source activities along with the mean and the standard deviation
+        self.sources: Dict[str, List[Tuple[str, float, float]]] = {}
+        for (source, target), (mean, std) in temporal_profile.items():
+            if target not in self.sources:
+                self.sources[target] = []
+            self.sources[target].append((source, mean, std))
+        self.cases: Dict[str, CaseState] = OrderedDict()
+        StreamingAlgorithm.__init__(self)
+
+    def _process(self, event: Event):
+        """
+        Checks the incoming event, and stores it in the state of its case
+
+        Parameters
+        ---------------
+        event
+            Event
+        """
+        if self.case_id_key not in event or self.start_timestamp_key not in event or self.timestamp_key not in event or self.activity_key not in event:
+            self.message_event_is_not_complete(event)
+        else:
+            case = str(event[self.case_id_key])
+            start_timestamp = event[self.start_timestamp_key].timestamp()
+            end_timestamp = event[self.timestamp_key].timestamp()
+            activity = str(event[self.activity_key])
+            if case not in self.cases:
+                self.cases[case] = CaseState()
+                if self.max_open_cases is not None and len(self.cases) > self.max_open_cases:
+                    self.terminate(next(iter(self.cases)))
+            else:
+                self.cases.move_to_end(case)
+            for dev_descr in self.check_conformance(case, start_timestamp, activity):
+                self.cases[case].deviations.append(dev_descr)
+                self.message_deviation(dev_descr)
+            self.cases[case].add(activity, end_timestamp)
+
+    def check_conformance(self, case: str, start_timestamp: float, activity: str) -> List[
+            Tuple[str, str, str, float, float]]:
+        """
+        Checks the conformance of an event according to the temporal profile, considering the previous events of
+        the case completed before the start of the event
+
+        Parameters
+        ---------------
+        case
+            Case identifier
+        start_timestamp
+            Start timestamp of the event
+        activity
+            Activity of the event
+
+        Returns
+        ---------------
+        deviations
+            Deviations (sorted by the position of the source event in the case)
+        """
+        state = self.cases[case]
+        deviations = []
+        for source, mean, std in self.sources.get(activity, []):
+            if source not in state.timestamps:
+                continue
+            timestamps = state.timestamps[source]
+            positions = state.positions[source]
+            # the difference with the start timestamp decreases along the (sorted) completion timestamps: the
+            # deviating occurrences are a prefix (too long) and a suffix (too short) of those completed before
+            completed = bisect_right(timestamps, start_timestamp)
+            minimum = mean - self.zeta * std
+            maximum = mean + self.zeta * std
+            too_long = self.__bisect(timestamps, 0, completed, lambda x: not start_timestamp - x > maximum)
+            too_short = self.__bisect(timestamps, too_long, completed, lambda x: start_timestamp - x < minimum)
+            for i in list(range(too_long)) + list(range(too_short, completed)):
+                diff = start_timestamp - timestamps[i]
+                this_zeta = abs(diff - mean) / std if std > 0 else sys.maxsize
+                deviations.append((positions[i], (case, source, activity, diff, this_zeta)))
+        return [x[1] for x in sorted(deviations, key=lambda x: x[0])]
+
+    @staticmethod
+    def __bisect(timestamps: List[float], lo: int, hi: int, condition) -> int:
+        # first position in [lo, hi) satisfying the condition (which is monotone along the timestamps)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if condition(timestamps[mid]):
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+
+    def get_status(self, case: str) -> Optional[List[Tuple[str, str, str, float, float]]]:
+        """
+        Gets the deviations of an open case
+
+        Parameters
+        ----------------
+        case
+            Case identifier
+
+        Returns
+        ----------------
+        deviations
+            Deviations of the case
+        """
+        case = str(case)
+        if case in self.cases:
+            return list(self.cases[case].deviations)
+        else:
+            self.message_case_not_in_dictionary(case)
+
+    def terminate(self, case: str) -> Optional[List[Tuple[str, str, str, float, float]]]:
+        """
+        Terminates a case, releasing its state
+
+        Parameters
+        ----------------
+        case
+            Case identifier
+
+        Returns
+        ----------------
+        deviations
+            Deviations of the case
+        """
+        case = str(case)
+        if case in self.cases:
+            return self.cases.pop(case).deviations
+        else:
+            self.message_case_not_in_dictionary(case)
+
+    def terminate_all(self):
+        """
+        Terminate all open cases
+        """
+        for case in list(self.cases):
+            self.terminate(case)
+
+    def message_event_is_not_complete(self, event: Event):
+        """
+        Method that is called when the event does not contain the case, or the activity, or the timestamp
+
+        Parameters
+        --------------
+        event
+            Incoming event
+        """
+        logging.error("case or activities or timestamp are none! " + str(event))
+
+    def message_deviation(self, dev_descr: Tuple[str, str, str, float, float]):
+        """
+        Method that is called to signal a deviation according to the temporal profile
+
+        Parameters
+        --------------
+        dev_descr
+            Description of the deviation to be printed
+        """
+        logging.error("the temporal profile is broken in the following setting: " + str(dev_descr))
+
+    def message_case_not_in_dictionary(self, case: str):
+        """
+        Method that is called when the case is not open
+
+        Parameters
+        --------------
+        case
+            Case identifier
+        """
+        logging.error("the case is not in the dictionary: " + str(case))
+
+    def _current_result(self) -> typing.TemporalProfileStreamingConfResults:
+        """
+        Gets the current deviations identified by conformance checking (for the open cases)
+
+        Returns
+        -------------
+        deviations_dict
+            Deviations dictionary
+        """
+        return {case: list(state.deviations) for case, state in self.cases.items() if state.deviations}
+
+
+def apply(temporal_profile: typing.TemporalProfile, parameters: Optional[Dict[Any, Any]] = None):
+    """
+    Initialize the streaming conformance checking, keeping in memory only the completion timestamps of the
+    activities of the open cases.
+
+    Implements the approach described in:
+    Stertz, Florian, Jürgen Mangler, and Stefanie Rinderle-Ma. "Temporal Conformance Checking at Runtime based on Time-infused Process Models." arXiv preprint arXiv:2008.07262 (2020).
+
+    Parameters
+    ---------------
+    temporal_profile
+        Temporal profile
+    parameters
+        Parameters of the algorithm, including:
+         - Parameters.ACTIVITY_KEY => the attribute to use as activity
+         - Parameters.START_TIMESTAMP_KEY => the attribute to use as start timestamp
+         - Parameters.TIMESTAMP_KEY => the attribute to use as timestamp
+         - Parameters.ZETA => multiplier for the standard deviation
+         - Parameters.CASE_ID_KEY => column to use as case identifier
+         - Parameters.MAX_OPEN_CASES => maximum number of open cases (default: None, no limit)
+    """
+    if parameters is None:
+        parameters = {}
+
+    return BoundedTemporalProfileStreamingConformance(temporal_profile, parameters=parameters)
@@ -14,9 +14,12 @@
     You should have received a copy of the GNU General Public License
     along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
 '''
-import math
-from datetime import timedelta, datetime, time
-from typing import List, Tuple
+from datetime import timedelta, datetime, date
+from functools import lru_cache
+from typing import List, Tuple, Optional, Dict
+
+import numpy as np
+import pandas as pd
 
 from pm4py.util import constants
 from pm4py.util.dt_parsing.variants import strpfromiso
@@ -55,6 +58,34 @@ def soj_time_business_hours_diff(st: datetime, et: datetime, business_hour_slots
     return bh.get_seconds()
 
 
+def soj_time_business_hours_diff_vectorized(st, et, business_hour_slots: Optional[List[Tuple[int]]] = None,
+                                            work_calendar=constants.DEFAULT_BUSINESS_HOURS_WORKCALENDAR) -> np.ndarray:
+    """
+    Calculates the differences between the provided arrays of timestamps based on the business hours
+    (vectorized version of soj_time_business_hours_diff)
+
+    Parameters
+    -----------------
+    st
+        Start timestamps (Pandas series, NumPy array or list)
+    et
+        Complete timestamps (Pandas series, NumPy array or list)
+    business_hour_slots
+        work schedule of the company, provided as a list of tuples where each tuple represents one time slot of business
+        hours (start and end time given in seconds since week start)
+    work_calendar
+        work calendar (it permits querying if a given day is a working day in a given culture). The business hours
+        of the non-working days are not counted.
+
+    Returns
+    -----------------
+    diff
+        NumPy array containing the differences in business hours
+    """
+    return BusinessHoursCalendar(business_hour_slots=business_hour_slots, work_calendar=work_calendar).get_seconds(st,
+                                                                                                               et)
+
+
 def get_overlapping_time(timespan1_begin: datetime, timespan1_end: datetime,
                          timespan2_begin: datetime, timespan2_end: datetime) -> float:
     latest_start = max(timespan1_begin, timespan2_begin)
@@ -80,37 +111,185 @@ class BusinessHours:
             else:
                 self.business_hour_slots_unified.append([begin, end])
 
-        # work calendar (it permits querying if a given day is a working day in a given culture) - not used yet
-        self.work_calendar = kwargs[
-            "work_calendar"] if "work_calendar" in kwargs else constants.DEFAULT_BUSINESS_HOURS_WORKCALENDAR
+        # work calendar (it permits querying if a given day is a working day in a given culture)
+        self.work_calendar = kwargs["work_calendar"] if "work_calendar" in kwargs else kwargs.get(
+            "workcalendar", constants.DEFAULT_BUSINESS_HOURS_WORKCALENDAR)
 
     def get_seconds(self):
-        sum = 0
-        week_start = self.datetime1.date() - timedelta(days=self.datetime1.weekday())
+        # the same cumulative calendar of the vectorized computation is used, so the slots exceeding the week are
+        # wrapped to its beginning in both cases
+        calendar = _get_business_hours_calendar(tuple(tuple(x) for x in self.business_hour_slots), self.work_calendar)
+        nanoseconds = np.array([pd.Timestamp(self.datetime1).value, pd.Timestamp(self.datetime2).value],
+                               dtype=np.int64)
+        cumulative = calendar.get_cumulative(nanoseconds)
+        return max(0, int(cumulative[1] - cumulative[0])) / 10 ** 9
+
+
+@lru_cache(maxsize=32)
+def _get_business_hours_calendar(business_hour_slots: Tuple[Tuple[int]], work_calendar) -> "BusinessHoursCalendar":
+    # the calendars are reused across the (many) BusinessHours objects sharing the same settings
+    return BusinessHoursCalendar(business_hour_slots=list(business_hour_slots), work_calendar=work_calendar)
+
+
+class BusinessHoursCalendar:
+    """
+    Cumulative calendar of the working seconds.
+
+    The business hour slots are unified and unrolled into a weekly cumulative function (working nanoseconds since the
+    start of the week), so the working time between two timestamps is the difference of the cumulative function at the
+    two timestamps, obtained with a lookup (searchsorted) on the boundaries of the slots. The working time of the
+    non-working days of the work calendar is subtracted through a second cumulative array (per day).
+    """
+
+    WEEK_NS = 7 * 86400 * 10 ** 9
+    DAY_NS = 86400 * 10 ** 9
+    # the epoch (1970-01-01) is a Thursday: shift to the previous Monday
+    EPOCH_WEEKDAY_SHIFT_NS = 3 * 86400 * 10 ** 9
+
+    def __init__(self, business_hour_slots: Optional[List[Tuple[int]]] = None,
+                 work_calendar=constants.DEFAULT_BUSINESS_HOURS_WORKCALENDAR):
+        if business_hour_slots is None:
+            business_hour_slots = constants.DEFAULT_BUSINESS_HOUR_SLOTS
+
+        week_seconds = 7 * 86400
+        pieces = []
+        for begin, end in business_hour_slots:
+            # the slots exceeding the week are wrapped to its beginning
+            while begin < end:
+                start = begin % week_seconds
+                length = min(end - begin, week_seconds - start)
+                pieces.append((start, start + length))
+                begin += length
+
+        # union of business hour slots in order to avoid overlapping business hours
+        unified = []
+        for begin, end in sorted(pieces):
+            if unified and unified[-1][1] >= begin - 1:
+                unified[-1][1] = max(unified[-1][1], end)
+            else:
+                unified.append([begin, end])
+
+        self.slot_starts = np.array([int(round(x[0] * 10 ** 9)) for x in unified], dtype=np.int64)
+        self.slot_lengths = np.array([int(round((x[1] - x[0]) * 10 ** 9)) for x in unified], dtype=np.int64)
+        self.slot_cumulative = np.concatenate(([0], np.cumsum(self.slot_lengths)[:-1])).astype(np.int64)
+        self.week_total = int(np.sum(self.slot_lengths))
+
+        self.work_calendar = work_calendar
+        # cache of the working days of the work calendar
+        self.__working_days: Dict[date, bool] = {}
+
+    @staticmethod
+    def __to_wall_clock_nanoseconds(timestamps) -> np.ndarray:
+        if not isinstance(timestamps, pd.Series):
+            timestamps = pd.Series(list(timestamps) if not isinstance(timestamps, np.ndarray) else timestamps)
+        if not pd.api.types.is_datetime64_any_dtype(timestamps):
+            timestamps = pd.to_datetime(timestamps)
+        if getattr(timestamps.dt, "tz", None) is not None:
+            # as in BusinessHours, the wall-clock time of the timestamps is considered
+            timestamps = timestamps.dt.tz_localize(None)
+        return timestamps.to_numpy(dtype="datetime64[ns]").view(np.int64)
+
+    @staticmethod
+    def __is_missing(nanoseconds: np.ndarray) -> np.ndarray:
+        # NaT is represented by the minimum int64 value
+        return nanoseconds == np.iinfo(np.int64).min
+
+    def __get_weekly_cumulative(self, nanoseconds: np.ndarray) -> np.ndarray:
+        # working nanoseconds from the Monday preceding the epoch
+        weeks, offsets = np.divmod(nanoseconds + self.EPOCH_WEEKDAY_SHIFT_NS, self.WEEK_NS)
+        ret = weeks * self.week_total
+        if len(self.slot_starts) > 0:
+            slots = np.searchsorted(self.slot_starts, offsets, side="right") - 1
+            inside = slots >= 0
+            slots_in = slots[inside]
+            ret[inside] += self.slot_cumulative[slots_in] + np.minimum(offsets[inside] - self.slot_starts[slots_in],
+                                                                       self.slot_lengths[slots_in])
+        return ret
+
+    def __is_working_day(self, day: date) -> bool:
+        if day not in self.__working_days:
+            self.__working_days[day] = bool(self.work_calendar.is_working_day(day))
+        return self.__working_days[day]
 
-        for bhs, bhe in self.business_hour_slots_unified:
-            begin_day_of_week = math.floor(bhs / 60 / 60 / 24)
-            begin_seconds_of_day = bhs - 24 * 60 * 60 * begin_day_of_week
-            bh_start = datetime.combine(week_start, time.min) + timedelta(days=begin_day_of_week) + timedelta(
-                seconds=begin_seconds_of_day)
+    def __get_holidays_cumulative(self, nanoseconds: np.ndarray, first_day: int, last_day: int) -> np.ndarray:
+        # working nanoseconds (according to the slots) falling in the non-working days of the calendar,
+        # from the first day of the considered range
+        days = np.arange(first_day, last_day + 1, dtype=np.int64)
+        epoch = date(1970, 1, 1)
+        is_holiday = np.array([not self.__is_working_day(epoch + timedelta(days=int(d))) for d in days], dtype=bool)
+        holidays = days[is_holiday]
+        if len(holidays) == 0:
+            return np.zeros(len(nanoseconds), dtype=np.int64)
+        holidays_starts = holidays * self.DAY_NS
+        holidays_work = self.__get_weekly_cumulative(holidays_starts + self.DAY_NS) - self.__get_weekly_cumulative(
+            holidays_starts)
+        holidays_cumulative = np.concatenate(([0], np.cumsum(holidays_work)))
 
-            end_day_of_week = math.floor(bhe / 60 / 60 / 24)
-            end_seconds_of_day = bhe - 24 * 60 * 60 * end_day_of_week
-            bh_end = datetime.combine(week_start, time.min) + timedelta(days=end_day_of_week) + timedelta(
-                seconds=end_seconds_of_day)
+        days_of_timestamps = np.floor_divide(nanoseconds, self.DAY_NS)
+        preceding = np.searchsorted(holidays, days_of_timestamps, side="left")
+        ret = holidays_cumulative[preceding]
+        # partial working time in the non-working day of the timestamp
+        in_holiday = (preceding < len(holidays)) & (holidays[np.minimum(preceding, len(holidays) - 1)] ==
+                                                     days_of_timestamps)
+        ret[in_holiday] += self.__get_weekly_cumulative(nanoseconds[in_holiday]) - self.__get_weekly_cumulative(
+            days_of_timestamps[in_holiday] * self.DAY_NS)
+        return ret
 
-            overlapping_time = get_overlapping_time(self.datetime1, self.datetime2, bh_start, bh_end)
-            sum += overlapping_time
+    def get_cumulative(self, nanoseconds: np.ndarray, first_day: Optional[int] = None,
+                       last_day: Optional[int] = None) -> np.ndarray:
+        """
+        Gets the cumulative working nanoseconds at the provided (wall-clock) timestamps
 
-            while True:
-                bh_start += timedelta(days=7)
-                bh_end += timedelta(days=7)
+        Parameters
+        ---------------
+        nanoseconds
+            Timestamps expressed as nanoseconds since the epoch
+        first_day
+            (if a work calendar is provided) first day (since the epoch) of the considered range
+        last_day
+            (if a work calendar is provided) last day (since the epoch) of the considered range
 
-                overlapping_time = get_overlapping_time(self.datetime1, self.datetime2, bh_start, bh_end)
+        Returns
+        ---------------
+        cumulative
+            Cumulative working nanoseconds
+        """
+        ret = self.__get_weekly_cumulative(nanoseconds)
+        if self.work_calendar is not None and len(nanoseconds) > 0:
+            if first_day is None:
+                first_day = int(np.min(nanoseconds) // self.DAY_NS)
+            if last_day is None:
+                last_day = int(np.max(nanoseconds) // self.DAY_NS)
+            ret = ret - self.__get_holidays_cumulative(nanoseconds, first_day, last_day)
+        return ret
 
-                if overlapping_time <= 0:
-                    break
+    def get_seconds(self, st, et) -> np.ndarray:
+        """
+        Gets the working seconds between the couples of timestamps
 
-                sum += overlapping_time
+        Parameters
+        ---------------
+        st
+            Start timestamps (Pandas series, NumPy array or list)
+        et
+            Complete timestamps (Pandas series, NumPy array or list)
 
-        return sum
+        Returns
+        ---------------
+        seconds
+            NumPy array containing the working seconds between the timestamps (0 if the complete timestamp precedes
+            the start timestamp, NaN if one of the timestamps is missing)
+        """
+        st = self.__to_wall_clock_nanoseconds(st)
+        et = self.__to_wall_clock_nanoseconds(et)
+        missing = self.__is_missing(st) | self.__is_missing(et)
+        st = st[~missing]
+        et = et[~missing]
+        ret = np.full(len(missing), np.nan, dtype=np.float64)
+        if len(st) == 0:
+            return ret
+        first_day = int(min(np.min(st), np.min(et)) // self.DAY_NS)
+        last_day = int(max(np.max(st), np.max(et)) // self.DAY_NS)
+        diff = self.get_cumulative(et, first_day, last_day) - self.get_cumulative(st, first_day, last_day)
+        ret[~missing] = np.maximum(diff, 0) / 10 ** 9
+        return ret
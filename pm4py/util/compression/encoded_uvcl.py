@@ -0,0 +1,470 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+import bisect
+from collections import Counter
+from collections.abc import Mapping
+from typing import Any, List, Optional, Tuple, Collection, Iterator, Union
+
+import numpy as np
+import pandas as pd
+
+from pm4py.objects.dfg.obj import DFG
+from pm4py.objects.log.obj import EventLog
+from pm4py.util.compression.dtypes import UVCL
+
+
+class EncodedUVCL(Mapping):
+    """
+    Array-backed univariate variant compressed log.
+    The activities are encoded as integers (the position of the activity in the sorted list of activities),
+    the variants are stored as one flat array of activity codes along with the offsets of the variants in the array,
+    and the number of occurrences of every variant.
+
+    The object behaves as a (read-only) UVCL, i.e., a mapping from the variants (tuples of activities) to their number
+    of occurrences, keeping the order in which the variants have been inserted. The variants are distinct.
+    """
+
+    def __init__(self, activities: List[Any], events: np.ndarray, offsets: np.ndarray, counts: np.ndarray):
+        """
+        Constructor
+
+        Parameters
+        ---------------
+        activities
+            sorted list of activities (shared by all the projections of the log)
+        events
+            flat array of activity codes
+        offsets
+            offsets of the variants in the flat array (number of variants + 1 elements)
+        counts
+            number of occurrences of every variant
+        """
+        self.activities = activities
+        self.events = events
+        self.offsets = offsets
+        self.counts = counts
+        self._variant_ids = None
+        self._index = None
+        self._dfg = None
+
+    @property
+    def lengths(self) -> np.ndarray:
+        return np.diff(self.offsets)
+
+    @property
+    def variant_ids(self) -> np.ndarray:
+        """
+        Index of the variant of every event of the flat array
+        """
+        if self._variant_ids is None:
+            self._variant_ids = np.repeat(np.arange(len(self.counts), dtype=np.int64), self.lengths)
+        return self._variant_ids
+
+    @property
+    def positions(self) -> np.ndarray:
+        """
+        Position of every event of the flat array inside its variant
+        """
+        return np.arange(len(self.events), dtype=np.int64) - self.offsets[self.variant_ids]
+
+    def get_variant(self, i: int) -> Tuple[Any]:
+        return tuple(self.activities[c] for c in self.events[self.offsets[i]:self.offsets[i + 1]].tolist())
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def __iter__(self) -> Iterator[Tuple[Any]]:
+        for i in range(len(self.counts)):
+            yield self.get_variant(i)
+
+    def __getitem__(self, variant: Tuple[Any]) -> int:
+        if self._index is None:
+            self._index = {v: i for i, v in enumerate(self)}
+        return int(self.counts[self._index[variant]])
+
+    def __contains__(self, variant: Any) -> bool:
+        if variant == ():
+            return bool(np.any(self.lengths == 0))
+        return super().__contains__(variant)
+
+    def values(self) -> List[int]:
+        return self.counts.tolist()
+
+    def __getstate__(self):
+        # the caches are recomputed on demand
+        state = dict(self.__dict__)
+        state["_variant_ids"] = None
+        state["_index"] = None
+        return state
+
+    def get_activity_code(self, activity: Any) -> int:
+        """
+        Gets the code of an activity (-1 if the activity is not known)
+
+        Parameters
+        ---------------
+        activity
+            activity
+
+        Returns
+        ---------------
+        code
+            Code of the activity
+        """
+        i = bisect.bisect_left(self.activities, activity)
+        return i if i < len(self.activities) and self.activities[i] == activity else -1
+
+    def get_activity_codes(self, activities: Collection[Any]) -> np.ndarray:
+        """
+        Gets a boolean mask over the activity codes, which is true for the provided activities
+
+        Parameters
+        ---------------
+        activities
+            collection of activities
+
+        Returns
+        ---------------
+        mask
+            Boolean mask over the activity codes
+        """
+        mask = np.zeros(len(self.activities), dtype=bool)
+        codes = [self.get_activity_code(a) for a in activities]
+        mask[[c for c in codes if c >= 0]] = True
+        return mask
+
+    def get_group_lookup(self, groups: List[Collection[Any]]) -> np.ndarray:
+        """
+        Gets, for every activity code, the index of the group containing the activity (-1 if no group contains it)
+
+        Parameters
+        ---------------
+        groups
+            list of groups of activities
+
+        Returns
+        ---------------
+        lookup
+            Index of the group of every activity code
+        """
+        lookup = np.full(len(self.activities), -1, dtype=np.int64)
+        for i, g in enumerate(groups):
+            lookup[self.get_activity_codes(g)] = i
+        return lookup
+
+    def get_alphabet_codes(self) -> np.ndarray:
+        """
+        Gets the (sorted) codes of the activities occurring in the log
+        """
+        return np.unique(self.events)
+
+    def get_start_codes(self) -> np.ndarray:
+        """
+        Gets the codes of the first activity of every non-empty variant
+        """
+        return self.events[self.offsets[:-1][self.lengths > 0]]
+
+    def get_end_codes(self) -> np.ndarray:
+        """
+        Gets the codes of the last activity of every non-empty variant
+        """
+        return self.events[self.offsets[1:][self.lengths > 0] - 1]
+
+    def get_dfg(self) -> DFG:
+        """
+        Gets the DFG of the log (the same of discover_dfg_uvcl, including the insertion order of the arcs and of the
+        start/end activities)
+        """
+        if self._dfg is None:
+            num_activities = len(self.activities)
+            dfg = DFG()
+            variant_ids = self.variant_ids
+            same_variant = variant_ids[1:] == variant_ids[:-1]
+            if np.any(same_variant):
+                pairs = self.events[:-1][same_variant].astype(np.int64) * num_activities + self.events[1:][
+                    same_variant]
+                weights = self.counts[variant_ids[1:][same_variant]]
+                unique_pairs, first_positions, inverse = np.unique(pairs, return_index=True, return_inverse=True)
+                frequencies = np.bincount(inverse, weights=weights)
+                for i in np.argsort(first_positions, kind="stable").tolist():
+                    pair = int(unique_pairs[i])
+                    dfg.graph[(self.activities[pair // num_activities], self.activities[pair % num_activities])] = int(
+                        round(frequencies[i]))
+            non_empty_counts = self.counts[self.lengths > 0]
+            for codes, target in [(self.get_start_codes(), dfg.start_activities),
+                                  (self.get_end_codes(), dfg.end_activities)]:
+                frequencies = np.bincount(codes, weights=non_empty_counts, minlength=num_activities)
+                for c in np.flatnonzero(frequencies).tolist():
+                    target[self.activities[c]] = int(round(frequencies[c]))
+            self._dfg = dfg
+        return self._dfg
+
+    def set_dfg(self, dfg: DFG):
+        """
+        Sets the DFG of the log, when it is derived (exactly) from the DFG of the parent log
+
+        Parameters
+        ---------------
+        dfg
+            DFG of the log
+        """
+        self._dfg = dfg
+
+    def filter_events(self, mask: np.ndarray, keep_last_count: bool = False) -> "EncodedUVCL":
+        """
+        Keeps, in every variant, only the events for which the mask is true (the variants which become equal are
+        merged)
+
+        Parameters
+        ---------------
+        mask
+            boolean mask over the events of the flat array
+        keep_last_count
+            when merging variants, keep the count of the last variant instead of summing them
+
+        Returns
+        ---------------
+        log
+            Encoded log
+        """
+        lengths = np.bincount(self.variant_ids[mask], minlength=len(self.counts))
+        return compact(self.activities, self.events[mask], lengths, self.counts, keep_last_count=keep_last_count)
+
+    def select_variants(self, mask: np.ndarray) -> "EncodedUVCL":
+        """
+        Keeps only the variants for which the mask is true
+
+        Parameters
+        ---------------
+        mask
+            boolean mask over the variants
+
+        Returns
+        ---------------
+        log
+            Encoded log
+        """
+        lengths = self.lengths[mask]
+        offsets = np.concatenate(([0], np.cumsum(lengths))).astype(np.int64)
+        return EncodedUVCL(self.activities, self.events[np.repeat(mask, self.lengths)], offsets, self.counts[mask])
+
+    def get_segments(self, starts: np.ndarray, ends: np.ndarray, counts: np.ndarray) -> "EncodedUVCL":
+        """
+        Builds a log whose traces are the given ranges of the flat array of events (the equal traces are merged)
+
+        Parameters
+        ---------------
+        starts
+            start positions of the ranges (in the flat array)
+        ends
+            end positions (excluded) of the ranges
+        counts
+            number of occurrences of every range
+
+        Returns
+        ---------------
+        log
+            Encoded log
+        """
+        return extract_segments(self.activities, self.events, starts, ends, counts)
+
+    def partition(self, mask: np.ndarray, assignment: np.ndarray, num_parts: int) -> List["EncodedUVCL"]:
+        """
+        Keeps, in every variant, only the events for which the mask is true, and distributes the variants among
+        some logs
+
+        Parameters
+        ---------------
+        mask
+            boolean mask over the events of the flat array
+        assignment
+            index of the log to which every variant is assigned
+        num_parts
+            number of logs
+
+        Returns
+        ---------------
+        logs
+            List of encoded logs
+        """
+        events = self.events[mask]
+        lengths = np.bincount(self.variant_ids[mask], minlength=len(self.counts))
+        parts = []
+        for i in range(num_parts):
+            selected = assignment == i
+            parts.append(compact(self.activities, events[np.repeat(selected, lengths)], lengths[selected],
+                                 self.counts[selected]))
+        return parts
+
+    def to_uvcl(self) -> UVCL:
+        """
+        Decodes the log into a UVCL
+        """
+        return Counter({v: int(c) for v, c in zip(self, self.counts.tolist())})
+
+
+def compact(activities: List[Any], events: np.ndarray, lengths: np.ndarray, counts: np.ndarray,
+            keep_last_count: bool = False) -> EncodedUVCL:
+    """
+    Builds an encoded log from a flat array of events, merging the equal variants (which keep the position of their
+    first occurrence)
+
+    Parameters
+    ---------------
+    activities
+        sorted list of activities
+    events
+        flat array of activity codes
+    lengths
+        length of every variant
+    counts
+        number of occurrences of every variant
+    keep_last_count
+        when merging variants, keep the count of the last variant instead of summing them
+
+    Returns
+    ---------------
+    log
+        Encoded log
+    """
+    offsets = np.concatenate(([0], np.cumsum(lengths))).astype(np.int64)
+    events = np.ascontiguousarray(events)
+    buffer = events.tobytes()
+    byte_offsets = (offsets * events.itemsize).tolist()
+    index = {}
+    inverse = [index.setdefault(buffer[byte_offsets[i]:byte_offsets[i + 1]], len(index)) for i in
+               range(len(lengths))]
+    if len(index) == len(lengths):
+        return EncodedUVCL(activities, events, offsets, np.asarray(counts, dtype=np.int64))
+
+    inverse = np.asarray(inverse, dtype=np.int64)
+    num_variants = len(index)
+    first = np.full(num_variants, len(lengths), dtype=np.int64)
+    np.minimum.at(first, inverse, np.arange(len(lengths), dtype=np.int64))
+    if keep_last_count:
+        last = np.zeros(num_variants, dtype=np.int64)
+        np.maximum.at(last, inverse, np.arange(len(lengths), dtype=np.int64))
+        new_counts = np.asarray(counts, dtype=np.int64)[last]
+    else:
+        new_counts = np.zeros(num_variants, dtype=np.int64)
+        np.add.at(new_counts, inverse, np.asarray(counts, dtype=np.int64))
+    keep = np.zeros(len(lengths), dtype=bool)
+    keep[first] = True
+    new_lengths = np.asarray(lengths)[keep]
+    new_offsets = np.concatenate(([0], np.cumsum(new_lengths))).astype(np.int64)
+    return EncodedUVCL(activities, events[np.repeat(keep, lengths)], new_offsets, new_counts)
+
+
+def extract_segments(activities: List[Any], events: np.ndarray, starts: np.ndarray, ends: np.ndarray,
+                     counts: np.ndarray) -> EncodedUVCL:
+    """
+    Builds an encoded log whose traces are the given ranges of a flat array of events (the equal traces are merged)
+
+    Parameters
+    ---------------
+    activities
+        sorted list of activities
+    events
+        flat array of activity codes
+    starts
+        start positions of the ranges (in the flat array)
+    ends
+        end positions (excluded) of the ranges
+    counts
+        number of occurrences of every range
+
+    Returns
+    ---------------
+    log
+        Encoded log
+    """
+    lengths = ends - starts
+    total = int(lengths.sum())
+    indexes = np.arange(total, dtype=np.int64) + np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+    return compact(activities, events[indexes], lengths, counts)
+
+
+def empty_log(activities: List[Any]) -> EncodedUVCL:
+    """
+    Builds an encoded log without variants
+
+    Parameters
+    ---------------
+    activities
+        sorted list of activities
+
+    Returns
+    ---------------
+    log
+        Encoded log
+    """
+    return EncodedUVCL(activities, np.zeros(0, dtype=np.int32), np.zeros(1, dtype=np.int64),
+                       np.zeros(0, dtype=np.int64))
+
+
+def from_uvcl(uvcl: UVCL) -> EncodedUVCL:
+    """
+    Encodes a UVCL
+
+    Parameters
+    ---------------
+    uvcl
+        univariate variant compressed log
+
+    Returns
+    ---------------
+    log
+        Encoded log
+    """
+    activities = sorted(set(a for v in uvcl for a in v))
+    mapping = {a: i for i, a in enumerate(activities)}
+    lengths = np.fromiter((len(v) for v in uvcl), dtype=np.int64, count=len(uvcl))
+    events = np.fromiter((mapping[a] for v in uvcl for a in v), dtype=np.int32, count=int(lengths.sum()))
+    counts = np.fromiter(uvcl.values(), dtype=np.int64, count=len(uvcl))
+    return compact(activities, events, lengths, counts)
+
+
+def encode(log: Union[EventLog, pd.DataFrame], key: str = 'concept:name', df_glue: str = 'case:concept:name',
+           df_sorting_criterion_key: str = 'time:timestamp') -> Optional[EncodedUVCL]:
+    """
+    Encodes an event log (or a dataframe) into an array-backed univariate variant compressed log, without building
+    the tuples of the variants (for dataframes)
+
+    Parameters
+    ---------------
+    log
+        event log or dataframe
+    key
+        key to use for the activities
+    df_glue
+        key to use for combining events into traces when the input is a dataframe
+    df_sorting_criterion_key
+        key to use as a sorting criterion for traces (typically timestamps)
+
+    Returns
+    ---------------
+    encoded_log
+        Encoded log
+    """
+    if type(log) is EventLog:
+        return from_uvcl(Counter(tuple(e[key] for e in t) for t in log))
+
+    log = log.loc[:, [key, df_glue, df_sorting_criterion_key]]
+    log = log.sort_values(by=[df_glue, df_sorting_criterion_key])
+    codes, activities = pd.factorize(log[key], sort=True)
+    _, lengths = np.unique(log[df_glue].to_numpy(), return_counts=True)
+    return compact(activities.tolist(), codes.astype(np.int32), lengths, np.ones(len(lengths), dtype=np.int64))
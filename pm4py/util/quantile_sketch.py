@@ -0,0 +1,195 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+"""
+Mergeable quantile sketch with relative accuracy guarantees.
+
+The values are assigned to logarithmically-spaced bins (value v > 0 goes to the bin ceil(log_gamma(v)), with
+gamma = (1 + alpha) / (1 - alpha)), so every quantile is estimated with a relative error of at most alpha.
+The sketch stores only the counts of the bins, therefore its size grows with the logarithm of the range of the values,
+and two sketches are merged by summing the counts of the bins (the result does not depend on the order of the merges).
+"""
+import math
+from typing import Dict, Tuple, Optional
+
+import numpy as np
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+
+# values whose absolute value is lower than this threshold are counted in the zero bin
+MIN_ABSOLUTE_VALUE = 1e-9
+
+
+class QuantileSketch(object):
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY):
+        """
+        Creates an empty sketch
+
+        Parameters
+        --------------
+        relative_accuracy
+            Relative accuracy of the estimated quantiles (e.g., 0.01 = 1%)
+        """
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1.0 + relative_accuracy) / (1.0 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.positive_bins: Dict[int, int] = {}
+        self.negative_bins: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def get_bins(self, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Gets the bins to which the provided values are assigned
+
+        Parameters
+        --------------
+        values
+            NumPy array of values
+
+        Returns
+        --------------
+        signs
+            Sign of the bin (-1 for negative values, 0 for the zero bin, 1 for positive values)
+        indexes
+            Index of the bin (0 for the zero bin)
+        """
+        values = np.asarray(values, dtype=np.float64)
+        absolute = np.abs(values)
+        signs = np.where(absolute < MIN_ABSOLUTE_VALUE, 0, np.sign(values)).astype(np.int64)
+        indexes = np.zeros(len(values), dtype=np.int64)
+        non_zero = signs != 0
+        indexes[non_zero] = np.ceil(np.log(absolute[non_zero]) / self.log_gamma).astype(np.int64)
+        return signs, indexes
+
+    def add_bins(self, signs: np.ndarray, indexes: np.ndarray, counts: np.ndarray, minimum: float, maximum: float):
+        """
+        Adds the counts of some bins to the sketch
+
+        Parameters
+        --------------
+        signs
+            Signs of the bins
+        indexes
+            Indexes of the bins
+        counts
+            Number of values to add to each bin
+        minimum
+            Minimum of the added values
+        maximum
+            Maximum of the added values
+        """
+        for sign, index, count in zip(np.asarray(signs).tolist(), np.asarray(indexes).tolist(),
+                                      np.asarray(counts).tolist()):
+            if sign > 0:
+                self.positive_bins[index] = self.positive_bins.get(index, 0) + count
+            elif sign < 0:
+                self.negative_bins[index] = self.negative_bins.get(index, 0) + count
+            else:
+                self.zero_count += count
+            self.count += count
+        self.min = min(self.min, minimum)
+        self.max = max(self.max, maximum)
+
+    def add(self, values: np.ndarray):
+        """
+        Adds some values to the sketch
+
+        Parameters
+        --------------
+        values
+            NumPy array (or list) of values
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if len(values) == 0:
+            return
+        signs, indexes = self.get_bins(values)
+        bins, counts = np.unique(np.stack([signs, indexes], axis=1), axis=0, return_counts=True)
+        self.add_bins(bins[:, 0], bins[:, 1], counts, float(values.min()), float(values.max()))
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """
+        Merges (in-place) another sketch, with the same relative accuracy, into the current sketch
+
+        Parameters
+        --------------
+        other
+            Other sketch
+
+        Returns
+        --------------
+        sketch
+            The current sketch
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise Exception("the sketches should have the same relative accuracy in order to be merged")
+        for index, count in other.positive_bins.items():
+            self.positive_bins[index] = self.positive_bins.get(index, 0) + count
+        for index, count in other.negative_bins.items():
+            self.negative_bins[index] = self.negative_bins.get(index, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def __value_at_rank(self, rank: int) -> float:
+        # the negative bins are visited from the most negative value, then the zero bin, then the positive bins
+        cumulative = 0
+        for index in sorted(self.negative_bins, reverse=True):
+            cumulative += self.negative_bins[index]
+            if cumulative > rank:
+                return -2.0 * self.gamma ** index / (self.gamma + 1.0)
+        cumulative += self.zero_count
+        if cumulative > rank:
+            return 0.0
+        for index in sorted(self.positive_bins):
+            cumulative += self.positive_bins[index]
+            if cumulative > rank:
+                return 2.0 * self.gamma ** index / (self.gamma + 1.0)
+        return self.max
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimates a quantile of the values added to the sketch (linearly interpolating between the two
+        closest ranks, as done by numpy/pandas)
+
+        Parameters
+        --------------
+        q
+            Quantile (between 0 and 1)
+
+        Returns
+        --------------
+        value
+            Estimated value of the quantile (None if the sketch is empty)
+        """
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        lower_rank = int(math.floor(rank))
+        upper_rank = int(math.ceil(rank))
+        lower = min(max(self.__value_at_rank(lower_rank), self.min), self.max)
+        upper = min(max(self.__value_at_rank(upper_rank), self.min), self.max) if upper_rank != lower_rank else lower
+        return lower + (upper - lower) * (rank - lower_rank)
+
+    def median(self) -> Optional[float]:
+        """
+        Estimates the median of the values added to the sketch
+        """
+        return self.quantile(0.5)
@@ -0,0 +1,420 @@
+'''
+    This file is part of PM4Py (More Info: https://pm4py.fit.fraunhofer.de).
+
+    PM4Py is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    PM4Py is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with PM4Py.  If not, see <https://www.gnu.org/licenses/>.
+'''
+"""
+On-disk columnar cache of the logs read by the pm4py.read functions.
+
+The cache is opt-in (constants.ENABLE_READ_CACHE, or the use_cache argument of the pm4py.read functions).
+The parsed log is stored in the Arrow IPC (Feather) format, in a per-user cache directory (pm4py/read_cache inside
+$XDG_CACHE_HOME, or ~/.cache), or in the directory set by the PM4PY_READ_CACHE_DIR environment variable, so that the
+directories of the source files are never written.
+Each entry is a directory, identified by the name, the path, the modification time and the size of the source file,
+and by a digest of the parameters of the importer, the version of pm4py and the global parsing settings. The tables are
+stored uncompressed, so that they are read back through a memory map. For object-centric event logs, the events,
+objects, relations, o2o, e2e and object changes tables are stored separately.
+
+When the cache directory exceeds the maximum number of entries (or the maximum size), the least recently used
+entries are removed. The entries related to an older version of a source file are removed when a new entry for the
+same file is stored.
+"""
+import hashlib
+import importlib.util
+import json
+import logging
+import os
+import shutil
+import tempfile
+from enum import Enum
+from typing import Optional, Dict, Any, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from pm4py.util import exec_utils, constants
+
+
+class Parameters(Enum):
+    CACHE_DIR = "cache_dir"
+    MAX_ENTRIES = "max_entries"
+    MAX_BYTES = "max_bytes"
+
+
+DEFAULT_CACHE_DIR = constants.get_param_from_env("PM4PY_READ_CACHE_DIR", os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "pm4py", "read_cache"))
+DEFAULT_MAX_ENTRIES = int(constants.get_param_from_env("PM4PY_READ_CACHE_MAX_ENTRIES", "32"))
+DEFAULT_MAX_BYTES = int(constants.get_param_from_env("PM4PY_READ_CACHE_MAX_BYTES", str(16 * 2 ** 30)))
+
+METADATA_KEY = b"pm4py"
+LOG_TABLE = "log"
+OCEL_TABLES = ["events", "objects", "relations", "o2o", "e2e", "object_changes"]
+OCEL_METADATA = "ocel.json"
+
+
+def is_enabled(use_cache: Optional[bool] = None) -> bool:
+    """
+    Checks if the cache should be used (the cache requires pyarrow)
+
+    Parameters
+    --------------
+    use_cache
+        Explicit choice of the user (if None, the default of constants.ENABLE_READ_CACHE is used)
+
+    Returns
+    --------------
+    boolean
+        Boolean value
+    """
+    if use_cache is None:
+        use_cache = constants.ENABLE_READ_CACHE
+    return bool(use_cache) and importlib.util.find_spec("pyarrow") is not None
+
+
+def get_cache_key(importer: str, importer_parameters: Dict[Any, Any]) -> Tuple[Any, ...]:
+    """
+    Gets the key identifying the output of an importer, including the parameters provided by the user, the version of
+    pm4py and pandas, and the global settings affecting the parsing of the log
+
+    Parameters
+    --------------
+    importer
+        Name of the importer
+    importer_parameters
+        Parameters provided to the importer
+
+    Returns
+    --------------
+    key
+        Key of the cache entry
+    """
+    from pm4py.meta import VERSION
+
+    settings = (VERSION, pd.__version__, constants.DEFAULT_TIMESTAMP_PARSE_FORMAT,
+                constants.ENABLE_DATETIME_COLUMNS_AWARE, constants.DEFAULT_PANDAS_PARSING_DTYPE_BACKEND)
+    return importer, settings, sorted((str(x), repr(y)) for x, y in importer_parameters.items())
+
+
+def __get_cache_dir(parameters: Dict[Any, Any]) -> str:
+    return exec_utils.get_param_value(Parameters.CACHE_DIR, parameters, DEFAULT_CACHE_DIR)
+
+
+def __get_source_prefix(file_path: str) -> str:
+    # the cache directory is shared by the source files having the same name in different directories
+    path_digest = hashlib.sha1(os.path.abspath(file_path).encode(constants.DEFAULT_ENCODING)).hexdigest()[:8]
+    return os.path.basename(file_path) + "." + path_digest + "."
+
+
+def get_entry_path(file_path: str, key: Any, parameters: Optional[Dict[Any, Any]] = None) -> str:
+    """
+    Gets the path of the cache entry associated to the current version of a source file and to the given key
+
+    Parameters
+    --------------
+    file_path
+        Path to the source file
+    key
+        Object describing the importer and its parameters (its representation is hashed)
+    parameters
+        Parameters of the cache, including:
+        - Parameters.CACHE_DIR => directory hosting the cache (default: DEFAULT_CACHE_DIR)
+
+    Returns
+    --------------
+    entry_path
+        Path of the cache entry
+    """
+    if parameters is None:
+        parameters = {}
+
+    stat = os.stat(file_path)
+    digest = hashlib.sha1(repr((os.path.abspath(file_path), key)).encode(constants.DEFAULT_ENCODING)).hexdigest()[:16]
+    return os.path.join(__get_cache_dir(parameters),
+                        __get_source_prefix(file_path) + "%d-%d.%s" % (stat.st_mtime_ns, stat.st_size, digest))
+
+
+def __prepare_table(df: pd.DataFrame):
+    """
+    Converts a dataframe to an Arrow table, if the conversion is lossless (otherwise, returns None)
+    """
+    import pyarrow
+
+    nan_columns = []
+    for col in df.columns:
+        if df[col].dtype == object:
+            if pd.api.types.infer_dtype(df[col], skipna=True) not in ["string", "empty"]:
+                return None
+            if df[col].isna().any():
+                nan_columns.append(str(col))
+        elif not (pd.api.types.is_numeric_dtype(df[col]) or pd.api.types.is_datetime64_any_dtype(df[col]) or
+                  isinstance(df[col].dtype, pd.StringDtype)):
+            return None
+
+    try:
+        table = pyarrow.Table.from_pandas(df)
+        metadata = dict(table.schema.metadata or {})
+        metadata[METADATA_KEY] = json.dumps({"attrs": df.attrs, "nan_columns": nan_columns}).encode(
+            constants.DEFAULT_ENCODING)
+    except (TypeError, ValueError, pyarrow.ArrowException):
+        return None
+
+    return table.replace_schema_metadata(metadata)
+
+
+def __read_table(path: str) -> pd.DataFrame:
+    from pyarrow import feather
+
+    table = feather.read_table(path, memory_map=True)
+    df = table.to_pandas()
+    metadata = json.loads(table.schema.metadata[METADATA_KEY].decode(constants.DEFAULT_ENCODING))
+    for col in metadata["nan_columns"]:
+        # pyarrow returns None for the missing values of the columns of strings
+        df[col] = df[col].where(df[col].notna(), np.nan)
+    df.attrs = metadata["attrs"]
+    return df
+
+
+def __store_entry(entry_path: str, tables: Dict[str, pd.DataFrame], extra: Optional[Dict[str, Any]],
+                  parameters: Dict[Any, Any]) -> bool:
+    from pyarrow import feather
+
+    arrow_tables = {}
+    for name, df in tables.items():
+        arrow_tables[name] = __prepare_table(df)
+        if arrow_tables[name] is None:
+            return False
+
+    cache_dir = os.path.dirname(entry_path)
+    try:
+        extra_dump = json.dumps(extra) if extra is not None else None
+    except (TypeError, ValueError):
+        return False
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # the entry is written in a temporary directory, and then moved atomically
+        temp_dir = tempfile.mkdtemp(dir=cache_dir, prefix=".tmp")
+        try:
+            for name, table in arrow_tables.items():
+                feather.write_feather(table, os.path.join(temp_dir, name + ".feather"), compression="uncompressed")
+            if extra_dump is not None:
+                with open(os.path.join(temp_dir, OCEL_METADATA), "w", encoding=constants.DEFAULT_ENCODING) as f:
+                    f.write(extra_dump)
+            if os.path.exists(entry_path):
+                shutil.rmtree(entry_path, ignore_errors=True)
+            os.replace(temp_dir, entry_path)
+        finally:
+            if os.path.exists(temp_dir):
+                shutil.rmtree(temp_dir, ignore_errors=True)
+    except OSError as e:
+        # e.g., the directory of the source file is read-only
+        logging.info("cannot store the log in the cache: " + str(e))
+        return False
+
+    evict(cache_dir, protected_entry=entry_path, parameters=parameters)
+    return True
+
+
+def __get_entries(cache_dir: str) -> List[str]:
+    if not os.path.isdir(cache_dir):
+        return []
+    return [os.path.join(cache_dir, x) for x in os.listdir(cache_dir) if not x.startswith(".tmp")]
+
+
+def __get_entry_size(entry_path: str) -> int:
+    size = 0
+    for name in os.listdir(entry_path):
+        size += os.path.getsize(os.path.join(entry_path, name))
+    return size
+
+
+def evict(cache_dir: str, protected_entry: Optional[str] = None, parameters: Optional[Dict[Any, Any]] = None):
+    """
+    Removes the stale entries (related to older versions of a source file) and the least recently used entries
+    exceeding the limits of the cache
+
+    Parameters
+    --------------
+    cache_dir
+        Directory hosting the cache
+    protected_entry
+        (optional) entry that should not be removed
+    parameters
+        Parameters of the cache, including:
+        - Parameters.MAX_ENTRIES => maximum number of entries kept in the cache directory
+        - Parameters.MAX_BYTES => maximum size (in bytes) of the cache directory
+    """
+    if parameters is None:
+        parameters = {}
+
+    max_entries = exec_utils.get_param_value(Parameters.MAX_ENTRIES, parameters, DEFAULT_MAX_ENTRIES)
+    max_bytes = exec_utils.get_param_value(Parameters.MAX_BYTES, parameters, DEFAULT_MAX_BYTES)
+
+    entries = __get_entries(cache_dir)
+
+    if protected_entry is not None:
+        # an entry of the same source file, but with a different version, is stale
+        name = os.path.basename(protected_entry)
+        source_prefix, version = name.rsplit(".", 2)[0] + ".", name.rsplit(".", 2)[1]
+        for entry in list(entries):
+            entry_name = os.path.basename(entry)
+            if entry_name.rsplit(".", 2)[0] + "." == source_prefix and entry_name.rsplit(".", 2)[1] != version:
+                shutil.rmtree(entry, ignore_errors=True)
+                entries.remove(entry)
+
+    try:
+        entries = sorted(entries, key=lambda x: os.path.getmtime(x), reverse=True)
+        sizes = [__get_entry_size(x) for x in entries]
+    except OSError:
+        return
+
+    total_size = 0
+    for i, entry in enumerate(entries):
+        total_size += sizes[i]
+        if entry != protected_entry and (i >= max_entries or total_size > max_bytes):
+            shutil.rmtree(entry, ignore_errors=True)
+
+
+def __touch(entry_path: str):
+    try:
+        os.utime(entry_path)
+    except OSError:
+        pass
+
+
+def load_dataframe(file_path: str, key: Any, parameters: Optional[Dict[Any, Any]] = None) -> Optional[pd.DataFrame]:
+    """
+    Loads a dataframe from the cache
+
+    Parameters
+    --------------
+    file_path
+        Path to the source file
+    key
+        Object describing the importer and its parameters
+    parameters
+        Parameters of the cache
+
+    Returns
+    --------------
+    dataframe
+        Dataframe (None if the cache does not contain the log)
+    """
+    entry_path = get_entry_path(file_path, key, parameters=parameters)
+    table_path = os.path.join(entry_path, LOG_TABLE + ".feather")
+    if not os.path.exists(table_path):
+        return None
+    try:
+        df = __read_table(table_path)
+    except Exception as e:
+        logging.info("cannot read the log from the cache: " + str(e))
+        return None
+    __touch(entry_path)
+    return df
+
+
+def store_dataframe(file_path: str, key: Any, df: pd.DataFrame, parameters: Optional[Dict[Any, Any]] = None) -> bool:
+    """
+    Stores a dataframe in the cache
+
+    Parameters
+    --------------
+    file_path
+        Path to the source file
+    key
+        Object describing the importer and its parameters
+    df
+        Dataframe
+    parameters
+        Parameters of the cache
+
+    Returns
+    --------------
+    boolean
+        Boolean value telling if the dataframe has been stored
+    """
+    if parameters is None:
+        parameters = {}
+
+    entry_path = get_entry_path(file_path, key, parameters=parameters)
+    return __store_entry(entry_path, {LOG_TABLE: df}, None, parameters)
+
+
+def load_ocel(file_path: str, key: Any, parameters: Optional[Dict[Any, Any]] = None):
+    """
+    Loads an object-centric event log from the cache
+
+    Parameters
+    --------------
+    file_path
+        Path to the source file
+    key
+        Object describing the importer and its parameters
+    parameters
+        Parameters of the cache
+
+    Returns
+    --------------
+    ocel
+        Object-centric event log (None if the cache does not contain the log)
+    """
+    from pm4py.objects.ocel.obj import OCEL
+
+    entry_path = get_entry_path(file_path, key, parameters=parameters)
+    metadata_path = os.path.join(entry_path, OCEL_METADATA)
+    if not os.path.exists(metadata_path):
+        return None
+    try:
+        with open(metadata_path, "r", encoding=constants.DEFAULT_ENCODING) as f:
+            metadata = json.load(f)
+        tables = {name: __read_table(os.path.join(entry_path, name + ".feather")) for name in OCEL_TABLES}
+    except Exception as e:
+        logging.info("cannot read the log from the cache: " + str(e))
+        return None
+    __touch(entry_path)
+    return OCEL(events=tables["events"], objects=tables["objects"], relations=tables["relations"],
+                globals=metadata["globals"], parameters=metadata["parameters"], o2o=tables["o2o"], e2e=tables["e2e"],
+                object_changes=tables["object_changes"])
+
+
+def store_ocel(file_path: str, key: Any, ocel, parameters: Optional[Dict[Any, Any]] = None) -> bool:
+    """
+    Stores an object-centric event log in the cache
+
+    Parameters
+    --------------
+    file_path
+        Path to the source file
+    key
+        Object describing the importer and its parameters
+    ocel
+        Object-centric event log
+    parameters
+        Parameters of the cache
+
+    Returns
+    --------------
+    boolean
+        Boolean value telling if the object-centric event log has been stored
+    """
+    if parameters is None:
+        parameters = {}
+
+    ocel_parameters = ocel.parameters if ocel.parameters is not None else {}
+    if not all(type(k) is str for k in ocel_parameters):
+        return False
+
+    entry_path = get_entry_path(file_path, key, parameters=parameters)
+    tables = {name: getattr(ocel, name) for name in OCEL_TABLES}
+    return __store_entry(entry_path, tables, {"globals": ocel.globals, "parameters": ocel_parameters}, parameters)
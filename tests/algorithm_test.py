@@ -32,6 +32,54 @@ class AlgorithmTest(unittest.TestCase):
         from pm4py.algo.conformance.log_skeleton import algorithm as lsk_conformance
         conf = lsk_conformance.apply(log, model)
 
+    def test_columnar_declare(self):
+        from pm4py.algo.discovery.declare import algorithm as declare_discovery
+        from pm4py.algo.discovery.declare import templates
+        log = pandas_utils.read_csv(os.path.join("input_data", "receipt.csv"))
+        log = dataframe_utils.convert_timestamp_columns_in_df(log, timest_format=constants.DEFAULT_TIMESTAMP_PARSE_FORMAT)
+        all_templates = {v for k, v in vars(templates).items() if k.isupper()}
+        for parameters in [{}, {"min_support_ratio": 0.2, "min_confidence_ratio": 0.5},
+                           {"allowed_templates": all_templates, "min_support_ratio": 0.0, "min_confidence_ratio": 0.0}]:
+            model = declare_discovery.apply(log, variant=declare_discovery.Variants.CLASSIC, parameters=parameters)
+            self.assertEqual(model, declare_discovery.apply(log, variant=declare_discovery.Variants.COLUMNAR,
+                                                            parameters=parameters))
+            self.assertEqual(model, declare_discovery.apply(log, variant=declare_discovery.Variants.COLUMNAR,
+                                                            parameters={**parameters, "cores": 2}))
+
+    def test_temporal_profile_bounded_memory(self):
+        import logging
+        import pm4py
+        from pm4py.algo.conformance.temporal_profile.variants import dataframe as temporal_profile_conformance
+        from pm4py.streaming.algo.conformance.temporal import algorithm as streaming_temporal_conformance
+        log = pm4py.read_xes(os.path.join("compressed_input_data", "03_repairExample.xes.gz"))
+        temporal_profile = pm4py.discover_temporal_profile(log)
+        parameters = {temporal_profile_conformance.Parameters.ZETA: 1.0}
+        results = temporal_profile_conformance.apply(log, temporal_profile, parameters=parameters)
+        deviations = list(temporal_profile_conformance.iterate_deviations(log, temporal_profile, parameters={
+            **parameters, temporal_profile_conformance.Parameters.CHUNK_SIZE: 50}))
+        cases = list(log["case:concept:name"].unique())
+        self.assertEqual(sorted(d for c in range(len(cases)) for d in results[c]), sorted(d[1:] for d in deviations))
+        self.assertEqual(set(cases[c] for c in range(len(cases)) if results[c]), set(d[0] for d in deviations))
+        self.assertTrue(all(type(d[3]) is float and type(d[4]) is float for d in deviations))
+        stream = pm4py.convert_to_event_stream(log.sort_values("time:timestamp", kind="stable"))
+        logging.disable(logging.ERROR)
+        try:
+            classic = streaming_temporal_conformance.apply(temporal_profile, parameters=parameters)
+            bounded = streaming_temporal_conformance.apply(temporal_profile,
+                                                           variant=streaming_temporal_conformance.Variants.BOUNDED,
+                                                           parameters={**parameters, "max_open_cases": 10})
+            for event in stream:
+                classic.receive(event)
+                bounded.receive(event)
+            self.assertLessEqual(len(bounded.cases), 10)
+            expected = {case: [tuple(x) for x in devs] for case, devs in classic.get().items()}
+            self.assertEqual({case: devs for case, devs in expected.items() if case in bounded.cases}, bounded.get())
+            for case in list(bounded.cases):
+                self.assertEqual(expected.get(case, []), bounded.terminate(case))
+            self.assertEqual({}, bounded.get())
+        finally:
+            logging.disable(logging.NOTSET)
+
     def test_alignment(self):
         log = xes_importer.apply(os.path.join("input_data", "running-example.xes"))
         from pm4py.algo.discovery.alpha import algorithm as alpha_miner
@@ -70,6 +118,16 @@ class AlgorithmTest(unittest.TestCase):
         generalization = generalization_evaluation.apply(log, net, im, fm,
                                                          variant=generalization_evaluation.Variants.GENERALIZATION_TOKEN)
 
+    def test_tokenreplay_compiled(self):
+        log = xes_importer.apply(os.path.join("compressed_input_data", "03_repairExample.xes.gz"))
+        from pm4py.algo.discovery.inductive import algorithm as inductive_miner
+        tree = inductive_miner.apply(log, variant=inductive_miner.Variants.IMf, parameters={"noise_threshold": 0.3})
+        net, im, fm = process_tree_converter.apply(tree)
+        from pm4py.algo.conformance.tokenreplay import algorithm as token_replay
+        replayed_traces = token_replay.apply(log, net, im, fm, variant=token_replay.Variants.TOKEN_REPLAY)
+        compiled_replayed_traces = token_replay.apply(log, net, im, fm, variant=token_replay.Variants.COMPILED)
+        self.assertEqual(replayed_traces, compiled_replayed_traces)
+
     def test_evaluation(self):
         log = xes_importer.apply(os.path.join("input_data", "running-example.xes"))
         from pm4py.algo.discovery.alpha import algorithm as alpha_miner
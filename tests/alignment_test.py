@@ -100,6 +100,55 @@ class AlignmentTest(unittest.TestCase):
         net, im, fm = pm4py.discover_petri_net_inductive(log)
         align_alg.apply(log, net, im, fm, variant=align_alg.Variants.VERSION_TWEAKED_STATE_EQUATION_A_STAR)
 
+    def test_variant_compact_state_eq_a_star(self):
+        import pm4py
+        import copy
+        log = pm4py.read_xes("compressed_input_data/03_repairExample.xes.gz", return_legacy_log_object=True)
+        net, im, fm = pm4py.discover_petri_net_inductive(pm4py.filter_variants_top_k(log, 3))
+        classic = align_alg.apply(log, net, im, fm, variant=align_alg.Variants.VERSION_STATE_EQUATION_A_STAR)
+        compact = align_alg.apply(log, net, im, fm, variant=align_alg.Variants.VERSION_COMPACT_STATE_EQUATION_A_STAR)
+        self.assertEqual([x["cost"] for x in classic], [x["cost"] for x in compact])
+        self.assertEqual([x["fitness"] for x in classic], [x["fitness"] for x in compact])
+        # the ties are broken in the same way on a copy of the net
+        net2, im2, fm2 = copy.deepcopy((net, im, fm))
+        compact2 = align_alg.apply(log, net2, im2, fm2, variant=align_alg.Variants.VERSION_COMPACT_STATE_EQUATION_A_STAR)
+        self.assertEqual([x["alignment"] for x in compact], [x["alignment"] for x in compact2])
+
+    def test_multiprocessing_shared_net(self):
+        import pm4py
+        log = pm4py.read_xes("compressed_input_data/02_teleclaims.xes.gz")
+        net, im, fm = pm4py.discover_petri_net_inductive(pm4py.filter_variants_top_k(log, 3))
+        sequential = align_alg.apply(log, net, im, fm)
+        parallel = align_alg.apply_multiprocessing(log, net, im, fm, parameters={align_alg.Parameters.CORES: 2,
+                                                                                align_alg.Parameters.VARIANTS_PER_TASK: 3})
+        self.assertEqual([x["cost"] for x in sequential], [x["cost"] for x in parallel])
+        self.assertEqual([x["fitness"] for x in sequential], [x["fitness"] for x in parallel])
+        streamed = list(align_alg.apply_multiprocessing_streaming(log, net, im, fm, parameters={align_alg.Parameters.CORES: 2}))
+        self.assertEqual(sum(len(idxs) for idxs, al in streamed), len(sequential))
+        for idxs, al in streamed:
+            for idx in idxs:
+                self.assertEqual(sequential[idx]["cost"], al["cost"])
+        # the pending tasks are cancelled when the generator is abandoned
+        generator = align_alg.apply_multiprocessing_streaming(log, net, im, fm,
+                                                               parameters={align_alg.Parameters.CORES: 2})
+        idxs, al = next(generator)
+        generator.close()
+        self.assertEqual(sequential[idxs[0]]["cost"], al["cost"])
+
+
+    def test_dijkstra_less_memory_prefix_cache(self):
+        import pm4py
+        from pm4py.algo.conformance.alignments.petri_net.utils.prefix_cache import PrefixCache
+        log = pm4py.read_xes("compressed_input_data/03_repairExample.xes.gz", return_legacy_log_object=True)
+        net, im, fm = pm4py.discover_petri_net_inductive(pm4py.filter_variants_top_k(log, 3))
+        without_cache = align_alg.apply(log, net, im, fm, variant=align_alg.Variants.VERSION_DIJKSTRA_LESS_MEMORY)
+        cache = PrefixCache(max_size=20)
+        with_cache = align_alg.apply(log, net, im, fm, variant=align_alg.Variants.VERSION_DIJKSTRA_LESS_MEMORY,
+                                     parameters={align_alg.Parameters.PREFIX_CACHE: cache})
+        self.assertEqual(without_cache, with_cache)
+        statistics = cache.get_statistics()
+        self.assertGreater(statistics["hits"], 0)
+        self.assertLessEqual(statistics["size"], 20)
 
 
 if __name__ == "__main__":
@@ -1,3 +1,4 @@
+import os
 import unittest
 
 import pm4py
@@ -18,6 +19,176 @@ class DfgTests(unittest.TestCase):
         act_count = pm4py.get_event_attribute_values(log, "concept:name")
         dfg_filtering.filter_dfg_on_paths_percentage(dfg, sa, ea, act_count, 0.3)
 
+    def test_fused_statistics(self):
+        from pm4py.algo.discovery.dfg.adapters.pandas import df_statistics, fused_statistics
+        log = pm4py.read_xes("input_data/interval_event_log.xes")
+        log = log.sample(frac=1.0, random_state=7)
+        statistics = fused_statistics.apply(log, perf_aggregation_key="all")
+        dfg, performance_dfg = df_statistics.get_dfg_graph(log.copy(), measure="both", perf_aggregation_key="all")
+        self.assertEqual(dfg, statistics[fused_statistics.DFG_FREQUENCY])
+        self.assertEqual(performance_dfg.keys(), statistics[fused_statistics.DFG_PERFORMANCE].keys())
+        for arc in performance_dfg:
+            for measure in ["mean", "median", "max", "min", "sum"]:
+                self.assertAlmostEqual(performance_dfg[arc][measure],
+                                       statistics[fused_statistics.DFG_PERFORMANCE][arc][measure], places=3)
+        self.assertEqual(pm4py.get_start_activities(log), statistics[fused_statistics.START_ACTIVITIES])
+        self.assertEqual(pm4py.get_end_activities(log), statistics[fused_statistics.END_ACTIVITIES])
+        self.assertEqual(pm4py.get_event_attribute_values(log, "concept:name"), statistics[fused_statistics.ACTIVITIES])
+
+    def test_fused_statistics_missing_values(self):
+        import numpy as np
+        from pm4py.algo.discovery.dfg.adapters.pandas import df_statistics, fused_statistics
+        log = pm4py.read_xes("compressed_input_data/03_repairExample.xes.gz")
+        log.loc[log.index[::7], "case:concept:name"] = np.nan
+        log.loc[log.index[3::11], "concept:name"] = np.nan
+        statistics = fused_statistics.apply(log, measure="frequency")
+        self.assertEqual(df_statistics.get_dfg_graph(log.copy()), statistics[fused_statistics.DFG_FREQUENCY])
+        grouped = log.groupby("case:concept:name", sort=False)["concept:name"]
+        self.assertEqual(grouped.first().value_counts().to_dict(), statistics[fused_statistics.START_ACTIVITIES])
+        self.assertEqual(grouped.last().value_counts().to_dict(), statistics[fused_statistics.END_ACTIVITIES])
+
+    def test_fused_statistics_missing_timestamps(self):
+        import math
+        import pandas as pd
+        from pm4py.algo.discovery.dfg import algorithm as dfg_discovery
+        from pm4py.algo.discovery.dfg.adapters.pandas import df_statistics, fused_statistics
+        log = pm4py.read_xes("compressed_input_data/03_repairExample.xes.gz")
+        log.loc[log.index[5::9], "time:timestamp"] = pd.NaT
+        # the events without timestamp are sorted last in their case
+        self.assertEqual(df_statistics.get_dfg_graph(log.copy()), dfg_discovery.apply(log))
+        dfg, raw_values = df_statistics.get_dfg_graph(log.copy(), measure="both", perf_aggregation_key="raw_values")
+        statistics = fused_statistics.apply(log, perf_aggregation_key="raw_values")
+        self.assertEqual(dfg, statistics[fused_statistics.DFG_FREQUENCY])
+        self.assertEqual(raw_values.keys(), statistics[fused_statistics.DFG_PERFORMANCE].keys())
+        for arc, values in raw_values.items():
+            # the flow times are kept in their order of occurrence
+            self.assertEqual([None if math.isnan(x) else x for x in values],
+                             [None if math.isnan(x) else x for x in statistics[fused_statistics.DFG_PERFORMANCE][arc]])
+        performance_dfg = df_statistics.get_dfg_graph(log.copy(), measure="performance", perf_aggregation_key="all")
+        statistics = fused_statistics.apply(log, measure="performance", perf_aggregation_key="all")
+        for arc in performance_dfg:
+            for measure in ["mean", "median", "max", "min", "sum"]:
+                expected = performance_dfg[arc][measure]
+                if math.isnan(expected):
+                    self.assertTrue(math.isnan(statistics[fused_statistics.DFG_PERFORMANCE][arc][measure]))
+                else:
+                    self.assertAlmostEqual(expected, statistics[fused_statistics.DFG_PERFORMANCE][arc][measure],
+                                           places=3)
+
+    def test_incremental_dfg(self):
+        import numpy as np
+        from pm4py.algo.discovery.dfg.adapters.pandas import incremental
+        log = pm4py.read_xes("compressed_input_data/03_repairExample.xes.gz")
+        log = log.sort_values("time:timestamp", kind="stable")
+        accumulator = incremental.apply()
+        for batch in np.array_split(np.arange(len(log)), 5):
+            accumulator.append(log.iloc[batch])
+        accumulator.snapshot(os.path.join("test_output_data", "dfg.snapshot"))
+        accumulator = incremental.restore(os.path.join("test_output_data", "dfg.snapshot"))
+        os.remove(os.path.join("test_output_data", "dfg.snapshot"))
+        dfg, sa, ea = pm4py.discover_dfg(log)
+        self.assertEqual(dfg, accumulator.get_dfg())
+        self.assertEqual(sa, accumulator.get_start_activities())
+        self.assertEqual(ea, accumulator.get_end_activities())
+        performance_dfg, _, _ = pm4py.discover_performance_dfg(log)
+        incremental_performance_dfg = accumulator.get_performance_dfg()
+        for arc in performance_dfg:
+            for measure in ["mean", "max", "min", "sum"]:
+                self.assertAlmostEqual(performance_dfg[arc][measure], incremental_performance_dfg[arc][measure],
+                                       places=3)
+            self.assertLessEqual(abs(performance_dfg[arc]["median"] - incremental_performance_dfg[arc]["median"]),
+                                 0.01 * abs(performance_dfg[arc]["median"]) + 1e-6)
+
+    def test_mergeable_dfg(self):
+        import math
+        from pm4py.algo.discovery.dfg.adapters.pandas import mergeable
+        log = pm4py.read_xes("input_data/interval_event_log.xes")
+        cases = sorted(log["case:concept:name"].unique())
+        shards = [log[log["case:concept:name"].isin(cases[i::3])] for i in range(3)]
+        performance_dfg, sa, ea = pm4py.discover_performance_dfg(log)
+        sharded_performance_dfg, sharded_sa, sharded_ea = pm4py.discover_performance_dfg(iter(shards))
+        self.assertEqual(sa, sharded_sa)
+        self.assertEqual(ea, sharded_ea)
+        for arc in performance_dfg:
+            for measure, value in performance_dfg[arc].items():
+                if math.isnan(value):
+                    self.assertTrue(math.isnan(sharded_performance_dfg[arc][measure]))
+                else:
+                    self.assertEqual(value, sharded_performance_dfg[arc][measure])
+        summary = mergeable.merge([mergeable.from_dataframe(shard).to_bytes() for shard in shards])
+        self.assertEqual(pm4py.discover_dfg(log)[0], summary.get_dfg())
+        self.assertEqual(pm4py.get_variants(log), summary.get_variants())
+        for arc, measures in summary.get_performance_dfg().items():
+            self.assertAlmostEqual(performance_dfg[arc]["mean"], measures["mean"], places=3)
+            self.assertLessEqual(abs(performance_dfg[arc]["median"] - measures["median"]),
+                                 0.01 * abs(performance_dfg[arc]["median"]) + 1e-6)
+        # with several processes, the iterator of shards is consumed progressively
+        consumed = []
+
+        def generate_shards():
+            for i in range(24):
+                consumed.append(i)
+                yield log[log["case:concept:name"].isin(cases[i::24])]
+
+        summary = mergeable.apply(generate_shards(), parameters={mergeable.Parameters.CORES: 2,
+                                                                 mergeable.Parameters.INCLUDE_VARIANTS: False})
+        self.assertEqual(24, len(consumed))
+        self.assertEqual(pm4py.discover_dfg(log)[0], summary.get_dfg())
+        self.assertEqual(sa, summary.get_start_activities())
+        # the serialization contains only data
+        for exact in [False, True]:
+            summary = mergeable.from_dataframe(log, parameters={mergeable.Parameters.EXACT_PERFORMANCE: exact})
+            restored = mergeable.from_bytes(summary.to_bytes())
+            self.assertEqual(summary.get_dfg(), restored.get_dfg())
+            self.assertEqual(summary.get_variants(), restored.get_variants())
+            self.assertEqual(summary.get_activities(), restored.get_activities())
+            self.assertEqual(summary.get_performance_dfg(), restored.get_performance_dfg())
+        import pickle
+        with self.assertRaises(Exception):
+            mergeable.from_bytes(pickle.dumps((mergeable.SERIALIZATION_VERSION, summary)))
+
+    def test_eventually_follows_aggregates(self):
+        from pm4py.algo.discovery.dfg.adapters.pandas import eventually_follows
+        from pm4py.algo.discovery.dfg.adapters.pandas.df_statistics import get_partial_order_dataframe
+        for path in ["input_data/interval_event_log.xes", "compressed_input_data/03_repairExample.xes.gz"]:
+            log = pm4py.read_xes(path)
+            # merges the cases in a few long cases
+            log["case:concept:name"] = (log.index % 4).astype(str)
+            log = log.sort_values("time:timestamp", kind="stable").head(2000)
+            aggregates = eventually_follows.get_aggregates(log)
+            efg = get_partial_order_dataframe(log.copy(), keep_first_following=False)
+            efg = efg.groupby(["concept:name", "concept:name_2"])["@@flow_time"].agg(["count", "sum"]).to_dict("index")
+            self.assertEqual(efg.keys(), aggregates.keys())
+            for pair in efg:
+                self.assertEqual(efg[pair]["count"], aggregates[pair][0])
+                self.assertAlmostEqual(efg[pair]["sum"], aggregates[pair][1], delta=1e-6 * abs(efg[pair]["sum"]) + 1e-3)
+
+    def test_eventually_follows_large_flow_times(self):
+        import numpy as np
+        import pandas as pd
+        from pm4py.algo.discovery.dfg.adapters.pandas import eventually_follows
+        from pm4py.algo.discovery.dfg.adapters.pandas.df_statistics import get_partial_order_dataframe
+        rng = np.random.default_rng(3)
+        # short cases (the couples are aggregated in chunks) and long cases (prefix sums over the activities)
+        for num_cases, num_events in [(500, 1), (4, 40)]:
+            rows = []
+            for case in range(num_cases):
+                start = pd.Timestamp("2020-01-01") + pd.Timedelta(seconds=int(rng.integers(0, 10 ** 8)))
+                for i, activity in enumerate("ABC"):
+                    for _ in range(num_events):
+                        seconds = i * 10 ** 7 + int(rng.integers(0, 3))
+                        rows.append((str(case), activity, start + pd.Timedelta(seconds=seconds)))
+            log = pd.DataFrame(rows, columns=["case:concept:name", "concept:name", "time:timestamp"])
+            log = log.sort_values(["case:concept:name", "time:timestamp"], kind="stable").reset_index(drop=True)
+            mean_std = eventually_follows.get_mean_std(eventually_follows.get_aggregates(log))
+            efg = get_partial_order_dataframe(log.copy(), keep_first_following=False)
+            efg = efg.groupby(["concept:name", "concept:name_2"])["@@flow_time"].agg(["mean", "std"]).fillna(0)
+            self.assertEqual(set(efg.index), mean_std.keys())
+            for pair, row in efg.to_dict("index").items():
+                self.assertAlmostEqual(row["mean"], mean_std[pair][0], places=3)
+                self.assertGreater(mean_std[pair][1], 0.5)
+                self.assertAlmostEqual(row["std"], mean_std[pair][1], places=6)
+
 
 if __name__ == "__main__":
     unittest.main()
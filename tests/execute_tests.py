@@ -10,6 +10,9 @@ sys.path.insert(0, parent_dir)
 
 EXECUTE_TESTS = True
 
+# the tests do not persist the parsed logs (test_read_cache uses a temporary directory)
+os.environ.setdefault("PM4PY_ENABLE_READ_CACHE", "False")
+
 import pm4py
 import numpy
 import pandas
@@ -156,12 +156,50 @@ class DataframePrefilteringTest(unittest.TestCase):
                                                                                         ltl_checker.Parameters.POSITIVE: False})
 
 
+    def test_compiled_ltl_checker(self):
+        from pm4py.algo.filtering.pandas.ltl import compiled_checker
+        from pm4py.algo.filtering.log.ltl import ltl_checker as log_ltl_checker
+        df = pandas_utils.read_csv(os.path.join("input_data", "running-example.csv"))
+        df = dataframe_utils.convert_timestamp_columns_in_df(df, timest_format=constants.DEFAULT_TIMESTAMP_PARSE_FORMAT)
+        log = log_conv_fact.apply(df, variant=log_conv_fact.Variants.TO_EVENT_LOG)
+        rules = [(compiled_checker.EVENTUALLY_FOLLOWS, ["register request", "check ticket", "pay compensation"], {}),
+                 (compiled_checker.A_NEXT_B_NEXT_C, ["register request", "examine casually", "check ticket"], {}),
+                 (compiled_checker.FOUR_EYES_PRINCIPLE, ["register request", "decide"], {}),
+                 (compiled_checker.FOUR_EYES_PRINCIPLE, ["check ticket", "decide"], {compiled_checker.Parameters.POSITIVE: False}),
+                 (compiled_checker.ATTR_VALUE_DIFFERENT_PERSONS, ["check ticket"], {})]
+        results = compiled_checker.apply(df, rules)
+        expected = [log_ltl_checker.eventually_follows(log, ["register request", "check ticket", "pay compensation"]),
+                    log_ltl_checker.A_next_B_next_C(log, "register request", "examine casually", "check ticket"),
+                    log_ltl_checker.four_eyes_principle(log, "register request", "decide"),
+                    log_ltl_checker.four_eyes_principle(log, "check ticket", "decide", parameters={log_ltl_checker.Parameters.POSITIVE: False}),
+                    log_ltl_checker.attr_value_different_persons(log, "check ticket")]
+        for i in range(len(rules)):
+            self.assertEqual(set(results.index[results[i]]), set(trace.attributes["concept:name"] for trace in expected[i]))
+
     def test_attr_value_repetition(self):
         from pm4py.algo.filtering.pandas.attr_value_repetition import filter
         df = pandas_utils.read_csv(os.path.join("input_data", "running-example.csv"))
         df = dataframe_utils.convert_timestamp_columns_in_df(df, timest_format=constants.DEFAULT_TIMESTAMP_PARSE_FORMAT)
         filtered_df = filter.apply(df, "Sara", parameters={constants.PARAMETER_CONSTANT_ATTRIBUTE_KEY: "org:resource"})
 
+    def test_filter_pipeline(self):
+        import pm4py
+        df = pandas_utils.read_csv(os.path.join("input_data", "receipt.csv"))
+        df = dataframe_utils.convert_timestamp_columns_in_df(df, timest_format=constants.DEFAULT_TIMESTAMP_PARSE_FORMAT)
+        df = df.sample(frac=1.0, random_state=11)
+        filtered_df = pm4py.filter_start_activities(df, ["Confirmation of receipt"])
+        filtered_df = pm4py.filter_event_attribute_values(filtered_df, "org:group", ["Group 1", "EMPTY"], level="event", retain=False)
+        filtered_df = pm4py.filter_time_range(filtered_df, "2011-01-01 00:00:00", "2011-09-01 00:00:00", mode="traces_contained")
+        filtered_df = pm4py.filter_case_size(filtered_df, 2, 20)
+        filtered_df = pm4py.filter_variants_top_k(filtered_df, 5)
+        filtered_df = pm4py.filter_end_activities(filtered_df, ["T04 Determine confirmation of receipt"], retain=False)
+        pipeline = pm4py.filtering.pipeline(df).start_activities(["Confirmation of receipt"]) \
+            .event_attribute_values("org:group", ["Group 1", "EMPTY"], level="event", retain=False) \
+            .time_range("2011-01-01 00:00:00", "2011-09-01 00:00:00", mode="traces_contained") \
+            .case_size(2, 20).variants_top_k(5) \
+            .end_activities(["T04 Determine confirmation of receipt"], retain=False)
+        self.assertTrue(pipeline.collect().index.equals(filtered_df.index))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -166,6 +166,66 @@ class InductiveMinerTest(unittest.TestCase):
 
         tree = imfuvcl.apply(IMDataStructureUVCL(uvcl), parameters=parameters)
 
+    def test_inductive_miner_parallel_recursion(self):
+        import pm4py
+        from pm4py.algo.discovery.inductive.variants.abc import Parameters
+        log = pm4py.read_xes(os.path.join(COMPRESSED_INPUT_DATA, "08_receipt.xes.gz"))
+        parallel_parameters = {Parameters.PARALLEL_RECURSION: True, Parameters.PARALLEL_RECURSION_MIN_SIZE: 0,
+                               Parameters.CORES: 2}
+        for variant in [inductive_miner.Variants.IM, inductive_miner.Variants.IMf]:
+            tree = inductive_miner.apply(log, variant=variant)
+            parallel_tree = inductive_miner.apply(log, variant=variant, parameters=parallel_parameters)
+            self.assertEqual(str(tree), str(parallel_tree))
+
+    def test_inductive_miner_encoded_uvcl(self):
+        import pm4py
+        from pm4py.util.compression import encoded_uvcl, util as comut
+        log = pm4py.read_xes(os.path.join(COMPRESSED_INPUT_DATA, "13_SEPSIS_1t_per_variant.xes.gz"))
+        uvcl = comut.get_variants(comut.project_univariate(log))
+        encoded = encoded_uvcl.encode(log)
+        self.assertEqual(uvcl, encoded.to_uvcl())
+        self.assertEqual(list(uvcl), list(encoded))
+        dfg = comut.discover_dfg_uvcl(uvcl)
+        self.assertEqual(dfg.graph, encoded.get_dfg().graph)
+        self.assertEqual(dfg.start_activities, encoded.get_dfg().start_activities)
+        self.assertEqual(dfg.end_activities, encoded.get_dfg().end_activities)
+        for variant in [inductive_miner.Variants.IM, inductive_miner.Variants.IMf, inductive_miner.Variants.IMd]:
+            parameters = {"noise_threshold": 0.2}
+            tree = inductive_miner.apply(log, variant=variant, parameters=parameters)
+            encoded_tree = inductive_miner.apply(log, variant=variant, parameters={
+                **parameters, inductive_miner.Parameters.USE_ENCODED_UVCL: True})
+            self.assertEqual(str(tree), str(encoded_tree))
+
+    def test_inductive_miner_indexed_dfg(self):
+        import random
+        import pm4py
+        from pm4py.algo.discovery.inductive.cuts.sequence import SequenceCut
+        from pm4py.algo.discovery.inductive.dtypes.im_ds import IMDataStructureDFG
+        from pm4py.algo.discovery.inductive.dtypes.im_dfg import InductiveDFG
+        from pm4py.objects.dfg import util as dfu
+        from pm4py.objects.dfg.obj import DFG
+        from pm4py.objects.process_tree.obj import Operator
+        log = pm4py.read_xes(os.path.join(COMPRESSED_INPUT_DATA, "13_SEPSIS_1t_per_variant.xes.gz"))
+        dfg = DFG(*pm4py.discover_dfg(log))
+        obj = IMDataStructureDFG(InductiveDFG(dfg))
+        pre, post = dfu.get_transitive_relations(dfg)
+        for i, act in enumerate(obj.indexed_dfg.vertices):
+            self.assertEqual((len(pre[act]), len(post[act])), obj.indexed_dfg.get_transitive_counts(i))
+        # sections of pages, visited in sequence
+        rnd = random.Random(7)
+        sections = [["p%d_%d" % (s, i) for i in range(50)] for s in range(20)]
+        dfg = DFG()
+        for _ in range(500):
+            trace = [rnd.choice(sec) for sec in sections for _ in range(rnd.randint(1, 4))]
+            dfg.start_activities[trace[0]] += 1
+            dfg.end_activities[trace[-1]] += 1
+            for a, b in zip(trace, trace[1:]):
+                dfg.graph[(a, b)] += 1
+        groups = SequenceCut.holds(IMDataStructureDFG(InductiveDFG(dfg)))
+        self.assertEqual([set(sec).intersection(dfu.get_vertices(dfg)) for sec in sections], groups)
+        tree = inductive_miner.apply(dfg, variant=inductive_miner.Variants.IMd)
+        self.assertEqual(Operator.SEQUENCE, tree.operator)
+        self.assertEqual(len(sections), len(tree.children))
 
 
 if __name__ == "__main__":
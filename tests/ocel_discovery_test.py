@@ -100,6 +100,24 @@ class OcelDiscoveryTest(unittest.TestCase):
         ocel = pm4py.read_ocel(os.path.join("input_data", "ocel", "example_log.jsonocel"))
         saw_nets_disc.apply(ocel)
 
+    def test_discovery_ocdfg_columnar(self):
+        from pm4py.algo.discovery.ocel.ocdfg.variants import classic, columnar
+        ocel = pm4py.read_ocel(os.path.join("input_data", "ocel", "recruiting-red.jsonocel"))
+        ocel.relations = ocel.relations.sample(frac=1.0, random_state=3)
+        for parameters in [{}, {"business_hours": True}]:
+            self.assertEqual(classic.apply(ocel, parameters=parameters), columnar.apply(ocel, parameters=parameters))
+        ocdfg = columnar.apply(ocel)
+        annotations = columnar.get_annotations(ocel)
+        for row in annotations[columnar.EDGES].to_dict("records"):
+            edge = (row["ocel:activity"], row["ocel:activity_2"])
+            for metric in [columnar.EVENT_COUPLES, columnar.UNIQUE_OBJECTS, columnar.TOTAL_OBJECTS]:
+                self.assertEqual(len(ocdfg["edges"][metric][row["ocel:type"]][edge]), row[metric])
+            performance = ocdfg["edges_performance"][columnar.EVENT_COUPLES][row["ocel:type"]][edge]
+            self.assertEqual(max(performance), row[columnar.EVENT_COUPLES + "_max"])
+        for row in annotations[columnar.START_ACTIVITIES].to_dict("records"):
+            self.assertEqual(len(ocdfg["start_activities"]["events"][row["ocel:type"]][row["ocel:activity"]]),
+                             row[columnar.EVENTS])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -114,6 +114,28 @@ class OcelFilteringTest(unittest.TestCase):
         ocel = pm4py.read_ocel(input_path)
         pm4py.filter_ocel_events_timestamp(ocel, "1981-01-01 00:00:00", "1982-01-01 00:00:00")
 
+    def test_ocel_filter_view(self):
+        from pm4py.objects.ocel.util import ocel_view
+        input_path = os.path.join("input_data", "ocel", "ocel20_example.jsonocel")
+        ocel = pm4py.read_ocel2(input_path)
+        filters = [lambda x: pm4py.filter_ocel_events_timestamp(x, "2022-01-15 00:00:00", "2022-02-20 00:00:00"),
+                   lambda x: pm4py.filter_ocel_object_types(x, ["Invoice", "Purchase Order", "Purchase Requisition"]),
+                   lambda x: pm4py.filter_ocel_start_events_per_object_type(x, "Purchase Order"),
+                   lambda x: pm4py.filter_ocel_event_attribute(x, "ocel:activity", ["Create Purchase Order"],
+                                                               positive=False)]
+        for i in range(len(filters)):
+            filtered = ocel
+            view = ocel_view.apply(ocel)
+            for f in filters[i:] + filters[:i]:
+                filtered = f(filtered)
+                view = f(view)
+            self.assertIsInstance(view, ocel_view.OCELView)
+            materialized = view.materialize()
+            for table in ["events", "objects", "relations", "o2o", "e2e", "object_changes"]:
+                self.assertTrue(getattr(filtered, table).equals(getattr(materialized, table)))
+            # the view is consumed as an object-centric event log
+            self.assertEqual(pm4py.discover_ocdfg(filtered)["edges"], pm4py.discover_ocdfg(view)["edges"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -334,6 +334,49 @@ class OtherPartsTests(unittest.TestCase):
         from pm4py.algo.transformation.ocel.split_ocel import algorithm as split_ocel
         res = split_ocel.apply(ocel, parameters={"object_type": "order"}, variant=split_ocel.Variants.ANCESTORS_DESCENDANTS)
 
+    def test_ocel_index(self):
+        import pm4py
+        from pm4py.objects.ocel.util import ocel_index
+        from pm4py.statistics.ocel import edge_metrics
+        ocel = pm4py.read_ocel("input_data/ocel/example_log.jsonocel")
+        # the events table is not sorted by timestamp
+        ocel.events = ocel.events.sample(frac=1.0, random_state=11).reset_index(drop=True)
+        index = ocel.get_index()
+        self.assertIs(index, ocel.get_index())
+        expected = ocel.relations.groupby(ocel.event_id_column)[ocel.object_id_column].agg(list).to_dict()
+        self.assertEqual(expected, index.get_event_objects_dict())
+        timestamps = ocel.events.set_index(ocel.event_id_column)[ocel.event_timestamp]
+        for obj, events in index.get_object_events_dict().items():
+            self.assertTrue(timestamps[events].is_monotonic_increasing)
+            self.assertEqual(events, [index.event_ids[e] for e in index.get_object_events(index.get_object_code(obj))])
+        expected = {}
+        history = {}
+        omap = ocel.relations.groupby(ocel.event_id_column)[ocel.object_id_column].agg(list).to_dict()
+        activities = ocel.events.set_index(ocel.event_id_column)[ocel.event_activity].to_dict()
+        object_types = ocel.objects.set_index(ocel.object_id_column)[ocel.object_type_column].to_dict()
+        for ev in ocel.events[ocel.event_id_column]:
+            for obj in omap.get(ev, []):
+                if obj in history:
+                    edge = (activities[history[obj]], activities[ev])
+                    expected.setdefault(object_types[obj], {}).setdefault(edge, []).append((history[obj], ev, obj))
+                history[obj] = ev
+        self.assertEqual(expected, edge_metrics.find_associations_per_edge(ocel))
+        # the index is invalidated when the relations are modified
+        ocel.relations = ocel.relations.iloc[:-1]
+        self.assertIsNot(index, ocel.get_index())
+        self.assertEqual(len(ocel.relations), int(ocel.get_index().get_event_degrees().sum()))
+        # the in-place modifications of single cells are notified through invalidate
+        ocel = pm4py.read_ocel("input_data/ocel/recruiting-red.jsonocel")
+        for i in range(5, 5000, 1500):
+            index = ocel.get_index()
+            objects = ocel.objects[ocel.object_id_column]
+            ocel.relations.loc[ocel.relations.index[i], ocel.object_id_column] = objects[
+                objects != ocel.relations[ocel.object_id_column].iloc[i]].iloc[i % 100]
+            ocel_index.invalidate(ocel)
+            self.assertIsNot(index, ocel.get_index())
+            expected = ocel.relations.groupby(ocel.event_id_column)[ocel.object_id_column].agg(list).to_dict()
+            self.assertEqual(expected, ocel.get_index().get_event_objects_dict())
+
     def test_ocel_object_features_non_simpl_interface(self):
         import pm4py
         ocel = pm4py.read_ocel("input_data/ocel/example_log.jsonocel")
@@ -382,12 +425,80 @@ class OtherPartsTests(unittest.TestCase):
         from pm4py.algo.transformation.ocel.graphs import object_codeath_graph
         object_codeath_graph.apply(ocel)
 
+    def test_ocel_sparse_graphs(self):
+        import pm4py
+        import networkx as nx
+        from pm4py.algo.transformation.ocel.graphs import object_interaction_graph, object_cobirth_graph, \
+            object_descendants_graph, incidence_matrix
+        from pm4py.algo.transformation.ocel.features.objects import object_degree_centrality
+        ocel = pm4py.read_ocel("input_data/ocel/example_log.jsonocel")
+        ocel.events = ocel.events.sample(frac=1.0, random_state=11).reset_index(drop=True)
+        omap = ocel.relations.groupby(ocel.event_id_column)[ocel.object_id_column].agg(set).to_dict()
+        interaction, cobirth, descendants = set(), set(), set()
+        seen = set()
+        for ev in ocel.events[ocel.event_id_column]:
+            objs = omap.get(ev, set())
+            interaction.update((o1, o2) for o1 in objs for o2 in objs if o1 < o2)
+            cobirth.update((o1, o2) for o1 in objs - seen for o2 in objs - seen if o1 < o2)
+            descendants.update((o1, o2) for o1 in objs & seen for o2 in objs - seen)
+            seen.update(objs)
+        self.assertEqual(interaction, object_interaction_graph.apply(ocel))
+        self.assertEqual(cobirth, object_cobirth_graph.apply(ocel))
+        self.assertEqual(descendants, object_descendants_graph.apply(ocel))
+        adjacency = object_interaction_graph.apply_sparse(ocel)
+        self.assertEqual(0, (adjacency != adjacency.T).nnz)
+        self.assertEqual(2 * len(interaction), adjacency.nnz)
+        centrality = nx.degree_centrality(nx.Graph(list(interaction)))
+        index = ocel.get_index()
+        data, _ = object_degree_centrality.apply(ocel)
+        for obj, row in zip(ocel.objects[ocel.object_id_column], data):
+            self.assertAlmostEqual(centrality.get(obj, 0.0), row[0])
+        self.assertAlmostEqual(centrality[index.object_ids[0]], incidence_matrix.get_degree_centrality(adjacency)[0])
+
+    def test_ocel_flattening_object_types(self):
+        import pm4py
+        import pandas as pd
+        from pm4py.objects.ocel.util import flattening
+        ocel = pm4py.read_ocel("input_data/ocel/example_log.jsonocel")
+        ocel.relations = ocel.relations.sample(frac=1.0, random_state=5)
+        object_types = pm4py.ocel_get_object_types(ocel)
+        flattened_logs = flattening.flatten_object_types(ocel)
+        self.assertEqual(set(object_types), set(flattened_logs))
+        for ot in object_types:
+            self.assertTrue(flattening.flatten(ocel, ot).equals(flattened_logs[ot]))
+        long_df = flattening.flatten_long(ocel, object_types, parameters={"minimal_columns": True,
+                                                                          "sort_by_case": True})
+        self.assertEqual(["concept:name", "time:timestamp", "case:concept:name", "case:ocel:type"],
+                         list(long_df.columns))
+        expected = pd.concat([flattening.flatten(ocel, ot).sort_values(["case:concept:name", "time:timestamp"],
+                                                                      kind="stable") for ot in object_types])
+        self.assertTrue(expected[list(long_df.columns)].reset_index(drop=True).equals(long_df))
+
     def test_ocel_description_non_simpl_interface(self):
         import pm4py
         ocel = pm4py.read_ocel("input_data/ocel/example_log.jsonocel")
         from pm4py.algo.transformation.ocel.description.variants import variant1
         variant1.apply(ocel)
 
+    def test_business_hours_vectorized(self):
+        import pandas as pd
+        from pm4py.util.business_hours import BusinessHours, soj_time_business_hours_diff_vectorized
+        st = pd.Series(pd.date_range("2023-01-02 05:30:00", periods=50, freq="17h", tz="UTC"))
+        et = st + pd.to_timedelta([3600 * 7 * i for i in range(50)], unit="s")
+        worked_times = soj_time_business_hours_diff_vectorized(st, et)
+        for i in range(50):
+            self.assertAlmostEqual(BusinessHours(st[i], et[i]).get_seconds(), worked_times[i], places=3)
+        # slot wrapping the end of the week (Sunday 22:00 - Monday 02:00) and missing timestamps
+        slots = [(6 * 86400 + 22 * 3600, 7 * 86400 + 2 * 3600)]
+        st = pd.Series(pd.to_datetime(["2023-01-02 01:00:00", None, "2023-01-08 23:00:00"]))
+        et = pd.Series(pd.to_datetime(["2023-01-02 03:00:00", "2023-01-02 03:00:00", "2023-01-09 05:00:00"]))
+        worked_times = soj_time_business_hours_diff_vectorized(st, et, slots)
+        self.assertEqual(3600, worked_times[0])
+        self.assertTrue(pd.isna(worked_times[1]))
+        self.assertEqual(10800, worked_times[2])
+        for i in [0, 2]:
+            self.assertEqual(worked_times[i], BusinessHours(st[i], et[i], business_hour_slots=slots).get_seconds())
+
 
 if __name__ == "__main__":
     unittest.main()
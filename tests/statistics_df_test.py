@@ -42,6 +42,39 @@ class StatisticsDfTest(unittest.TestCase):
         df = self.get_dataframe()
         get.get_variants_set(df)
 
+    def test_variant_index(self):
+        from collections import Counter
+        from pm4py.objects.log.util import variant_index
+        df = self.get_dataframe()
+        df = df.sample(frac=1.0, random_state=5)
+        index = variant_index.get_variant_index(df)
+        self.assertIs(index, variant_index.get_variant_index(df))
+        case_variant = df.groupby("case:concept:name", sort=True)["concept:name"].agg(tuple).to_dict()
+        self.assertEqual(case_variant, index.get_case_variant())
+        self.assertEqual(Counter(case_variant.values()), index.get_variants_count())
+        for case in range(len(index.case_ids)):
+            rows = index.get_case_rows(case)
+            self.assertTrue((df["case:concept:name"].iloc[rows] == index.case_ids[case]).all())
+        top_variant = max(index.get_variants_count().items(), key=lambda x: x[1])[0]
+        cases = [c for c, v in case_variant.items() if v == top_variant]
+        mask = index.get_rows_mask([index.get_variant_id(top_variant)])
+        self.assertTrue((df["case:concept:name"].isin(cases).to_numpy() == mask).all())
+        # the index is invalidated when the dataframe is modified
+        df["concept:name"] = df["concept:name"].str.upper()
+        self.assertIsNot(index, variant_index.get_variant_index(df))
+        self.assertIn(tuple(x.upper() for x in top_variant), variant_index.get_variant_index(df).get_variants_count())
+        # the in-place modifications of single cells are notified through invalidate
+        for i in range(1, 13, 3):
+            index = variant_index.get_variant_index(df)
+            df.loc[df.index[i], "concept:name"] = "EDITED"
+            variant_index.invalidate(df)
+            self.assertIsNot(index, variant_index.get_variant_index(df))
+            self.assertEqual(df.groupby("case:concept:name", sort=True)["concept:name"].agg(tuple).to_dict(),
+                             variant_index.get_variant_index(df).get_case_variant())
+        index = variant_index.get_variant_index(df)
+        df["concept:name"] = df["concept:name"].to_numpy()[::-1]
+        self.assertIsNot(index, variant_index.get_variant_index(df))
+
     def test_batch_detection(self):
         from pm4py.algo.discovery.batches.variants import pandas as pandas_batches
         dataframe = pandas_utils.read_csv(os.path.join("input_data", "receipt.csv"))
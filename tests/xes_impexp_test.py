@@ -62,6 +62,78 @@ class XesImportExportTest(unittest.TestCase):
             log = xes_importer.apply(os.path.join(INPUT_DATA_DIR, "bpic2012.xes.gz"), variant=xes_importer.Variants.RUSTXES)
             self.assertEqual(len(log), 13087)
 
+    def test_dataframe_chunks_import(self):
+        import pandas as pd
+        import pm4py
+        path = os.path.join(COMPRESSED_INPUT_DATA, "03_repairExample.xes.gz")
+        df = pm4py.read_xes(path)
+        chunks = list(xes_importer.apply(path, variant=xes_importer.Variants.DATAFRAME_CHUNKS,
+                                         parameters={"chunk_size": 1000}))
+        self.assertGreater(len(chunks), 1)
+        chunked_df = pd.concat(chunks, ignore_index=True)
+        self.assertEqual(len(df), len(chunked_df))
+        self.assertEqual(df["case:concept:name"].nunique(), sum(c["case:concept:name"].nunique() for c in chunks))
+        self.assertEqual(pm4py.discover_dfg(df), pm4py.discover_dfg(pm4py.read_xes(path, chunk_size=1000)))
+        chunks = list(xes_importer.apply(path, variant=xes_importer.Variants.DATAFRAME_CHUNKS,
+                                         parameters={"chunk_size": 1000, "max_traces": 10}))
+        self.assertEqual(pd.concat(chunks)["case:concept:name"].nunique(), 10)
+        with self.assertRaises(Exception):
+            pm4py.read_xes(path, variant="iterparse", chunk_size=1000)
+
+    def test_parallel_chunks_import(self):
+        import pandas as pd
+        path = os.path.join(COMPRESSED_INPUT_DATA, "03_repairExample.xes.gz")
+        log = xes_importer.apply(path, variant=xes_importer.Variants.DATAFRAME_CHUNKS)
+        parallel_log = xes_importer.apply(path, variant=xes_importer.Variants.PARALLEL_CHUNKS,
+                                          parameters={"cores": 2, "min_range_size": 2 ** 14,
+                                                      "return_legacy_log_object": False})
+        pd.testing.assert_frame_equal(pd.concat(list(log), ignore_index=True), parallel_log)
+        parallel_log = xes_importer.apply(path, variant=xes_importer.Variants.PARALLEL_CHUNKS,
+                                          parameters={"cores": 2, "min_range_size": 2 ** 14, "max_traces": 25})
+        self.assertEqual(len(parallel_log), 25)
+        # the attributes, extensions, globals and classifiers of the log are kept
+        serial_log = xes_importer.apply(path, variant=xes_importer.Variants.CHUNK_REGEX)
+        self.assertEqual(serial_log.attributes, parallel_log.attributes)
+        self.assertEqual(serial_log.extensions, parallel_log.extensions)
+        self.assertEqual(serial_log.omni_present, parallel_log.omni_present)
+        self.assertEqual(serial_log.classifiers, parallel_log.classifiers)
+
+    def test_read_cache(self):
+        import tempfile
+        import pandas as pd
+        import pm4py
+        from pm4py.util import read_cache, constants
+        if read_cache.is_enabled(True):
+            default_cache_dir = read_cache.DEFAULT_CACHE_DIR
+            default_aware = constants.ENABLE_DATETIME_COLUMNS_AWARE
+            with tempfile.TemporaryDirectory() as cache_dir:
+                read_cache.DEFAULT_CACHE_DIR = cache_dir
+                try:
+                    path = os.path.join(COMPRESSED_INPUT_DATA, "04_reviewing.xes.gz")
+                    df = pm4py.read_xes(path, use_cache=False)
+                    pm4py.read_xes(path, use_cache=True)
+                    self.assertTrue(any(x.startswith("04_reviewing.xes.gz.") for x in os.listdir(cache_dir)))
+                    cached_df = pm4py.read_xes(path, use_cache=True)
+                    pd.testing.assert_frame_equal(df, cached_df)
+                    self.assertEqual(df.attrs, cached_df.attrs)
+                    # a change of the global parsing settings requires a new entry
+                    constants.ENABLE_DATETIME_COLUMNS_AWARE = not default_aware
+                    naive_df = pm4py.read_xes(path, use_cache=True)
+                    self.assertEqual(2, len([x for x in os.listdir(cache_dir) if x.startswith("04_reviewing.xes.gz.")]))
+                    self.assertNotEqual(df["time:timestamp"].dtype, naive_df["time:timestamp"].dtype)
+                    constants.ENABLE_DATETIME_COLUMNS_AWARE = default_aware
+
+                    path = os.path.join(INPUT_DATA_DIR, "ocel", "ocel20_example.jsonocel")
+                    ocel = pm4py.read_ocel2(path, use_cache=False)
+                    pm4py.read_ocel2(path, use_cache=True)
+                    cached_ocel = pm4py.read_ocel2(path, use_cache=True)
+                    pd.testing.assert_frame_equal(ocel.events, cached_ocel.events)
+                    pd.testing.assert_frame_equal(ocel.objects, cached_ocel.objects)
+                    self.assertEqual(len(ocel.relations), len(cached_ocel.relations))
+                    self.assertEqual(ocel.globals, cached_ocel.globals)
+                finally:
+                    read_cache.DEFAULT_CACHE_DIR = default_cache_dir
+                    constants.ENABLE_DATETIME_COLUMNS_AWARE = default_aware
 
 if __name__ == "__main__":
     unittest.main()